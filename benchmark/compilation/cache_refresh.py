@@ -0,0 +1,75 @@
+"""
+Time the loading of the cache of compiled modules.
+
+Build synthetic caches with a given number of entries (each with a fake
+library and a key.pkl file) and time the creation of a ModuleCache on them,
+with and without the cmodule.use_index flag. Without the index, all the
+key.pkl files are loaded at creation. With it, only the index file is read,
+and a key.pkl file is only loaded when a lookup needs it.
+
+Usage: python cache_refresh.py [N_ENTRIES ...]   (default: 1000 10000 100000)
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import theano
+from theano.gof import cmodule
+from theano.gof.cc import hash_from_code
+
+
+def make_cache(dirname, n_entries):
+    """Fill `dirname` with `n_entries` fake versioned modules."""
+    lib_ext = cmodule.get_lib_extension()
+    # refresh() deletes empty directories, and would delete the whole cache
+    # if its root only had sub-directories.
+    open(os.path.join(dirname, 'README'), 'w').close()
+    module_hashes = []
+    for i in xrange(n_entries):
+        location = tempfile.mkdtemp(dir=dirname)
+        module_hash = hash_from_code('module %i' % i)
+        entry = os.path.join(location, '%s.%s' % (module_hash, lib_ext))
+        open(entry, 'w').close()
+        key = ((1, i), ('CLinker.cmodule_key', ('-O3',), (), (),
+                        'md5:%s' % module_hash, ('node', i)))
+        key_data = cmodule.KeyData(keys=set([key]), module_hash=module_hash,
+                                   key_pkl=os.path.join(location, 'key.pkl'),
+                                   entry=entry)
+        key_data.save_pkl()
+        module_hashes.append(module_hash)
+    return module_hashes
+
+
+def time_cache_creation(dirname, use_index):
+    theano.config.cmodule.use_index = use_index
+    t0 = time.time()
+    cache = cmodule.ModuleCache(dirname, check_for_broken_eq=False)
+    return time.time() - t0, cache
+
+
+def main(sizes):
+    for n_entries in sizes:
+        dirname = tempfile.mkdtemp(prefix='theano_cache_refresh_')
+        try:
+            module_hashes = make_cache(dirname, n_entries)
+            t_full, cache = time_cache_creation(dirname, use_index=False)
+            assert len(cache.module_hash_to_key_data) == n_entries
+            # Creates the index file.
+            cache.write_index()
+            t_index, cache = time_cache_creation(dirname, use_index=True)
+            assert not cache.module_hash_to_key_data
+            t0 = time.time()
+            cache.load_indexed(module_hashes[n_entries // 2])
+            t_lookup = time.time() - t0
+            print ('%7i entries: full refresh %8.3fs, with index %8.3fs '
+                   '(+%.5fs to load one entry)' % (
+                       n_entries, t_full, t_index, t_lookup))
+        finally:
+            shutil.rmtree(dirname, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    main(sizes)
@@ -0,0 +1,80 @@
+"""
+Stress test of the compilation lock.
+
+Launch N processes at the same time against a fresh compilation directory.
+Each process compiles functions whose C modules are different from those of
+the other processes, so that with the compile.fine_grained_lock flag they
+should not wait for each other. The total wall time is reported.
+
+Usage: python compilelock_stress.py [-n N_PROCESSES] [-f N_FUNCTIONS]
+                                    [--fine-grained-lock]
+"""
+import optparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def worker(idx, n_functions):
+    import numpy
+    import theano
+    from theano import tensor
+
+    ops = [tensor.exp, tensor.sin, tensor.cos, tensor.tanh, tensor.sqr,
+           tensor.log1p, tensor.sqrt, tensor.abs_]
+    rng = numpy.random.RandomState(idx)
+    x = tensor.dvector()
+    for i in xrange(n_functions):
+        # A random chain of unary ops is fused into one Composite, whose C
+        # code is specific to this chain.
+        out = x
+        for op_idx in rng.randint(len(ops), size=6):
+            out = ops[op_idx](out)
+        theano.function([x], out)
+
+
+def main():
+    parser = optparse.OptionParser(usage=__doc__)
+    parser.add_option('-n', '--n-processes', type='int', default=8)
+    parser.add_option('-f', '--n-functions', type='int', default=4,
+                      help='number of functions compiled by each process')
+    parser.add_option('--fine-grained-lock', action='store_true',
+                      default=False)
+    options, args = parser.parse_args()
+
+    compiledir = tempfile.mkdtemp(prefix='theano_compilelock_stress_')
+    flags = 'compiledir=%s,compile.fine_grained_lock=%s' % (
+        compiledir, options.fine_grained_lock)
+    env = dict(os.environ)
+    env['THEANO_FLAGS'] = ','.join(f for f in [env.get('THEANO_FLAGS'),
+                                               flags] if f)
+    try:
+        # Compile the modules shared by all the processes (cutils,
+        # lazylinker, ...) first, so that we only time the functions.
+        subprocess.check_call([sys.executable, __file__, '--worker', '0',
+                               '0'], env=env)
+        t0 = time.time()
+        procs = [subprocess.Popen([sys.executable, __file__, '--worker',
+                                   str(i + 1), str(options.n_functions)],
+                                  env=env)
+                 for i in xrange(options.n_processes)]
+        status = [p.wait() for p in procs]
+        t1 = time.time()
+    finally:
+        shutil.rmtree(compiledir, ignore_errors=True)
+    if any(status):
+        print >> sys.stderr, 'Some processes failed: %s' % status
+        sys.exit(1)
+    print 'fine_grained_lock=%s processes=%i functions/process=%i' % (
+        options.fine_grained_lock, options.n_processes, options.n_functions)
+    print 'total wall time: %.2fs' % (t1 - t0)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 and sys.argv[1] == '--worker':
+        worker(int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        main()
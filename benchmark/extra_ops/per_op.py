@@ -0,0 +1,67 @@
+"""
+Time each op of theano.tensor.extra_ops that has a C implementation with
+its Python perform (linker=py) and its C code (linker=cvm), on a small and
+a large input, to show the per-call overhead and the throughput.
+
+fill_diagonal is applied to an intermediate result, so that the inplace
+optimization can be used. It is also timed without that optimization.
+
+Usage: python per_op.py
+"""
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import Mode
+from theano.tensor import extra_ops
+
+N_CALLS = 200
+
+
+def cases():
+    floatX = theano.config.floatX
+    rng = numpy.random.RandomState(0)
+    x = T.matrix('x')
+    v = T.lvector('v')
+    r = T.lvector('r')
+    m = T.lscalar('m')
+    for n in (10, 1000):
+        a = rng.rand(n, n).astype(floatX)
+        ints = rng.randint(0, 1000, size=(n * n,))
+        yield 'diff', n, [x], extra_ops.diff(x, n=2, axis=0), [a]
+        yield 'bincount', n, [v], extra_ops.bincount(v), [ints]
+        yield ('repeat', n, [x, r], extra_ops.repeat(x, r, axis=1),
+               [a, rng.randint(0, 3, size=(n,))])
+        yield 'bartlett', n, [m], extra_ops.bartlett(m), [n * n]
+        yield ('fill_diagonal', n, [x],
+               extra_ops.fill_diagonal(x * 2, numpy.asarray(1, floatX)), [a])
+
+
+def time_fn(f, data):
+    f(*data)
+    t0 = time.time()
+    for i in range(N_CALLS):
+        f(*data)
+    return (time.time() - t0) / N_CALLS
+
+
+def main():
+    print '%-14s %6s %12s %12s %16s' % ('op', 'size', 'py', 'c',
+                                        'c (no inplace)')
+    for name, n, inputs, out, data in cases():
+        times = []
+        for mode in (Mode(linker='py'), Mode(linker='cvm'),
+                     Mode(linker='cvm').excluding(
+                         'local_inplace_fill_diagonal')):
+            f = theano.function(inputs, out, mode=mode)
+            times.append('%10.1fus' % (time_fn(f, data) * 1e6))
+        if name != 'fill_diagonal':
+            times[2] = ''
+        print '%-14s %6d %12s %12s %16s' % (name, n, times[0], times[1],
+                                            times[2])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Time an epoch of minibatches of varying sizes (as when the examples are
+bucketed by length) through a stack of dot + tanh layers, with the
+garbage collection of the intermediate results (allow_gc=True):
+
+  cvm:          the default linker, each op allocates its outputs
+  vm:           the Python VM (LoopGC) used by the buffer pool
+  vm+pool:      vm.buffer_pool=True, the freed buffers are used again
+  cvm (no gc):  allow_gc=False, the ops reuse their outputs when the
+                shape did not change
+
+The hits and misses of the pool are taken from the profile of the
+function.
+
+Usage: python buffer_pool.py [N_LAYERS]   (default: 6)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import Mode, ProfileStats
+from theano.gof.vm import VM_Linker
+
+WIDTH = 256
+SIZES = (64, 128, 192, 256)
+N_BATCHES = 200
+
+
+def build(n_layers):
+    rng = numpy.random.RandomState(0)
+    x = T.matrix('x')
+    h = x
+    for i in range(n_layers):
+        W = theano.shared(rng.uniform(-.1, .1, (WIDTH, WIDTH)).astype(
+            theano.config.floatX))
+        h = T.tanh(T.dot(h, W))
+    data = [rng.rand(SIZES[k], WIDTH).astype(theano.config.floatX)
+            for k in rng.randint(len(SIZES), size=N_BATCHES)]
+    return x, h.sum(), data
+
+
+def main(n_layers):
+    x, cost, data = build(n_layers)
+    for name, linker in [
+            ('cvm', VM_Linker(allow_gc=True, use_cloop=True)),
+            ('vm', VM_Linker(allow_gc=True)),
+            ('vm+pool', VM_Linker(allow_gc=True, buffer_pool=True)),
+            ('cvm (no gc)', VM_Linker(allow_gc=False, use_cloop=True))]:
+        profile = ProfileStats(False)
+        f = theano.function([x], cost, mode=Mode(linker=linker),
+                            profile=profile)
+        for d in data[:10]:
+            f(d)
+        t0 = time.time()
+        for d in data:
+            f(d)
+        t = time.time() - t0
+        line = '%-12s %8.2fms/minibatch' % (name, t * 1000 / len(data))
+        if profile.pool_hits or profile.pool_misses:
+            line += '  pool: %i hits, %i misses, max held %iKB' % (
+                profile.pool_hits, profile.pool_misses,
+                profile.pool_max_bytes_held // 1024)
+        print line
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] and int(sys.argv[1]) or 6)
@@ -0,0 +1,48 @@
+"""
+Time of a call of a tiny Theano function (x + 1 on a vector of one
+element) with the CVM linker:
+
+  checked:       a normal call, which filters and checks the arguments
+  trust_input:   trust_input=True, with the call done in Python
+                 (Function.__call__ without the C fast path)
+  fast path:     trust_input=True, the call is done by CLazyLinker.fast_call
+  fast_call:     fn.fast_call called directly, without Function.__call__
+
+Usage: python call_overhead.py [N_CALLS]   (default: 200000)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import Mode
+
+
+def time_calls(f, arg, n_calls):
+    f(arg)
+    t0 = time.time()
+    for i in xrange(n_calls):
+        f(arg)
+    return (time.time() - t0) / n_calls
+
+
+def main(n_calls):
+    x = T.vector('x')
+    arg = numpy.ones(1, dtype=theano.config.floatX)
+    f = theano.function([x], x + 1, mode=Mode(linker='cvm'))
+    fast_call = f._fast_call
+    results = [('checked', time_calls(f, arg, n_calls))]
+    f.trust_input = True
+    f._fast_call = None
+    results.append(('trust_input', time_calls(f, arg, n_calls)))
+    f._fast_call = fast_call
+    results.append(('fast path', time_calls(f, arg, n_calls)))
+    results.append(('fast_call', time_calls(f.fn.fast_call, arg, n_calls)))
+    for name, t in results:
+        print '%-14s %8.2fus/call' % (name, t * 1e6)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] and int(sys.argv[1]) or 200000)
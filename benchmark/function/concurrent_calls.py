@@ -0,0 +1,114 @@
+"""
+Compare two ways of serving one Theano function from N threads:
+
+ - pool: one compiled function and a FunctionPool of copies of it, that
+   share its compiled code, graph and shared variables.
+ - compiled: N separate calls to theano.function, one per thread.
+
+For each N, print the time and the memory (increase of the resident set
+size) needed to set up the N functions, and the number of calls per second
+done by N threads each calling its function in a loop.
+
+Each setting is run in a separate process, so that the memory measurements
+do not interfere.
+
+Usage: python concurrent_calls.py [N_THREADS ...]   (default: 1 2 4 8)
+"""
+import subprocess
+import sys
+import threading
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import FunctionPool
+
+N_LAYERS = 4
+WIDTH = 512
+BATCH = 32
+DURATION = 3.0
+
+
+def rss():
+    """Return the resident set size of this process, in MB."""
+    for line in open('/proc/self/status'):
+        if line.startswith('VmRSS:'):
+            return int(line.split()[1]) / 1024.
+    raise RuntimeError('VmRSS not found in /proc/self/status')
+
+
+def build():
+    rng = numpy.random.RandomState(0)
+    x = T.matrix('x')
+    h = x
+    for i in range(N_LAYERS):
+        W = theano.shared(rng.uniform(-.1, .1, (WIDTH, WIDTH)).astype(
+            theano.config.floatX), name='W%i' % i)
+        b = theano.shared(numpy.zeros(WIDTH, dtype=theano.config.floatX),
+                          name='b%i' % i)
+        h = T.tanh(T.dot(h, W) + b)
+    return x, T.nnet.softmax(h)
+
+
+def run(mode, n_threads):
+    x, y = build()
+    # Compile once so that the C code is in the cache for both modes.
+    theano.function([x], y)
+
+    mem0 = rss()
+    t0 = time.time()
+    if mode == 'pool':
+        pool = FunctionPool(theano.function([x], y))
+        fns = [pool.acquire() for i in range(n_threads)]
+        for fn in fns:
+            pool.release(fn)
+        calls = [pool] * n_threads
+    else:
+        calls = [theano.function([x], y) for i in range(n_threads)]
+    setup_time = time.time() - t0
+    setup_mem = rss() - mem0
+
+    data = numpy.random.rand(BATCH, WIDTH).astype(theano.config.floatX)
+    counts = [0] * n_threads
+    stop = [False]
+
+    def work(i):
+        f = calls[i]
+        while not stop[0]:
+            f(data)
+            counts[i] += 1
+
+    threads = [threading.Thread(target=work, args=(i,))
+               for i in range(n_threads)]
+    t0 = time.time()
+    for t in threads:
+        t.start()
+    time.sleep(DURATION)
+    stop[0] = True
+    for t in threads:
+        t.join()
+    rate = sum(counts) / (time.time() - t0)
+    print '%s %f %f %f' % (mode, setup_time, setup_mem, rate)
+
+
+def main(sizes):
+    print '%9s %9s %10s %10s %12s' % ('threads', 'mode', 'setup',
+                                      'memory', 'calls/s')
+    for n in sizes:
+        for mode in ('pool', 'compiled'):
+            out = subprocess.Popen(
+                [sys.executable, __file__, '--run', mode, str(n)],
+                stdout=subprocess.PIPE).communicate()[0]
+            line = out.strip().splitlines()[-1].split()
+            setup_time, setup_mem, rate = [float(v) for v in line[1:]]
+            print '%9d %9s %9.2fs %8.1fMB %12.1f' % (n, mode, setup_time,
+                                                    setup_mem, rate)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--run']:
+        run(sys.argv[2], int(sys.argv[3]))
+    else:
+        main([int(a) for a in sys.argv[1:]] or [1, 2, 4, 8])
@@ -0,0 +1,100 @@
+"""
+Measure how the throughput of a Theano function grows with the number of
+threads calling it, when its C code releases the GIL during the computation
+(config.cmodule.release_gil).
+
+For each kind of computation (gemm, conv, elemwise and a reduction), a
+FunctionPool is called from N threads during a few seconds, and the number
+of calls per second is printed, with release_gil=True and False. Each
+setting is run in a separate process, as the flag must be set before the
+functions are compiled.
+
+Usage: python gil_release_scaling.py [N_THREADS ...]   (default: 1 2 4 8)
+"""
+import subprocess
+import sys
+import threading
+import time
+
+import numpy
+
+DURATION = 3.0
+KINDS = ('gemm', 'conv', 'elemwise', 'reduce')
+
+
+def build(kind):
+    import theano
+    import theano.tensor as T
+    from theano.tensor.nnet import conv
+    floatX = theano.config.floatX
+    rng = numpy.random.RandomState(0)
+    if kind == 'gemm':
+        x = T.matrix('x')
+        W = theano.shared(rng.rand(512, 512).astype(floatX))
+        out = T.dot(x, W)
+        data = rng.rand(256, 512).astype(floatX)
+    elif kind == 'conv':
+        x = T.tensor4('x')
+        W = theano.shared(rng.rand(16, 8, 5, 5).astype(floatX))
+        out = conv.conv2d(x, W, image_shape=(8, 8, 32, 32),
+                          filter_shape=(16, 8, 5, 5))
+        data = rng.rand(8, 8, 32, 32).astype(floatX)
+    elif kind == 'elemwise':
+        x = T.matrix('x')
+        out = T.tanh(x) * T.exp(-x)
+        data = rng.rand(1000, 1000).astype(floatX)
+    elif kind == 'reduce':
+        x = T.matrix('x')
+        out = x.sum(axis=0)
+        data = rng.rand(2000, 2000).astype(floatX)
+    else:
+        raise ValueError(kind)
+    return theano.function([x], out), data
+
+
+def run(kind, release_gil, n_threads):
+    import theano
+    theano.config.cmodule.release_gil = release_gil
+    from theano.compile import FunctionPool
+    f, data = build(kind)
+    pool = FunctionPool(f)
+    pool(data)
+    counts = [0] * n_threads
+    stop = [False]
+
+    def work(i):
+        while not stop[0]:
+            pool(data)
+            counts[i] += 1
+
+    threads = [threading.Thread(target=work, args=(i,))
+               for i in range(n_threads)]
+    t0 = time.time()
+    for t in threads:
+        t.start()
+    time.sleep(DURATION)
+    stop[0] = True
+    for t in threads:
+        t.join()
+    print sum(counts) / (time.time() - t0)
+
+
+def main(sizes):
+    print '%9s %8s %16s %16s' % ('kind', 'threads', 'calls/s (GIL)',
+                                 'calls/s (no GIL)')
+    for kind in KINDS:
+        for n in sizes:
+            rates = []
+            for release_gil in ('0', '1'):
+                out = subprocess.Popen(
+                    [sys.executable, __file__, '--run', kind, release_gil,
+                     str(n)], stdout=subprocess.PIPE).communicate()[0]
+                rates.append(float(out.strip().splitlines()[-1]))
+            print '%9s %8d %16.1f %16.1f' % (kind, n, rates[0], rates[1])
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--run']:
+        run(sys.argv[2], bool(int(sys.argv[3])), int(sys.argv[4]))
+    else:
+        main([int(a) for a in sys.argv[1:]] or [1, 2, 4, 8])
@@ -0,0 +1,57 @@
+"""
+Number of calls per second of a small Theano function, when it is called in
+a Python loop and with Function.map, which checks all the arguments first
+and then runs the calls in a tight loop.
+
+The graph has 10 elemwise and reduction nodes on a vector of a few
+elements (the elemwise fusion is disabled to keep them separate), so the
+time of a call is mostly overhead. The arguments are given to map as an
+ndarray stacked along its first axis, and as a list of vectors.
+
+Usage: python map_calls.py [N_CALLS]   (default: 20000)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import Mode
+
+
+def build():
+    x = T.vector('x')
+    y = x
+    for i in range(2):
+        y = T.tanh(y * 2 + 1)
+    y = (y * x).sum() + x.max()
+    return x, y
+
+
+def main(n_calls):
+    x, y = build()
+    data = numpy.random.rand(n_calls, 8).astype(theano.config.floatX)
+    as_list = list(data)
+    print '%-8s %14s %14s %14s' % ('linker', 'loop', 'map(array)',
+                                   'map(list)')
+    for linker in ('cvm', 'vm', 'c|py'):
+        f = theano.function([x], y,
+                            mode=Mode(linker=linker).excluding('fusion'))
+        assert len(f.maker.fgraph.toposort()) == 10
+        t0 = time.time()
+        loop = [f(v) for v in data]
+        t_loop = time.time() - t0
+        t0 = time.time()
+        out = f.map(data)
+        t_map = time.time() - t0
+        t0 = time.time()
+        f.map(as_list)
+        t_list = time.time() - t0
+        assert numpy.allclose(loop, out)
+        print '%-8s %12.0f/s %12.0f/s %12.0f/s' % (
+            linker, n_calls / t_loop, n_calls / t_map, n_calls / t_list)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] and int(sys.argv[1]) or 20000)
@@ -0,0 +1,80 @@
+"""
+Effect of the vm.memory_plan flag on a stack of dot + tanh layers, with
+and without the garbage collection of the intermediate results (allow_gc).
+
+For each case, print the time of a call with the CVM, then the number and
+size of the outputs that the ops allocated at each call and the peak
+memory computed by the memory profile (both measured with the Stack VM,
+as the CVM does not support the memory profile).
+
+Usage: python memory_plan.py [N_LAYERS]   (default: 8)
+"""
+import StringIO
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import Mode, ProfileStats
+from theano.gof.vm import VM_Linker
+
+WIDTH = 256
+BATCH = 512
+N_CALLS = 50
+
+
+def build(n_layers):
+    rng = numpy.random.RandomState(0)
+    x = T.matrix('x')
+    h = x
+    for i in range(n_layers):
+        W = theano.shared(rng.uniform(-.1, .1, (WIDTH, WIDTH)).astype(
+            theano.config.floatX))
+        h = T.tanh(T.dot(h, W))
+    data = rng.rand(BATCH, WIDTH).astype(theano.config.floatX)
+    return x, h.sum(), data
+
+
+def main(n_layers):
+    x, cost, data = build(n_layers)
+    print '%-10s %-6s %10s %14s %10s' % ('allow_gc', 'plan', 'time',
+                                         'allocations', 'peak')
+    for allow_gc in (True, False):
+        for plan in (False, True):
+            mode = Mode(linker=VM_Linker(allow_gc=allow_gc, use_cloop=True,
+                                         memory_plan=plan))
+            f = theano.function([x], cost, mode=mode)
+            f(data)
+            t0 = time.time()
+            for i in range(N_CALLS):
+                f(data)
+            t = (time.time() - t0) / N_CALLS
+
+            theano.config.profile = True
+            theano.config.profile_memory = True
+            try:
+                profile = ProfileStats(False)
+                mode = Mode(linker=VM_Linker(allow_gc=allow_gc,
+                                             memory_plan=plan))
+                f = theano.function([x], cost, mode=mode, profile=profile)
+                for i in range(3):
+                    f(data)
+            finally:
+                theano.config.profile = False
+                theano.config.profile_memory = False
+            out = StringIO.StringIO()
+            profile.summary_memory(out)
+            peak = [l for l in out.getvalue().split('\n')
+                    if (allow_gc and 'c|py' in l and 'Max' in l) or
+                    (not allow_gc and 'Max if no gc' in l)][-1]
+            print '%-10s %-6s %8.2fms %6.1f (%4dKB) %10s' % (
+                allow_gc, plan, t * 1000,
+                profile.n_allocations / float(profile.fct_callcount),
+                profile.allocated_bytes / 1024 / profile.fct_callcount,
+                peak.split(':')[-1].strip())
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] and int(sys.argv[1]) or 8)
@@ -0,0 +1,68 @@
+"""
+Time a graph made of independent towers with the sequential linkers and
+with the vm_parallel linker, which runs the ready nodes of the graph on
+several threads.
+
+Each tower is a stack of dot + tanh layers on its own input, and the cost
+sums the outputs of all the towers. The dot and elemwise C code release the
+GIL (config.cmodule.release_gil), so the towers can run at the same time.
+
+Usage: python parallel_vm.py [N_THREADS ...]   (default: 1 2 4 8)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import Mode
+
+N_TOWERS = 8
+N_LAYERS = 4
+WIDTH = 256
+BATCH = 128
+N_CALLS = 50
+
+
+def build():
+    rng = numpy.random.RandomState(0)
+    floatX = theano.config.floatX
+    inputs = []
+    outputs = []
+    for t in range(N_TOWERS):
+        x = T.matrix('x%i' % t)
+        h = x
+        for i in range(N_LAYERS):
+            W = theano.shared(rng.uniform(-.1, .1, (WIDTH, WIDTH)).astype(
+                floatX))
+            h = T.tanh(T.dot(h, W))
+        inputs.append(x)
+        outputs.append(h.sum())
+    data = [rng.rand(BATCH, WIDTH).astype(floatX) for x in inputs]
+    return inputs, T.add(*outputs), data
+
+
+def time_fn(f, data):
+    f(*data)
+    t0 = time.time()
+    for i in range(N_CALLS):
+        f(*data)
+    return (time.time() - t0) / N_CALLS
+
+
+def main(sizes):
+    inputs, cost, data = build()
+    print '%-22s %12s' % ('linker', 'time/call')
+    for linker in ('cvm', 'vm'):
+        f = theano.function(inputs, cost, mode=Mode(linker=linker))
+        print '%-22s %11.2fms' % (linker, time_fn(f, data) * 1000)
+    for n in sizes:
+        theano.config.vm.threads = n
+        f = theano.function(inputs, cost, mode=Mode(linker='vm_parallel'))
+        print '%-22s %11.2fms' % ('vm_parallel (%d)' % n,
+                                  time_fn(f, data) * 1000)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [1, 2, 4, 8])
@@ -0,0 +1,86 @@
+"""
+Read all the minibatches of a dataset stored in an .npy file and compute a
+reduction on each of them, in one pass over the file:
+
+  numpy.load:  load the whole file, then feed each slice to the function
+  memmap:      numpy.load(mmap_mode='c'), then feed each slice
+  load_slice:  tensor.load_slice in the graph, for each mmap_mode, and with
+               the read-ahead of the next minibatch
+
+The file is written once, so the later passes mostly read from the OS
+cache, unless the cache is dropped between them (as root:
+echo 3 > /proc/sys/vm/drop_caches), which is done when --drop-caches is
+given.
+
+Usage: python load_slice.py [--drop-caches] [N_ROWS]   (default: 200000)
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano import Generic, Variable
+
+N_COLS = 512
+BATCH = 1000
+
+
+def drop_caches(enabled):
+    if enabled:
+        os.system('sync')
+        f = open('/proc/sys/vm/drop_caches', 'w')
+        f.write('3\n')
+        f.close()
+
+
+def main(n_rows, drop):
+    path = os.path.join(tempfile.gettempdir(), 'theano_load_slice.npy')
+    data = numpy.lib.format.open_memmap(path, mode='w+', dtype='float32',
+                                        shape=(n_rows, N_COLS))
+    for i in range(0, n_rows, 10000):
+        data[i:i + 10000] = numpy.random.rand(
+            min(10000, n_rows - i), N_COLS)
+    del data
+    n_batches = n_rows // BATCH
+    print 'file: %d MB, %d minibatches of %d rows' % (
+        os.path.getsize(path) // 2 ** 20, n_batches, BATCH)
+
+    x = T.matrix('x', dtype='float32')
+    f = theano.function([x], x.sum(axis=0))
+    for name, mmap_mode in [('numpy.load', None), ('memmap', 'c')]:
+        drop_caches(drop)
+        t0 = time.time()
+        d = numpy.load(path, mmap_mode=mmap_mode)
+        for i in range(n_batches):
+            f(d[i * BATCH:(i + 1) * BATCH])
+        del d
+        print '%-32s %8.3fs' % (name, time.time() - t0)
+
+    p = Variable(Generic())
+    i = T.lscalar('i')
+    for mmap_mode in ('c', None):
+        for read_ahead in (False, True):
+            x = T.load_slice(p, i * BATCH, (i + 1) * BATCH, 'float32',
+                             (False, False), mmap_mode=mmap_mode,
+                             read_ahead=read_ahead)
+            f = theano.function([p, i], x.sum(axis=0))
+            drop_caches(drop)
+            t0 = time.time()
+            for k in range(n_batches):
+                f(path, k)
+            print '%-32s %8.3fs' % (
+                'load_slice(%s%s)' % (mmap_mode,
+                                      read_ahead and ', read_ahead' or ''),
+                time.time() - t0)
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    drop = '--drop-caches' in args
+    args = [a for a in args if a != '--drop-caches']
+    main(args and int(args[0]) or 200000, drop)
@@ -0,0 +1,104 @@
+"""
+Time the inplace elemwise optimizer on graphs of increasing size.
+
+The optimizer makes each Elemwise node inplace in turn and validates the
+graph after each change (tensor.insert_inplace_optimizer_validate_nb=1).
+Validating requires computing the dependencies introduced by the
+destructive operations and checking that they do not contain a cycle. Both
+are updated incrementally by the DestroyHandler, and are compared here with
+computing them again over the whole graph at each validation (the previous
+behavior).
+
+Usage: python destroyhandler_scaling.py [--max-full N] [N_NODES ...]
+
+    N_NODES defaults to 1000 5000 10000 50000. The full check is quadratic,
+    so it is only timed for graphs of at most --max-full nodes (default
+    10000).
+"""
+import optparse
+import random
+import time
+
+import theano
+import theano.tensor as T
+from theano import gof
+from theano.gof import destroyhandler
+from theano.tensor.opt import inplace_elemwise_optimizer
+
+
+class FullCheckDestroyHandler(destroyhandler.DestroyHandler):
+    """DestroyHandler computing the orderings and checking the whole graph
+    for cycles at each validation."""
+
+    def validate(self, fgraph):
+        if self.destroyers:
+            self.stale_droot = True
+            ords = self.orderings(fgraph)
+            if destroyhandler._contains_cycle(fgraph, ords):
+                raise gof.InconsistencyError(
+                    "Dependency graph contains cycles")
+        return True
+
+
+def build_graph(n_nodes, seed=0):
+    """Return the inputs and outputs of a random graph of elemwise
+    operations on vectors. Each node uses recently computed variables, so
+    that many of them are read by several nodes."""
+    rng = random.Random(seed)
+    inputs = [T.vector('x%i' % i) for i in range(10)]
+    variables = list(inputs)
+    unused = set()
+    for i in range(n_nodes):
+        if rng.random() < 0.3:
+            op = rng.choice([T.exp, T.tanh, T.neg])
+            args = [rng.choice(variables[-20:])]
+        else:
+            op = rng.choice([T.add, T.mul, T.sub])
+            args = rng.sample(variables[-20:], 2)
+        out = op(*args)
+        unused.difference_update(args)
+        unused.add(out)
+        variables.append(out)
+    outputs = [v for v in variables if v in unused]
+    return inputs, outputs
+
+
+def time_inplace(inputs, outputs, dh_class):
+    fgraph = gof.FunctionGraph(inputs, outputs)
+    fgraph.attach_feature(dh_class())
+    fgraph.attach_feature(gof.toolbox.ReplaceValidate())
+    n_nodes = len(fgraph.apply_nodes)
+    t0 = time.time()
+    inplace_elemwise_optimizer.optimize(fgraph)
+    elapsed = time.time() - t0
+    n_destroyers = len(fgraph.destroy_handler.destroyers)
+    return n_nodes, n_destroyers, elapsed
+
+
+def main():
+    parser = optparse.OptionParser(
+        usage='%prog [--max-full N] [N_NODES ...]')
+    parser.add_option('--max-full', type='int', default=10000,
+                      help='largest graph on which to time the full check')
+    options, args = parser.parse_args()
+    sizes = [int(a) for a in args] or [1000, 5000, 10000, 50000]
+
+    theano.config.tensor.insert_inplace_optimizer_validate_nb = 1
+    print '%8s %10s %14s %14s' % ('nodes', 'inplace', 'incremental',
+                                  'full check')
+    for n in sizes:
+        inputs, outputs = build_graph(n)
+        n_nodes, n_destroyers, t_inc = time_inplace(
+            inputs, outputs, destroyhandler.DestroyHandler)
+        if n <= options.max_full:
+            n_nodes2, n_destroyers2, t_full = time_inplace(
+                inputs, outputs, FullCheckDestroyHandler)
+            assert n_destroyers2 == n_destroyers
+            full = '%13.2fs' % t_full
+        else:
+            full = '%14s' % 'skipped'
+        print '%8d %10d %13.2fs %s' % (n_nodes, n_destroyers, t_inc, full)
+
+
+if __name__ == '__main__':
+    main()
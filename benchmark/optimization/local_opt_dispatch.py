@@ -0,0 +1,170 @@
+"""
+Time the dispatch of local optimizers to the nodes they can apply to.
+
+Build a large MLP graph and a convolutional network graph (with their
+gradients), and run the canonicalize and specialize passes registered in
+theano/tensor/opt.py on them, in two ways:
+
+ - indexed: the local optimizers are only tried on the nodes whose op they
+   track (through the `tracks()` declared with `@local_optimizer`).
+ - untracked: the optimizers hide their `tracks()`, so each node is offered
+   to every local optimizer, which is what happens for optimizers that do
+   not declare what they track.
+
+The same comparison is done for a single in_to_out TopoOptimizer pass over a
+LocalOptGroup of all the canonicalize local optimizers.
+
+For each run, print the time taken and the number of calls to the
+`transform` methods of the local optimizers.
+
+Usage: python local_opt_dispatch.py [N_LAYERS]   (default: 50)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano import gof
+from theano.compile import optdb
+from theano.gof import FunctionGraph
+from theano.tensor.nnet import conv
+
+
+class Counted(gof.LocalOptimizer):
+    """Wrap a local optimizer to count the calls to its transform method,
+    optionally hiding what it tracks."""
+
+    def __init__(self, lopt, counter, hide_tracks):
+        self.lopt = lopt
+        self.counter = counter
+        self.hide_tracks = hide_tracks
+
+    def tracks(self):
+        if self.hide_tracks:
+            return None
+        return self.lopt.tracks()
+
+    def transform(self, node):
+        self.counter[0] += 1
+        return self.lopt.transform(node)
+
+    def add_requirements(self, fgraph):
+        self.lopt.add_requirements(fgraph)
+
+    def __str__(self):
+        return str(self.lopt)
+
+
+def build_mlp(n_layers, width=100):
+    rng = numpy.random.RandomState(0)
+    x = T.matrix('x')
+    y = T.ivector('y')
+    params = []
+    h = x
+    for i in range(n_layers):
+        W = theano.shared(rng.uniform(size=(width, width)).astype(
+            theano.config.floatX), name='W%i' % i)
+        b = theano.shared(numpy.zeros(width, dtype=theano.config.floatX),
+                          name='b%i' % i)
+        params += [W, b]
+        h = T.tanh(T.dot(h, W) + b)
+    p_y = T.nnet.softmax(h)
+    cost = -T.mean(T.log(p_y)[T.arange(y.shape[0]), y])
+    cost += 1e-4 * sum((p ** 2).sum() for p in params)
+    return [x, y], [cost] + T.grad(cost, params)
+
+
+def build_conv(n_layers, n_filters=8):
+    rng = numpy.random.RandomState(0)
+    x = T.tensor4('x')
+    params = []
+    h = x
+    n_in = 1
+    for i in range(n_layers):
+        W = theano.shared(rng.uniform(size=(n_filters, n_in, 3, 3)).astype(
+            theano.config.floatX), name='W%i' % i)
+        b = theano.shared(numpy.zeros(n_filters, dtype=theano.config.floatX),
+                          name='b%i' % i)
+        params += [W, b]
+        h = T.nnet.sigmoid(conv.conv2d(h, W, border_mode='full') +
+                           b.dimshuffle('x', 0, 'x', 'x'))
+        n_in = n_filters
+    cost = T.sqr(h).mean()
+    return [x], [cost] + T.grad(cost, params)
+
+
+def prepare(inputs, outputs):
+    # The shared variables are inputs of the graph too.
+    inputs = inputs + [v for v in gof.graph.inputs(outputs)
+                       if v not in inputs and not isinstance(v, gof.Constant)]
+    fgraph = FunctionGraph(inputs, outputs)
+    fgraph.attach_feature(gof.toolbox.PreserveNames())
+    optdb['ShapeOpt'].optimize(fgraph)
+    optdb['merge1'].optimize(fgraph)
+    return fgraph
+
+
+def equilibrium(name, counter, hide_tracks):
+    eq = optdb[name].query('+fast_run')
+    opts = [Counted(o, counter, hide_tracks)
+            for o in eq.get_local_optimizers()]
+    return gof.EquilibriumOptimizer(
+        opts + eq.global_optimizers,
+        max_use_ratio=eq.max_use_ratio,
+        failure_callback=gof.NavigatorOptimizer.warn_inplace)
+
+
+def topo_group(counter, hide_tracks):
+    eq = optdb['canonicalize'].query('+fast_run')
+    opts = [Counted(o, counter, hide_tracks)
+            for o in eq.get_local_optimizers()]
+    return gof.TopoOptimizer(
+        gof.LocalOptGroup(*opts),
+        failure_callback=gof.NavigatorOptimizer.warn_inplace)
+
+
+def run(inputs, outputs):
+    # Warm up: the first optimization of a graph compiles and loads the C
+    # code needed for constant folding.
+    fgraph = prepare(inputs, outputs)
+    for name in ('canonicalize', 'specialize'):
+        equilibrium(name, [0], False).optimize(fgraph)
+
+    for hide_tracks in (False, True):
+        label = hide_tracks and 'untracked' or 'indexed'
+        fgraph = prepare(inputs, outputs)
+        print '  %-9s %6d nodes' % (label, len(fgraph.apply_nodes)),
+        for name in ('canonicalize', 'specialize'):
+            counter = [0]
+            opt = equilibrium(name, counter, hide_tracks)
+            t0 = time.time()
+            opt.optimize(fgraph)
+            print '| %s %7.3fs %8d calls' % (name, time.time() - t0,
+                                             counter[0]),
+        print
+
+    for hide_tracks in (False, True):
+        label = hide_tracks and 'untracked' or 'indexed'
+        fgraph = prepare(inputs, outputs)
+        counter = [0]
+        opt = topo_group(counter, hide_tracks)
+        t0 = time.time()
+        opt.optimize(fgraph)
+        print '  %-9s TopoOptimizer(LocalOptGroup) %7.3fs %8d calls' % (
+            label, time.time() - t0, counter[0])
+
+
+def main(n_layers):
+    print 'MLP, %d layers' % n_layers
+    run(*build_mlp(n_layers))
+    print 'Convolutional network, %d layers' % (n_layers // 5)
+    run(*build_conv(max(1, n_layers // 5)))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main(50)
@@ -0,0 +1,90 @@
+"""
+Time of associative scans over N_STEPS steps, computed:
+
+  sequential: the loop over the steps (the scan_associative optimization
+              excluded)
+  prefix:     by the scan_associative optimization. A cumulative sum is
+              computed by cumsum, the others by a parallel prefix: a scan
+              over the log2(N_STEPS) positions of blocks of that size, then
+              two scans over the levels of a tree of the totals of the
+              blocks. Each step combines all the pairs of its position or
+              level at once.
+  cumsum:     tensor.extra_ops.cumsum, for the cumulative sum only
+
+for three step functions on vectors of UNITS units:
+
+  sum:        h_t = h_tm1 + x_t
+  max:        h_t = maximum(h_tm1, x_t)
+  linear:     h_t = a_t * h_tm1 + b_t (elementwise), on the pairs (a, b)
+
+The prefix does about twice the work of the loop, in far fewer steps whose
+ops work on whole blocks or levels (in parallel for the elemwise ones if
+config.openmp is set).
+
+Usage: python associative.py [N_STEPS [UNITS]]   (default: 100000 16)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.tensor.extra_ops import cumsum
+
+
+def build(kind, units):
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+    if kind == 'sum':
+        hs, _ = theano.scan(lambda x_t, h_tm1: h_tm1 + x_t, sequences=x,
+                            outputs_info=h0, associative=True)
+        return [x, h0], hs
+    if kind == 'max':
+        hs, _ = theano.scan(lambda x_t, h_tm1: T.maximum(h_tm1, x_t),
+                            sequences=x, outputs_info=h0, associative=True)
+        return [x, h0], hs
+    a = T.matrix('a')
+    [_, hs], _ = theano.scan(lambda a_t, b_t, a_tm1, b_tm1:
+                                 [a_t * a_tm1, a_t * b_tm1 + b_t],
+                             sequences=[a, x],
+                             outputs_info=[T.ones_like(h0), h0],
+                             associative=True)
+    return [a, x, h0], hs
+
+
+def best_time(f, values):
+    times = []
+    for i in range(3):
+        t0 = time.time()
+        f(*values)
+        times.append(time.time() - t0)
+    return min(times)
+
+
+def main(n_steps, units):
+    rng = numpy.random.RandomState(0)
+    sequential = theano.compile.get_default_mode().excluding(
+        'scan_associative')
+    print '%-8s %12s %12s %12s' % ('', 'sequential', 'prefix', 'cumsum')
+    for kind in ('sum', 'max', 'linear'):
+        inputs, hs = build(kind, units)
+        values = [rng.uniform(.5, 1., (n_steps, units))
+                  for x in inputs[:-1]] + [rng.rand(units)]
+        f_sequential = theano.function(inputs, hs, mode=sequential)
+        f_prefix = theano.function(inputs, hs)
+        assert numpy.allclose(f_sequential(*values), f_prefix(*values))
+        times = [best_time(f_sequential, values),
+                 best_time(f_prefix, values)]
+        if kind == 'sum':
+            f_cumsum = theano.function(inputs,
+                                       cumsum(inputs[0], axis=0) + inputs[1])
+            times.append(best_time(f_cumsum, values))
+            print '%-8s %11.4fs %11.4fs %11.4fs' % tuple([kind] + times)
+        else:
+            print '%-8s %11.4fs %11.4fs %12s' % tuple([kind] + times + [''])
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:]] + [100000, 16][len(sys.argv[1:]):]
+    main(*args)
@@ -0,0 +1,68 @@
+"""
+Time to run an RNN, h_t = tanh(dot(x_t, W) + dot(h_tm1, U)), over a set of
+sequences of different lengths (between N_STEPS / 2 and N_STEPS steps):
+
+  loop:       one call of the compiled scan per sequence
+  vectorized: one call for all the sequences, with the graph given by
+              theano.scan_module.vectorize. The sequences are padded to
+              N_STEPS steps and a mask keeps the last state of the short
+              ones. The dots of the inner function are done on the whole
+              batch (Gemm instead of Gemv).
+
+Usage: python batched.py [N_SEQUENCES [N_STEPS [UNITS]]]
+       (default: 1000 50 64)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.scan_module import vectorize
+
+
+def build(units):
+    rng = numpy.random.RandomState(0)
+    W = theano.shared(rng.uniform(-.1, .1, (units, units)))
+    U = theano.shared(rng.uniform(-.1, .1, (units, units)))
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+    hs, _ = theano.scan(lambda x_t, h_tm1: T.tanh(T.dot(x_t, W) +
+                                                  T.dot(h_tm1, U)),
+                        sequences=x, outputs_info=h0)
+    return x, h0, hs[-1]
+
+
+def main(n_sequences, n_steps, units):
+    rng = numpy.random.RandomState(1)
+    lengths = rng.randint(n_steps // 2, n_steps + 1, n_sequences)
+    xv = rng.rand(n_sequences, n_steps, units)
+    hv = numpy.zeros(units)
+    mv = numpy.asarray([[t < l for t in range(n_steps)] for l in lengths],
+                       dtype=theano.config.floatX)
+
+    x, h0, last = build(units)
+    f = theano.function([x, h0], last)
+    X = T.tensor3('X')
+    M = T.matrix('M')
+    g = theano.function([X, h0, M], vectorize(last, {x: X}, mask=M))
+
+    t0 = time.time()
+    expected = [f(xv[i, :l], hv) for i, l in enumerate(lengths)]
+    t_loop = time.time() - t0
+    t0 = time.time()
+    out = g(xv, hv, mv)
+    t_vectorized = time.time() - t0
+    assert numpy.allclose(out, expected)
+
+    print '%d sequences of %d to %d steps, %d units' % (
+        n_sequences, n_steps // 2, n_steps, units)
+    print '  loop:       %8.3fs' % t_loop
+    print '  vectorized: %8.3fs  (x%.1f)' % (t_vectorized,
+                                             t_loop / t_vectorized)
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:]] + [1000, 50, 64][len(sys.argv[1:]):]
+    main(*args)
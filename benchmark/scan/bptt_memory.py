@@ -0,0 +1,82 @@
+"""
+Peak memory of the gradient of a simple RNN, h_t = tanh(x_t + dot(h_tm1,
+W)), with respect to W and h0, for the cost sum(h_T), depending on the
+number of steps T, with:
+
+  full:          the backward scan reads the states of all the steps
+  truncated:     truncate_gradient=TRUNCATE, only the states of the last
+                 TRUNCATE steps are kept
+  checkpointed:  checkpoint_gradient=sqrt(T), the states are kept every
+                 sqrt(T) steps and the others are computed again, segment
+                 by segment, by the backward scan
+
+The peak memory is the growth of the maximum resident set size of the
+process during the call of the compiled function. Each case runs in its
+own process, so that they do not share their peaks.
+
+Usage: python bptt_memory.py [UNITS]   (default: 256)
+"""
+import resource
+import subprocess
+import sys
+import time
+
+import numpy
+
+STEPS = (1000, 4000, 16000, 64000)
+MODES = ('full', 'truncated', 'checkpointed')
+TRUNCATE = 100
+
+
+def peak_rss():
+    # In KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024.
+
+
+def run(mode, n_steps, units):
+    import theano
+    import theano.tensor as T
+    rng = numpy.random.RandomState(0)
+    W = theano.shared(rng.uniform(-.1, .1, (units, units)))
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+    kwargs = {}
+    if mode == 'truncated':
+        kwargs['truncate_gradient'] = TRUNCATE
+    elif mode == 'checkpointed':
+        kwargs['checkpoint_gradient'] = int(numpy.sqrt(n_steps))
+    hs, _ = theano.scan(lambda x_t, h_tm1: T.tanh(x_t + T.dot(h_tm1, W)),
+                        sequences=x, outputs_info=h0, **kwargs)
+    f = theano.function([x, h0], T.grad(hs[-1].sum(), [W, h0]))
+    # The inner functions of the scans are compiled by the first call
+    f(rng.rand(2, units), rng.rand(units))
+    x_value = rng.rand(n_steps, units)
+    h0_value = rng.rand(units)
+    before = peak_rss()
+    t0 = time.time()
+    f(x_value, h0_value)
+    t = time.time() - t0
+    return peak_rss() - before, t
+
+
+def main(units):
+    print '%8s %s' % ('steps', ''.join(['%24s' % m for m in MODES]))
+    for n_steps in STEPS:
+        line = '%8d' % n_steps
+        for mode in MODES:
+            out = subprocess.Popen(
+                [sys.executable, __file__, '--run', mode, str(n_steps),
+                 str(units)], stdout=subprocess.PIPE).communicate()[0]
+            peak, t = [float(v) for v in out.split()]
+            line += '%14.1fMB %7.2fs' % (peak / 2 ** 20, t)
+        print line
+    print '(the states of all the steps take %.1fMB per 1000 steps)' % (
+        1000 * units * 8. / 2 ** 20)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--run']:
+        print '%f %f' % run(sys.argv[2], int(sys.argv[3]),
+                            int(sys.argv[4]))
+    else:
+        main(sys.argv[1:] and int(sys.argv[1]) or 256)
@@ -0,0 +1,107 @@
+"""
+Time per step and memory of the output buffers of scans over long
+sequences (default: 10^5 steps), with 64 units:
+
+  leaky:      h_t = .9 * h_tm1 + x_t, the ops write the states directly in
+              the buffer of scan
+  rnn:        h_t = tanh(x_t + dot(h_tm1, W)), the states are computed in
+              place of the result of dot, then copied in the buffer
+
+for the two kinds of buffers:
+
+  all:        all the states are returned, the buffer has one slot per step
+              and the ops can write each state directly in its slot
+  last:       only the last state is returned, ScanSaveMem makes the buffer
+              a ring buffer of the slots read by the taps. The state is
+              written in the slot read by its oldest tap, so it is computed
+              out of the buffer and copied in it.
+
+and the two loops: the default one (scan_perform) and the fused one
+(config.scan.fused). The memory is the size of the outputs of the scan,
+given by a callback of the VM.
+
+Usage: python long_sequences.py [N_STEPS]   (default: 100000)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import Mode
+from theano.gof.vm import VM_Linker
+from theano.scan_module.scan_op import Scan
+
+UNITS = 64
+
+
+def leaky(x_t, h_tm1):
+    return .9 * h_tm1 + x_t
+
+
+def rnn(x_t, h_tm1, W):
+    return T.tanh(x_t + T.dot(h_tm1, W))
+
+
+def build(step, keep):
+    rng = numpy.random.RandomState(0)
+    W = theano.shared(rng.uniform(-.1, .1, (UNITS, UNITS)))
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+    non_sequences = []
+    if step is rnn:
+        non_sequences = [W]
+    hs, _ = theano.scan(step, sequences=x, outputs_info=h0,
+                        non_sequences=non_sequences)
+    if keep == 'last':
+        hs = hs[-1]
+    return [x, h0], hs
+
+
+def buffer_size(inputs, output, values):
+    sizes = []
+
+    def callback(node, thunk, storage_map, compute_map):
+        if isinstance(node.op, Scan):
+            sizes.extend([storage_map[var][0].nbytes
+                          for var in node.outputs])
+    f = theano.function(inputs, output,
+                        mode=Mode(linker=VM_Linker(callback=callback)))
+    f(*values)
+    return sum(sizes)
+
+
+def time_per_step(inputs, output, values, fused):
+    fused_flag = theano.config.scan.fused
+    theano.config.scan.fused = fused
+    try:
+        f = theano.function(inputs, output)
+    finally:
+        theano.config.scan.fused = fused_flag
+    times = []
+    for i in range(3):
+        t0 = time.time()
+        f(*values)
+        times.append(time.time() - t0)
+    return min(times) / len(values[0])
+
+
+def main(n_steps):
+    rng = numpy.random.RandomState(1)
+    values = [rng.rand(n_steps, UNITS), rng.rand(UNITS)]
+    print '%-6s %-5s %12s %16s %16s' % ('', '', 'buffers', 'default',
+                                        'fused')
+    for step in (leaky, rnn):
+        for keep in ('all', 'last'):
+            inputs, output = build(step, keep)
+            size = buffer_size(inputs, output, values)
+            default = time_per_step(inputs, output, values, False)
+            fused = time_per_step(inputs, output, values, True)
+            print '%-6s %-5s %10.1fKB %12.2fus/step %12.2fus/step' % (
+                step.__name__, keep, size / 1024., default * 1e6,
+                fused * 1e6)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] and int(sys.argv[1]) or 100000)
@@ -0,0 +1,63 @@
+"""
+Steps per second of a simple RNN, h_t = tanh(x_t + dot(h_tm1, W)), done
+by scan for 1000 steps, with the inner function:
+
+  default:    compiled as a Theano function, called by the Cython loop
+              of scan_perform once per step
+  fused:      config.scan.fused=True, compiled by the CLinker into one C
+              thunk, called by the C loop of scan_fused
+
+Usage: python rnn_fused.py [N_STEPS]   (default: 1000)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+
+HIDDEN_SIZES = (32, 64, 128, 256, 512, 1024)
+
+
+def build(hidden, fused):
+    rng = numpy.random.RandomState(0)
+    W = theano.shared(rng.uniform(-.1, .1, (hidden, hidden)))
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+    hs, _ = theano.scan(lambda x_t, h_tm1: T.tanh(x_t + T.dot(h_tm1, W)),
+                        sequences=x, outputs_info=h0)
+    fused_flag = theano.config.scan.fused
+    theano.config.scan.fused = fused
+    try:
+        f = theano.function([x, h0], hs[-1])
+        # The inner function is compiled by the first call
+        f(numpy.zeros((1, hidden)), numpy.zeros(hidden))
+    finally:
+        theano.config.scan.fused = fused_flag
+    return f
+
+
+def steps_per_second(f, hidden, n_steps):
+    rng = numpy.random.RandomState(1)
+    x = rng.rand(n_steps, hidden)
+    h0 = rng.rand(hidden)
+    times = []
+    for i in range(5):
+        t0 = time.time()
+        f(x, h0)
+        times.append(time.time() - t0)
+    return n_steps / min(times)
+
+
+def main(n_steps):
+    print '%8s %14s %14s %8s' % ('hidden', 'default', 'fused', 'speedup')
+    for hidden in HIDDEN_SIZES:
+        default = steps_per_second(build(hidden, False), hidden, n_steps)
+        fused = steps_per_second(build(hidden, True), hidden, n_steps)
+        print '%8d %12.0f/s %12.0f/s %7.2fx' % (hidden, default, fused,
+                                                fused / default)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] and int(sys.argv[1]) or 1000)
@@ -0,0 +1,116 @@
+"""
+Peak memory of the intermediate results of a conv model and of a scan
+model, with the default order of the nodes (FunctionGraph.toposort) and
+with gof.sched.memory_schedule_fn, which orders them greedily to reduce
+the memory in use.
+
+Both models have independent branches, whose big intermediate results
+are reduced:
+
+  conv:  4 branches of conv2d + tanh on a minibatch of images, each
+         summed over the feature maps, with the shapes given to conv2d
+  scan:  4 recurrent nets (scan) on sequences of different lengths (so
+         the scans are not merged), each averaged over time, whose shapes
+         are only known at run time
+
+For each order, print the peak estimated from the static shapes (the
+unknown dimensions count as 100) and the peak computed from the shapes
+measured by the memory profiler, both freeing the results after their
+last use (allow_gc), with the time of a call.
+
+Usage: python peak_memory.py
+"""
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import Mode, ProfileStats
+from theano.gof.sched import memory_schedule_fn, peak_memory
+from theano.gof.vm import VM_Linker
+from theano.tensor.nnet import conv
+
+floatX = theano.config.floatX
+
+
+def conv_model():
+    rng = numpy.random.RandomState(0)
+    image_shape = (32, 3, 32, 32)
+    x = T.tensor4('x')
+    cost = 0
+    for i in range(4):
+        filter_shape = (16, 3, 3 + 2 * (i % 2), 3 + 2 * (i % 2))
+        W = theano.shared(rng.uniform(-.1, .1, filter_shape).astype(floatX))
+        h = T.tanh(conv.conv2d(x, W, image_shape=image_shape,
+                               filter_shape=filter_shape))
+        cost = cost + h.sum(axis=[2, 3]).mean()
+    return [x], cost, [rng.rand(*image_shape).astype(floatX)]
+
+
+def scan_model():
+    rng = numpy.random.RandomState(0)
+    n_steps, batch, n_in, n_hid = 50, 64, 32, 128
+    x = T.tensor3('x')
+    cost = 0
+    for i in range(4):
+        W_in = theano.shared(rng.uniform(-.1, .1, (n_in, n_hid)).astype(
+            floatX))
+        W = theano.shared(rng.uniform(-.1, .1, (n_hid, n_hid)).astype(
+            floatX))
+        h, _ = theano.scan(lambda x_t, h_tm1: T.tanh(T.dot(x_t, W_in) +
+                                                     T.dot(h_tm1, W)),
+                           sequences=x[:n_steps - 5 * i],
+                           outputs_info=T.zeros((x.shape[1], n_hid)))
+        cost = cost + (h * (i + 1)).mean(axis=0).sum()
+    return [x], cost, [rng.rand(n_steps, batch, n_in).astype(floatX)]
+
+
+def measured_size(profile):
+    def size_of(var):
+        shape = profile.variable_shape.get(var)
+        if shape is None or not hasattr(var.type, 'get_size'):
+            return 0
+        return var.type.get_size(shape)
+    return size_of
+
+
+def main():
+    print '%-6s %-10s %12s %12s %10s' % ('model', 'schedule', 'estimated',
+                                         'measured', 'time')
+    for name, model in [('conv', conv_model), ('scan', scan_model)]:
+        inputs, cost, data = model()
+        for sched_name, schedule in [('toposort', None),
+                                     ('memory', memory_schedule_fn())]:
+            mode = Mode(linker=VM_Linker(allow_gc=True, use_cloop=True,
+                                         schedule=schedule))
+            f = theano.function(inputs, cost, mode=mode)
+            f(*data)
+            t0 = time.time()
+            for i in range(5):
+                f(*data)
+            t = (time.time() - t0) / 5
+            fgraph = f.maker.fgraph
+            estimated = peak_memory(fgraph, f.fn.nodes)
+
+            theano.config.profile = True
+            theano.config.profile_memory = True
+            try:
+                profile = ProfileStats(False)
+                mode = Mode(linker=VM_Linker(allow_gc=True,
+                                             schedule=schedule))
+                f = theano.function(inputs, cost, mode=mode,
+                                    profile=profile)
+                f(*data)
+            finally:
+                theano.config.profile = False
+                theano.config.profile_memory = False
+            measured = peak_memory(f.maker.fgraph, f.fn.nodes,
+                                   size_of=measured_size(profile))
+            print '%-6s %-10s %10dKB %10dKB %8.1fms' % (
+                name, sched_name, estimated // 1024, measured // 1024,
+                t * 1000)
+
+
+if __name__ == '__main__':
+    main()
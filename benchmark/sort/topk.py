@@ -0,0 +1,62 @@
+"""
+Time the C implementations of sort, argsort and topk against NumPy, on a
+batch of rows sorted along the last axis.
+
+numpy.sort and numpy.argsort are compared to theano.tensor.sort and
+argsort, and the top k values and indices of each row are computed with
+numpy.argpartition (followed by a sort of the k selected values, to get the
+same result) and with theano.tensor.topk.
+
+Usage: python topk.py [K ...]   (default: 1 10 100 1000)
+"""
+import sys
+import time
+
+import numpy
+
+import theano
+import theano.tensor as T
+
+BATCH = 256
+LENGTH = 10000
+N_CALLS = 20
+
+
+def time_fn(f, *args):
+    f(*args)
+    t0 = time.time()
+    for i in range(N_CALLS):
+        f(*args)
+    return (time.time() - t0) / N_CALLS
+
+
+def numpy_topk(x, k):
+    part = numpy.argpartition(-x, k - 1, axis=-1)[:, :k]
+    rows = numpy.arange(x.shape[0])[:, None]
+    order = numpy.argsort(-x[rows, part], axis=-1)
+    idx = part[rows, order]
+    return x[rows, idx], idx
+
+
+def main(ks):
+    floatX = theano.config.floatX
+    data = numpy.random.RandomState(0).rand(BATCH, LENGTH).astype(floatX)
+    x = T.matrix('x')
+    k = T.lscalar('k')
+    print '%-20s %12s %12s' % ('op', 'numpy', 'theano')
+    f = theano.function([x], T.sort(x))
+    print '%-20s %10.2fms %10.2fms' % (
+        'sort', time_fn(numpy.sort, data) * 1000, time_fn(f, data) * 1000)
+    f = theano.function([x], T.argsort(x))
+    print '%-20s %10.2fms %10.2fms' % (
+        'argsort', time_fn(numpy.argsort, data) * 1000,
+        time_fn(f, data) * 1000)
+    f = theano.function([x, k], T.topk(x, k))
+    for kk in ks:
+        print '%-20s %10.2fms %10.2fms' % (
+            'topk (k=%d)' % kk, time_fn(numpy_topk, data, kk) * 1000,
+            time_fn(f, data, kk) * 1000)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [1, 10, 100, 1000])
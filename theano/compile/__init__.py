@@ -8,6 +8,8 @@ from theano.compile.function_module import *
 
 from theano.compile.mode import *
 
+from theano.compile.remat import checkpoint, Rematerialize
+
 from theano.compile.io import *
 
 from theano.compile.module import *
@@ -6,7 +6,9 @@ __docformat__ = "restructuredtext en"
 import copy
 import copy_reg
 import cPickle
-import itertools
+import Queue
+import sys
+import threading
 import time
 import warnings
 
@@ -18,6 +20,7 @@ from theano.gof.python25 import partial
 import theano.compile.mode
 from theano.compile.io import In, SymbolicInput, SymbolicInputKit, SymbolicOutput
 from theano.compile.ops import deep_copy_op, view_op
+from theano.compile import graph_cache
 
 import logging
 _logger = logging.getLogger('theano.compile.function_module')
@@ -155,6 +158,34 @@ def std_fgraph(input_specs, output_specs, accept_inplace = False):
 
 std_fgraph.features = [gof.toolbox.PreserveNames]
 
+
+def fgraph_from_optimized(input_specs, inputs, outputs):
+    """
+    Makes a FunctionGraph from an already optimized graph, such as one
+    loaded from the optimized graph cache.
+
+    This attaches the same features as `std_fgraph`, but it does not clone
+    the graph and it accepts the inplace operations introduced by the
+    optimizer.
+    """
+    fgraph = gof.fg.FunctionGraph(inputs, outputs, clone=False)
+
+    for node in fgraph.apply_nodes:
+        if getattr(node.op, 'destroy_map', None):
+            fgraph.attach_feature(gof.DestroyHandler())
+            break
+
+    fgraph.attach_feature(
+            Supervisor(input
+                for spec, input in zip(input_specs, fgraph.inputs)
+                if not (spec.mutable or
+                        (hasattr(fgraph, 'destroyers') and
+                            fgraph.destroyers(input)))))
+
+    for feature in std_fgraph.features:
+        fgraph.attach_feature(feature())
+    return fgraph
+
 class AliasedMemoryError(Exception):
     """Memory is aliased that should not be"""
     pass
@@ -195,7 +226,8 @@ class Function(object):
     better error message. In some case, python code will still return
     the good results if you pass a python or numpy scalar instead of a
     numpy tensor.  C code should raise an error if you pass an object
-    of the wrong type.
+    of the wrong type. With the CVM linker, a call with only positional
+    arguments and no profiling is then done in C by the VM.
 
     """
 
@@ -442,6 +474,37 @@ class Function(object):
             if input.update is not None:
                 self.n_returned_outputs -= 1
 
+        # When trust_input is True, the CVM can do the whole call in C (see
+        # CLazyLinker.fast_call), if each input has its own container.
+        self._fast_call = None
+        if (hasattr(self.fn, 'set_fast_call') and
+                not self.fn.need_update_inputs and
+                not [i for i in self.indices if i[1] is not None]):
+            # The implicit inputs (e.g. shared variables) come last, and
+            # cannot be given.
+            explicit = []
+            for c in self.input_storage:
+                if c.implicit:
+                    break
+                explicit.append(c.storage)
+            refeed = [c for c, (required, refeed, value)
+                      in zip(self.input_storage, self.defaults) if refeed]
+            clear = [c.storage for c in self.input_storage if c.required]
+            if getattr(self.fn, 'allow_gc', False):
+                # Like __call__, do not keep the computed outputs.
+                clear += [c.storage for c, o in zip(self.output_storage,
+                                                    self.maker.fgraph.outputs)
+                          if o.owner is not None]
+            self.fn.set_fast_call(
+                explicit,
+                clear,
+                [c.storage for c in refeed],
+                [c.storage[0] for c in refeed],
+                self.n_returned_outputs,
+                bool(self.unpack_single),
+                bool(self.return_none))
+            self._fast_call = self.fn.fast_call
+
     def __contains__(self, item):
         return self.value.__contains__(item)
 
@@ -452,19 +515,130 @@ class Function(object):
         self.value[item] = value
 
     def __copy__(self):
+        return self.copy()
+
+    def copy(self, share_shared=False):
+        """
+        Return a copy of this function.
+
+        The copy has its own input and output containers and its own storage
+        for intermediate results, so it can be called while this function
+        is running in another thread. The graph, the maker and the compiled
+        C modules are shared.
+
+        :param share_shared: if True, the inputs whose value comes from a
+            Container (e.g. shared variables) use the same storage in the
+            copy as in this function, so the updates done by either one
+            are seen by both. If False, their current value is copied.
+        """
         defaults = [default for _1, _2, default in self.defaults]
+        if share_shared:
+            for i, (input, _1, _2) in enumerate(self.indices):
+                if isinstance(getattr(input, 'value', None), gof.Container):
+                    defaults[i] = input.value
         cpy = self.maker.create(defaults, trustme=True)
         for (input, _1, _2), here, there in zip(self.indices,
                                                 self.input_storage,
                                                 cpy.input_storage):
+            if there.storage is here.storage:
+                continue
             if input.mutable and here is not None:
                 there.data = copy.copy(here.data)
             else:
                 there.data = here.data
+        cpy.trust_input = self.trust_input
+        cpy.name = self.name
         return cpy
 
+    def _filter_input(self, i, arg):
+        """Return the value `arg` of the i-th input filtered by its type."""
+        s = self.input_storage[i]
+        # see this emails for a discuation about None as input
+        # https://groups.google.com/group/theano-dev/browse_thread/thread/920a5e904e8a8525/4f1b311a28fc27e5
+        if arg is None:
+            return arg
+        try:
+            return s.type.filter(arg, strict=s.strict,
+                                 allow_downcast=s.allow_downcast)
+        except Exception, e:
+            function_name = "theano function"
+            if self.name:
+                function_name += ' with name "' + self.name + '" '
+            e.args = tuple(["Bad input argument to " + function_name +
+                            " at index %d(0-based)" % i] + list(e.args))
+            raise
+
+    def _check_provided(self, provided):
+        """
+        Raise a TypeError if an input is missing, was given more than once
+        or is implicit and was given. `provided` is the number of times
+        each input was given.
+        """
+        for c, n in zip(self.input_storage, provided):
+            if c.required and not n:
+                raise TypeError("Missing required input: %s" %
+                                getattr(self.inv_finder[c], 'variable',
+                                        self.inv_finder[c]))
+            if n > 1:
+                raise TypeError("Multiple values for input: %s" %
+                                getattr(self.inv_finder[c], 'variable',
+                                        self.inv_finder[c]))
+            if c.implicit and n > 0:
+                raise TypeError(
+                    'Tried to provide value for implicit input: %s'
+                    % getattr(self.inv_finder[c], 'variable',
+                              self.inv_finder[c]))
+
+    def _copy_aliased_inputs(self, values):
+        """
+        Replace in the list `values` of the values of the first inputs the
+        ones that share memory with a previous one by a copy, when one of
+        them is mutable or borrowed, so that an op that destroys one of
+        them does not change the other.
+        """
+        if not getattr(self, '_check_for_aliased_inputs', True):
+            return
+        inputs = self.maker.inputs
+        for i in xrange(len(values)):
+            i_type = inputs[i].variable.type
+            if not hasattr(i_type, 'may_share_memory'):
+                continue
+            for j in xrange(i):
+                if (inputs[j].variable.type is i_type and
+                        (inputs[i].mutable or inputs[i].borrow or
+                         inputs[j].mutable or inputs[j].borrow) and
+                        i_type.may_share_memory(values[j], values[i])):
+                    values[i] = copy.copy(values[i])
+                    break
+
+    def _call_trusted(self, args):
+        """
+        Call the function on the positional arguments `args`, without
+        checking them, like `__call__` does when trust_input is True.
+        """
+        if self._fast_call is not None and not self.profile:
+            t0 = time.time()
+            try:
+                outputs = self._fast_call(*args)
+            except Exception:
+                if self.fn.position_of_error == -1:
+                    raise
+                self._reraise_fn_error()
+            dt_call = time.time() - t0
+            self.maker.mode.fn_time += dt_call
+            self.maker.mode.call_time += dt_call
+            return outputs
+        t0 = time.time()
+        i = 0
+        for arg in args:
+            self.input_storage[i].storage[0] = arg
+            i += 1
+        return self._run(t0)
+
     def __call__(self, *args, **kwargs):
-        profile = self.profile
+        if self.trust_input and not kwargs:
+            return self._call_trusted(args)
+
         t0 = time.time()
 
         # Reinitialize each container's 'provided' counter
@@ -484,29 +658,8 @@ class Function(object):
             # Set positional arguments
             i = 0
             for arg in args:
-                #TODO: provide a Param option for skipping the filter if we
-                #      really want speed.
                 s = self.input_storage[i]
-                # see this emails for a discuation about None as input
-                # https://groups.google.com/group/theano-dev/browse_thread/thread/920a5e904e8a8525/4f1b311a28fc27e5
-                if arg is None:
-                    s.storage[0] = arg
-                else:
-                    try:
-                        s.storage[0] = s.type.filter(arg, strict=s.strict,
-                                allow_downcast=s.allow_downcast)
-
-                    except Exception, e:
-                        function_name = "theano function"
-                        if self.name:
-                            function_name += ' with name "' + self.name + '" '
-                        #end if
-                        e.args = tuple(["Bad input argument to " + function_name +
-                                        " at index %d(0-based)" % i] +
-                                       list(e.args))
-                        raise
-                    #end except
-                #end if
+                s.storage[0] = self._filter_input(i, arg)
                 s.provided += 1
                 i += 1
 
@@ -515,85 +668,32 @@ class Function(object):
             for k, arg in kwargs.iteritems():
                 self[k] = arg
 
-        if not self.trust_input and (
-            not hasattr(self, '_check_for_aliased_inputs') or
-            self._check_for_aliased_inputs):
-            ## Collect aliased inputs among the storage space
-            args_share_memory = []
-            for i in xrange(len(self.input_storage)):
-                i_var = self.maker.inputs[i].variable
-                i_val = self.input_storage[i].storage[0]
-                if hasattr(i_var.type, 'may_share_memory'):
-                    is_aliased = False
-                    for j in xrange(len(args_share_memory)):
-
-                        group_j = itertools.izip(
-                            [self.maker.inputs[k].variable for k
-                             in args_share_memory[j]],
-                            [self.input_storage[k].storage[0] for k
-                             in args_share_memory[j]])
-                        if numpy.any([(var.type is i_var.type and
-                                        var.type.may_share_memory(val,i_val))
-                                       for (var,val) in group_j]):
-
-                            is_aliased = True
-                            args_share_memory[j].append(i)
-                            break
-
-                    if not is_aliased:
-                        args_share_memory.append([i])
-
-                # Check for groups of more than one argument that share memory
-                for group in args_share_memory:
-                    if len(group) > 1:
-                        # see if any of these arguments are mutable
-                        mutable = numpy.any([(self.maker.inputs[idx].mutable or
-                                             self.maker.inputs[idx].borrow)
-                                             for idx in group])
-                        # copy all but the first
-                        for idx in group[1:]:
-                            self.input_storage[i].storage[0] = copy.copy(
-                                self.input_storage[i].storage[0])
-
-        # Check if inputs are missing, or if inputs were set more than once, or
-        # if we tried to provide inputs that are supposed to be implicit.
         if not self.trust_input:
-            for c in self.input_storage:
-                if c.required and not c.provided:
-                    raise TypeError("Missing required input: %s" %
-                                    getattr(self.inv_finder[c], 'variable',
-                                            self.inv_finder[c]))
-                if c.provided > 1:
-                    raise TypeError("Multiple values for input: %s" %
-                                    getattr(self.inv_finder[c], 'variable',
-                                            self.inv_finder[c]))
-                if c.implicit and c.provided > 0:
-                    raise TypeError(
-                        'Tried to provide value for implicit input: %s'
-                        % getattr(self.inv_finder[c], 'variable',
-                                  self.inv_finder[c]))
+            values = [c.storage[0] for c in self.input_storage]
+            self._copy_aliased_inputs(values)
+            for c, value in zip(self.input_storage, values):
+                if c.storage[0] is not value:
+                    c.storage[0] = value
+
+            # Check if inputs are missing, or if inputs were set more than
+            # once, or if we tried to provide inputs that are supposed to be
+            # implicit.
+            self._check_provided([c.provided for c in self.input_storage])
 
+        return self._run(t0)
+
+    def _run(self, t0):
+        """
+        Run the function on the values in its input storage, and return
+        its outputs. `t0` is the time at which the call started.
+        """
+        profile = self.profile
         # Do the actual work
         t0_fn = time.time()
         try:
             outputs = self.fn()
         except Exception:
-            if hasattr(self.fn, 'position_of_error'):
-                # this is a new vm-provided function or c linker
-                # they need this because the exception manipulation
-                # done by raise_with_op is not implemented in C.
-                if hasattr(self.fn, 'thunks'):
-                    # For the CVM
-                    gof.vm.raise_with_op(self.fn.nodes[self.fn.position_of_error],
-                                         self.fn.thunks[self.fn.position_of_error])
-                else:
-                    # For the c linker
-                    # We don't have access from python to all the temps values
-                    # So for now, we just don't print the extra shapes/strides info
-                    gof.vm.raise_with_op(self.fn.nodes[self.fn.position_of_error])
-            else:
-                # old-style linkers raise their own exceptions
-                raise
+            self._reraise_fn_error()
 
         dt_fn = time.time() - t0_fn
         self.maker.mode.fn_time += dt_fn
@@ -658,6 +758,204 @@ class Function(object):
         else:
             return outputs
 
+    def map(self, *sequences, **kwargs):
+        """
+        Call this function once for each element of the sequences.
+
+        The i-th positional argument is the sequence of the values of the
+        i-th input, e.g. an ndarray stacked along its first axis or a list.
+        All the sequences must have the same length. The keyword arguments
+        give the values of named inputs, which are the same for all the
+        calls. The updates are done after each call.
+
+        The arguments are all checked before the first call, and the calls
+        are then made in a loop that skips the bookkeeping done by
+        `__call__`. The storage of the outputs is not cleared between the
+        calls, so the ops can reuse it. An ndarray sequence given for a
+        TensorType input is filtered at once (this is where the savings are
+        the largest), and the views of its elements are given to the calls.
+
+        Return, for each output, the ndarray of its values stacked along a
+        new first axis, or the list of its values if they do not all have
+        the same shape and dtype. A single output is returned alone, as by
+        `__call__`.
+        """
+        from theano.tensor import TensorType
+        profile = self.profile
+        t0 = time.time()
+        input_storage = self.input_storage
+        if not sequences:
+            raise TypeError("Function.map needs at least one sequence")
+        if len(sequences) + len(kwargs) > len(input_storage):
+            raise TypeError("Too many parameter passed to theano function")
+        for c in input_storage:
+            c.provided = 0
+
+        # Filter the sequences
+        n_steps = None
+        mapped = []
+        for i, seq in enumerate(sequences):
+            s = input_storage[i]
+            if not self.trust_input:
+                try:
+                    if (isinstance(seq, numpy.ndarray) and
+                            isinstance(s.type, TensorType)):
+                        stacked_type = TensorType(
+                            dtype=s.type.dtype,
+                            broadcastable=(False,) + s.type.broadcastable)
+                        seq = stacked_type.filter(
+                            seq, strict=s.strict,
+                            allow_downcast=s.allow_downcast)
+                    else:
+                        seq = [s.type.filter(v, strict=s.strict,
+                                             allow_downcast=s.allow_downcast)
+                               for v in seq]
+                except Exception, e:
+                    function_name = "theano function"
+                    if self.name:
+                        function_name += ' with name "' + self.name + '" '
+                    e.args = tuple(["Bad input sequence to " + function_name +
+                                    " at index %d(0-based)" % i] +
+                                   list(e.args))
+                    raise
+            if n_steps is None:
+                n_steps = len(seq)
+            elif len(seq) != n_steps:
+                raise ValueError("The sequences given to Function.map must "
+                                 "have the same length", n_steps, len(seq), i)
+            mapped.append((s.storage, seq,
+                           isinstance(seq, numpy.ndarray)))
+            s.provided += 1
+        for k, arg in kwargs.iteritems():
+            self[k] = arg
+        self._check_provided([c.provided for c in input_storage])
+
+        # The defaults that an inplace op may destroy are put back after
+        # each call, the others only once at the end.
+        refeed = [(i, value) for i, (required, refeed, value)
+                  in enumerate(self.defaults)
+                  if refeed and self.maker.inputs[i].mutable]
+        if getattr(self.fn, 'need_update_inputs', True):
+            updated = [storage for input, storage
+                       in reversed(zip(self.maker.expanded_inputs,
+                                       input_storage))
+                       if input.update is not None]
+        else:
+            updated = []
+        n_returned = self.n_returned_outputs
+        output_storage = self.output_storage
+        fn = self.fn
+
+        results = None
+        dt_fn = 0
+        for step in xrange(n_steps):
+            for storage, seq, is_array in mapped:
+                if is_array:
+                    # With an Ellipsis, the elements of a vector are 0-d
+                    # ndarrays, not numpy scalars.
+                    storage[0] = seq[step, ...]
+                else:
+                    storage[0] = seq[step]
+            t0_fn = time.time()
+            try:
+                outputs = fn()
+            except Exception:
+                self._reraise_fn_error()
+            dt_fn += time.time() - t0_fn
+            if outputs is None:
+                outputs = [x.data for x in output_storage]
+            if updated:
+                outputs = list(outputs)
+                for storage in updated:
+                    storage.data = outputs.pop()
+            else:
+                outputs = outputs[:n_returned]
+            for i, value in refeed:
+                if isinstance(value, gof.Container):
+                    value = value.storage[0]
+                self[i] = value
+
+            # Copy the outputs, as their storage is reused by the next call
+            if results is None:
+                results = []
+                for o in outputs:
+                    if isinstance(o, numpy.ndarray):
+                        r = numpy.empty((n_steps,) + o.shape, dtype=o.dtype)
+                        r[0] = o
+                    else:
+                        r = [o]
+                    results.append(r)
+                continue
+            for j, o in enumerate(outputs):
+                r = results[j]
+                if type(r) is list:
+                    if isinstance(o, numpy.ndarray):
+                        o = o.copy()
+                    r.append(o)
+                elif (isinstance(o, numpy.ndarray) and
+                      o.shape == r.shape[1:] and o.dtype == r.dtype):
+                    r[step] = o
+                else:
+                    if isinstance(o, numpy.ndarray):
+                        o = o.copy()
+                    results[j] = list(r[:step]) + [o]
+        if results is None:
+            results = [[] for o in xrange(n_returned)]
+
+        self.maker.mode.fn_time += dt_fn
+        if profile:
+            profile.vm_call_time += dt_fn
+
+        # Same cleanup as after a call of __call__
+        for c in input_storage:
+            if c.required:
+                c.storage[0] = None
+        if getattr(self.fn, 'allow_gc', False):
+            for o_container, o_variable in zip(output_storage,
+                                               self.maker.fgraph.outputs):
+                if o_variable.owner is not None:
+                    o_container.storage[0] = None
+        for i, (required, refeed, value) in enumerate(self.defaults):
+            if refeed:
+                if isinstance(value, gof.Container):
+                    value = value.storage[0]
+                self[i] = value
+
+        dt_call = time.time() - t0
+        self.maker.mode.call_time += dt_call
+        if profile:
+            profile.fct_callcount += n_steps
+            profile.fct_call_time += dt_call
+            if hasattr(self.fn, 'update_profile'):
+                self.fn.update_profile(profile)
+
+        if self.return_none:
+            return None
+        elif self.unpack_single and len(results) == 1:
+            return results[0]
+        else:
+            return results
+
+    def _reraise_fn_error(self):
+        # Called in the except clause of a call of self.fn, to add the
+        # information on the node that failed.
+        if hasattr(self.fn, 'position_of_error'):
+            # this is a new vm-provided function or c linker
+            # they need this because the exception manipulation
+            # done by raise_with_op is not implemented in C.
+            if hasattr(self.fn, 'thunks'):
+                # For the CVM
+                gof.vm.raise_with_op(self.fn.nodes[self.fn.position_of_error],
+                                     self.fn.thunks[self.fn.position_of_error])
+            else:
+                # For the c linker
+                # We don't have access from python to all the temps values
+                # So for now, we just don't print the extra shapes/strides info
+                gof.vm.raise_with_op(self.fn.nodes[self.fn.position_of_error])
+        else:
+            # old-style linkers raise their own exceptions
+            raise
+
     value = property(
         lambda self: self._value,
         None,  # this property itself is not settable
@@ -722,6 +1020,212 @@ def _constructor_Function(maker, input_storage, inputs_data):
 copy_reg.pickle(Function, _pickle_Function)
 
 
+class FunctionPool(object):
+    """
+    Call a compiled `Function` from several threads.
+
+    A Function keeps its inputs, outputs and intermediate results in its own
+    storage, so it can only run one call at a time. A FunctionPool keeps
+    copies of it that share its shared variables (see `Function.copy`), and
+    each call runs on a copy that is not in use. A copy is created when all
+    the existing ones are busy, up to `size` of them; calls then wait for
+    one to be free.
+
+    Concurrent updates of a shared variable are not synchronized: if two
+    calls update the same shared variable at the same time, one of the
+    updates is lost. Outputs compiled with borrow=True may be overwritten
+    by the next call that runs on the same copy.
+    """
+
+    def __init__(self, fn, size=None):
+        """
+        :param fn: the Function to call. It is the first copy of the pool.
+        :param size: maximum number of copies, or None for no limit.
+        """
+        if size is not None and size < 1:
+            raise ValueError('The size of a FunctionPool must be at least 1',
+                             size)
+        self.fn = fn
+        self.size = size
+        self.free = [fn]
+        self.n_copies = 1
+        self.cond = threading.Condition()
+        # Compilation caches are not thread-safe, so copies are created one
+        # at a time.
+        self.copy_lock = threading.Lock()
+
+    def acquire(self):
+        """Return a copy of the function that is not in use."""
+        self.cond.acquire()
+        try:
+            while not self.free:
+                if self.size is None or self.n_copies < self.size:
+                    break
+                self.cond.wait()
+            if self.free:
+                return self.free.pop()
+            self.n_copies += 1
+        finally:
+            self.cond.release()
+
+        self.copy_lock.acquire()
+        try:
+            try:
+                return self.fn.copy(share_shared=True)
+            except Exception:
+                self.cond.acquire()
+                try:
+                    self.n_copies -= 1
+                    self.cond.notify()
+                finally:
+                    self.cond.release()
+                raise
+        finally:
+            self.copy_lock.release()
+
+    def release(self, fn):
+        """Give back a copy returned by `acquire`."""
+        self.cond.acquire()
+        try:
+            self.free.append(fn)
+            self.cond.notify()
+        finally:
+            self.cond.release()
+
+    def __call__(self, *args, **kwargs):
+        fn = self.acquire()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.release(fn)
+
+
+class FunctionPrefetcher(object):
+    """
+    Call a compiled `Function` on each tuple of arguments of an iterable,
+    and prepare the arguments of the next calls in a background thread.
+
+    Before it runs the graph, `Function.__call__` converts each argument
+    with the `filter` method of the type of its input. A prefetcher reads
+    the next tuples of the iterable and filters them in a thread while the
+    current call runs, then gives them to the function without checking
+    them again (like `Function.trust_input`). The thread can only run while
+    the current call releases the GIL: in C code that releases it (see
+    `config.cmodule.release_gil`), or when the iterable does I/O.
+
+    The arguments are positional. The inputs that are not given must have
+    a default value.
+
+    When the function is profiled, its ProfileStats records the calls
+    after the first one of each iteration (the steady state): their number,
+    their wall time, the time spent filtering their arguments in the thread
+    and the time they waited for it.
+    """
+
+    def __init__(self, fn, depth=2):
+        """
+        :param fn: the Function to call.
+        :param depth: maximum number of tuples of arguments filtered in
+            advance.
+        """
+        if depth < 1:
+            raise ValueError('The depth of a FunctionPrefetcher must be at '
+                             'least 1', depth)
+        self.fn = fn
+        self.depth = depth
+
+    def filter(self, args):
+        """Return the list of the arguments `args` filtered for `fn`."""
+        fn = self.fn
+        if len(args) > len(fn.input_storage):
+            raise TypeError("Too many parameter passed to theano function")
+        fn._check_provided([1] * len(args) +
+                           [0] * (len(fn.input_storage) - len(args)))
+        values = [fn._filter_input(i, arg) for i, arg in enumerate(args)]
+        fn._copy_aliased_inputs(values)
+        return values
+
+    def __call__(self, iterable):
+        """
+        Return an iterator on the outputs of `fn` called on each tuple of
+        arguments of `iterable`.
+        """
+        return _PrefetchIterator(self, iterable)
+
+
+def _prefetch_worker(prefetcher, iterable, queue, state):
+    # Put in the queue ('args', filtered args, filter time) for each tuple
+    # of arguments, then ('end', None, 0), or ('error', exc_info, 0).
+    def put(item):
+        while not state['closed']:
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
+    try:
+        for args in iterable:
+            t0 = time.time()
+            values = prefetcher.filter(args)
+            if not put(('args', values, time.time() - t0)):
+                return
+        put(('end', None, 0))
+    except Exception:
+        put(('error', sys.exc_info(), 0))
+
+
+class _PrefetchIterator(object):
+    # The iterator returned by FunctionPrefetcher.__call__. The worker
+    # thread stops when the iterator is closed or garbage collected.
+
+    def __init__(self, prefetcher, iterable):
+        self.fn = prefetcher.fn
+        self.queue = Queue.Queue(maxsize=prefetcher.depth)
+        self.state = {'closed': False}
+        self.n_calls = 0
+        self.thread = threading.Thread(
+            target=_prefetch_worker,
+            args=(prefetcher, iter(iterable), self.queue, self.state))
+        self.thread.setDaemon(True)
+        self.thread.start()
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self.state['closed']:
+            raise StopIteration
+        t0 = time.time()
+        kind, values, filter_time = self.queue.get()
+        wait_time = time.time() - t0
+        if kind == 'end':
+            self.close()
+            raise StopIteration
+        if kind == 'error':
+            self.close()
+            raise values[0], values[1], values[2]
+        fn = self.fn
+        outputs = fn._call_trusted(values)
+        t1 = time.time()
+        if self.n_calls > 0 and fn.profile:
+            profile = fn.profile
+            profile.prefetch_callcount += 1
+            profile.prefetch_time += t1 - self.t_last
+            profile.prefetch_filter_time += filter_time
+            profile.prefetch_wait_time += wait_time
+        self.t_last = t1
+        self.n_calls += 1
+        return outputs
+
+    def close(self):
+        """Stop the worker thread."""
+        self.state['closed'] = True
+
+    def __del__(self):
+        self.close()
+
+
 
 ###
 ### SanityCheckFunction
@@ -1009,26 +1513,43 @@ class FunctionMaker(object):
         fgraph, additional_outputs = std_fgraph(inputs, outputs, accept_inplace)
         fgraph.profile = profile
 
-        self.fgraph = fgraph
-
         # Fetch the optimizer and linker
         optimizer, linker = mode.optimizer, copy.copy(mode.linker)
 
+        # look for an already optimized version of the fgraph
+        cache_key = None
+        cached = None
+        if theano.config.cache_optimizations:
+            cache_key = graph_cache.get_cache_key(fgraph, inputs, mode,
+                                                  accept_inplace)
+            if cache_key is not None:
+                cached = graph_cache.load(cache_key)
+        if cached is not None:
+            _logger.debug('Reusing cached optimized graph %s', cache_key)
+            fgraph = fgraph_from_optimized(inputs, *cached)
+            fgraph.profile = profile
+
+        self.fgraph = fgraph
+
         # optimize the fgraph
         compute_test_value_orig = theano.config.compute_test_value
         add_stack_trace_on_call = gof.Op.add_stack_trace_on_call
         try:
             theano.config.compute_test_value = theano.config.compute_test_value_opt
             gof.Op.add_stack_trace_on_call = False
-            start_optimizer = time.time()
-            optimizer_profile = optimizer(fgraph)
-            end_optimizer = time.time()
-            opt_time = end_optimizer - start_optimizer
-            if profile:
-                profile.optimizer_time += opt_time
-                if theano.config.profile_optimizer:
-                    profile.optimizer_profile = (optimizer, optimizer_profile)
-            _logger.debug('Optimizing took %f seconds', opt_time)
+            if cached is None:
+                start_optimizer = time.time()
+                optimizer_profile = optimizer(fgraph)
+                end_optimizer = time.time()
+                opt_time = end_optimizer - start_optimizer
+                if profile:
+                    profile.optimizer_time += opt_time
+                    if theano.config.profile_optimizer:
+                        profile.optimizer_profile = (optimizer,
+                                                     optimizer_profile)
+                _logger.debug('Optimizing took %f seconds', opt_time)
+                if cache_key is not None:
+                    graph_cache.store(cache_key, fgraph)
 
             #Add deep copy to respect the memory interface
             insert_deepcopy(fgraph, inputs, outputs + additional_outputs)
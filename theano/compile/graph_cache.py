@@ -0,0 +1,258 @@
+"""On-disk cache of optimized function graphs.
+
+When `config.cache_optimizations` is True, `FunctionMaker` looks up the
+graph it is about to optimize in this cache. The cache is keyed on a
+canonical hash of the unoptimized FunctionGraph, of the optimizer that the
+mode would run, of the Theano and NumPy versions and of all the config
+options, so that any of those changing invalidates the entry. On a hit,
+the pickled optimized graph is loaded back and the optimization phase is
+skipped entirely.
+
+Entries are stored in `<compiledir>/optimized_graphs`. Each lookup
+refreshes the modification time of the file it hits, and the least
+recently used entries are removed when the total size of the cache goes
+above `config.cache_optimizations_maxsize` megabytes.
+"""
+__docformat__ = "restructuredtext en"
+
+import cPickle
+import logging
+import os
+import tempfile
+
+import numpy
+
+import theano
+from theano import gof
+from theano.configparser import AddConfigVar, BoolParam, IntParam
+from theano.gof.cc import hash_from_code
+
+_logger = logging.getLogger('theano.compile.graph_cache')
+
+AddConfigVar('cache_optimizations',
+             "If True, store optimized graphs on disk and reuse them when "
+             "the same graph is compiled again with the same mode and "
+             "config, skipping the optimization phase.",
+             BoolParam(False),
+             in_c_key=False)
+
+AddConfigVar('cache_optimizations_maxsize',
+             "Maximum size (in MB) of the optimized graph cache. The least "
+             "recently used entries are removed when it is exceeded.",
+             IntParam(512, lambda i: i > 0),
+             in_c_key=False)
+
+
+def get_cache_dir():
+    return os.path.join(theano.config.compiledir, 'optimized_graphs')
+
+
+def _optimizer_signature(opt, seen):
+    """Return a string describing `opt` and the optimizers it contains.
+
+    Optimizers do not have a meaningful equality or pickle, so we describe
+    them by the names of their classes and of the functions they wrap,
+    recursively.
+    """
+    if id(opt) in seen:
+        return '<recursion>'
+    seen.add(id(opt))
+    cls = type(opt)
+    parts = ['%s.%s' % (cls.__module__, cls.__name__)]
+    for attr in ('name', '__name__'):
+        val = getattr(opt, attr, None)
+        if isinstance(val, basestring):
+            parts.append(val)
+    for attr in ('apply', 'transform'):
+        fn = getattr(opt, attr, None)
+        if hasattr(fn, 'func_name'):
+            parts.append('%s.%s' % (fn.__module__, fn.func_name))
+
+    children = []
+    if isinstance(opt, (list, tuple)):
+        children.extend(opt)
+    for attr in ('opts', 'local_opt', 'local_optimizers_all',
+                 'global_optimizers', 'pure', 'inplace'):
+        child = getattr(opt, attr, None)
+        if isinstance(child, (list, tuple)):
+            children.extend(child)
+        elif child is not None:
+            children.append(child)
+    parts.extend(_optimizer_signature(c, seen) for c in children)
+
+    # The map is keyed on ops, whose hash can change between processes.
+    op_map = getattr(opt, 'local_optimizers_map', None)
+    if op_map:
+        parts.append(repr(sorted(
+            _optimizer_signature(c, seen)
+            for lopts in op_map.values() for c in lopts)))
+    return '(%s)' % ' '.join(parts)
+
+
+def _config_signature():
+    return '\n'.join('%s = %s' % (cv.fullname, cv.__get__())
+                     for cv in sorted(theano.configparser._config_var_list,
+                                      key=lambda cv: cv.fullname))
+
+
+def graph_signature(fgraph, input_specs):
+    """Return a canonical description of `fgraph`.
+
+    Two graphs get the same signature iff they apply the same ops, in the
+    same topological order, to the same inputs and constants. Variables are
+    identified by their position, not by their identity.
+
+    Raise an exception if some op, type or constant cannot be pickled.
+    """
+    def dumps(obj):
+        return cPickle.dumps(obj, protocol=2)
+
+    index = {}
+    sig = []
+    for var, spec in zip(fgraph.inputs, input_specs):
+        index[var] = len(index)
+        sig.append(('input', dumps(var.type), bool(spec.mutable),
+                    spec.update is not None))
+    for node in fgraph.toposort():
+        ins = []
+        for var in node.inputs:
+            if var in index:
+                ins.append(index[var])
+            elif isinstance(var, gof.Constant):
+                ins.append(('constant', dumps(var.type), dumps(var.data)))
+            else:
+                raise ValueError('Variable not in the graph', var)
+        for var in node.outputs:
+            index[var] = len(index)
+        sig.append((dumps(node.op), tuple(ins),
+                    tuple(dumps(out.type) for out in node.outputs)))
+    outs = []
+    for var in fgraph.outputs:
+        if var in index:
+            outs.append(index[var])
+        else:
+            outs.append(('constant', dumps(var.type), dumps(var.data)))
+    sig.append(('outputs', tuple(outs)))
+    return dumps(sig)
+
+
+def get_cache_key(fgraph, input_specs, mode, accept_inplace):
+    """Return the key under which the optimized `fgraph` is cached.
+
+    Return None when the graph cannot be cached: only modes whose optimizer
+    is a query of the optimization database are supported, since arbitrary
+    optimizers can not be reliably identified across processes.
+    """
+    if not isinstance(getattr(mode, '_optimizer', None), gof.Query):
+        return None
+    try:
+        msg = '\n'.join([
+            graph_signature(fgraph, input_specs),
+            str(bool(accept_inplace)),
+            _optimizer_signature(mode.optimizer, set()),
+            theano.__version__,
+            numpy.__version__,
+            _config_signature()])
+    except Exception, e:
+        _logger.debug('Cannot compute the optimization cache key: %s', e)
+        return None
+    return hash_from_code(msg)
+
+
+def load(key):
+    """Return the (inputs, outputs) of the optimized graph stored under
+    `key`, or None if there is no such entry.
+    """
+    filename = os.path.join(get_cache_dir(), key + '.pkl')
+    try:
+        f = open(filename, 'rb')
+    except IOError:
+        return None
+    try:
+        try:
+            inputs, outputs = cPickle.load(f)
+        finally:
+            f.close()
+    except Exception, e:
+        _logger.warning('Removing corrupted optimized graph %s (%s)',
+                        filename, e)
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+        return None
+    try:
+        # Mark the entry as recently used.
+        os.utime(filename, None)
+    except OSError:
+        pass
+    return inputs, outputs
+
+
+def store(key, fgraph):
+    """Store the optimized `fgraph` under `key`.
+
+    Failures (unpicklable graph, disk full, ...) are logged and ignored: the
+    cache is only an optimization.
+    """
+    cache_dir = get_cache_dir()
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        # The variables of `fgraph` reference it (and its features)
+        # through their `fgraph` and `clients` attributes, so we pickle a
+        # clone of the graph. Its inputs are plain variables of the same
+        # types: the shared variables would be pickled with their container,
+        # i.e. their value, and `fgraph_from_optimized` rebinds the inputs
+        # by position anyway.
+        memo = dict((i, i.type(name=i.name)) for i in fgraph.inputs)
+        equiv = gof.graph.clone_get_equiv(fgraph.inputs, fgraph.outputs,
+                                          memo=memo)
+        inputs = [equiv[i] for i in fgraph.inputs]
+        outputs = [equiv[o] for o in fgraph.outputs]
+        # Write to a temporary file that is then renamed, so that
+        # concurrent processes never read a partially written entry.
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            f = os.fdopen(fd, 'wb')
+            try:
+                cPickle.dump((inputs, outputs), f, protocol=2)
+            finally:
+                f.close()
+            os.rename(tmp, os.path.join(cache_dir, key + '.pkl'))
+        except:
+            os.remove(tmp)
+            raise
+    except Exception, e:
+        _logger.debug('Could not cache the optimized graph: %s', e)
+        return
+    evict(theano.config.cache_optimizations_maxsize * 2 ** 20)
+
+
+def evict(max_size):
+    """Remove the least recently used entries until the cache takes at
+    most `max_size` bytes.
+    """
+    cache_dir = get_cache_dir()
+    entries = []
+    total = 0
+    for name in os.listdir(cache_dir):
+        if not name.endswith('.pkl'):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Removed by another process.
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+    entries.sort()
+    for mtime, size, path in entries:
+        if total <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total -= size
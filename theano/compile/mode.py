@@ -73,6 +73,8 @@ predefined_linkers = {
     'cvm': gof.vm.VM_Linker(use_cloop=True),  # Use allow_gc Theano flag
     'vm_nogc': gof.vm.VM_Linker(allow_gc=False, use_cloop=False),
     'cvm_nogc': gof.vm.VM_Linker(allow_gc=False, use_cloop=True),
+    # Use allow_gc Theano flag
+    'vm_parallel': gof.vm.VM_Linker(use_cloop=False, parallel=True),
     }
 
 
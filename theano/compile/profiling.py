@@ -75,12 +75,19 @@ def _atexit_print_fn():
         for ps in to_sum[1:]:
             for attr in ["compile_time", "fct_call_time", "fct_callcount",
                          "vm_call_time", "optimizer_time", "linker_time",
-                         "validate_time"]:
+                         "validate_time", "prefetch_callcount",
+                         "prefetch_time", "prefetch_filter_time",
+                         "prefetch_wait_time", "n_allocations",
+                         "allocated_bytes", "pool_hits", "pool_misses",
+                         "pool_unused", "pool_evictions"]:
                 setattr(cum, attr, getattr(cum, attr) + getattr(ps, attr))
+            cum.pool_max_bytes_held = max(cum.pool_max_bytes_held,
+                                          ps.pool_max_bytes_held)
 
             #merge dictonary
-            for attr in ["apply_time", "apply_callcount",
-                         "apply_cimpl", "variable_shape", "variable_strides"]:
+            for attr in ["apply_time", "apply_callcount", "apply_wait_time",
+                         "apply_cimpl", "variable_shape", "variable_strides",
+                         "storage_group", "node_order"]:
                 cum_attr = getattr(cum, attr)
                 for key, val in getattr(ps, attr).iteritems():
                     assert key not in cum_attr
@@ -132,6 +139,24 @@ class ProfileStats(object):
     # Total time spent in Function.fn.__call__
     #
 
+    prefetch_callcount = 0
+    # Number of calls made by a FunctionPrefetcher, after the first call of
+    # each iteration
+    #
+
+    prefetch_time = 0.0
+    # Wall time of these calls, from the end of the previous call
+    #
+
+    prefetch_filter_time = 0.0
+    # Time spent filtering the arguments of these calls in the prefetch
+    # thread
+    #
+
+    prefetch_wait_time = 0.0
+    # Time these calls waited for their arguments to be filtered
+    #
+
     apply_time = None
     # dict from node -> float runtime
     #
@@ -140,6 +165,11 @@ class ProfileStats(object):
     # dict from node -> number of executions
     #
 
+    apply_wait_time = None
+    # dict from node -> float time spent ready to run but waiting for a
+    # thread (only filled by the vm_parallel linker)
+    #
+
     apply_cimpl = None
     # dict from node -> bool (1 if c, 0 if py)
     #
@@ -156,6 +186,46 @@ class ProfileStats(object):
     # Variable -> strides
     #
 
+    node_order = {}
+    # FunctionGraph -> its nodes, in the order the linker runs them
+    #
+
+    storage_group = {}
+    # Variable -> the first variable of the group of variables that share
+    # its storage (see vm.memory_plan)
+    #
+
+    n_allocations = 0
+    # Number of outputs allocated by the thunks (measured by the Stack VM
+    # with profile_memory)
+    #
+
+    allocated_bytes = 0
+    # Total size of these outputs
+    #
+
+    pool_hits = 0
+    # Number of buffers taken from the BufferPool (vm.buffer_pool)
+    #
+
+    pool_misses = 0
+    # Number of buffers the BufferPool allocated, because it had none of
+    # the right size
+    #
+
+    pool_unused = 0
+    # Number of buffers of the BufferPool that a node did not use, because
+    # the shape of its output changed
+    #
+
+    pool_evictions = 0
+    # Number of buffers removed from the BufferPool to respect its capacity
+    #
+
+    pool_max_bytes_held = 0
+    # Maximum size of the buffers held by the BufferPool
+    #
+
     optimizer_time = 0.0
     # time spent optimizing graph (FunctionMaker.__init__)
 
@@ -196,9 +266,12 @@ class ProfileStats(object):
         self.apply_callcount = {}
         self.output_size = {}
         self.apply_time = {}
+        self.apply_wait_time = {}
         self.apply_cimpl = {}
         self.variable_shape = {}
         self.variable_strides = {}
+        self.storage_group = {}
+        self.node_order = {}
         if flag_time_thunks is None:
             self.flag_time_thunks = config.profiling.time_thunks
         else:
@@ -487,6 +560,10 @@ class ProfileStats(object):
         hs += ['<time per call>']
         es += ['     %8.2es ']
 
+        if self.apply_wait_time:
+            hs += ['<wait time>']
+            es += ['  %7.3fs ']
+
         hs += ['<#call>']
         es += [' %4d  ']
 
@@ -535,10 +612,11 @@ class ProfileStats(object):
             else:
                 flops = "        "
                 flops_s = "          "
-            print >> file, format_str %(f, ftot, t, t / nb_call, nb_call,
-                                        nd_id,
-                                        flops, flops_s,
-                                        str(a)[:maxlen])
+            values = [f, ftot, t, t / nb_call]
+            if self.apply_wait_time:
+                values.append(self.apply_wait_time.get(a, 0))
+            values += [nb_call, nd_id, flops, flops_s, str(a)[:maxlen]]
+            print >> file, format_str % tuple(values)
             if not config.profile_memory:
                 continue
             for idx, var in enumerate(a.inputs):
@@ -577,6 +655,32 @@ class ProfileStats(object):
             if local_time > 0:
                 print >> file, '  Time in thunks: %es (%.3f%%)' % (
                         local_time, 100*local_time / self.fct_call_time)
+            if self.apply_wait_time:
+                print >> file, ('  Time thunks waited for a thread of the'
+                                ' parallel VM: %es' %
+                                sum(self.apply_wait_time.values()))
+        if self.prefetch_callcount:
+            print >> file, ('  Steady state of FunctionPrefetcher: %i calls'
+                            ' in %es (%.1f calls/s)' % (
+                                self.prefetch_callcount, self.prefetch_time,
+                                self.prefetch_callcount /
+                                max(self.prefetch_time, 1e-9)))
+            overlap = 100.
+            if self.prefetch_filter_time > 0:
+                overlap = max(0., 100. * (1 - self.prefetch_wait_time /
+                                          self.prefetch_filter_time))
+            print >> file, ('    Input filtering in the prefetch thread: %es,'
+                            ' waited for: %es (%.1f%% overlapped)' % (
+                                self.prefetch_filter_time,
+                                self.prefetch_wait_time, overlap))
+        if self.pool_hits or self.pool_misses:
+            print >> file, ('  Buffer pool: %i hits, %i misses (%.1f%% hits),'
+                            ' %i unused, %i evictions, max held %iKB' % (
+                                self.pool_hits, self.pool_misses,
+                                100. * self.pool_hits /
+                                (self.pool_hits + self.pool_misses),
+                                self.pool_unused, self.pool_evictions,
+                                self.pool_max_bytes_held // 1024))
         print >> file, '  Total compile time: %es' % self.compile_time
         print >> file, '    Theano Optimizer time: %es' % self.optimizer_time
         print >> file, '       Theano validate time: %es' % self.validate_time
@@ -616,6 +720,7 @@ class ProfileStats(object):
         #Find the function that used the most of that statistic
         max_sum_size = 0
         max_node_memory_size = 0
+        max_node_memory_planned = 0
         max_running_max_memory_size = 0
         max_node_memory_saved_by_view = 0
         max_node_memory_saved_by_inplace = 0
@@ -636,8 +741,13 @@ class ProfileStats(object):
             running_memory_size = 0
             # The maximum of running_memory_size during the function
             running_max_memory_size = 0
+            # Like node_memory_size, but the variables that share their
+            # storage (vm.memory_plan) count once per group, for the
+            # biggest of them.
+            node_memory_planned = 0
+            group_size = {}
 
-            order = fgraph.toposort()
+            order = self.node_order.get(fgraph) or fgraph.toposort()
             # A list of intermediate variable that are not need
             # after the execution of the corresponding node.
             # It mean that after executing the node,
@@ -665,6 +775,12 @@ class ProfileStats(object):
                         node_memory_saved_by_view += v
                     elif not isinstance(v, str):
                         node_memory_size += v
+                        group = self.storage_group.get(node.outputs[idx])
+                        if group is None:
+                            node_memory_planned += v
+                        else:
+                            group_size[group] = max(group_size.get(group, 0),
+                                                    v)
                         running_memory_size += v
                         if running_memory_size > running_max_memory_size:
                             running_max_memory_size = running_memory_size
@@ -677,6 +793,9 @@ class ProfileStats(object):
             # Store the max of some stats by any function in this profile.
             max_sum_size = max(max_sum_size, sum_size)
             max_node_memory_size = max(max_node_memory_size, node_memory_size)
+            node_memory_planned += sum(group_size.values())
+            max_node_memory_planned = max(max_node_memory_planned,
+                                          node_memory_planned)
             max_running_max_memory_size = max(max_running_max_memory_size,
                                           running_max_memory_size)
             max_node_memory_saved_by_view = max(max_node_memory_saved_by_view,
@@ -700,6 +819,9 @@ class ProfileStats(object):
         print >> file,  "    Max if linker=cvm (default): unknown"
         print >> file,  "    Max if no gc (allow_gc=False): %dKB" % int(round(
                              max_node_memory_size / 1024.))
+        if self.storage_group:
+            print >> file,  "    Max if no gc, with vm.memory_plan: %dKB" % int(
+                round(max_node_memory_planned / 1024.))
         print >> file,  "    Max if linker=c|py: %dKB" % int(round(
             max_running_max_memory_size / 1024.))
 #        print >> file,  "    Memory saved if views are used: %dKB" % int(
@@ -708,6 +830,12 @@ class ProfileStats(object):
 #            int(round(max_node_memory_saved_by_inplace / 1024.))
         print >> file,  "    Memory saved if gc is enabled (linker=c|py): %dKB" % int(
             round(max_node_memory_size - max_running_max_memory_size) / 1024.)
+        if self.n_allocations and self.fct_callcount:
+            print >> file,  ("    Outputs allocated by the ops: %.1f per call,"
+                             " %dKB per call" % (
+                                 self.n_allocations / float(self.fct_callcount),
+                                 int(round(self.allocated_bytes / 1024. /
+                                           self.fct_callcount))))
         if (hasattr(theano, 'sandbox') and
             hasattr(theano.sandbox, 'cuda') and
             hasattr(theano.sandbox.cuda, 'cuda_ndarray') and
@@ -0,0 +1,368 @@
+"""
+Rematerialization (also called gradient checkpointing).
+
+The graphs built by `theano.gradient.grad` use the results of the forward
+pass in the backward pass, so with allow_gc they all stay alive until the
+backward pass reaches them. The `Rematerialize` optimizer keeps only some
+of them, the checkpoints, and computes the others a second time in the
+backward pass, from the checkpoints, right before they are used.
+
+The checkpoints are the variables marked with `checkpoint`. Without
+marks, when the flag remat.budget is set and the estimated peak memory of
+the graph is above it, the optimizer chooses them: one in sqrt(n) of the n
+results of the forward pass that are used by the backward pass. The
+recomputation of a segment of the forward pass, between two checkpoints,
+costs its compute time again and saves the memory of its results.
+"""
+import logging
+import math
+import time
+
+from theano import gof
+from theano.configparser import config, AddConfigVar, FloatParam
+from theano.gof import Constant
+from theano.gof.sched import peak_memory, static_size
+from theano.compile.mode import optdb
+from theano.compile.ops import Shape_i, ViewOp
+from theano.compile.sharedvalue import SharedVariable
+
+_logger = logging.getLogger('theano.compile.remat')
+
+AddConfigVar('remat.budget',
+             "Peak memory (in MB) that the results of a function should "
+             "not exceed. When it is positive and the estimated peak is "
+             "above it, the results of the forward pass are computed again "
+             "in the backward pass instead of being kept, until the "
+             "estimate is below the budget. 0 disables it; the variables "
+             "marked with theano.compile.remat.checkpoint are always used.",
+             FloatParam(0, lambda v: v >= 0),
+             in_c_key=False)
+
+
+class Checkpoint(ViewOp):
+    """
+    Mark its input as a result to keep for the backward pass. The
+    `Rematerialize` optimizer removes it.
+    """
+
+
+def checkpoint(x):
+    """Return `x`, marked as a result to keep for the backward pass.
+
+    The results computed before it that the backward pass uses are
+    recomputed from the checkpoints (when rematerialization is enabled in
+    the mode, as it is in FAST_RUN).
+    """
+    return Checkpoint()(x)
+
+
+class RecomputeAfter(ViewOp):
+    """
+    Return its first input, once its second input is computed.
+
+    The recomputed nodes take their inputs through it, with a result of
+    the backward pass as second input. This makes the linkers compute them
+    in the backward pass, and prevents the MergeOptimizer from merging them
+    back with the nodes they copy.
+    """
+    def make_node(self, x, after):
+        return gof.Apply(self, [x, after], [x.type()])
+
+    def perform(self, node, inp, out):
+        out[0][0] = inp[0]
+
+    def c_code(self, node, nodename, inp, out, sub):
+        return ViewOp.c_code(self, node, nodename, inp[:1], out, sub)
+
+    def infer_shape(self, node, input_shapes):
+        return input_shapes[:1]
+
+    def connection_pattern(self, node):
+        return [[True], [False]]
+
+    def grad(self, args, g_outs):
+        from theano.gradient import DisconnectedType
+        return [g_outs[0], DisconnectedType()()]
+
+
+def _size_of(fgraph, unknown_dim=100):
+    """Return a function that estimates the size in bytes of a variable
+    from the ShapeFeature of fgraph. It uses the shape of the values of
+    the shared variables, which static_size counts as unknown."""
+    shape_feature = getattr(fgraph, 'shape_feature', None)
+
+    def size_of(var):
+        size = static_size(fgraph, var, unknown_dim)
+        shape = None
+        if shape_feature is not None:
+            shape = shape_feature.shape_of.get(var)
+        if not size or shape is None:
+            return size
+        for dim in shape:
+            if (dim.owner and isinstance(dim.owner.op, Shape_i) and
+                    isinstance(dim.owner.inputs[0], SharedVariable)):
+                value = dim.owner.inputs[0].get_value(borrow=True)
+                size = size // unknown_dim * value.shape[dim.owner.op.i]
+        return size
+    return size_of
+
+
+class Rematerialize(gof.Optimizer):
+    """
+    Recompute the results of the forward pass used by the backward pass,
+    instead of keeping them, except the checkpoints.
+
+    :param budget: the peak memory in bytes to reach. None uses the flag
+        remat.budget. The segments of the graph between checkpoints are
+        recomputed in the order of the forward pass until the estimated
+        peak is below it. With 0, all the segments between the variables
+        marked by `checkpoint` are recomputed, and nothing is done when no
+        variable is marked.
+    :param size_of: a function of a variable that returns its size in
+        bytes, used to estimate the peak memory. By default, the shapes
+        are taken from the ShapeFeature and the dimensions that are not
+        known count as 100.
+
+    The nodes with a destroy_map are never recomputed, and the changes are
+    validated, so the destroy handler keeps the graph consistent.
+    """
+    def __init__(self, budget=None, size_of=None):
+        self.budget = budget
+        self.size_of = size_of
+
+    def add_requirements(self, fgraph):
+        fgraph.attach_feature(gof.toolbox.ReplaceValidate())
+
+    def apply(self, fgraph):
+        t0 = time.time()
+        budget = self.budget
+        if budget is None:
+            budget = int(config.remat.budget * 2 ** 20)
+        marks = []
+        for node in fgraph.toposort():
+            if isinstance(node.op, Checkpoint):
+                marks.append(node.inputs[0])
+                fgraph.replace_validate(node.outputs[0], node.inputs[0],
+                                        reason='Rematerialize')
+        if not marks and not budget:
+            return None
+        size_of = self.size_of or _size_of(fgraph)
+        peak_before = peak_after = peak_memory(fgraph, fgraph.toposort(),
+                                               size_of)
+        if budget and peak_before <= budget:
+            return (len(marks), 0, 0, peak_before, peak_after,
+                    time.time() - t0)
+        if not marks:
+            marks = self.choose_marks(fgraph, size_of)
+        segments = self.segments(fgraph, marks)
+        nb_segments = nb_recomputed = 0
+        for segment in segments:
+            if budget and peak_after <= budget:
+                break
+            nb = self.recompute(fgraph, segment)
+            if nb:
+                nb_segments += 1
+                nb_recomputed += nb
+                peak_after = peak_memory(fgraph, fgraph.toposort(), size_of)
+        _logger.debug('%i nodes recomputed, estimated peak memory: %i -> %i',
+                      nb_recomputed, peak_before, peak_after)
+        return (len(marks), nb_segments, nb_recomputed, peak_before,
+                peak_after, time.time() - t0)
+
+    @staticmethod
+    def choose_marks(fgraph, size_of):
+        """Return the checkpoints to use when none is marked.
+
+        The forward pass is taken to be made of the ancestors of the last
+        result computed that is alive at the estimated peak memory of
+        fgraph. Its results that other nodes use are its candidate
+        checkpoints. One in sqrt(number of candidates) is kept, up to the
+        last one.
+        """
+        order = fgraph.toposort()
+        pos = dict([(node, i) for i, node in enumerate(order)])
+        used = [0] * (len(order) + 1)
+        outputs = set(fgraph.outputs)
+        alive = []  # (first position, last position, variable)
+        for node in order:
+            vmap = getattr(node.op, 'view_map', {})
+            dmap = getattr(node.op, 'destroy_map', {})
+            for k, out in enumerate(node.outputs):
+                if k in vmap or k in dmap or out in outputs:
+                    continue
+                last = max([pos[c] for c, i in out.clients] or [-1])
+                size = size_of(out)
+                if last <= pos[node] or not size:
+                    continue
+                alive.append((pos[node], last, out))
+                used[pos[node]] += size
+                used[last] -= size
+        current = peak = peak_pos = 0
+        for i in range(len(order)):
+            current += used[i]
+            if current > peak:
+                peak, peak_pos = current, i
+        alive = [a for a in alive if a[0] < peak_pos < a[1]]
+        if not alive:
+            return []
+        fwd = set(gof.graph.ops(fgraph.inputs, [max(alive)[2]]))
+        candidates = []
+        for node in order:
+            if node in fwd:
+                candidates.extend([o for o in node.outputs
+                                   if [c for c, i in o.clients
+                                       if c not in fwd]])
+        step = int(math.ceil(math.sqrt(len(candidates))))
+        return candidates[::-1][::step][::-1]
+
+    @staticmethod
+    def segments(fgraph, marks):
+        """The sets of nodes to recompute, in the order of the forward pass.
+
+        The forward pass is made of the ancestors of the marks. Its results
+        used by other nodes, except the marks, are
+        recomputed with their ancestors up to the marks (and the inputs of
+        the graph). The nodes that only use those results and the marks
+        are recomputed too, as they could be computed early and kept until
+        the backward pass.
+        """
+        order = fgraph.toposort()
+        pos = dict([(node, i) for i, node in enumerate(order)])
+        fwd = set(gof.graph.ops(fgraph.inputs, marks))
+        marks = set(marks)
+        stored = marks | set(fgraph.outputs)
+        candidates = []
+        for node in order:
+            if node not in fwd:
+                continue
+            for out in node.outputs:
+                if out not in stored and [c for c, i in out.clients
+                                          if c not in fwd]:
+                    candidates.append(out)
+        candidates.sort(key=lambda v: -pos[v.owner])
+        segments = []
+        covered = set()
+        for var in candidates:
+            if var.owner in covered:
+                continue
+            closure = set()
+            todo = [var.owner]
+            while todo:
+                node = todo.pop()
+                if node in closure:
+                    continue
+                closure.add(node)
+                todo.extend([i.owner for i in node.inputs
+                             if i.owner and i not in stored])
+            covered.update(closure)
+            for seg in [s for s in segments if s & closure]:
+                segments.remove(seg)
+                closure.update(seg)
+            segments.append(closure)
+
+        segment_of = {}
+        for seg in segments:
+            for node in seg:
+                segment_of[node] = seg
+        for node in order:
+            if node in fwd or [o for o in node.outputs if o in stored]:
+                continue
+            segs = []
+            for i in node.inputs:
+                if i.owner is None or i in marks:
+                    continue
+                if i.owner not in segment_of:
+                    break
+                if segment_of[i.owner] not in segs:
+                    segs.append(segment_of[i.owner])
+            else:
+                if len(segs) == 1:
+                    segs[0].add(node)
+                    segment_of[node] = segs[0]
+                elif not segs and [i for i in node.inputs if i in marks]:
+                    segments.append(set([node]))
+                    segment_of[node] = segments[-1]
+        segments.sort(key=lambda s: min([pos[n] for n in s]))
+        return [(seg, fwd) for seg in segments]
+
+    @staticmethod
+    def recompute(fgraph, segment):
+        """Copy the nodes of the segment to compute the results they give
+        to the other nodes, except the forward pass. Return the number of
+        nodes copied, 0 when it was not possible."""
+        nodes, fwd = segment
+        if [n for n in nodes if getattr(n.op, 'destroy_map', None)]:
+            return 0
+        order = fgraph.toposort()
+        pos = dict([(node, i) for i, node in enumerate(order)])
+        late = []  # (node, i, var): the late uses of the segment results
+        for node in order:
+            if node not in nodes:
+                continue
+            for out in node.outputs:
+                late.extend([(c, i, out) for c, i in out.clients
+                             if c != 'output' and c not in nodes and
+                             c not in fwd])
+        if not late:
+            return 0
+        # The copies are computed after the input of the first late use
+        # computed last, which is not a result of the segment.
+        first = min([(pos[c], c) for c, i, v in late])[1]
+        after = [(pos[i.owner], i) for i in first.inputs
+                 if i.owner and i.owner not in nodes]
+        if not after:
+            return 0
+        after = max(after)[1]
+        copies = {}
+        barriers = {}
+        for node in order:
+            if node not in nodes:
+                continue
+            inputs = []
+            for i in node.inputs:
+                if i in copies:
+                    inputs.append(copies[i])
+                elif isinstance(i, Constant):
+                    inputs.append(i)
+                else:
+                    if i not in barriers:
+                        barriers[i] = RecomputeAfter()(i, after)
+                    inputs.append(barriers[i])
+            new_node = node.clone_with_new_inputs(inputs)
+            copies.update(zip(node.outputs, new_node.outputs))
+        chk = fgraph.checkpoint()
+        try:
+            for node, i, var in late:
+                fgraph.change_input(node, i, copies[var],
+                                    reason='Rematerialize')
+            fgraph.validate()
+            # The copies have the shape of the results they copy, which
+            # the ShapeFeature may not be able to infer again.
+            shape_feature = getattr(fgraph, 'shape_feature', None)
+            if shape_feature is not None:
+                for var, copy in copies.items():
+                    if (var in shape_feature.shape_of and
+                            copy in shape_feature.shape_of):
+                        shape_feature.update_shape(copy, var)
+        except Exception, e:
+            _logger.debug('Rematerialize failed: %s', e)
+            fgraph.revert(chk)
+            return 0
+        return len(nodes)
+
+    @staticmethod
+    def print_profile(stream, prof, level=0):
+        blanc = ('    ' * level)
+        (nb_marks, nb_segments, nb_recomputed, peak_before, peak_after,
+         t) = prof
+        print >> stream, blanc, "Rematerialize"
+        print >> stream, blanc, "  nb_checkpoints", nb_marks
+        print >> stream, blanc, "  nb_segments", nb_segments
+        print >> stream, blanc, "  nb_recomputed_nodes", nb_recomputed
+        print >> stream, blanc, "  estimated peak memory before", peak_before
+        print >> stream, blanc, "  estimated peak memory after", peak_after
+        print >> stream, blanc, "  time", t
+
+
+# After the destroy handler is added, before the inplace optimizations.
+optdb.register('rematerialize', Rematerialize(), 50, 'fast_run')
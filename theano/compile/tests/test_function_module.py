@@ -1,13 +1,15 @@
 import copy
 import cPickle
 import numpy
+import os
+import threading
 import unittest
 
 
 from theano import config, gof
 from theano.compile.io import In, Out
 from theano.compile import function
-from theano.compile import UnusedInputError
+from theano.compile import FunctionPool, FunctionPrefetcher, UnusedInputError
 from theano.gof import MissingInputError
 from theano.compat import all, exc_message
 
@@ -17,6 +19,7 @@ import theano
 
 import numpy as N
 from numpy.testing.noseclasses import KnownFailureTest
+from nose.plugins.skip import SkipTest
 
 PatternOptimizer = lambda p1, p2, ign=True: gof.OpKeyOptimizer(gof.PatternSub(p1, p2), ignore_newtrees=ign)
 
@@ -238,6 +241,175 @@ class T_function(unittest.TestCase):
         f(1,2) # put them out of sync
         self.assertFalse(f(1, 2) == g(1, 2)) #they should not be equal anymore.
 
+    def test_copy_share_shared(self):
+        x = T.scalar('x')
+        s = theano.shared(0.0, 's')
+        f = function([x], s + x, updates={s: s + x})
+
+        g = f.copy(share_shared=True)
+        self.assertFalse(g.container[x].storage is f.container[x].storage)
+        self.assertTrue(g.container[s].storage is f.container[s].storage)
+        g(2)
+        self.assertTrue(s.get_value() == 2)
+        f(3)
+        self.assertTrue(g.container[s].value == 5)
+
+        h = f.copy()
+        self.assertFalse(h.container[s].storage is f.container[s].storage)
+        h(1)
+        self.assertTrue(s.get_value() == 5)
+
+    def test_function_pool(self):
+        x = T.vector('x')
+        n_calls = theano.shared(0, 'n_calls')
+        f = function([x], (x ** 2).sum(), updates={n_calls: n_calls + 1})
+        pool = FunctionPool(f, size=3)
+
+        errors = []
+
+        def work(seed):
+            rng = numpy.random.RandomState(seed)
+            try:
+                for i in range(50):
+                    v = rng.rand(100).astype(config.floatX)
+                    assert numpy.allclose(pool(v), (v ** 2).sum())
+            except Exception, e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(i,))
+                   for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors, errors
+        assert 1 <= pool.n_copies <= 3
+        assert len(pool.free) == pool.n_copies
+        # The updates are not synchronized, so some may be lost.
+        assert 0 < n_calls.get_value() <= 300
+
+    def test_function_prefetcher(self):
+        x = T.vector('x')
+        a = T.scalar('a')
+        s = theano.shared(0., 's')
+        profile = theano.compile.ProfileStats(False)
+        f = theano.function([x, theano.Param(a, default=2.)],
+                            (a * x ** 2).sum(), updates={s: s + 1},
+                            profile=profile)
+        prefetch = FunctionPrefetcher(f, depth=3)
+        data = [[float(i), 1.] for i in range(10)]
+        # Lists are filtered in the thread, and `a` takes its default.
+        out = list(prefetch(([d] for d in data)))
+        assert len(out) == 10
+        for o, d in zip(out, data):
+            assert numpy.allclose(o, 2 * (numpy.asarray(d) ** 2).sum())
+        out = list(prefetch([(d, 3.) for d in data]))
+        for o, d in zip(out, data):
+            assert numpy.allclose(o, 3 * (numpy.asarray(d) ** 2).sum())
+        assert s.get_value() == 20
+        assert not f.trust_input
+        # The calls do not turn off the input checks of f for the other
+        # threads, like the one that reads the iterable.
+        seen = []
+
+        def watch():
+            for d in data:
+                seen.append(f.trust_input)
+                yield (d,)
+        list(prefetch(watch()))
+        assert seen == [False] * len(data)
+        assert s.get_value() == 30
+        assert profile.prefetch_callcount == 27
+        assert profile.prefetch_time > 0
+        assert profile.prefetch_filter_time > 0
+
+        # Bad inputs are reported when they are reached.
+        it = prefetch([([1., 2.],), ([[1.]],)])
+        assert numpy.allclose(it.next(), 10)
+        self.assertRaises(TypeError, it.next)
+        self.assertRaises(StopIteration, it.next)
+        self.assertRaises(TypeError, list, prefetch([()]))
+
+        # Closing the iterator stops the thread.
+        def endless():
+            while True:
+                yield ([1.],)
+        it = prefetch(endless())
+        it.next()
+        it.close()
+        it.thread.join(5)
+        assert not it.thread.isAlive()
+        self.assertRaises(ValueError, FunctionPrefetcher, f, depth=0)
+
+    def test_trust_input_fast_call(self):
+        x = T.vector('x')
+        a = T.scalar('a')
+        s = theano.shared(numpy.asarray(0., dtype=config.floatX), 's')
+        f = theano.function([x, theano.Param(a, default=2.)],
+                            [a * x, T.dot(x, x)], updates={s: s + a},
+                            mode=theano.compile.Mode(linker='cvm'))
+        if f._fast_call is None:
+            raise SkipTest("The CVM is not available")
+        f.trust_input = True
+        v = numpy.ones(3, dtype=config.floatX)
+        a3 = numpy.asarray(3., dtype=config.floatX)
+        ax, vv = f(v)
+        assert numpy.allclose(ax, 2 * v) and numpy.allclose(vv, 3)
+        # The default value is put back after a call.
+        assert numpy.allclose(f(v, a3)[0], 3 * v)
+        assert numpy.allclose(f(v)[0], 2 * v)
+        assert numpy.allclose(s.get_value(), 7)
+        # The required input is not kept.
+        assert f.input_storage[0].storage[0] is None
+        self.assertRaises(TypeError, f, v, a3, v)
+        # A single output is unpacked.
+        m = T.matrix('m')
+        g = theano.function([m], T.dot(m, m),
+                            mode=theano.compile.Mode(linker='cvm'))
+        g.trust_input = True
+        call_time = g.maker.mode.call_time
+        assert numpy.allclose(g(numpy.ones((2, 2), dtype=config.floatX)), 2)
+        assert g.maker.mode.call_time > call_time
+        # The outputs are not kept when the VM collects the garbage.
+        if g.fn.allow_gc:
+            assert g.output_storage[0].storage[0] is None
+        # The errors of the nodes are reported as by the normal path.
+        try:
+            g(numpy.ones((2, 3), dtype=config.floatX))
+            assert False
+        except ValueError, e:
+            assert 'Apply node that caused the error' in str(e)
+
+    def test_map(self):
+        x = T.vector('x')
+        a = T.scalar('a')
+        s = theano.shared(numpy.asarray(0., dtype=config.floatX), 's')
+        f = theano.function([x, theano.Param(a, default=2.)],
+                            [a * x, (x ** 2).sum()], updates={s: s + a})
+        xs = numpy.random.rand(5, 3).astype(config.floatX)
+        ax, sq = f.map(xs)
+        assert ax.shape == (5, 3) and sq.shape == (5,)
+        assert numpy.allclose(ax, 2 * xs)
+        assert numpy.allclose(sq, (xs ** 2).sum(axis=1))
+        assert numpy.allclose(s.get_value(), 10)
+        # A list of vectors, and a keyword argument for all the calls.
+        ax, sq = f.map(list(xs), a=3.)
+        assert numpy.allclose(ax, 3 * xs)
+        assert numpy.allclose(s.get_value(), 25)
+        # The default value is back.
+        assert numpy.allclose(f(xs[0])[0], 2 * xs[0])
+        # Several sequences, scalars, and outputs of different shapes.
+        g = theano.function([a, x], x[:x.shape[0] // 2] * a)
+        assert numpy.allclose(g.map(numpy.arange(3.), [[1., 2.]] * 3),
+                              [[0.], [1.], [2.]])
+        out = g.map([1., 2.], [[1., 2.], [1., 2., 3., 4.]])
+        assert isinstance(out, list)
+        assert numpy.allclose(out[0], [1.])
+        assert numpy.allclose(out[1], [2., 4.])
+        self.assertRaises(ValueError, g.map, [1., 2.], [[1.]])
+        self.assertRaises(TypeError, g.map, [1.])
+        self.assertRaises(TypeError, g.map, [1.], numpy.ones((1, 2, 2)))
+
     def test_shared_state0(self):
         a = T.scalar() # the a is for 'anonymous' (un-named).
         x,s = T.scalars('xs')
@@ -700,6 +872,75 @@ def test_empty_givens_updates():
     function([theano.In(x)], y, updates={})
 
 
+def test_cache_optimizations():
+    """
+    Test that optimized graphs are reused from the on-disk cache.
+    """
+    from theano.compile import graph_cache
+    import shutil
+    import tempfile
+
+    mode = theano.compile.mode.get_default_mode()
+    if not isinstance(mode._optimizer, gof.Query):
+        raise SkipTest('The optimizer of the default mode is not cacheable')
+
+    tmpdir = tempfile.mkdtemp()
+    orig_cache_dir = graph_cache.get_cache_dir
+    orig_load = graph_cache.load
+    orig_flag = config.cache_optimizations
+    hits = []
+
+    def load(key):
+        rval = orig_load(key)
+        hits.append(rval is not None)
+        return rval
+
+    def build():
+        x = T.vector('x')
+        s = theano.shared(numpy.zeros(3, dtype=config.floatX))
+        w = theano.shared(numpy.ones((1000, 3), dtype=config.floatX))
+        return function([x], ((T.exp(x) * 2 + s) * w).sum(axis=0),
+                        updates={s: s + x})
+
+    # Loading the module cache can import modules that add config options,
+    # which changes the keys: do it before.
+    build()
+    try:
+        graph_cache.get_cache_dir = lambda: tmpdir
+        graph_cache.load = load
+        config.cache_optimizations = True
+        f1 = build()
+        f2 = build()
+        assert hits == [False, True]
+        assert len(os.listdir(tmpdir)) == 1
+        # The values of the shared variables are not stored in the cache.
+        entry = os.path.join(tmpdir, os.listdir(tmpdir)[0])
+        assert (os.path.getsize(entry) <
+                1000 * 3 * numpy.dtype(config.floatX).itemsize)
+        inputs, outputs = orig_load(os.listdir(tmpdir)[0][:-len('.pkl')])
+        assert not [i for i in inputs if hasattr(i, 'container')]
+        assert ([str(n.op) for n in f1.maker.fgraph.toposort()] ==
+                [str(n.op) for n in f2.maker.fgraph.toposort()])
+        v = numpy.arange(3).astype(config.floatX)
+        for i in range(2):
+            assert numpy.allclose(f1(v), f2(v))
+
+        # A different graph must not hit the cache.
+        x = T.vector('x')
+        function([x], T.exp(x) * 3)
+        assert hits[-1] is False
+        assert len(os.listdir(tmpdir)) == 2
+
+        # Eviction removes the least recently used entries.
+        graph_cache.evict(0)
+        assert os.listdir(tmpdir) == []
+    finally:
+        graph_cache.get_cache_dir = orig_cache_dir
+        graph_cache.load = orig_load
+        config.cache_optimizations = orig_flag
+        shutil.rmtree(tmpdir)
+
+
 if __name__ == '__main__':
 
     if 1:
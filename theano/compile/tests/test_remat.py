@@ -0,0 +1,86 @@
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import checkpoint
+from theano.compile.remat import RecomputeAfter, _size_of
+from theano.gof.sched import peak_memory
+
+
+def mlp(n_layers, every=0, batch=200, width=20):
+    rng = numpy.random.RandomState(0)
+    x = T.matrix('x')
+    h = T.specify_shape(x, (batch, width))
+    params = []
+    for i in range(n_layers):
+        W = theano.shared(rng.uniform(-.5, .5, (width, width)))
+        params.append(W)
+        h = T.tanh(T.dot(h, W))
+        if every and i % every == every - 1 and i < n_layers - 1:
+            h = checkpoint(h)
+    grads = T.grad(h.sum(), params)
+    return x, grads, rng.rand(batch, width)
+
+
+def recomputed(f):
+    return [node for node in f.maker.fgraph.toposort()
+            if isinstance(node.op, RecomputeAfter)]
+
+
+def estimated_peak(f):
+    fgraph = f.maker.fgraph
+    return peak_memory(fgraph, fgraph.toposort(), _size_of(fgraph))
+
+
+def test_checkpoint():
+    x, grads, xv = mlp(9, every=3)
+    mode = theano.compile.Mode(optimizer='fast_run')
+    f = theano.function([x], grads, mode=mode)
+    f_ref = theano.function([x], grads,
+                            mode=mode.excluding('rematerialize'))
+    assert recomputed(f)
+    assert not recomputed(f_ref)
+    assert estimated_peak(f) < estimated_peak(f_ref)
+    for a, b in zip(f(xv), f_ref(xv)):
+        assert numpy.allclose(a, b)
+
+
+def test_checkpoint_not_optimized():
+    # Without the optimization, checkpoint is an identity.
+    x, grads, xv = mlp(4, every=2)
+    f = theano.function([x], grads, mode='FAST_COMPILE')
+    x_ref, grads_ref, xv = mlp(4)
+    f_ref = theano.function([x_ref], grads_ref, mode='FAST_COMPILE')
+    for a, b in zip(f(xv), f_ref(xv)):
+        assert numpy.allclose(a, b)
+
+
+def test_budget():
+    x, grads, xv = mlp(9)
+    mode = theano.compile.Mode(optimizer='fast_run')
+    f_ref = theano.function([x], grads,
+                            mode=mode.excluding('rematerialize'))
+    budget = theano.config.remat.budget
+    try:
+        # Nothing to do when there is no budget and no checkpoint
+        theano.config.remat.budget = 0
+        assert not recomputed(theano.function([x], grads, mode=mode))
+        # Nor when the budget is not exceeded
+        theano.config.remat.budget = 1000
+        assert not recomputed(theano.function([x], grads, mode=mode))
+        theano.config.remat.budget = 0.01
+        f = theano.function([x], grads, mode=mode)
+    finally:
+        theano.config.remat.budget = budget
+    assert recomputed(f)
+    assert estimated_peak(f) < estimated_peak(f_ref)
+    for a, b in zip(f(xv), f_ref(xv)):
+        assert numpy.allclose(a, b)
+
+
+def test_debugmode():
+    # DebugMode checks the view_map of RecomputeAfter and the C code
+    x, grads, xv = mlp(4, every=2, batch=5, width=3)
+    f = theano.function([x], grads, mode='DEBUG_MODE')
+    assert recomputed(f)
+    f(xv)
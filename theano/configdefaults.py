@@ -136,7 +136,7 @@ if rc == 0:
                  ("Default linker used if the theano flags mode is Mode "
                   "or ProfileMode(deprecated)"),
                  EnumStr('cvm', 'c|py', 'py', 'c', 'c|py_nogc', 'c&py',
-                     'vm', 'vm_nogc', 'cvm_nogc'),
+                     'vm', 'vm_nogc', 'cvm_nogc', 'vm_parallel'),
                  in_c_key=False)
 else:
     # g++ is not present, linker should default to python only
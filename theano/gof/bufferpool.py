@@ -0,0 +1,181 @@
+"""
+A pool of memory buffers for the outputs of the nodes run by the VMs.
+
+When the VM garbage collects an intermediate result (allow_gc), the pool
+keeps its buffer instead of letting numpy free it. Before the next node
+runs, the VM puts in its empty output storage an array taken from the
+pool, of the shape its output had the last time its inputs had the same
+shapes. The C code of the
+ops (and most perform) only allocate their output when the one in the
+storage does not have the right shape, so they write into the pooled
+buffer. This removes most of the allocations of the graphs whose shapes
+change from a call to the next (e.g. minibatches of varying size), which
+keep the buffers of all the shapes they saw.
+
+The buffers are flat uint8 arrays whose size is rounded up to a bucket
+size (at most 25% more than requested), so a buffer can be used for any
+shape and dtype with the same bucket.
+"""
+import sys
+import weakref
+
+import numpy
+
+
+def bucket_size(nbytes):
+    """Return the size of the buffers used for an array of `nbytes` bytes.
+
+    The sizes are 64 bytes, then 4 sizes between consecutive powers of 2.
+    """
+    size = 64
+    while size < nbytes:
+        size *= 2
+    if size == 64:
+        return size
+    base = size // 2
+    step = base // 4
+    return base + step * ((nbytes - base + step - 1) // step)
+
+
+def _remove(buffers, buf):
+    # list.remove compares the arrays with ==
+    for i, b in enumerate(buffers):
+        if b is buf:
+            del buffers[i]
+            return
+    raise ValueError(buf)
+
+
+class BufferPool(object):
+    """
+    Keep the buffers of the garbage collected results, up to `capacity`
+    bytes, to use them for the outputs computed next.
+
+    :param capacity: maximum number of bytes kept in the pool. When a
+        buffer does not fit, the buffers are evicted in the order given by
+        `eviction`: 'lru' evicts the buffers returned the longest time ago,
+        'largest' the largest buffers first.
+
+    The counters `hits`, `misses` (buffers allocated because the pool had
+    none of the right size), `unused` (buffers given to a node that
+    allocated its output anyway, because its shape changed) and
+    `evictions` count from the creation of the pool, or from the last
+    `reset_counters`. `bytes_held` is the size
+    of the buffers currently in the pool and `max_bytes_held` its maximum.
+    """
+    def __init__(self, capacity, eviction='lru'):
+        if eviction not in ('lru', 'largest'):
+            raise ValueError('Unknown eviction policy', eviction)
+        self.capacity = capacity
+        self.eviction = eviction
+        # bucket size -> list of free buffers, the last returned at the end
+        self.free = {}
+        # The free buffers, in the order they were returned
+        self.free_order = []
+        # id -> buffer given to an output. They can be returned when the
+        # result is garbage collected.
+        self.in_use = weakref.WeakValueDictionary()
+        # (Variable, shapes of the inputs of its owner) -> its shape
+        self.shapes = {}
+        self.bytes_held = 0
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.unused = 0
+        self.evictions = 0
+        self.max_bytes_held = self.bytes_held
+
+    def acquire(self, dtype, shape):
+        """Return an uninitialized array that uses a buffer of the pool."""
+        dtype = numpy.dtype(dtype)
+        nbytes = dtype.itemsize * int(numpy.prod(shape))
+        if nbytes == 0:
+            return numpy.empty(shape, dtype=dtype)
+        size = bucket_size(nbytes)
+        bucket = self.free.get(size)
+        if bucket:
+            buf = bucket.pop()
+            _remove(self.free_order, buf)
+            self.bytes_held -= size
+            self.hits += 1
+        else:
+            buf = numpy.empty(size, dtype='uint8')
+            self.misses += 1
+        self.in_use[id(buf)] = buf
+        return buf[:nbytes].view(dtype).reshape(shape)
+
+    def clear(self, container):
+        """Empty `container` (a storage cell) and keep the buffer of its
+        value, if it comes from the pool and nothing else uses it."""
+        value = container[0]
+        container[0] = None
+        if type(value) is not numpy.ndarray:
+            return
+        buf = value.base
+        if buf is None or self.in_use.get(id(buf)) is not buf:
+            return
+        # The only references must be the locals of this method (and the
+        # argument of getrefcount). Otherwise, another storage cell or a
+        # view still uses the memory.
+        if sys.getrefcount(value) > 2 or sys.getrefcount(buf) > 3:
+            return
+        del self.in_use[id(buf)]
+        del value
+        self._keep(buf)
+
+    def _keep(self, buf):
+        size = buf.size
+        if size > self.capacity:
+            return
+        while self.bytes_held + size > self.capacity:
+            if self.eviction == 'lru':
+                old = self.free_order[0]
+            else:
+                old = max(self.free_order, key=lambda b: b.size)
+            _remove(self.free_order, old)
+            _remove(self.free[old.size], old)
+            self.bytes_held -= old.size
+            self.evictions += 1
+        self.free.setdefault(size, []).append(buf)
+        self.free_order.append(buf)
+        self.bytes_held += size
+        self.max_bytes_held = max(self.max_bytes_held, self.bytes_held)
+
+    def fill(self, inputs, outputs):
+        """Put a pooled array in the empty storage of `outputs`, a list of
+        (variable, storage cell), for the variables whose shape is known
+        for the shapes of the values in `inputs` (the storage cells of the
+        inputs of the node).
+
+        Return the arrays put in the storage, and the input shapes, to give
+        to `settle`."""
+        in_shapes = tuple([getattr(c[0], 'shape', None) for c in inputs])
+        acquired = []
+        for var, container in outputs:
+            arr = None
+            if container[0] is None:
+                shape = self.shapes.get((var, in_shapes))
+                if shape is not None:
+                    arr = self.acquire(var.type.dtype, shape)
+                    container[0] = arr
+            acquired.append(arr)
+        return acquired, in_shapes
+
+    def settle(self, outputs, ticket):
+        """To call after the node ran, with the return value of `fill`.
+        Record the shapes of the outputs and keep the pooled arrays that
+        the node did not use."""
+        acquired, in_shapes = ticket
+        for i, (var, container) in enumerate(outputs):
+            value = container[0]
+            if type(value) is numpy.ndarray:
+                self.shapes[(var, in_shapes)] = value.shape
+            if acquired[i] is not None:
+                c = [acquired[i]]
+                # Do not keep a reference, that would prevent clear().
+                acquired[i] = None
+                if value is not c[0]:
+                    self.unused += 1
+                    self.clear(c)
@@ -139,6 +139,19 @@ def failure_code(sub):
         goto __label_%(id)i;}''' % sub
 
 
+def nogil_code():
+    """Code contained in sub['begin_nogil'] and sub['end_nogil'].
+
+    They release the GIL and take it back, when config.cmodule.release_gil
+    is True. The code between them must not use the Python C API (this
+    includes %(fail)s), and must not jump out of that region. They open
+    and close a C block, so variables declared in between are local to it.
+    """
+    if config.cmodule.release_gil:
+        return 'Py_BEGIN_ALLOW_THREADS\n', 'Py_END_ALLOW_THREADS\n'
+    return '', ''
+
+
 def code_gen(blocks):
     """WRITEME From a list of L{CodeBlock} instances, returns a string
     that executes them all in sequence. eg for C{(decl1, task1,
@@ -626,6 +639,7 @@ class CLinker(link.Linker):
             # Make the CodeBlock for c_code
             sub['id'] = id
             sub['fail'] = failure_code(sub)
+            sub['begin_nogil'], sub['end_nogil'] = nogil_code()
 
             op = node.op
             # type-specific support code
@@ -1136,6 +1150,12 @@ class CLinker(link.Linker):
                         #generic constants don't have a hashable signature
                         error_on_play[0] = True
                         return None
+                    if i in fgraph_inputs_dict:
+                        # A constant that is an input of the fgraph (like
+                        # in Op.make_thunk) is extracted at each run, not
+                        # when the module is instantiated like an orphan,
+                        # so the module takes its arguments in another order.
+                        isig = (isig, fgraph_inputs_dict[i])
                     constant_ids[id(i)] = isig
                 else:
                     isig = constant_ids[id(i)]
@@ -1208,8 +1228,13 @@ class CLinker(link.Linker):
         Compile the module and return it.
         """
         # Go through all steps of the compilation process.
-        for step_result in self.compile_cmodule_by_step(location=location):
-            pass
+        get_lock()
+        try:
+            for step_result in self.compile_cmodule_by_step(
+                    location=location):
+                pass
+        finally:
+            release_lock()
         # And return the output of the last step, which should be the module
         # itself.
         return step_result
@@ -1223,9 +1248,33 @@ class CLinker(link.Linker):
             - it last yields the module itself
             - it may yield other intermediate outputs in-between if needed
               in the future (but this is not currently the case)
+
+        The caller is responsible for locking the compilation directory.
         """
         if location is None:
             location = cmodule.dlimport_workdir(config.compiledir)
+        src_code, c_compiler, compile_kwargs = self.prepare_cmodule()
+        yield src_code
+        _logger.debug("LOCATION %s", str(location))
+        try:
+            module = c_compiler.compile_str(
+                src_code=src_code,
+                location=location,
+                **compile_kwargs)
+        except Exception, e:
+            e.args += (str(self.fgraph),)
+            raise
+
+        yield module
+
+    def prepare_cmodule(self):
+        """
+        Generate the code of the module, without compiling it.
+
+        :returns: a (src_code, c_compiler, compile_kwargs) tuple, such that
+        ``c_compiler.compile_str(src_code=src_code, location=location,
+        **compile_kwargs)`` compiles the module in `location`.
+        """
         mod = self.build_dynamic_module()
         c_compiler = self.c_compiler()
         libs = self.libraries()
@@ -1244,27 +1293,14 @@ class CLinker(link.Linker):
                 preargs.remove('-DREPLACE_WITH_AMDLIBM')
             if 'amdlibm' in libs:
                 libs.remove('amdlibm')
+        # The module name is only known once the code is generated.
         src_code = mod.code()
-        yield src_code
-        get_lock()
-        try:
-            _logger.debug("LOCATION %s", str(location))
-            try:
-                module = c_compiler.compile_str(
-                    module_name=mod.code_hash,
-                    src_code=src_code,
-                    location=location,
-                    include_dirs=self.header_dirs(),
-                    lib_dirs=self.lib_dirs(),
-                    libs=libs,
-                    preargs=preargs)
-            except Exception, e:
-                e.args += (str(self.fgraph),)
-                raise
-        finally:
-            release_lock()
-
-        yield module
+        compile_kwargs = dict(module_name=mod.code_hash,
+                              include_dirs=self.header_dirs(),
+                              lib_dirs=self.lib_dirs(),
+                              libs=libs,
+                              preargs=preargs)
+        return src_code, c_compiler, compile_kwargs
 
     def build_dynamic_module(self):
         """Return a cmodule.DynamicModule instance full of the code
@@ -1425,25 +1461,32 @@ class _CThunk(object):
     def __call__(self):
         failure = run_cthunk(self.cthunk)
         if failure:
-            task, taskname, id = self.find_task(failure)
-            try:
-                trace = task.trace
-            except AttributeError:
-                trace = ()
-            try:
-                exc_type, _exc_value, exc_trace = self.error_storage
-                if task in self.nodes:
-                    self.position_of_error = self.nodes.index(task)
-                # this can be used to retrieve the location the Op was declared
-                exc_value = exc_type(_exc_value)
-                exc_value.__thunk_trace__ = trace
-            except Exception:
-                print >> sys.stderr, ('ERROR retrieving error_storage.'
-                                      ' Was the error set in the c code?'),
-                print >> sys.stderr, self.error_storage
-                raise
-
-            raise exc_type, exc_value, exc_trace
+            self.raise_failure(failure)
+
+    def raise_failure(self, failure):
+        """
+        Raise the error stored by the C code for the failure code
+        `failure`, returned by the C function of the thunk.
+        """
+        task, taskname, id = self.find_task(failure)
+        try:
+            trace = task.trace
+        except AttributeError:
+            trace = ()
+        try:
+            exc_type, _exc_value, exc_trace = self.error_storage
+            if task in self.nodes:
+                self.position_of_error = self.nodes.index(task)
+            # this can be used to retrieve the location the Op was declared
+            exc_value = exc_type(_exc_value)
+            exc_value.__thunk_trace__ = trace
+        except Exception:
+            print >> sys.stderr, ('ERROR retrieving error_storage.'
+                                  ' Was the error set in the c code?'),
+            print >> sys.stderr, self.error_storage
+            raise
+
+        raise exc_type, exc_value, exc_trace
 
 
 class OpWiseCLinker(link.LocalLinker):
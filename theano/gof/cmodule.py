@@ -5,12 +5,14 @@ import cPickle
 import logging
 import operator
 import os
+import pickle
 import re
 import shutil
 import stat
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 
 import distutils.sysconfig
@@ -35,7 +37,7 @@ from theano.misc.windows import call_subprocess_Popen
 from theano.gof import compilelock
 from theano.gof.compiledir import gcc_version_str, local_bitwidth
 
-from theano.configparser import AddConfigVar, BoolParam
+from theano.configparser import AddConfigVar, BoolParam, IntParam
 
 AddConfigVar('cmodule.mac_framework_link',
         "If set to True, breaks certain MacOS installations with the infamous "
@@ -60,6 +62,30 @@ AddConfigVar('cmodule.compilation_warning',
              "If True, will print compilation warnings.",
              BoolParam(False))
 
+AddConfigVar('cmodule.use_index',
+             "If True, the cache of compiled modules keeps an index file "
+             "mapping module hashes and key digests to cache directories. "
+             "Starting a process then only reads this file, and the key.pkl "
+             "file of a cached module is only loaded when a function needs "
+             "that module, instead of loading all of them when the cache is "
+             "first used.",
+             BoolParam(False),
+             in_c_key=False)
+
+AddConfigVar('cmodule.compile_workers',
+             "Number of g++ processes used to compile in parallel the C "
+             "modules of a function that are not in the cache yet. "
+             "0 disables parallel compilation (modules are compiled one "
+             "after the other) and -1 uses one process per CPU.",
+             IntParam(0, lambda i: i >= -1),
+             in_c_key=False)
+
+AddConfigVar('cmodule.release_gil',
+             "If True, the C code of Ops that support it releases the "
+             "Python GIL during its computation, so that Theano functions "
+             "called from different threads can run in parallel.",
+             BoolParam(True))
+
 
 _logger = logging.getLogger("theano.gof.cmodule")
 _logger.setLevel(logging.WARNING)
@@ -400,6 +426,32 @@ def get_module_hash(src_code, key):
     return hash_from_code('\n'.join(to_hash))
 
 
+def get_key_digest(key):
+    """
+    Return an MD5 hash of the pickled `key`, or None if it cannot be pickled.
+
+    It is stored in the index file (see `ModuleCache.index_filename`), to find
+    the module of a key without generating its C code. As the key is always
+    compared with the keys loaded from the key.pkl file of that module, a
+    digest that is not stable across processes only causes a cache miss.
+    """
+    # cPickle only memoizes the objects that have other references, so its
+    # output depends on reference counts, unless the memo is disabled with
+    # the `fast` mode. The slower pickle module is needed for cyclic keys.
+    buf = BytesIO()
+    pickler = cPickle.Pickler(buf, 2)
+    pickler.fast = 1
+    try:
+        try:
+            pickler.dump(key)
+            pickled = buf.getvalue()
+        except ValueError:
+            pickled = pickle.dumps(key, 2)
+    except Exception:
+        return None
+    return hash_from_code(pickled)
+
+
 def get_safe_part(key):
     """
     Return a tuple containing a subset of `key`, to be used to find equal keys.
@@ -582,6 +634,14 @@ class ModuleCache(object):
     """set of all key.pkl files that have been loaded.
     """
 
+    index_filename = 'modules_index.txt'
+    """Name of the index file (in `dirname`) used with `config.cmodule.use_index`.
+
+    Each line contains the hash of a versioned module, the name of its
+    directory and the digests of its keys (see `get_key_digest`). New
+    modules are appended to it, and it is rewritten by ``refresh``.
+    """
+
     def __init__(self, dirname, check_for_broken_eq=True, do_refresh=True):
         """
         :param check_for_broken_eq: A bad __eq__ implementation can break this
@@ -599,10 +659,25 @@ class ModuleCache(object):
         self.stats = [0, 0, 0]
         self.check_for_broken_eq = check_for_broken_eq
         self.loaded_key_pkl = set()
+        # Maps a module hash to the (location, library filename) of a module
+        # compiled by ``compile_parallel`` that was not added to the cache
+        # yet.
+        self.precompiled = {}
+        # Maps the module hash of a module listed in the index file, whose
+        # key.pkl file was not loaded yet, to the directory of the module.
+        self.indexed_dirs = {}
+        # Maps the digest of a key listed in the index file to the module
+        # hash of its module, for the modules in `indexed_dirs`.
+        self.indexed_keys = {}
         self.time_spent_in_check_key = 0
 
         if do_refresh:
-            self.refresh()
+            if (config.cmodule.use_index and
+                os.path.exists(os.path.join(dirname, self.index_filename))):
+                # The modules will be loaded when they are needed.
+                self.read_index()
+            else:
+                self.refresh()
 
     age_thresh_use = 60 * 60 * 24 * 24    # 24 days
     """
@@ -627,6 +702,9 @@ class ModuleCache(object):
               unknown exception.
             - Duplicated modules, regardless of their age.
 
+        With `config.cmodule.use_index`, the key.pkl files of the modules
+        listed in the index are not loaded, and the index is rewritten.
+
         :returns: a list of modules of age higher than age_thresh_use.
         """
         if age_thresh_use is None:
@@ -636,6 +714,12 @@ class ModuleCache(object):
 
         compilelock.get_lock()
         try:
+            if config.cmodule.use_index:
+                # Other processes may have added modules to the index.
+                self.read_index()
+            indexed_dirs = set(self.indexed_dirs.values())
+            # Directories of indexed modules that still exist.
+            found_indexed_dirs = set()
             # add entries that are not in the entry_from_key dictionary
             time_now = time.time()
             # Go through directories in alphabetical order to ensure consistent
@@ -664,6 +748,10 @@ class ModuleCache(object):
                                 msg="missing module file", level=logging.INFO)
                         continue
                     if (time_now - last_access_time(entry)) < age_thresh_use:
+                        if root in indexed_dirs:
+                            # Its key.pkl will be loaded only if needed.
+                            found_indexed_dirs.add(root)
+                            continue
                         _logger.debug('refresh adding %s', key_pkl)
 
                         def unpickle_failure():
@@ -860,6 +948,16 @@ class ModuleCache(object):
                                     pkl_file_to_remove)
                         self.loaded_key_pkl.remove(pkl_file_to_remove)
 
+            if config.cmodule.use_index:
+                for module_hash, root in self.indexed_dirs.items():
+                    if root not in found_indexed_dirs:
+                        # Deleted, or too old to use.
+                        del self.indexed_dirs[module_hash]
+                for digest, module_hash in self.indexed_keys.items():
+                    if module_hash not in self.indexed_dirs:
+                        del self.indexed_keys[digest]
+                self.write_index()
+
         finally:
             compilelock.release_lock()
 
@@ -868,6 +966,133 @@ class ModuleCache(object):
 
         return too_old_to_use
 
+    def read_index(self):
+        """
+        Read the index file, to know which modules are in the cache.
+
+        Only the modules that are neither loaded nor already known from the
+        index are added to `indexed_dirs`, and the digests of their keys to
+        `indexed_keys`.
+        """
+        try:
+            index_file = open(os.path.join(self.dirname, self.index_filename))
+        except IOError:
+            return
+        try:
+            for line in index_file:
+                fields = line.split()
+                if len(fields) < 2:
+                    # May happen if a process was killed while writing it.
+                    continue
+                module_hash, dirname = fields[:2]
+                if module_hash not in self.module_hash_to_key_data:
+                    self.indexed_dirs.setdefault(
+                        module_hash, os.path.join(self.dirname, dirname))
+                    for digest in fields[2:]:
+                        self.indexed_keys[digest] = module_hash
+        finally:
+            index_file.close()
+
+    def write_index(self):
+        """
+        Rewrite the index file from the modules known to this cache.
+
+        The compilation lock should be held when calling this function.
+        """
+        lines = set()
+        for module_hash, key_data in self.module_hash_to_key_data.iteritems():
+            if key_data.key_pkl in self.loaded_key_pkl:
+                # This is a versioned module (saved on disk).
+                lines.add(self._index_line(
+                    module_hash, os.path.dirname(key_data.key_pkl),
+                    [get_key_digest(key) for key in key_data.keys]))
+        digests = {}
+        for digest, module_hash in self.indexed_keys.iteritems():
+            digests.setdefault(module_hash, []).append(digest)
+        for module_hash, root in self.indexed_dirs.iteritems():
+            lines.add(self._index_line(module_hash, root,
+                                       digests.get(module_hash, [])))
+        index_path = os.path.join(self.dirname, self.index_filename)
+        # Write to a temporary file and rename it, so that other processes
+        # never read a partial index.
+        tmp_path = index_path + '.%s.tmp' % os.getpid()
+        tmp_file = open(tmp_path, 'w')
+        try:
+            tmp_file.writelines(sorted(lines))
+        finally:
+            tmp_file.close()
+        os.rename(tmp_path, index_path)
+
+    def _index_line(self, module_hash, location, digests):
+        """Return the line of the index file for a module."""
+        fields = [module_hash, os.path.basename(location)]
+        fields += sorted(d for d in digests if d is not None)
+        return ' '.join(fields) + '\n'
+
+    def add_to_index(self, module_hash, location, keys):
+        """
+        Append a new versioned module, or new keys of a module, to the index
+        file.
+
+        If there is no index file yet, nothing is done: the next ``refresh``
+        will write a complete one.
+
+        The compilation lock should be held when calling this function.
+        """
+        index_path = os.path.join(self.dirname, self.index_filename)
+        if not os.path.exists(index_path):
+            return
+        index_file = open(index_path, 'a')
+        try:
+            index_file.write(self._index_line(
+                module_hash, location, [get_key_digest(key) for key in keys]))
+        finally:
+            index_file.close()
+
+    def load_indexed(self, module_hash):
+        """
+        Load the key.pkl file of a module listed in the index file.
+
+        Modules that cannot be loaded are forgotten: the next ``refresh``
+        will clean up their directory if needed.
+
+        The compilation lock should be held when calling this function.
+        """
+        root = self.indexed_dirs.pop(module_hash)
+        for digest, digest_hash in self.indexed_keys.items():
+            if digest_hash == module_hash:
+                del self.indexed_keys[digest]
+        key_pkl = os.path.join(root, 'key.pkl')
+        if key_pkl in self.loaded_key_pkl:
+            return
+        try:
+            entry = module_name_from_dir(root)
+            if (time.time() - last_access_time(entry) >=
+                    self.age_thresh_use):
+                return
+            key_data = cPickle.load(open(key_pkl, 'rb'))
+        except Exception:
+            _logger.info("ModuleCache.load_indexed() Failed to load %s",
+                         key_pkl)
+            return
+        if (not isinstance(key_data, KeyData) or
+            key_data.module_hash != module_hash or
+            not is_same_entry(entry, key_data.get_entry())):
+            _logger.info("ModuleCache.load_indexed() Ignoring %s, which "
+                         "does not match the index", key_pkl)
+            return
+        _logger.debug('load_indexed adding %s', key_pkl)
+        key_data.entry = entry
+        key_data.key_pkl = key_pkl
+        self.module_hash_to_key_data[module_hash] = key_data
+        for key in key_data.keys:
+            if key not in self.entry_from_key:
+                self.entry_from_key[key] = entry
+                if key[0]:
+                    self.similar_keys.setdefault(get_safe_part(key),
+                                                 []).append(key)
+        self.loaded_key_pkl.add(key_pkl)
+
     def module_from_key(self, key, fn=None, keep_lock=False, key_data=None):
         """
         :param fn: A callable object that will return an iterable object when
@@ -893,6 +1118,16 @@ class ModuleCache(object):
                 raise ValueError(
                         "Invalid key. key must have form (version, rest)", key)
         name = None
+        if (key is not None and self.indexed_keys and
+                key not in self.entry_from_key):
+            # Look for the key in the index before generating the C code.
+            module_hash = self.indexed_keys.get(get_key_digest(key))
+            if module_hash in self.indexed_dirs:
+                compilelock.get_lock()
+                try:
+                    self.load_indexed(module_hash)
+                finally:
+                    compilelock.release_lock()
         if key is not None and key in self.entry_from_key:
             # We have seen this key either in this process or previously.
             name = self.entry_from_key[key]
@@ -917,6 +1152,9 @@ class ModuleCache(object):
             # generate C code. Otherwise, we would take the lock for ops
             # that have only a perform().
             lock_taken = False
+            # With the compile.fine_grained_lock flag, this is the lock held
+            # while compiling this module, see below.
+            module_lock = None
             # This try/finally block ensures that the lock is released once we
             # are done writing in the cache file or after raising an exception.
             try:
@@ -941,6 +1179,19 @@ class ModuleCache(object):
                     src_code = next(compile_steps)
                     module_hash = get_module_hash(src_code, key)
 
+                    if (compilelock.use_fine_grained_lock() and
+                        not getattr(compilelock.get_lock, 'n_lock', 0)):
+                        # Only one process at a time may compile a given
+                        # module, but the lock on the whole cache is released
+                        # during compilation (see below). We do not do it if
+                        # we already hold that lock, as waiting for the module
+                        # lock could then deadlock.
+                        module_lock = compilelock.get_module_lock(
+                            self.dirname, module_hash)
+                        if module_lock.acquire():
+                            # Another process may have just compiled it.
+                            self.refresh()
+
                     # The op has c_code, so take the lock.
                     compilelock.get_lock()
                     lock_taken = True
@@ -950,6 +1201,10 @@ class ModuleCache(object):
                         # get deleted by the clear*() fct.
                         os.makedirs(location)
 
+                    if module_hash in self.indexed_dirs:
+                        # Only load the key.pkl file of this module now.
+                        self.load_indexed(module_hash)
+
                     if module_hash in self.module_hash_to_key_data:
                         _logger.debug("Duplicated module! Will re-use the "
                                       "previous one")
@@ -962,40 +1217,74 @@ class ModuleCache(object):
                         module = self.module_from_key(key=None,
                                                       key_data=key_data)
                         name = module.__file__
-                        # Add current key to the set of keys associated to the
-                        # same module. We only save the KeyData object of
-                        # versioned modules.
-                        try:
-                            key_data.add_key(key, save_pkl=bool(_version))
+                        if key in key_data.keys:
+                            # The key was just loaded from the index: this is
+                            # a cache hit after all.
                             key_broken = False
-                        except cPickle.PicklingError:
-                            # This should only happen if we tried to save the
-                            # pickled file.
-                            assert _version
-                            # The key we are trying to add is broken: we will
-                            # not add it after all.
-                            key_data.remove_key(key)
-                            key_broken = True
-
-                        if (_version and not key_broken and
-                            self.check_for_broken_eq):
-                            self.check_key(key, key_data.key_pkl)
+                        else:
+                            # Add current key to the set of keys associated to
+                            # the same module. We only save the KeyData object
+                            # of versioned modules.
+                            try:
+                                key_data.add_key(key, save_pkl=bool(_version))
+                                key_broken = False
+                            except cPickle.PicklingError:
+                                # This should only happen if we tried to save
+                                # the pickled file.
+                                assert _version
+                                # The key we are trying to add is broken: we
+                                # will not add it after all.
+                                key_data.remove_key(key)
+                                key_broken = True
+
+                            if (_version and not key_broken and
+                                self.check_for_broken_eq):
+                                self.check_key(key, key_data.key_pkl)
+
+                            if (_version and not key_broken and
+                                key_data.key_pkl in self.loaded_key_pkl):
+                                # Also find this key through the index.
+                                self.add_to_index(
+                                    module_hash,
+                                    os.path.dirname(key_data.key_pkl), [key])
 
                         # We can delete the work directory.
                         _rmtree(location, ignore_nocleanup=True,
                                 msg='temporary workdir of duplicated module')
 
                     else:
-                        # Will fail if there is an error compiling the C code.
-                        # The exception will be caught and the work dir will be
-                        # deleted.
-                        while True:
+                        if module_hash in self.precompiled:
+                            # The library was already built by
+                            # compile_parallel(): we only need to import it
+                            # from its own directory.
+                            _rmtree(location, ignore_nocleanup=True,
+                                    msg='workdir of precompiled module')
+                            location, lib_filename = self.precompiled.pop(
+                                module_hash)
+                            open(os.path.join(location, "__init__.py"),
+                                 'w').close()
+                            module = dlimport(lib_filename)
+                        else:
+                            if module_lock is not None:
+                                # The module lock is enough while compiling in
+                                # our own work dir.
+                                compilelock.release_lock()
+                                lock_taken = False
+                            # Will fail if there is an error compiling the C
+                            # code. The exception will be caught and the work
+                            # dir will be deleted.
                             try:
-                                # The module should be returned by the last
-                                # step of the compilation.
-                                module = next(compile_steps)
-                            except StopIteration:
-                                break
+                                while True:
+                                    try:
+                                        # The module should be returned by the
+                                        # last step of the compilation.
+                                        module = next(compile_steps)
+                                    except StopIteration:
+                                        break
+                            finally:
+                                if not lock_taken:
+                                    compilelock.get_lock()
+                                    lock_taken = True
 
                         # Obtain path to the '.so' module file.
                         name = module.__file__
@@ -1043,6 +1332,10 @@ class ModuleCache(object):
                             # Adding the KeyData file to this set means it is a
                             # versioned module.
                             self.loaded_key_pkl.add(key_pkl)
+                            # Done even without config.cmodule.use_index, to
+                            # keep an existing index up to date.
+                            self.add_to_index(module_hash, location,
+                                              key_data.keys)
                         elif config.cmodule.warn_no_version:
                             key_flat = flatten(key)
                             ops = [k for k in key_flat
@@ -1073,6 +1366,8 @@ class ModuleCache(object):
                 # Release lock if needed.
                 if not keep_lock and lock_taken:
                     compilelock.release_lock()
+                if module_lock is not None and module_lock.fd is not None:
+                    module_lock.release()
 
             # Update map from key to module name for all keys associated to
             # this same module.
@@ -1106,6 +1401,82 @@ class ModuleCache(object):
         #_logger.debug('stats %s %i', self.stats, sum(self.stats))
         return rval
 
+    def compile_parallel(self, jobs, n_workers):
+        """
+        Compile several modules at the same time, without importing them.
+
+        The libraries are only built here. They are added to the cache the
+        next time ``module_from_key`` is called with their key, which then
+        only has to import them instead of compiling them.
+
+        :param jobs: A list of (key, src_code, compile_fn) tuples. `compile_fn`
+        is called with a single `location` argument, the directory where the
+        library should be built, and should return the path to the library.
+        Modules that are already in the cache (or have the same module hash
+        as another job) are skipped.
+
+        :param n_workers: The maximum number of modules compiled at the same
+        time.
+        """
+        todo = []
+        seen = set()
+        for key, src_code, compile_fn in jobs:
+            if key in self.entry_from_key:
+                continue
+            module_hash = get_module_hash(src_code, key)
+            if (module_hash in self.module_hash_to_key_data or
+                module_hash in self.precompiled or
+                module_hash in seen):
+                continue
+            seen.add(module_hash)
+            todo.append((module_hash, compile_fn))
+        if len(todo) < 2 or n_workers < 2:
+            # Nothing to gain: module_from_key will compile it.
+            return
+        _logger.debug('Compiling %i modules with %i workers',
+                      len(todo), n_workers)
+
+        results = []
+
+        def worker():
+            while True:
+                try:
+                    module_hash, compile_fn = todo.pop()
+                except IndexError:
+                    return
+                location = dlimport_workdir(self.dirname)
+                try:
+                    lib_filename = compile_fn(location=location)
+                except Exception:
+                    # The error will be reported when module_from_key
+                    # compiles this module again.
+                    _rmtree(location, ignore_if_missing=True,
+                            msg='parallel compilation failed')
+                    continue
+                results.append((module_hash, location, lib_filename))
+
+        compilelock.get_lock()
+        try:
+            threads = [threading.Thread(target=worker)
+                       for i in xrange(min(n_workers, len(todo)))]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            for module_hash, location, lib_filename in results:
+                self.precompiled[module_hash] = (location, lib_filename)
+        finally:
+            compilelock.release_lock()
+
+    def discard_precompiled(self):
+        """
+        Delete the modules built by ``compile_parallel`` that were not used.
+        """
+        for location, lib_filename in self.precompiled.values():
+            _rmtree(location, ignore_nocleanup=True,
+                    msg='unused precompiled module')
+        self.precompiled.clear()
+
     def check_key(self, key, key_pkl):
         """
         Perform checks to detect broken __eq__ / __hash__ implementations.
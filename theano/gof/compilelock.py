@@ -2,13 +2,32 @@
 # in the same compilation directory (which can cause crashes).
 
 import atexit
+import errno
 import os
 import random
 import socket  # only used for gethostname()
 import time
 import logging
 
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows.
+    fcntl = None
+
 from theano import config
+from theano.configparser import AddConfigVar, BoolParam
+
+AddConfigVar('compile.fine_grained_lock',
+             "If True, the lock on the compilation directory is only held "
+             "while reading or updating the cache of compiled modules, and "
+             "each module is compiled under its own lock, so that processes "
+             "compiling different modules do not wait for each other. "
+             "Processes waiting for a lock are then woken up as soon as it "
+             "is released, instead of checking it every few seconds. "
+             "Ignored on systems without fcntl (e.g. Windows).",
+             BoolParam(False),
+             in_c_key=False)
 
 _logger = logging.getLogger("theano.gof.compilelock")
 # INFO will show the the messages "Refreshing lock" message
@@ -26,6 +45,17 @@ timeout_before_override = 120
 # 'refresh_every' seconds.
 refresh_every = 60
 
+# Number of files used to lock the compilation of individual modules. Modules
+# whose hash falls in the same stripe share the same lock.
+n_module_lock_stripes = 256
+
+
+def use_fine_grained_lock():
+    """
+    Return True if the `compile.fine_grained_lock` flag is set and supported.
+    """
+    return config.compile.fine_grained_lock and fcntl is not None
+
 
 def force_unlock():
     """
@@ -72,7 +102,19 @@ def get_lock(lock_dir=None, **kw):
     if get_lock.lock_is_enabled:
         # Only really try to acquire the lock if we do not have it already.
         if get_lock.n_lock == 0:
-            lock(get_lock.lock_dir, timeout=timeout_before_override, **kw)
+            if use_fine_grained_lock():
+                # Processes using fcntl locks queue on this file instead of
+                # polling the lock directory, which is then free unless it is
+                # held by a process that does not use fcntl locks.
+                get_lock.file_lock = FileLock(get_lock.lock_dir + '.flock')
+                get_lock.file_lock.acquire()
+            try:
+                lock(get_lock.lock_dir, timeout=timeout_before_override, **kw)
+            except Exception:
+                if getattr(get_lock, 'file_lock', None) is not None:
+                    get_lock.file_lock.release()
+                    get_lock.file_lock = None
+                raise
             atexit.register(Unlocker.unlock, get_lock.unlocker)
             # Store time at which the lock was set.
             get_lock.start_time = time.time()
@@ -99,6 +141,9 @@ def release_lock():
     if get_lock.lock_is_enabled and get_lock.n_lock == 0:
         get_lock.start_time = None
         get_lock.unlocker.unlock()
+        if getattr(get_lock, 'file_lock', None) is not None:
+            get_lock.file_lock.release()
+            get_lock.file_lock = None
 
 
 def set_lock_status(use_lock):
@@ -278,6 +323,73 @@ def refresh_lock(lock_file):
     return unique_id
 
 
+class FileLock(object):
+    """
+    Exclusive lock between processes, based on `fcntl.flock`.
+
+    A process waiting for the lock sleeps until it is released, and the
+    operating system releases the lock if the process holding it dies, so
+    there is no need for timeouts or polling. Only available where `fcntl`
+    is.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.fd = None
+
+    def acquire(self):
+        """
+        Acquire the lock, creating the file if needed.
+
+        :returns: True if another process was holding the lock, so that we
+        had to wait for it, and False otherwise.
+        """
+        assert self.fd is None
+        lock_dir = os.path.dirname(self.filename)
+        nb_error = 0
+        while True:
+            try:
+                if not os.path.isdir(lock_dir):
+                    os.makedirs(lock_dir)
+                self.fd = os.open(self.filename, os.O_RDWR | os.O_CREAT)
+                break
+            except OSError:
+                # Someone else may have created (or deleted, if it was empty)
+                # the directory at the same time.
+                nb_error += 1
+                if nb_error > 10:
+                    raise
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return False
+        except IOError, e:
+            if e.errno not in (errno.EAGAIN, errno.EACCES):
+                os.close(self.fd)
+                self.fd = None
+                raise
+        _logger.debug('Waiting for lock %s', self.filename)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return True
+
+    def release(self):
+        """Release the lock."""
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        os.close(self.fd)
+        self.fd = None
+
+
+def get_module_lock(compiledir, module_hash):
+    """
+    Return the (not yet acquired) `FileLock` for compiling a module.
+
+    Locks are striped over `n_module_lock_stripes` files, selected from the
+    end of the module hash.
+    """
+    stripe = int(module_hash[-4:], 16) % n_module_lock_stripes
+    return FileLock(os.path.join(compiledir, 'lock_dir_modules',
+                                 'lock_%i' % stripe))
+
+
 class Unlocker(object):
     """
     Class wrapper around release mechanism so that the lock is automatically
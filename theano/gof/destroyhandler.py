@@ -2,6 +2,8 @@
 Classes and functions for validating graphs that contain view
 and inplace operations.
 """
+from bisect import bisect_left, bisect_right, insort
+
 import theano
 import toolbox
 import graph
@@ -182,6 +184,235 @@ def _contains_cycle(fgraph, orderings):
 
     return visited != len(parent_counts)
 
+class DynamicTopoOrder(object):
+    """
+    Maintain a topological order of the Apply nodes of a FunctionGraph,
+    including the extra dependencies given by orderings, so that cycles can
+    be detected at a cost proportional to the size of the change instead of
+    the size of the graph.
+
+    Each node has a float key, and the keys respect every dependency that was
+    checked. When a node is imported, it gets a key between those of its
+    parents and children. When a dependency u -> v violates the order, the
+    order is repaired locally as in Pearce and Kelly's dynamic topological
+    sort: the descendants of v whose key is lower than u's and the ancestors
+    of u whose key is higher than v's are swapped, and a cycle is detected if
+    u is among the descendants of v.
+
+    The callbacks only record the changes, the order is updated by `check`.
+    When the order is `stale`, `check` computes it from scratch.
+    """
+
+    def __init__(self):
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget the order, it will be recomputed by the next `check`."""
+        self.stale = True
+        # Apply -> key
+        self.key = {}
+        # sorted list of all the keys
+        self.keys = []
+        # nodes that were imported since the last check
+        self.unplaced = OrderedSet()
+        # nodes whose incoming dependencies have not been checked
+        self.pending = OrderedSet()
+
+    def on_import(self, app):
+        if not self.stale:
+            self.unplaced.add(app)
+            self.pending.add(app)
+
+    def on_prune(self, app):
+        if self.stale:
+            return
+        self.unplaced.discard(app)
+        self.pending.discard(app)
+        if app in self.key:
+            k = self.key.pop(app)
+            del self.keys[bisect_left(self.keys, k)]
+
+    def on_change_input(self, app):
+        if not self.stale:
+            self.pending.add(app)
+
+    def check(self, fgraph, clients, orderings, ord_clients, changed):
+        """
+        Update the order with the changes recorded since the last call.
+
+        :param clients: variable -> {Apply using that variable: count}
+        :param orderings: Apply -> Apply instances that must be computed
+            before it (see `DestroyHandler.orderings`).
+        :param ord_clients: the reverse of `orderings`.
+        :param changed: the Apply instances whose orderings may have
+            changed since the last successful call.
+
+        Raise InconsistencyError if the graph contains a cycle.
+        """
+        def get_parents(app):
+            rval = [i.owner for i in app.inputs if i.owner is not None]
+            rval.extend(orderings.get(app, ()))
+            return rval
+
+        def get_children(app):
+            rval = []
+            for o in app.outputs:
+                rval.extend(clients.get(o, ()))
+            rval.extend(ord_clients.get(app, ()))
+            return rval
+
+        if self.stale:
+            self._rebuild(fgraph, get_parents)
+            return
+
+        key = self.key
+        for app in self.unplaced:
+            self._place(app, get_parents(app), get_children(app))
+        self.unplaced = OrderedSet()
+
+        # Dependencies that may violate the order
+        to_check = []
+        for app in self.pending:
+            for parent in get_parents(app):
+                if key[parent] >= key[app]:
+                    to_check.append((parent, app))
+        for app in changed:
+            for d in orderings.get(app, ()):
+                if key[d] >= key[app]:
+                    to_check.append((d, app))
+
+        # Pearce and Kelly's algorithm requires the order to be valid for
+        # all the dependencies except the one being added, so the
+        # searches ignore the ones that were not processed yet.
+        unchecked = set(to_check)
+        for u, v in to_check:
+            unchecked.discard((u, v))
+            if key[u] < key[v]:
+                continue
+            if u is v:
+                raise InconsistencyError("Dependency graph contains cycles")
+            lb = key[v]
+            ub = key[u]
+            delta_f = self._search(v, get_children, unchecked, False,
+                                   lambda k: k < ub, u)
+            delta_b = self._search(u, get_parents, unchecked, True,
+                                   lambda k: k > lb, None)
+            delta_b.sort(key=key.__getitem__)
+            delta_f.sort(key=key.__getitem__)
+            moved = delta_b + delta_f
+            for app, k in zip(moved, sorted(key[a] for a in moved)):
+                key[app] = k
+        self.pending = OrderedSet()
+
+    def _search(self, start, neighbors, unchecked, backward, in_bounds,
+                forbidden):
+        """
+        Return the nodes reachable from `start` through `neighbors`, only
+        going through nodes whose key satisfies `in_bounds`.
+
+        Raise InconsistencyError if `forbidden` is reachable.
+        """
+        key = self.key
+        rval = [start]
+        seen = set(rval)
+        stack = [start]
+        while stack:
+            app = stack.pop()
+            for n in neighbors(app):
+                if backward:
+                    edge = (n, app)
+                else:
+                    edge = (app, n)
+                if edge in unchecked:
+                    continue
+                if n is forbidden:
+                    raise InconsistencyError(
+                        "Dependency graph contains cycles")
+                if n not in seen and in_bounds(key[n]):
+                    seen.add(n)
+                    stack.append(n)
+                    rval.append(n)
+        return rval
+
+    def _place(self, app, parents, children):
+        """Give `app` a key after its parents and, if possible, before its
+        children."""
+        key = self.key
+        keys = self.keys
+        while True:
+            lb = None
+            for p in parents:
+                if p in key and (lb is None or key[p] > lb):
+                    lb = key[p]
+            ub = None
+            for c in children:
+                if c in key and (ub is None or key[c] < ub):
+                    ub = key[c]
+            if lb is not None:
+                # Just after the last parent.
+                idx = bisect_right(keys, lb)
+                if idx < len(keys):
+                    k = (lb + keys[idx]) / 2.
+                    ok = lb < k < keys[idx]
+                else:
+                    k = lb + 1
+                    ok = True
+            elif ub is not None:
+                # Just before the first child.
+                idx = bisect_left(keys, ub)
+                if idx > 0:
+                    k = (keys[idx - 1] + ub) / 2.
+                    ok = keys[idx - 1] < k < ub
+                else:
+                    k = ub - 1
+                    ok = True
+            elif keys:
+                k = keys[-1] + 1
+                ok = True
+            else:
+                k = 0.
+                ok = True
+            if ok:
+                break
+            # We ran out of float precision between two keys.
+            self._renumber()
+        key[app] = k
+        insort(keys, k)
+
+    def _renumber(self):
+        apps = sorted(self.key, key=self.key.__getitem__)
+        for i, app in enumerate(apps):
+            self.key[app] = float(i)
+        self.keys = map(float, range(len(apps)))
+
+    def _rebuild(self, fgraph, get_parents):
+        n_parents = {}
+        children = {}
+        ready = deque()
+        for app in fgraph.apply_nodes:
+            parents = get_parents(app)
+            n_parents[app] = len(parents)
+            for p in parents:
+                children.setdefault(p, []).append(app)
+            if not parents:
+                ready.append(app)
+        order = []
+        while ready:
+            app = ready.popleft()
+            order.append(app)
+            for c in children.get(app, ()):
+                n_parents[c] -= 1
+                if not n_parents[c]:
+                    ready.append(c)
+        if len(order) != len(n_parents):
+            raise InconsistencyError("Dependency graph contains cycles")
+        self.key = dict((app, float(i)) for i, app in enumerate(order))
+        self.keys = map(float, range(len(order)))
+        self.unplaced = OrderedSet()
+        self.pending = OrderedSet()
+        self.stale = False
+
+
 def getroot(r, view_i):
     """
     TODO: what is view_i ? based on add_impact's docstring, IG is guessing
@@ -636,7 +867,9 @@ class DestroyHandler(toolbox.Bookkeeper):
 
     It is a work in progress. The following data structures have been
     converted to use the incremental strategy:
-        <none>
+        the topological order used to detect cycles (see DynamicTopoOrder)
+        droot, impact and root_destroyer, as long as no view is modified
+        the orderings of each destroyer
 
     The following data structures remain to be converted:
         <unknown>
@@ -714,6 +947,17 @@ class DestroyHandler(toolbox.Bookkeeper):
         #clients: how many times does an apply use a given variable
         self.clients = OrderedDict() # variable -> apply -> ninputs
         self.stale_droot = True
+        # destroyers imported, pruned or modified since droot was refreshed
+        self.droot_changes = OrderedSet()
+        # destroyer -> the roots it destroys
+        self.destroyed_roots = OrderedDict()
+        # destroyer -> the Apply instances that must be computed before it
+        self.orderings_cache = OrderedDict()
+        # Apply -> the destroyers that must be computed after it
+        self.orderings_clients = {}
+        # destroyers whose orderings changed since the last validation
+        self.orderings_changes = OrderedSet()
+        self.topo_order = DynamicTopoOrder()
 
         self.debug_all_apps = OrderedSet()
         if self.do_imports_on_attach:
@@ -724,34 +968,79 @@ class DestroyHandler(toolbox.Bookkeeper):
         Makes sure self.droot, self.impact, and self.root_destroyer are
         up to date, and returns them.
         (see docstrings for these properties above)
+
+        They are rebuilt from scratch when the view structure changed, and
+        only updated for the destroyers in self.droot_changes otherwise.
         """
         if self.stale_droot:
-            droot = OrderedDict()   # destroyed view + nonview variables -> foundation
-            impact = OrderedDict()  # destroyed nonview variable -> it + all views of it
-            root_destroyer = OrderedDict() # root -> destroyer apply
-
-            for app in self.destroyers:
-                for output_idx, input_idx_list in app.op.destroy_map.items():
-                    if len(input_idx_list) != 1:
-                        raise NotImplementedError()
-                    input_idx = input_idx_list[0]
-                    input = app.inputs[input_idx]
-                    input_root = getroot(input, self.view_i)
-                    if input_root in droot:
-                        raise InconsistencyError("Multiple destroyers of %s" % input_root)
-                    droot[input_root] = input_root
-                    root_destroyer[input_root] = app
-                    input_impact = get_impact(input_root, self.view_o)
-                    for v in input_impact:
-                        assert v not in droot
-                        droot[v] = input_root
-
-                    impact[input_root] = input_impact
-                    impact[input_root].add(input_root)
-            self.droot, self.impact, self.root_destroyer = droot, impact, root_destroyer
+            self.droot = OrderedDict()
+            self.impact = OrderedDict()
+            self.root_destroyer = OrderedDict()
+            self.destroyed_roots = OrderedDict()
+            self.orderings_cache = OrderedDict()
+            self.orderings_clients = {}
+            self.orderings_changes = OrderedSet(self.destroyers)
+            self.droot_changes = OrderedSet(self.destroyers)
             self.stale_droot = False
+        if self.droot_changes:
+            try:
+                self._update_droot_impact()
+            except InconsistencyError:
+                self.stale_droot = True
+                raise
         return self.droot, self.impact, self.root_destroyer
 
+    def _update_droot_impact(self):
+        droot = self.droot  # destroyed view + nonview variables -> foundation
+        impact = self.impact  # destroyed nonview variable -> it + all views of it
+        root_destroyer = self.root_destroyer  # root -> destroyer apply
+
+        # Forget all the changed destroyers before adding back those that
+        # are still in the graph, as a destroyer is imported before the one
+        # it replaces is pruned.
+        for app in self.droot_changes:
+            for root in self.destroyed_roots.pop(app, ()):
+                for v in impact.pop(root):
+                    del droot[v]
+                del root_destroyer[root]
+            for d in self.orderings_cache.pop(app, ()):
+                self.orderings_clients[d].remove(app)
+                if not self.orderings_clients[d]:
+                    del self.orderings_clients[d]
+            self.orderings_changes.add(app)
+
+        for app in self.droot_changes:
+            if app not in self.destroyers:
+                continue
+            roots = self.destroyed_roots[app] = []
+            for output_idx, input_idx_list in app.op.destroy_map.items():
+                if len(input_idx_list) != 1:
+                    raise NotImplementedError()
+                input_idx = input_idx_list[0]
+                input = app.inputs[input_idx]
+                input_root = getroot(input, self.view_i)
+                if input_root in droot:
+                    raise InconsistencyError("Multiple destroyers of %s" % input_root)
+                droot[input_root] = input_root
+                root_destroyer[input_root] = app
+                input_impact = get_impact(input_root, self.view_o)
+                for v in input_impact:
+                    assert v not in droot
+                    droot[v] = input_root
+
+                impact[input_root] = input_impact
+                impact[input_root].add(input_root)
+                roots.append(input_root)
+        self.droot_changes = OrderedSet()
+
+    def _clients_changed(self, r):
+        """Forget the orderings of the destroyer whose dependencies include
+        the clients of `r`."""
+        if not self.stale_droot:
+            root = self.droot.get(r)
+            if root is not None:
+                self.droot_changes.add(self.root_destroyer[root])
+
     def on_detach(self, fgraph):
         if fgraph is not self.fgraph:
             raise Exception("detaching wrong fgraph", fgraph)
@@ -760,6 +1049,12 @@ class DestroyHandler(toolbox.Bookkeeper):
         del self.view_o
         del self.clients
         del self.stale_droot
+        del self.droot_changes
+        del self.destroyed_roots
+        del self.orderings_cache
+        del self.orderings_clients
+        del self.orderings_changes
+        del self.topo_order
         assert self.fgraph.destroyer_handler is self
         delattr(self.fgraph, 'destroyers')
         delattr(self.fgraph, 'destroy_handler')
@@ -775,6 +1070,7 @@ class DestroyHandler(toolbox.Bookkeeper):
         # If it's a destructive op, add it to our watch list
         if getattr(app.op, 'destroy_map', OrderedDict()):
             self.destroyers.add(app)
+            self.droot_changes.add(app)
 
         # add this symbol to the forward and backward maps
         for o_idx, i_idx_list in getattr(app.op, 'view_map', OrderedDict()).items():
@@ -784,16 +1080,18 @@ class DestroyHandler(toolbox.Bookkeeper):
             i = app.inputs[i_idx_list[0]]
             self.view_i[o] = i
             self.view_o.setdefault(i, OrderedSet()).add(o)
+            self.stale_droot = True
 
         # update self.clients
         for i, input in enumerate(app.inputs):
             self.clients.setdefault(input, OrderedDict()).setdefault(app,0)
             self.clients[input][app] += 1
+            self._clients_changed(input)
 
         for i, output in enumerate(app.outputs):
             self.clients.setdefault(output, OrderedDict())
 
-        self.stale_droot = True
+        self.topo_order.on_import(app)
 
     def on_prune(self, fgraph, app, reason):
         """Remove Apply instance from set which must be computed"""
@@ -803,9 +1101,11 @@ class DestroyHandler(toolbox.Bookkeeper):
         #UPDATE self.clients
         for i, input in enumerate(OrderedSet(app.inputs)):
             del self.clients[input][app]
+            self._clients_changed(input)
 
         if getattr(app.op, 'destroy_map', OrderedDict()):
             self.destroyers.remove(app)
+            self.droot_changes.add(app)
 
         # Note: leaving empty client dictionaries in the struct.
         # Why? It's a pain to remove them. I think they aren't doing any harm, they will be
@@ -824,8 +1124,9 @@ class DestroyHandler(toolbox.Bookkeeper):
             self.view_o[i].remove(o)
             if not self.view_o[i]:
                 del self.view_o[i]
+            self.stale_droot = True
 
-        self.stale_droot = True
+        self.topo_order.on_prune(app)
 
     def on_change_input(self, fgraph, app, i, old_r, new_r, reason):
         """app.inputs[i] changed from old_r to new_r """
@@ -843,6 +1144,11 @@ class DestroyHandler(toolbox.Bookkeeper):
 
             self.clients.setdefault(new_r, OrderedDict()).setdefault(app,0)
             self.clients[new_r][app] += 1
+            self._clients_changed(old_r)
+            self._clients_changed(new_r)
+
+            if app in self.destroyers:
+                self.droot_changes.add(app)
 
             #UPDATE self.view_i, self.view_o
             for o_idx, i_idx_list in getattr(app.op, 'view_map', OrderedDict()).items():
@@ -862,8 +1168,9 @@ class DestroyHandler(toolbox.Bookkeeper):
                         del self.view_o[old_r]
 
                     self.view_o.setdefault(new_r, OrderedSet()).add(output)
+                    self.stale_droot = True
 
-        self.stale_droot = True
+            self.topo_order.on_change_input(app)
 
     def validate(self, fgraph):
         """Return None
@@ -875,14 +1182,17 @@ class DestroyHandler(toolbox.Bookkeeper):
         """
 
         if self.destroyers:
-            ords = self.orderings(fgraph)
-
-            if _contains_cycle(fgraph, ords):
-                raise InconsistencyError("Dependency graph contains cycles")
+            self.refresh_orderings()
+            self.topo_order.check(fgraph, self.clients, self.orderings_cache,
+                                  self.orderings_clients,
+                                  self.orderings_changes)
+            self.orderings_changes = OrderedSet()
         else:
             #James's Conjecture:
             #If there are no destructive ops, then there can be no cycles.
-            pass
+            # We don't maintain the order until there are some.
+            if not self.topo_order.stale:
+                self.topo_order.invalidate()
         return True
 
     def orderings(self, fgraph):
@@ -900,86 +1210,112 @@ class DestroyHandler(toolbox.Bookkeeper):
             # BUILD DATA STRUCTURES
             # CHECK for multiple destructions during construction of variables
 
-            droot, impact, __ignore = self.refresh_droot_impact()
+            self.refresh_orderings()
+            for app in self.destroyers:
+                if self.orderings_cache[app]:
+                    rval[app] = self.orderings_cache[app]
 
-            # check for destruction of constants
-            illegal_destroy = [r for r in droot if \
-                    getattr(r.tag,'indestructible', False) or \
-                    isinstance(r, graph.Constant)]
-            if illegal_destroy:
-                raise InconsistencyError("Attempting to destroy indestructible variables: %s" %
-                        illegal_destroy)
+        return rval
 
-            # add destroyed variable clients as computational dependencies
-            for app in self.destroyers:
-                # for each destroyed input...
-                for output_idx, input_idx_list in app.op.destroy_map.items():
-                    destroyed_idx = input_idx_list[0]
-                    destroyed_variable = app.inputs[destroyed_idx]
-                    root = droot[destroyed_variable]
-                    root_impact = impact[root]
-                    # we generally want to put all clients of things which depend on root
-                    # as pre-requisites of app.
-                    # But, app is itself one such client!
-                    # App will always be a client of the node we're destroying
-                    # (destroyed_variable, but the tricky thing is when it is also a client of
-                    # *another variable* viewing on the root.  Generally this is illegal, (e.g.,
-                    # add_inplace(x, x.T).  In some special cases though, the in-place op will
-                    # actually be able to work properly with multiple destroyed inputs (e.g,
-                    # add_inplace(x, x).  An Op that can still work in this case should declare
-                    # so via the 'destroyhandler_tolerate_same' attribute or
-                    # 'destroyhandler_tolerate_aliased' attribute.
-                    #
-                    # destroyhandler_tolerate_same should be a list of pairs of the form
-                    # [(idx0, idx1), (idx0, idx2), ...]
-                    # The first element of each pair is the input index of a destroyed
-                    # variable.
-                    # The second element of each pair is the index of a different input where
-                    # we will permit exactly the same variable to appear.
-                    # For example, add_inplace.tolerate_same might be [(0,1)] if the destroyed
-                    # input is also allowed to appear as the second argument.
-                    #
-                    # destroyhandler_tolerate_aliased is the same sort of list of
-                    # pairs.
-                    # op.destroyhandler_tolerate_aliased = [(idx0, idx1)] tells the
-                    # destroyhandler to IGNORE an aliasing between a destroyed
-                    # input idx0 and another input idx1.
-                    # This is generally a bad idea, but it is safe in some
-                    # cases, such as
-                    # - the op reads from the aliased idx1 before modifying idx0
-                    # - the idx0 and idx1 are guaranteed not to overlap (e.g.
-                    #   they are pointed at different rows of a matrix).
-                    #
-
-                    #CHECK FOR INPUT ALIASING
-                    # OPT: pre-compute this on import
-                    tolerate_same = getattr(app.op, 'destroyhandler_tolerate_same', [])
-                    assert isinstance(tolerate_same, list)
-                    tolerated = OrderedSet(idx1 for idx0, idx1 in tolerate_same
-                            if idx0 == destroyed_idx)
-                    tolerated.add(destroyed_idx)
-                    tolerate_aliased = getattr(app.op, 'destroyhandler_tolerate_aliased', [])
-                    assert isinstance(tolerate_aliased, list)
-                    ignored = OrderedSet(idx1 for idx0, idx1 in tolerate_aliased
-                            if idx0 == destroyed_idx)
-                    #print 'tolerated', tolerated
-                    #print 'ignored', ignored
-                    for i, input in enumerate(app.inputs):
-                        if i in ignored:
-                            continue
-                        if input in root_impact \
-                                and (i not in tolerated or input is not destroyed_variable):
-                            raise InconsistencyError("Input aliasing: %s (%i, %i)"
-                                    % (app, destroyed_idx, i))
-
-                    # add the rule: app must be preceded by all other Apply instances that
-                    # depend on destroyed_input
-                    root_clients = OrderedSet()
-                    for r in root_impact:
-                        assert not [a for a, c in self.clients[r].items() if not c]
-                        root_clients.update([a for a, c in self.clients[r].items() if c])
-                    root_clients.remove(app)
-                    if root_clients:
-                        rval[app] = root_clients
+    def refresh_orderings(self):
+        """
+        Makes sure self.orderings_cache and self.orderings_clients are up to
+        date.
+
+        The orderings of a destroyer only change when it is modified or when
+        the clients of the variables it destroys change, so only those of
+        the destroyers in self.orderings_changes are computed again.
+        """
+        droot, impact, __ignore = self.refresh_droot_impact()
+        for app in self.orderings_changes:
+            if app in self.orderings_cache or app not in self.destroyers:
+                continue
+            deps = self.destroyer_orderings(app, droot, impact)
+            self.orderings_cache[app] = deps
+            for d in deps:
+                self.orderings_clients.setdefault(d, OrderedSet()).add(app)
+
+    def destroyer_orderings(self, app, droot, impact):
+        """Return the Apply instances that must be computed before the
+        destroyer `app` (see `orderings`)."""
+        # check for destruction of constants
+        illegal_destroy = [r for root in self.destroyed_roots[app]
+                           for r in impact[root] if \
+                getattr(r.tag,'indestructible', False) or \
+                isinstance(r, graph.Constant)]
+        if illegal_destroy:
+            raise InconsistencyError("Attempting to destroy indestructible variables: %s" %
+                    illegal_destroy)
+
+        # add destroyed variable clients as computational dependencies
+        rval = OrderedSet()
+        # for each destroyed input...
+        for output_idx, input_idx_list in app.op.destroy_map.items():
+            destroyed_idx = input_idx_list[0]
+            destroyed_variable = app.inputs[destroyed_idx]
+            root = droot[destroyed_variable]
+            root_impact = impact[root]
+            # we generally want to put all clients of things which depend on root
+            # as pre-requisites of app.
+            # But, app is itself one such client!
+            # App will always be a client of the node we're destroying
+            # (destroyed_variable, but the tricky thing is when it is also a client of
+            # *another variable* viewing on the root.  Generally this is illegal, (e.g.,
+            # add_inplace(x, x.T).  In some special cases though, the in-place op will
+            # actually be able to work properly with multiple destroyed inputs (e.g,
+            # add_inplace(x, x).  An Op that can still work in this case should declare
+            # so via the 'destroyhandler_tolerate_same' attribute or
+            # 'destroyhandler_tolerate_aliased' attribute.
+            #
+            # destroyhandler_tolerate_same should be a list of pairs of the form
+            # [(idx0, idx1), (idx0, idx2), ...]
+            # The first element of each pair is the input index of a destroyed
+            # variable.
+            # The second element of each pair is the index of a different input where
+            # we will permit exactly the same variable to appear.
+            # For example, add_inplace.tolerate_same might be [(0,1)] if the destroyed
+            # input is also allowed to appear as the second argument.
+            #
+            # destroyhandler_tolerate_aliased is the same sort of list of
+            # pairs.
+            # op.destroyhandler_tolerate_aliased = [(idx0, idx1)] tells the
+            # destroyhandler to IGNORE an aliasing between a destroyed
+            # input idx0 and another input idx1.
+            # This is generally a bad idea, but it is safe in some
+            # cases, such as
+            # - the op reads from the aliased idx1 before modifying idx0
+            # - the idx0 and idx1 are guaranteed not to overlap (e.g.
+            #   they are pointed at different rows of a matrix).
+            #
+
+            #CHECK FOR INPUT ALIASING
+            # OPT: pre-compute this on import
+            tolerate_same = getattr(app.op, 'destroyhandler_tolerate_same', [])
+            assert isinstance(tolerate_same, list)
+            tolerated = OrderedSet(idx1 for idx0, idx1 in tolerate_same
+                    if idx0 == destroyed_idx)
+            tolerated.add(destroyed_idx)
+            tolerate_aliased = getattr(app.op, 'destroyhandler_tolerate_aliased', [])
+            assert isinstance(tolerate_aliased, list)
+            ignored = OrderedSet(idx1 for idx0, idx1 in tolerate_aliased
+                    if idx0 == destroyed_idx)
+            #print 'tolerated', tolerated
+            #print 'ignored', ignored
+            for i, input in enumerate(app.inputs):
+                if i in ignored:
+                    continue
+                if input in root_impact \
+                        and (i not in tolerated or input is not destroyed_variable):
+                    raise InconsistencyError("Input aliasing: %s (%i, %i)"
+                            % (app, destroyed_idx, i))
+
+            # add the rule: app must be preceded by all other Apply instances that
+            # depend on destroyed_input
+            root_clients = OrderedSet()
+            for r in root_impact:
+                assert not [a for a, c in self.clients[r].items() if not c]
+                root_clients.update([a for a, c in self.clients[r].items() if c])
+            root_clients.remove(app)
+            rval.update(root_clients)
 
         return rval
@@ -124,6 +124,17 @@ typedef struct {
     int do_timing;
     int need_update_inputs;
     int position_of_error; // -1 for no error, otw the index into `thunks` that failed.
+
+    // Set by set_fast_call, used by fast_call
+    PyObject * fast_input_cells; // list of the cells of the positional inputs
+    PyObject * fast_clear_cells; // list of the cells to clear after a call
+                                 // (required inputs, and computed outputs
+                                 // if allow_gc)
+    PyObject * fast_refeed_cells; // list of the cells of the default values
+    PyObject * fast_refeed_values; // list of the default values
+    Py_ssize_t fast_n_returned; // number of outputs to return
+    int fast_unpack_single;
+    int fast_return_none;
 } CLazyLinker;
 
 
@@ -183,6 +194,10 @@ CLazyLinker_dealloc(PyObject* _self)
   Py_XDECREF(self->call_times);
   Py_XDECREF(self->call_counts);
   Py_XDECREF(self->pre_call_clear);
+  Py_XDECREF(self->fast_input_cells);
+  Py_XDECREF(self->fast_clear_cells);
+  Py_XDECREF(self->fast_refeed_cells);
+  Py_XDECREF(self->fast_refeed_values);
   Py_TYPE(self)->tp_free((PyObject*)self);
 }
 static PyObject *
@@ -232,6 +247,14 @@ CLazyLinker_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
       self->need_update_inputs = 0;
       self->position_of_error = -1;
+
+      self->fast_input_cells = NULL;
+      self->fast_clear_cells = NULL;
+      self->fast_refeed_cells = NULL;
+      self->fast_refeed_values = NULL;
+      self->fast_n_returned = 0;
+      self->fast_unpack_single = 0;
+      self->fast_return_none = 0;
     }
     return (PyObject *)self;
 }
@@ -794,19 +817,13 @@ int lazy_rec_eval(CLazyLinker * self, Py_ssize_t var_idx, PyObject*one, PyObject
   return err;
 }
 
+/**
+  Run the program n_calls times, and return the list of the values of the
+  output variables, or NULL on error.
+  */
 static PyObject *
-CLazyLinker_call(PyObject *_self, PyObject *args, PyObject *kwds)
+CLazyLinker_run(CLazyLinker * self, int n_calls)
 {
-  CLazyLinker * self = (CLazyLinker*)_self;
-  static char *kwlist[] = {
-    (char*)"time_thunks",
-    (char *)"n_calls",
-    NULL};
-  int n_calls=1;
-  if (! PyArg_ParseTupleAndKeywords(args, kwds, "|ii", kwlist,
-                                    &self->do_timing,
-                                    &n_calls))
-    return NULL;
   int err = 0;
   self->position_of_error = -1;
   // create constants used to fill the var_compute_cells
@@ -921,14 +938,149 @@ CLazyLinker_call(PyObject *_self, PyObject *args, PyObject *kwds)
   return rval;
 }
 
-#if 0
-static PyMethodDef CLazyLinker_methods[] = {
+static PyObject *
+CLazyLinker_call(PyObject *_self, PyObject *args, PyObject *kwds)
+{
+  CLazyLinker * self = (CLazyLinker*)_self;
+  static char *kwlist[] = {
+    (char*)"time_thunks",
+    (char *)"n_calls",
+    NULL};
+  int n_calls=1;
+  if (! PyArg_ParseTupleAndKeywords(args, kwds, "|ii", kwlist,
+                                    &self->do_timing,
+                                    &n_calls))
+    return NULL;
+  return CLazyLinker_run(self, n_calls);
+}
+
+static PyObject *
+CLazyLinker_set_fast_call(PyObject *_self, PyObject *args)
+{
+  CLazyLinker * self = (CLazyLinker*)_self;
+  PyObject *input_cells, *clear_cells, *refeed_cells, *refeed_values;
+  Py_ssize_t n_returned;
+  int unpack_single, return_none;
+  if (! PyArg_ParseTuple(args, "O!O!O!O!nii",
+                         &PyList_Type, &input_cells,
+                         &PyList_Type, &clear_cells,
+                         &PyList_Type, &refeed_cells,
+                         &PyList_Type, &refeed_values,
+                         &n_returned, &unpack_single, &return_none))
+    return NULL;
+  if (PyList_GET_SIZE(refeed_cells) != PyList_GET_SIZE(refeed_values))
+    {
+      PyErr_SetString(PyExc_ValueError,
+                      "refeed_cells and refeed_values must have the same length");
+      return NULL;
+    }
+  PyObject * lists[] = {input_cells, clear_cells, refeed_cells};
+  for (int l = 0; l < 3; ++l)
+    {
+      for (Py_ssize_t i = 0; i < PyList_GET_SIZE(lists[l]); ++i)
+        {
+          PyObject * cell = PyList_GET_ITEM(lists[l], i);
+          if (!PyList_Check(cell) || PyList_GET_SIZE(cell) != 1)
+            {
+              PyErr_SetString(PyExc_TypeError,
+                              "the cells must be lists of length 1");
+              return NULL;
+            }
+        }
+    }
+  Py_INCREF(input_cells);
+  Py_XDECREF(self->fast_input_cells);
+  self->fast_input_cells = input_cells;
+  Py_INCREF(clear_cells);
+  Py_XDECREF(self->fast_clear_cells);
+  self->fast_clear_cells = clear_cells;
+  Py_INCREF(refeed_cells);
+  Py_XDECREF(self->fast_refeed_cells);
+  self->fast_refeed_cells = refeed_cells;
+  Py_INCREF(refeed_values);
+  Py_XDECREF(self->fast_refeed_values);
+  self->fast_refeed_values = refeed_values;
+  self->fast_n_returned = n_returned;
+  self->fast_unpack_single = unpack_single;
+  self->fast_return_none = return_none;
+  Py_RETURN_NONE;
+}
+
+/**
+  Store the positional arguments in the input cells given to set_fast_call,
+  run the program once, clear and refeed the cells and return the outputs,
+  like Function.__call__ does when trust_input is True.
+  */
+static PyObject *
+CLazyLinker_fast_call(PyObject *_self, PyObject *args)
+{
+  CLazyLinker * self = (CLazyLinker*)_self;
+  if (!self->fast_input_cells)
+    {
+      PyErr_SetString(PyExc_RuntimeError,
+                      "set_fast_call must be called before fast_call");
+      return NULL;
+    }
+  self->position_of_error = -1;
+  Py_ssize_t n_args = PyTuple_GET_SIZE(args);
+  if (n_args > PyList_GET_SIZE(self->fast_input_cells))
+    {
+      PyErr_SetString(PyExc_TypeError,
+                      "Too many parameter passed to theano function");
+      return NULL;
+    }
+  for (Py_ssize_t i = 0; i < n_args; ++i)
+    {
+      PyObject * arg = PyTuple_GET_ITEM(args, i);
+      PyObject * cell = PyList_GET_ITEM(self->fast_input_cells, i);
+      Py_INCREF(arg);
+      PyList_SetItem(cell, 0, arg);
+    }
+  PyObject * rval = CLazyLinker_run(self, 1);
+  if (!rval)
+    return NULL;
+  for (Py_ssize_t i = 0; i < PyList_GET_SIZE(self->fast_clear_cells); ++i)
+    {
+      Py_INCREF(Py_None);
+      PyList_SetItem(PyList_GET_ITEM(self->fast_clear_cells, i), 0, Py_None);
+    }
+  for (Py_ssize_t i = 0; i < PyList_GET_SIZE(self->fast_refeed_cells); ++i)
+    {
+      PyObject * value = PyList_GET_ITEM(self->fast_refeed_values, i);
+      Py_INCREF(value);
+      PyList_SetItem(PyList_GET_ITEM(self->fast_refeed_cells, i), 0, value);
+    }
+  if (self->fast_return_none)
+    {
+      Py_DECREF(rval);
+      Py_RETURN_NONE;
+    }
+  if (self->fast_n_returned < PyList_GET_SIZE(rval) &&
+      PyList_SetSlice(rval, self->fast_n_returned, PyList_GET_SIZE(rval), NULL))
+    {
+      Py_DECREF(rval);
+      return NULL;
+    }
+  if (self->fast_unpack_single && PyList_GET_SIZE(rval) == 1)
     {
-      //"name", (PyCFunction)CLazyLinker_accept, METH_VARARGS, "Return the name, combining the first and last name"
-    },
+      PyObject * item = PyList_GET_ITEM(rval, 0);
+      Py_INCREF(item);
+      Py_DECREF(rval);
+      return item;
+    }
+  return rval;
+}
+
+static PyMethodDef CLazyLinker_methods[] = {
+    {(char*)"set_fast_call", CLazyLinker_set_fast_call, METH_VARARGS,
+     (char*)"set_fast_call(input_cells, clear_cells, refeed_cells, refeed_values, "
+     "n_returned, unpack_single, return_none): set the storage used by "
+     "fast_call"},
+    {(char*)"fast_call", CLazyLinker_fast_call, METH_VARARGS,
+     (char*)"fast_call(*args): call with the positional arguments args, stored "
+     "without checks"},
     {NULL}  /* Sentinel */
 };
-#endif
 
 static PyMemberDef CLazyLinker_members[] = {
     {(char*)"nodes", T_OBJECT_EX, offsetof(CLazyLinker, nodes), 0,
@@ -945,6 +1097,8 @@ static PyMemberDef CLazyLinker_members[] = {
      (char*)"bool: nonzero means call will time thunks"},
     {(char*)"need_update_inputs", T_INT, offsetof(CLazyLinker, need_update_inputs), 0,
      (char*)"bool: nonzero means Function.__call__ must implement update mechanism"},
+    {(char*)"allow_gc", T_INT, offsetof(CLazyLinker, allow_gc), READONLY,
+     (char*)"bool: nonzero means the intermediate results are cleared"},
     {NULL}  /* Sentinel */
 };
 
@@ -981,7 +1135,7 @@ static PyTypeObject lazylinker_ext_CLazyLinkerType = {
     0,                         /* tp_weaklistoffset */
     0,                         /* tp_iter */
     0,                         /* tp_iternext */
-    0,//CLazyLinker_methods,       /* tp_methods */
+    CLazyLinker_methods,       /* tp_methods */
     CLazyLinker_members,       /* tp_members */
     0,                         /* tp_getset */
     0,                         /* tp_base */
@@ -996,7 +1150,7 @@ static PyTypeObject lazylinker_ext_CLazyLinkerType = {
 
 static PyObject * get_version(PyObject *dummy, PyObject *args)
 {
-  PyObject *result = PyFloat_FromDouble(0.20);
+  PyObject *result = PyFloat_FromDouble(0.22);
   return result;
 }
 
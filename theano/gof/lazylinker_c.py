@@ -10,7 +10,7 @@ from theano.gof import cmodule
 _logger = logging.getLogger('theano.gof.lazylinker_c')
 
 force_compile = False
-version = 0.20  # must match constant returned in function get_version()
+version = 0.22  # must match constant returned in function get_version()
 
 def try_import():
     global lazylinker_ext
@@ -13,6 +13,7 @@ __contact__   = "theano-dev <theano-dev@googlegroups.com>"
 __docformat__ = "restructuredtext en"
 
 import logging
+import os
 import sys
 import warnings
 
@@ -24,6 +25,7 @@ from theano.gof import graph
 from theano.gof import utils
 from theano.gof.cmodule import GCC_compiler
 from theano.gof.fg import FunctionGraph
+from theano.misc.cpucount import cpuCount
 
 
 class CLinkerObject(object):
@@ -237,6 +239,8 @@ class CLinkerOp(CLinkerObject):
            However, its shape, or stride pattern, could not be adequate.
          `sub` : dict of strings
            extra symbols defined in `CLinker` sub symbols (such as 'fail').
+           'begin_nogil' and 'end_nogil' delimit a region of code that runs
+           without holding the Python GIL (see `cc.nogil_code`).
            WRITEME
 
         :Exceptions:
@@ -855,3 +859,65 @@ int main( int argc, const char* argv[] )
         self.update_self_openmp()
         return super(OpenMPOp, self).make_thunk(node, storage_map,
                                                 compute_map, no_recycling)
+
+
+def precompile_c_thunks(nodes, no_recycling):
+    """
+    Compile in parallel the C modules that `Op.make_thunk` will need.
+
+    `Op.make_thunk` compiles the C module of each node one after the other.
+    When the `cmodule.compile_workers` flag is not 0, this generates the
+    code of all the nodes first, and builds the modules that are not in the
+    cache yet with that many g++ processes at the same time. The following
+    calls to `make_thunk` then only import them.
+
+    The caller should call ``discard_precompiled()`` on the module cache once
+    the thunks are built, to delete the modules that were not used.
+
+    :param nodes: the Apply nodes for which thunks will be made.
+
+    :param no_recycling: the variables passed to `make_thunk` as
+        `no_recycling`.
+    """
+    n_workers = config.cmodule.compile_workers
+    if n_workers == 0 or not config.cxx:
+        return
+    if n_workers < 0:
+        n_workers = cpuCount()
+
+    jobs = []
+    for node in nodes:
+        op = node.op
+        # Ops that override make_thunk may not use the CLinker.
+        make_thunk = getattr(type(op).make_thunk, 'im_func', None)
+        if (make_thunk not in (Op.make_thunk.im_func,
+                               OpenMPOp.make_thunk.im_func) or
+            not op._op_use_c_code):
+            continue
+        if isinstance(op, OpenMPOp):
+            op.update_self_openmp()
+        e = FunctionGraph(node.inputs, node.outputs)
+        e_no_recycling = [new_o
+                for (new_o, old_o) in zip(e.outputs, node.outputs)
+                if old_o in no_recycling]
+        cl = theano.gof.cc.CLinker().accept(e, no_recycling=e_no_recycling)
+        try:
+            key = cl.cmodule_key()
+            src_code, c_compiler, compile_kwargs = cl.prepare_cmodule()
+        except Exception:
+            # No C code (or a broken one): make_thunk will fall back on
+            # perform, or report the error.
+            continue
+        if key is None or c_compiler is not GCC_compiler:
+            continue
+
+        def compile_fn(location, c_compiler=c_compiler, src_code=src_code,
+                       compile_kwargs=compile_kwargs):
+            c_compiler.compile_str(src_code=src_code, location=location,
+                                   py_module=False, **compile_kwargs)
+            return os.path.join(location, '%s.%s' % (
+                compile_kwargs['module_name'],
+                theano.gof.cmodule.get_lib_extension()))
+        jobs.append((key, src_code, compile_fn))
+
+    theano.gof.cc.get_module_cache().compile_parallel(jobs, n_workers)
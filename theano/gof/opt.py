@@ -4,6 +4,7 @@ amount of useful generic optimization tools.
 """
 
 import copy
+import inspect
 import logging
 import pdb
 import sys
@@ -817,11 +818,69 @@ def local_optimizer(tracks):
     return decorator
 
 
+class LocalOptTracker:
+    """
+    Index local optimizers by the Ops and Op classes they track, so that
+    only the optimizers that can apply to a node are tried on it.
+
+    An optimizer tracking an Op class is returned for instances of that
+    class and of its subclasses. Optimizers whose `tracks()` is None are
+    returned for all Ops.
+    """
+
+    def __init__(self, optimizers):
+        self.position = {}
+        self.untracked = []
+        self.tracked_types = {}
+        self.tracked_instances = {}
+        self._type_cache = {}
+        for opt in optimizers:
+            if opt in self.position:
+                continue
+            self.position[opt] = len(self.position)
+            tracks = opt.tracks()
+            if tracks is None:
+                self.untracked.append(opt)
+                continue
+            for c in tracks:
+                if inspect.isclass(c):
+                    self.tracked_types.setdefault(c, []).append(opt)
+                else:
+                    self.tracked_instances.setdefault(c, []).append(opt)
+
+    def get_trackers(self, op):
+        """
+        Return the optimizers that can apply to a node whose op is `op`, in
+        the order in which they were given.
+        """
+        t = type(op)
+        try:
+            opts = self._type_cache[t]
+        except KeyError:
+            opts = set(self.untracked)
+            for cls in inspect.getmro(t):
+                opts.update(self.tracked_types.get(cls, ()))
+            opts = sorted(opts, key=self.position.__getitem__)
+            self._type_cache[t] = opts
+        if self.tracked_instances:
+            try:
+                inst_opts = self.tracked_instances.get(op)
+            except TypeError:
+                # Unhashable op, compare it with each tracked instance.
+                inst_opts = [opt for c, l in self.tracked_instances.items()
+                             if c == op for opt in l]
+            if inst_opts:
+                opts = sorted(set(opts).union(inst_opts),
+                              key=self.position.__getitem__)
+        return opts
+
+
 class LocalOptGroup(LocalOptimizer):
     """WRITEME"""
 
     def __init__(self, *optimizers):
         self.opts = optimizers
+        self.tracker = LocalOptTracker(optimizers)
         self.reentrant = any(getattr(opt, 'reentrant', True)
                              for opt in optimizers)
         self.retains_inputs = all(getattr(opt, 'retains_inputs', False)
@@ -833,7 +892,7 @@ class LocalOptGroup(LocalOptimizer):
                         str([str(o) for o in self.opts])))
 
     def transform(self, node):
-        for opt in self.opts:
+        for opt in self.tracker.get_trackers(node.op):
             repl = opt.transform(node)
             if repl:
                 return repl
@@ -1358,6 +1417,12 @@ class TopoOptimizer(NavigatorOptimizer):
         self.order = order
         NavigatorOptimizer.__init__(self, local_opt, ignore_newtrees,
                                     failure_callback)
+        if local_opt is None:
+            self.tracker = None
+        else:
+            self.tracker = getattr(local_opt, 'tracker', None)
+            if self.tracker is None:
+                self.tracker = LocalOptTracker([local_opt])
 
     def apply(self, fgraph, start_from=None):
         if start_from is None:
@@ -1381,6 +1446,7 @@ class TopoOptimizer(NavigatorOptimizer):
 
         u = self.attach_updater(fgraph, importer, pruner)
         nb = 0
+        tracker = self.tracker
         try:
             t0 = time.time()
             while q:
@@ -1388,6 +1454,9 @@ class TopoOptimizer(NavigatorOptimizer):
                     node = q.pop()
                 else:
                     node = q.popleft()
+                if tracker is not None and not tracker.get_trackers(node.op):
+                    # No optimizer can apply to this node.
+                    continue
                 current_node = node
                 nb += self.process_node(fgraph, node)
             loop_t = time.time() - t0
@@ -1486,12 +1555,49 @@ class ChangeTracker:
         fgraph.change_tracker = self
 
 
+class ChangeWorklist:
+    """
+    Record the nodes that were imported in the graph or whose inputs
+    changed, in the order in which that happened.
+
+    Used by EquilibriumOptimizer in incremental mode to only revisit the
+    part of the graph that changed since the last pass.
+    """
+    def __init__(self):
+        self.nodes = []
+        self.seen = set()
+
+    def add(self, node):
+        if node not in self.seen:
+            self.seen.add(node)
+            self.nodes.append(node)
+
+    def on_import(self, fgraph, node, reason):
+        self.add(node)
+
+    def on_change_input(self, fgraph, node, i, r, new_r, reason):
+        # node is the string 'output' when an output of the graph changes.
+        if node != 'output':
+            self.add(node)
+        # new_r gained a client, which can enable optimizations on its owner.
+        if new_r.owner is not None:
+            self.add(new_r.owner)
+
+    def pop_all(self):
+        """Return the recorded nodes and forget them."""
+        nodes = self.nodes
+        self.nodes = []
+        self.seen = set()
+        return nodes
+
+
 class EquilibriumOptimizer(NavigatorOptimizer):
     def __init__(self,
                  optimizers,
                  failure_callback=None,
                  max_depth=None,
-                 max_use_ratio=None):
+                 max_use_ratio=None,
+                 incremental=False):
         """
         :param optimizers:  list or set of local or global optimizations to
             apply until equilibrium.
@@ -1501,6 +1607,12 @@ class EquilibriumOptimizer(NavigatorOptimizer):
 
         :param max_depth: TODO what does this do? (EquilibriumDB sets it to 5)
 
+        :param incremental: if True, only the first pass traverses the
+            whole graph. The following passes only visit the nodes that were
+            imported or whose inputs changed since the previous pass, as well
+            as their neighbors. When such a pass does not change the graph, a
+            full pass is done to make sure the equilibrium is reached.
+
         """
 
         super(EquilibriumOptimizer, self).__init__(
@@ -1522,6 +1634,7 @@ class EquilibriumOptimizer(NavigatorOptimizer):
                 self.global_optimizers.append(opt)
         self.max_depth = max_depth
         self.max_use_ratio = max_use_ratio
+        self.incremental = incremental
         assert self.max_use_ratio is not None, (
                 'max_use_ratio has to be a number')
 
@@ -1544,6 +1657,28 @@ class EquilibriumOptimizer(NavigatorOptimizer):
         for opt in self.global_optimizers:
             opt.add_requirements(fgraph)
 
+    @staticmethod
+    def worklist_nodes(fgraph, touched):
+        """
+        Return the nodes of `fgraph` in `touched` and their neighbors
+        (the owners of their inputs and the clients of their outputs).
+        """
+        apply_nodes = fgraph.apply_nodes
+        seen = set()
+        rval = []
+        for node in touched:
+            if node not in apply_nodes:
+                continue
+            neighbors = [node]
+            neighbors.extend(i.owner for i in node.inputs if i.owner)
+            for o in node.outputs:
+                neighbors.extend(c for c, _ in o.clients if c != 'output')
+            for n in neighbors:
+                if n not in seen and n in apply_nodes:
+                    seen.add(n)
+                    rval.append(n)
+        return rval
+
     def apply(self, fgraph, start_from=None):
         if start_from is None:
             start_from = fgraph.outputs
@@ -1551,7 +1686,18 @@ class EquilibriumOptimizer(NavigatorOptimizer):
             for node in start_from:
                 assert node in fgraph.outputs
 
+        if self.incremental:
+            worklist = ChangeWorklist()
+            fgraph.attach_feature(worklist)
+            try:
+                return self._apply(fgraph, start_from, worklist)
+            finally:
+                fgraph.remove_feature(worklist)
+        return self._apply(fgraph, start_from, None)
+
+    def _apply(self, fgraph, start_from, worklist):
         changed = True
+        full_pass = True
         max_use_abort = False
         opt_name = None
         global_process_count = {}
@@ -1565,6 +1711,7 @@ class EquilibriumOptimizer(NavigatorOptimizer):
         time_opts = {}
         io_toposort_timing = []
         nb_nodes = []
+        node_visits = []
         for opt in self.global_optimizers + list(self.get_local_optimizers()):
             global_process_count.setdefault(opt, 0)
             time_opts.setdefault(opt, 0)
@@ -1594,12 +1741,20 @@ class EquilibriumOptimizer(NavigatorOptimizer):
 
             #apply local optimizer
             topo_t0 = time.time()
-            q = deque(graph.io_toposort(fgraph.inputs, start_from))
+            if full_pass:
+                q = deque(graph.io_toposort(fgraph.inputs, start_from))
+                if worklist is not None:
+                    # All the changes so far are covered by this pass.
+                    worklist.pop_all()
+                max_nb_nodes = max(max_nb_nodes, len(q))
+            else:
+                q = deque(self.worklist_nodes(fgraph, worklist.pop_all()))
+                max_nb_nodes = max(max_nb_nodes, len(fgraph.apply_nodes))
             io_toposort_timing.append(time.time() - topo_t0)
 
             nb_nodes.append(len(q))
-            max_nb_nodes = max(max_nb_nodes, len(q))
             max_use = max_nb_nodes * self.max_use_ratio
+            nb_visits = 0
 
             def importer(node):
                 if node is not current_node:
@@ -1617,6 +1772,7 @@ class EquilibriumOptimizer(NavigatorOptimizer):
                 while q:
                     node = q.pop()
                     current_node = node
+                    nb_visits += 1
 
                     for lopt in (self.local_optimizers_all +
                                  self.local_optimizers_map.get(type(node.op), []) +
@@ -1641,6 +1797,16 @@ class EquilibriumOptimizer(NavigatorOptimizer):
 
             loop_process_count.append(process_count)
             loop_timing.append(float(time.time() - t0))
+            node_visits.append(nb_visits)
+
+            if worklist is not None:
+                if not changed and not full_pass:
+                    # The worklist passes reached a fixed point, check
+                    # that it is one for the whole graph.
+                    changed = True
+                    full_pass = True
+                else:
+                    full_pass = False
 
         end_nb_nodes = len(fgraph.apply_nodes)
 
@@ -1652,7 +1818,8 @@ class EquilibriumOptimizer(NavigatorOptimizer):
 
         return (self, loop_timing, loop_process_count,
                 (start_nb_nodes, end_nb_nodes, max_nb_nodes),
-                global_opt_timing, nb_nodes, time_opts, io_toposort_timing)
+                global_opt_timing, nb_nodes, time_opts, io_toposort_timing,
+                node_visits)
 
     def print_summary(self, stream=sys.stdout, level=0, depth=-1):
         name = getattr(self, 'name', None)
@@ -1667,7 +1834,8 @@ class EquilibriumOptimizer(NavigatorOptimizer):
     def print_profile(stream, prof, level=0):
         (opt, loop_timing, loop_process_count,
          (start_nb_nodes, end_nb_nodes, max_nb_nodes),
-         global_opt_timing, nb_nodes, time_opts, io_toposort_timing) = prof
+         global_opt_timing, nb_nodes, time_opts, io_toposort_timing,
+         node_visits) = prof
 
         blanc = ('    ' * level)
         print >> stream, blanc, "EquilibriumOptimizer",
@@ -1677,6 +1845,9 @@ class EquilibriumOptimizer(NavigatorOptimizer):
                 sum(loop_timing), len(loop_timing))
         print >> stream, blanc, "  nb nodes (start, end,  max) %d %d %d" % (
                 start_nb_nodes, end_nb_nodes, max_nb_nodes)
+        print >> stream, blanc, "  nb node visits %d%s" % (
+                sum(node_visits),
+                getattr(opt, 'incremental', False) and " (incremental)" or "")
         print >> stream, blanc, "  time io_toposort %.3fs" % sum(
             io_toposort_timing)
         s = sum([time_opts[o] for o in opt.get_local_optimizers()])
@@ -1693,12 +1864,13 @@ class EquilibriumOptimizer(NavigatorOptimizer):
                 if len(d) > 5:
                     lopt += " ..."
             print >> stream, blanc, ('  %2d - %.3fs %d (%.3fs in global opts, '
-                                     '%.3fs io_toposort) - %d nodes - %s' % (
+                                     '%.3fs io_toposort) - %d nodes '
+                                     '(%d visited) - %s' % (
                                          i, loop_timing[i],
                                          sum(loop_process_count[i].values()),
                                          global_opt_timing[i],
                                          io_toposort_timing[i], nb_nodes[i],
-                                         lopt))
+                                         node_visits[i], lopt))
 
         count_opt = []
         not_used = []
@@ -1733,7 +1905,8 @@ class EquilibriumOptimizer(NavigatorOptimizer):
     @staticmethod
     def merge_profile(prof1, prof2):
         #(opt, loop_timing, loop_process_count, max_nb_nodes,
-        # global_opt_timing, nb_nodes, time_opts, io_toposort_timing) = prof1
+        # global_opt_timing, nb_nodes, time_opts, io_toposort_timing,
+        # node_visits) = prof1
 
         local_optimizers = set(prof1[0].get_local_optimizers()).union(
             prof2[0].get_local_optimizers())
@@ -1780,8 +1953,11 @@ class EquilibriumOptimizer(NavigatorOptimizer):
 
         io_toposort_timing = merge_list(prof1[7], prof2[7])
 
+        node_visits = merge_list(prof1[8], prof2[8])
+
         assert (len(loop_timing) == len(global_opt_timing) ==
-                len(io_toposort_timing) == len(nb_nodes))
+                len(io_toposort_timing) == len(nb_nodes) ==
+                len(node_visits))
         assert len(loop_timing) == max(len(prof1[1]), len(prof2[1]))
         return (new_opt,
                 loop_timing,
@@ -1790,7 +1966,8 @@ class EquilibriumOptimizer(NavigatorOptimizer):
                 global_opt_timing,
                 nb_nodes,
                 time_opts,
-                io_toposort_timing)
+                io_toposort_timing,
+                node_visits)
 
 #################
 ### Utilities ###
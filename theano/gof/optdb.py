@@ -5,7 +5,7 @@ from theano.gof.python25 import DefaultOrderedDict
 import numpy
 from theano.compat.six import StringIO
 from theano.gof import opt
-from theano.configparser import AddConfigVar, FloatParam
+from theano.configparser import AddConfigVar, BoolParam, FloatParam
 from theano import config
 AddConfigVar('optdb.position_cutoff',
         'Where to stop eariler during optimization. It represent the'
@@ -16,6 +16,12 @@ AddConfigVar('optdb.max_use_ratio',
         'A ratio that prevent infinite loop in EquilibriumOptimizer.',
         FloatParam(5),
         in_c_key=False)
+AddConfigVar('optdb.incremental_equilibrium',
+        'If True, after their first pass, EquilibriumOptimizers only revisit'
+             ' the nodes that changed since the previous pass and their'
+             ' neighbors, instead of the whole graph.',
+        BoolParam(False),
+        in_c_key=False)
 
 
 class DB(object):
@@ -196,6 +202,7 @@ class EquilibriumDB(DB):
         return opt.EquilibriumOptimizer(opts,
                 max_depth=5,
                 max_use_ratio=config.optdb.max_use_ratio,
+                incremental=config.optdb.incremental_equilibrium,
                 failure_callback=opt.NavigatorOptimizer.warn_inplace)
 
 
@@ -1,4 +1,6 @@
-from theano.gof.graph import list_of_nodes
+import numpy
+
+from theano.gof.graph import Constant, list_of_nodes
 from theano.gof.python25 import any, defaultdict
 from theano.compat import cmp
 
@@ -213,3 +215,184 @@ def key_to_cmp(key):
     def key_cmp(a, b):
         return cmp(key(a), key(b))
     return key_cmp
+
+
+def alias_roots(nodes):
+    """ The results whose memory is used by the outputs of nodes
+
+    inputs:
+        nodes - the nodes of a graph, in a topological order
+    outputs:
+        root - a dict {output: the result that owns its memory}, for the
+               outputs of the nodes. The outputs that are not views nor
+               destroyed inputs (see view_map and destroy_map) own their
+               memory.
+        shared - the results aliased by an output of several inputs. Their
+               memory is used by a result that is not theirs, so they
+               should be kept alive.
+    """
+    root = {}
+    shared = set()
+    for node in nodes:
+        vmap = getattr(node.op, 'view_map', {})
+        dmap = getattr(node.op, 'destroy_map', {})
+        for k, out in enumerate(node.outputs):
+            aliased = vmap.get(k, []) + dmap.get(k, [])
+            if not aliased:
+                root[out] = out
+                continue
+            ins = [node.inputs[a] for a in aliased]
+            root[out] = root.get(ins[0], ins[0])
+            if len(ins) > 1:
+                shared.update([root.get(i, i) for i in ins])
+    return root, shared
+
+
+def static_size(fgraph, var, unknown_dim=100):
+    """ An estimation of the size in bytes of the value of var
+
+    The dimensions are taken from the ShapeFeature of fgraph when they are
+    constant, and the broadcastable dimensions are 1. The other dimensions
+    count as unknown_dim. The variables without a dtype and an ndim (e.g.
+    random states) count as 0.
+    """
+    vtype = var.type
+    if not hasattr(vtype, 'dtype') or not hasattr(vtype, 'ndim'):
+        return 0
+    try:
+        size = numpy.dtype(vtype.dtype).itemsize
+    except TypeError:
+        return 0
+    shape = None
+    shape_feature = getattr(fgraph, 'shape_feature', None)
+    if shape_feature is not None:
+        shape = shape_feature.shape_of.get(var)
+    for i in range(vtype.ndim):
+        if getattr(vtype, 'broadcastable', [False] * vtype.ndim)[i]:
+            continue
+        if shape is not None and isinstance(shape[i], Constant):
+            size *= int(shape[i].data)
+        else:
+            size *= unknown_dim
+    return size
+
+
+class _MemoryModel(object):
+    """ The memory used by the results of a FunctionGraph, when each one is
+    freed after its last use (as the linkers do with allow_gc).
+
+    size_of - a function of a variable that returns its size in bytes.
+    """
+    def __init__(self, fgraph, size_of):
+        nodes = fgraph.toposort()
+        self.root, shared = alias_roots(nodes)
+        keep = set(fgraph.outputs) | shared
+        self.keep = set([self.root.get(v, v) for v in keep])
+        self.users = {}  # root -> number of nodes that use its memory
+        self.roots_of = {}  # node -> roots of its inputs
+        for node in nodes:
+            roots = set([self.root.get(v, v) for v in node.inputs])
+            self.roots_of[node] = roots
+            for r in roots:
+                self.users[r] = self.users.get(r, 0) + 1
+        self.size = {}
+        for node in nodes:
+            for out in node.outputs:
+                if self.root[out] is out:
+                    self.size[out] = size_of(out)
+
+    def allocated(self, node):
+        """ Bytes allocated by the outputs of node """
+        return sum([self.size.get(out, 0) for out in node.outputs])
+
+    def freed(self, node, remaining):
+        """ Bytes that can be freed after node, given the number of nodes
+        that still have to use each root """
+        rval = 0
+        for r in self.roots_of[node]:
+            if remaining[r] == 1 and r not in self.keep:
+                rval += self.size.get(r, 0)
+        for out in node.outputs:
+            if (self.root[out] is out and not remaining.get(out) and
+                    out not in self.keep):
+                rval += self.size[out]
+        return rval
+
+    def run(self, node, remaining):
+        for r in self.roots_of[node]:
+            remaining[r] -= 1
+
+
+def peak_memory(fgraph, order, size_of=None, unknown_dim=100):
+    """ The peak memory used by the results of fgraph computed in order
+
+    The results are freed after their last use, as with allow_gc. The
+    inputs of the graph are not counted. The peak includes the inputs and
+    outputs of the node that runs.
+
+    size_of - a function of a variable that returns its size in bytes. By
+              default, it is estimated by static_size.
+    """
+    if size_of is None:
+        size_of = lambda v: static_size(fgraph, v, unknown_dim)
+    model = _MemoryModel(fgraph, size_of)
+    remaining = model.users.copy()
+    current = peak = 0
+    for node in order:
+        current += model.allocated(node)
+        peak = max(peak, current)
+        current -= model.freed(node, remaining)
+        model.run(node, remaining)
+    return peak
+
+
+def memory_schedule_fn(size_of=None, unknown_dim=100):
+    """ Make a schedule function that reduces the peak memory
+
+    The nodes are ordered greedily: among the nodes whose inputs are
+    computed, the next one is the one that increases the memory in use the
+    least (its outputs minus the results it frees), and the first one in
+    the order of FunctionGraph.toposort between those. The sizes of the
+    results are estimated by static_size, or given by size_of.
+
+    Use it with the schedule argument of the linkers, e.g.
+    VM_Linker(schedule=memory_schedule_fn()).
+    """
+    def schedule(fgraph):
+        """ Order nodes in a FunctionGraph """
+        nodes = fgraph.toposort()
+        if len(nodes) < 2:
+            return nodes
+        if size_of is None:
+            sizes = lambda v: static_size(fgraph, v, unknown_dim)
+        else:
+            sizes = size_of
+        model = _MemoryModel(fgraph, sizes)
+        idx = dict([(node, i) for i, node in enumerate(nodes)])
+        ords = fgraph.orderings()
+        missing = {}
+        clients = dict([(node, []) for node in nodes])
+        for node in nodes:
+            prereqs = set([v.owner for v in node.inputs if v.owner])
+            prereqs.update(ords.get(node, []))
+            missing[node] = len(prereqs)
+            for p in prereqs:
+                clients[p].append(node)
+
+        remaining = model.users.copy()
+        ready = [node for node in nodes if not missing[node]]
+        order = []
+        while ready:
+            best = min([(model.allocated(node) -
+                         model.freed(node, remaining), idx[node], node)
+                        for node in ready])[2]
+            ready.remove(best)
+            order.append(best)
+            model.run(best, remaining)
+            for c in clients[best]:
+                missing[c] -= 1
+                if not missing[c]:
+                    ready.append(c)
+        assert len(order) == len(nodes)
+        return order
+    return schedule
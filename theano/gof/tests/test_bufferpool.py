@@ -0,0 +1,84 @@
+import numpy
+
+import theano
+from theano import tensor
+from theano.compile import Mode
+from theano.gof import vm
+from theano.gof.bufferpool import BufferPool, bucket_size
+
+
+def test_bucket_size():
+    assert bucket_size(1) == 64
+    assert bucket_size(64) == 64
+    assert bucket_size(65) == 80
+    assert bucket_size(1000) == 1024
+    assert bucket_size(1025) == 1280
+    for n in range(1, 5000, 7):
+        assert n <= bucket_size(n) <= max(64, n * 1.25)
+
+
+def test_reuse():
+    pool = BufferPool(10 ** 6)
+    a = pool.acquire('float64', (10, 10))
+    assert a.shape == (10, 10) and a.dtype == 'float64'
+    assert (pool.hits, pool.misses) == (0, 1)
+    cell = [a]
+    del a
+    pool.clear(cell)
+    assert cell[0] is None
+    assert pool.bytes_held == bucket_size(800)
+
+    # The buffer is used for another dtype and shape of the same bucket.
+    b = pool.acquire('float32', (2, 100))
+    assert (pool.hits, pool.misses) == (1, 1)
+    assert pool.bytes_held == 0
+
+    # It is not kept while a view uses it.
+    v = b[1:]
+    cell = [b]
+    del b
+    pool.clear(cell)
+    assert pool.bytes_held == 0
+    v[:] = 1
+
+    # Nor are the arrays that do not come from the pool.
+    pool.clear([numpy.zeros((10, 10))])
+    assert pool.bytes_held == 0
+
+
+def test_eviction():
+    for eviction, kept in [('lru', [1024, 1024]), ('largest', [512, 1024])]:
+        pool = BufferPool(2048, eviction)
+        cells = [[pool.acquire('int8', (n,))] for n in (512, 1024, 1024)]
+        for cell in cells:
+            pool.clear(cell)
+        assert pool.evictions == 1
+        assert sorted([b.size for b in pool.free_order]) == kept
+        assert pool.bytes_held == sum(kept) <= pool.capacity
+
+
+def test_vm_buffer_pool():
+    x = tensor.matrix('x')
+    W = theano.shared(numpy.random.rand(8, 8).astype(theano.config.floatX))
+    h = x
+    for i in range(3):
+        h = tensor.dot(tensor.tanh(h) + 1, W)
+    outs = [h.sum(axis=1), h.max()]
+    f_ref = theano.function([x], outs, mode=Mode(linker='vm'))
+    for lazy in (False, True):
+        profile = theano.compile.ProfileStats(atexit_print=False)
+        linker = vm.VM_Linker(allow_gc=True, use_cloop=True, lazy=lazy,
+                              buffer_pool=True)
+        f = theano.function([x], outs, mode=Mode(linker=linker),
+                            profile=profile)
+        assert f.fn.pool is not None
+        # Minibatches of different sizes
+        for n in (5, 3, 5, 3, 5):
+            xv = numpy.random.rand(n, 8).astype(theano.config.floatX)
+            for r, r_ref in zip(f(xv), f_ref(xv)):
+                assert numpy.allclose(r, r_ref)
+        # Once the pool knows the shapes of both sizes, all the
+        # intermediate results come from it.
+        assert profile.pool_hits > 0
+        assert profile.pool_unused == 0
+        assert profile.pool_max_bytes_held > 0
@@ -251,6 +251,18 @@ def test_clinker_dups_inner():
     assert fn(1.0, 2.0, 3.0) == 8.0
 
 
+def test_clinker_constant_input_key():
+    # A constant is an orphan of the graph of a function, but an input of
+    # the graph built for a single node by Op.make_thunk. The modules take
+    # their arguments in a different order, so they must not share a key.
+    x, y, z = inputs()
+    c = Constant(tdouble, 4.0)
+    e = add(x, c)
+    key_orphan = CLinker().accept(Env([x], [e])).cmodule_key()
+    key_input = CLinker().accept(Env([x, c], [e])).cmodule_key()
+    assert key_orphan != key_input
+
+
 ######################
 # Test OpWiseCLinker #
 ######################
@@ -360,3 +372,35 @@ def test_c_fail_error():
         print 'Yay, TEST PASSED'
         return  # test passed
     assert 0  # test failed
+
+
+class AddNoGil(Binary):
+    def c_code(self, node, name, inp, out, sub):
+        x, y = inp
+        z, = out
+        return """%(begin_nogil)s
+            %(z)s = %(x)s + %(y)s;
+            %(end_nogil)s""" % dict(locals(), **sub)
+
+    def impl(self, x, y):
+        return x + y
+add_nogil = AddNoGil()
+
+
+def test_c_release_gil():
+    if not theano.config.cxx:
+        raise SkipTest("G++ not available, so we need to skip this test.")
+    orig = theano.config.cmodule.release_gil
+    try:
+        for release_gil in (True, False):
+            theano.config.cmodule.release_gil = release_gil
+            x, y, z = inputs()
+            e = add_nogil(mul(x, y), z)
+            lnk = CLinker().accept(Env([x, y, z], [e]))
+            src_code = lnk.prepare_cmodule()[0]
+            assert ('Py_BEGIN_ALLOW_THREADS' in src_code) == release_gil
+            assert ('Py_END_ALLOW_THREADS' in src_code) == release_gil
+            fn = lnk.make_function()
+            assert fn(2.0, 2.0, 2.0) == 6.0
+    finally:
+        theano.config.cmodule.release_gil = orig
@@ -4,10 +4,16 @@ But this one tests a current behavior that isn't good: the c_code isn't
 deterministic based on the input type and the op.
 
 """
+import os
+
 import numpy
+from nose.plugins.skip import SkipTest
 
 import theano
-from theano.gof.cmodule import GCC_compiler
+from theano.gof import compilelock, graph
+from theano.gof.cc import CLinker, get_module_cache
+from theano.gof.cmodule import GCC_compiler, ModuleCache, get_key_digest
+from theano.gof.fg import FunctionGraph
 
 
 class MyOp(theano.compile.ops.DeepCopyOp):
@@ -66,3 +72,160 @@ def test_flag_detection():
     # but was not detected because that path is not usually taken,
     # so we test it here directly.
     GCC_compiler.try_flags(["-lblas"])
+
+
+class AddCstOp(theano.Op):
+    """Add a constant to a vector. Each constant gives a different module."""
+
+    def __init__(self, cst):
+        self.cst = cst
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.cst == other.cst
+
+    def __hash__(self):
+        return hash((type(self), self.cst))
+
+    def make_node(self, x):
+        x = theano.tensor.as_tensor_variable(x)
+        return theano.Apply(self, [x], [x.type()])
+
+    def perform(self, node, inputs, output_storage):
+        output_storage[0][0] = inputs[0] + self.cst
+
+    def c_code_cache_version(self):
+        return ()
+
+    def c_code(self, node, name, inames, onames, sub):
+        x, = inames
+        z, = onames
+        fail = sub['fail']
+        cst = repr(self.cst)
+        return """
+        Py_XDECREF(%(z)s);
+        %(z)s = (PyArrayObject*)PyArray_NewCopy(%(x)s, NPY_CORDER);
+        if (!%(z)s)
+            %(fail)s;
+        for (npy_intp i = 0; i < PyArray_SIZE(%(z)s); ++i)
+            ((double*)PyArray_DATA(%(z)s))[i] += %(cst)s;
+        """ % locals()
+
+
+def test_compile_parallel():
+    if not theano.config.cxx:
+        raise SkipTest("G++ not available, so we need to skip this test.")
+    x = theano.tensor.dvector('x')
+    ops = [AddCstOp(numpy.random.rand()) for i in range(4)]
+    outs = [op(x) for op in ops]
+    orig_workers = theano.config.cmodule.compile_workers
+    cache = get_module_cache()
+    built = []
+    unused = []
+
+    def compile_parallel(jobs, n_workers):
+        before = set(cache.precompiled)
+        ModuleCache.compile_parallel(cache, jobs, n_workers)
+        built.extend([location for module_hash, (location, lib_filename)
+                      in cache.precompiled.items()
+                      if module_hash not in before])
+
+    def discard_precompiled():
+        unused.extend(cache.precompiled.values())
+        ModuleCache.discard_precompiled(cache)
+
+    try:
+        theano.config.cmodule.compile_workers = 2
+        cache.compile_parallel = compile_parallel
+        cache.discard_precompiled = discard_precompiled
+        mode = theano.compile.Mode(linker='cvm', optimizer=None)
+        f = theano.function([x], outs, mode=mode)
+        # A module was built in parallel for each op, and make_thunk
+        # imported all of them from where they were built.
+        assert len(built) == len(ops)
+        assert not unused
+        for location in built:
+            assert [name for name in cache.module_from_name
+                    if name.startswith(location)]
+        val = numpy.arange(3.)
+        for op, out in zip(ops, f(val)):
+            assert numpy.allclose(out, val + op.cst)
+    finally:
+        theano.config.cmodule.compile_workers = orig_workers
+        del cache.compile_parallel
+        del cache.discard_precompiled
+
+
+def test_fine_grained_lock():
+    if not theano.config.cxx:
+        raise SkipTest("G++ not available, so we need to skip this test.")
+    if compilelock.fcntl is None:
+        raise SkipTest("fcntl not available.")
+    x = theano.tensor.dvector('x')
+    op = AddCstOp(numpy.random.rand())
+    orig_lock = theano.config.compile.fine_grained_lock
+    try:
+        theano.config.compile.fine_grained_lock = True
+        mode = theano.compile.Mode(linker='cvm', optimizer=None)
+        f = theano.function([x], op(x), mode=mode)
+        val = numpy.arange(3.)
+        assert numpy.allclose(f(val), val + op.cst)
+        assert os.path.isdir(os.path.join(theano.config.compiledir,
+                                          'lock_dir_modules'))
+        # The locks were released.
+        assert compilelock.get_lock.n_lock == 0
+        lock = compilelock.get_module_lock(theano.config.compiledir,
+                                           'd41d8cd98f00b204e9800998ecf8427e')
+        assert not lock.acquire()
+        lock.release()
+    finally:
+        theano.config.compile.fine_grained_lock = orig_lock
+
+
+class VersionedAddCstOp(AddCstOp):
+    def c_code_cache_version(self):
+        return (1,)
+
+
+def test_cache_index():
+    if not theano.config.cxx:
+        raise SkipTest("G++ not available, so we need to skip this test.")
+    x = theano.tensor.dvector('x')
+    op = VersionedAddCstOp(numpy.random.rand())
+    orig_use_index = theano.config.cmodule.use_index
+    try:
+        theano.config.cmodule.use_index = True
+        cache = get_module_cache()
+        compilelock.get_lock()
+        try:
+            cache.write_index()
+        finally:
+            compilelock.release_lock()
+        fgraph = FunctionGraph(*graph.clone([x], [op(x)]))
+        cl = CLinker().accept(fgraph)
+        key = cl.cmodule_key()
+        module = cache.module_from_key(key=key, fn=cl.compile_cmodule_by_step)
+
+        # A new process only reads the index when it starts.
+        new_cache = ModuleCache(theano.config.compiledir,
+                                check_for_broken_eq=False)
+        assert key not in new_cache.entry_from_key
+        assert new_cache.indexed_dirs
+        # The module is found through the index, and not compiled again.
+        new_module = new_cache.module_from_key(
+            key=key, fn=CLinker().accept(fgraph).compile_cmodule_by_step)
+        assert new_module.__file__ == module.__file__
+        assert new_cache.entry_from_key[key] == module.__file__
+
+        # The digest of the key is also in the index, so that a new process
+        # does not even need to generate the C code of the module.
+        new_cache = ModuleCache(theano.config.compiledir,
+                                check_for_broken_eq=False)
+        assert get_key_digest(key) in new_cache.indexed_keys
+
+        def fn(location):
+            raise AssertionError('the C code should not be generated')
+        new_module = new_cache.module_from_key(key=key, fn=fn)
+        assert new_module.__file__ == module.__file__
+        assert get_key_digest(key) not in new_cache.indexed_keys
+    finally:
+        theano.config.cmodule.use_index = orig_use_index
@@ -426,3 +426,59 @@ def test_value_repl_2():
     consistent(g)
     g.replace(sy, transpose_view(MyConstant("abc")))
     consistent(g)
+
+
+def test_incremental_cycle_detection():
+    # Compare the incremental cycle detection of the DestroyHandler with a
+    # full check of the graph, on random changes of a random graph.
+    import random
+    rng = random.Random(42)
+    for trial in range(5):
+        x, y, z = inputs()
+        variables = [x, y, z]
+        for i in range(40):
+            op = rng.choice([sigmoid, transpose_view, add, dot])
+            args = [rng.choice(variables[-10:]) for j in range(op.nin)]
+            variables.append(op(*args))
+        g = Env([x, y, z], variables[-5:])
+        dh = g.destroy_handler
+
+        for step in range(60):
+            nodes = g.toposort()
+            node = rng.choice(nodes)
+            chk = g.checkpoint()
+            if rng.random() < 0.5:
+                # Make a node inplace, like an inplace optimizer would.
+                if node.op is not add:
+                    continue
+                g.replace(node.outputs[0], add_in_place(*node.inputs),
+                          reason='test')
+            else:
+                # Replace a variable with another one of the graph, this
+                # can introduce cycles.
+                old_r = node.outputs[0]
+                new_r = rng.choice([v for n in nodes
+                                    for v in n.inputs + n.outputs])
+                if new_r is old_r or new_r in g.outputs:
+                    continue
+                g.replace(old_r, new_r, reason='test')
+            try:
+                expected = destroyhandler._contains_cycle(
+                    g, dh.orderings(g))
+            except InconsistencyError:
+                expected = None
+            if not dh.destroyers:
+                # Cycles are not checked without destroyers, just keep
+                # the graph acyclic.
+                if expected:
+                    g.revert(chk)
+                continue
+            try:
+                g.validate()
+                valid = True
+            except InconsistencyError:
+                valid = False
+            if expected is not None:
+                assert valid == (not expected)
+            if not valid:
+                g.revert(chk)
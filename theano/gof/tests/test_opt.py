@@ -5,6 +5,7 @@ from theano.gof.op import Op
 from theano.gof.opt import *
 from theano.gof.fg import FunctionGraph as Env
 from theano.gof.toolbox import *
+from theano.compat.six import StringIO
 
 
 def as_variable(x):
@@ -409,3 +410,79 @@ class TestEquilibrium(object):
             _logger.setLevel(oldlevel)
         #print 'after', g
         assert str(g) == '[Op1(x, y)]'
+
+    def test_incremental(self):
+        x, y, z = map(MyVariable, 'xyz')
+        opts = [PatternSub((op1, (op2, 'x', 'y')), (op4, 'x', 'y')),
+                PatternSub((op3, 'x', 'y'), (op4, 'x', 'y')),
+                PatternSub((op4, 'x', 'y'), (op5, 'x', 'y')),
+                PatternSub((op5, 'x', 'y'), (op6, 'x', 'y')),
+                PatternSub((op6, 'x', 'y'), (op2, 'x', 'y'))]
+        # Many independent chains, only one of which needs many passes.
+        outs = [op1(op1(op3(x, y)))] + [op1(x, op2(y, z)) for i in range(20)]
+        g = Env([x, y, z], outs)
+        ref = Env([x, y, z], outs)
+        EquilibriumOptimizer(opts, max_use_ratio=10).optimize(ref)
+        opt = EquilibriumOptimizer(opts, max_use_ratio=10, incremental=True)
+        prof = opt.optimize(g)
+        assert str(g) == str(ref)
+        assert str(g).startswith('[Op2(x, y), ')
+
+        node_visits = prof[8]
+        assert len(node_visits) > 2
+        # After the first pass, only the chain that changes is revisited,
+        # until the final pass that checks the whole graph.
+        assert max(node_visits[1:-1]) < node_visits[0] / 4
+        assert node_visits[-1] == len(g.apply_nodes)
+        opt.print_profile(StringIO(), prof)
+
+
+class MySubOp(MyOp):
+    pass
+
+
+class TestLocalOptTracker(object):
+
+    def test_get_trackers(self):
+        sub_op = MySubOp('SubOp')
+
+        def make(name, tracks):
+            @local_optimizer(tracks)
+            def lopt(node):
+                return False
+            lopt.__name__ = name
+            return lopt
+        on_cls = make('on_cls', [MyOp])
+        on_op1 = make('on_op1', [op1])
+        on_sub = make('on_sub', [MySubOp])
+        on_all = make('on_all', None)
+        tracker = LocalOptTracker([on_cls, on_op1, on_sub, on_all])
+        assert tracker.get_trackers(op1) == [on_cls, on_op1, on_all]
+        assert tracker.get_trackers(op2) == [on_cls, on_all]
+        assert tracker.get_trackers(sub_op) == [on_cls, on_sub, on_all]
+
+        tracker = LocalOptTracker([on_op1, on_sub])
+        assert tracker.get_trackers(op2) == []
+
+    def test_group_dispatch(self):
+        x, y, z = inputs()
+        called = []
+
+        @local_optimizer([op1])
+        def op1_to_op2(node):
+            called.append(node.op)
+            if node.op == op1:
+                return [op2(*node.inputs)]
+
+        @local_optimizer([op3])
+        def op3_to_op4(node):
+            called.append(node.op)
+            if node.op == op3:
+                return [op4(*node.inputs)]
+
+        e = op5(op1(x), op3(y), op6(z))
+        g = Env([x, y, z], [e])
+        TopoOptimizer(LocalOptGroup(op1_to_op2, op3_to_op4)).optimize(g)
+        assert str(g) == "[Op5(Op2(x), Op4(y), Op6(z))]"
+        # The optimizers were only tried on the nodes they track.
+        assert sorted(map(str, called)) == ['Op1', 'Op3']
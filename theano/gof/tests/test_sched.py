@@ -1,5 +1,8 @@
+import numpy
+
 from theano.gof.sched import (make_dependence_cmp, sort_apply_nodes,
-                              reverse_dict, _toposort, posort)
+                              reverse_dict, _toposort, posort,
+                              memory_schedule_fn, peak_memory, static_size)
 
 import theano
 from theano import tensor
@@ -66,3 +69,34 @@ def test_posort():
             lambda a, b: a - b]
     assert posort(l, *cmps) == \
             [10, 1, 11, 2, 12, 3, 13, 4, 14, 5, 15, 6, 16, 7, 17, 8, 18, 9, 19]
+
+
+def test_memory_schedule():
+    # The outer products are summed as soon as they are computed, so only
+    # one of them is alive at a time.
+    x = tensor.vector('x')
+    y = 0
+    for i in range(4):
+        y = y + tensor.outer(x + i, x).sum()
+    fgraph = theano.FunctionGraph([x], [y])
+    order = memory_schedule_fn()(fgraph)
+    assert set(order) == set(fgraph.apply_nodes)
+    for i, node in enumerate(order):
+        for inp in node.inputs:
+            assert inp.owner is None or inp.owner in order[:i]
+    # The unknown dimensions count as 100.
+    outer_size = 100 * 100 * numpy.dtype(x.dtype).itemsize
+    outers = [node.outputs[0] for node in order
+              if isinstance(node.op, tensor.basic.Dot)]
+    assert len(outers) == 4
+    assert static_size(fgraph, outers[0]) == outer_size
+    assert peak_memory(fgraph, order) < 2 * outer_size
+    assert peak_memory(fgraph, fgraph.toposort()) >= \
+        peak_memory(fgraph, order)
+
+    # The function computes the same thing.
+    linker = theano.gof.vm.VM_Linker(schedule=memory_schedule_fn())
+    f = theano.function([x], y, mode=theano.Mode(linker=linker))
+    f_ref = theano.function([x], y)
+    xv = numpy.arange(5).astype(x.dtype)
+    assert numpy.allclose(f(xv), f_ref(xv))
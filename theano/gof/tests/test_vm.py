@@ -1,4 +1,5 @@
 import gc
+import StringIO
 import sys
 import time
 import unittest
@@ -319,3 +320,103 @@ def test_vm_gc():
     f = theano.function([x], [pp + pp],
                         mode=mode)
     f([1, 2, 3])
+
+
+def test_parallel_loop():
+    orig_threads = theano.config.vm.threads
+    try:
+        theano.config.vm.threads = 4
+        x = tensor.matrix('x')
+        y = tensor.matrix('y')
+        # Independent branches, with inplace nodes that must wait for the
+        # other clients of the variables they destroy.
+        outs = [tensor.tanh(tensor.dot(x + i, y)) * i + x.sum()
+                for i in range(6)]
+        cost = tensor.add(*outs).sum()
+        for allow_gc in (True, False):
+            mode = Mode(linker=vm.VM_Linker(allow_gc=allow_gc,
+                                            parallel=True))
+            f = function([x, y], [cost] + outs, mode=mode)
+            assert isinstance(f.fn, vm.ParallelLoop)
+            assert len(f.fn.workers) == 0
+            f_ref = function([x, y], [cost] + outs,
+                             mode=Mode(linker='vm'))
+            xv = numpy.random.rand(20, 30).astype(theano.config.floatX)
+            yv = numpy.random.rand(30, 10).astype(theano.config.floatX)
+            for k in range(3):
+                for r, r_ref in zip(f(xv, yv), f_ref(xv, yv)):
+                    assert numpy.allclose(r, r_ref)
+            assert len(f.fn.workers) == 3
+
+            # The error of a node is raised once the running nodes are done.
+            try:
+                f(xv, xv)
+            except ValueError:
+                pass
+            else:
+                assert False
+            for r, r_ref in zip(f(xv, yv), f_ref(xv, yv)):
+                assert numpy.allclose(r, r_ref)
+    finally:
+        theano.config.vm.threads = orig_threads
+
+
+def test_parallel_loop_profile():
+    x = tensor.vector('x')
+    mode = Mode(linker=vm.VM_Linker(parallel=True))
+    profile = theano.compile.ProfileStats(atexit_print=False)
+    f = function([x], [tensor.exp(x), tensor.tanh(x)], mode=mode,
+                 profile=profile)
+    f(numpy.ones(10, dtype=theano.config.floatX))
+    # The wait and run time of each node is recorded.
+    profile.summary(file=StringIO.StringIO())
+    nodes = f.maker.fgraph.toposort()
+    assert set(profile.apply_wait_time) == set(nodes)
+    assert set(profile.apply_time) == set(nodes)
+
+
+def test_memory_plan():
+    x = tensor.matrix('x')
+    # Each tanh is computed after the dot that used the previous tanh, so
+    # they can share their storage, and so can the dots.
+    y = x
+    for i in range(4):
+        y = tensor.dot(tensor.tanh(y * 2 + 1), y)
+    outs = [y, y * 2]
+    xv = numpy.random.rand(5, 5).astype(theano.config.floatX)
+    f_ref = function([x], outs, mode=Mode(linker='vm'))
+    for use_cloop in (True, False):
+        for allow_gc in (True, False):
+            linker = vm.VM_Linker(use_cloop=use_cloop, allow_gc=allow_gc,
+                                  memory_plan=True)
+            f = function([x], outs, mode=Mode(linker=linker))
+            assert f.fn.memory_groups
+            nodes = f.maker.fgraph.toposort()
+            for group in f.fn.memory_groups:
+                # The outputs and the aliased results are never shared.
+                for v in group:
+                    assert v not in f.maker.fgraph.outputs
+                    assert not getattr(v.owner.op, 'view_map', None)
+                    assert not getattr(v.owner.op, 'destroy_map', None)
+                # All the users of a variable run before the next one.
+                for v, next_v in zip(group[:-1], group[1:]):
+                    for client, _ in v.clients:
+                        assert (nodes.index(client) <
+                                nodes.index(next_v.owner))
+            r1 = f(xv)
+            r2 = f(xv)
+            assert r1[0] is not r2[0]
+            for r, r_ref in zip(r2, f_ref(xv)):
+                assert numpy.allclose(r, r_ref)
+
+
+def test_memory_plan_lazy():
+    # The plan is not used when some nodes can be skipped.
+    a, b = tensor.vectors('a', 'b')
+    c = tensor.scalar('c')
+    z = ifelse(c, tensor.exp(a + 1), tensor.exp(b + 1))
+    linker = vm.VM_Linker(lazy=True, memory_plan=True)
+    f = function([a, b, c], z * 2, mode=Mode(linker=linker))
+    assert f.fn.memory_groups == []
+    av = numpy.ones(3, dtype=theano.config.floatX)
+    assert numpy.allclose(f(av, av * 2, 1), numpy.exp(av + 1) * 2)
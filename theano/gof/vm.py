@@ -3,18 +3,25 @@ VMs that run Theano graph computations.
 A VM is not actually different from a Linker, we just decided
 VM was a better name at some point.
 """
+import atexit
 import link
 import logging
 import os
 import sys
 import time
 import warnings
+import weakref
 
-from theano.gof.python25 import all
+from theano.gof.python25 import all, any
 
-from theano.configparser import config, AddConfigVar, BoolParam, ConfigParam
+from theano.configparser import (config, AddConfigVar, BoolParam,
+                                  ConfigParam, EnumStr, IntParam)
 
 import theano.gof.cmodule
+from theano.gof import graph
+from theano.gof.bufferpool import BufferPool
+from theano.gof.sched import alias_roots
+from theano.misc.cpucount import cpuCount
 
 logger = logging.getLogger(__name__)
 
@@ -50,9 +57,156 @@ AddConfigVar('vm.lazy',
              ConfigParam('None', filter_vm_lazy),
              in_c_key=False)
 
+AddConfigVar('vm.threads',
+             "Number of threads used by the vm_parallel linker to run the "
+             "independent nodes of a graph at the same time, including the "
+             "thread that calls the function. -1 uses one thread per CPU.",
+             IntParam(-1, lambda i: i == -1 or i >= 1),
+             in_c_key=False)
+
+AddConfigVar('vm.memory_plan',
+             "Useful only for the vm linkers. If True, the intermediate "
+             "results that are never alive at the same time share their "
+             "storage, so the ops can write into the buffer of a result that "
+             "is not needed anymore (see vm.memory_plan).",
+             BoolParam(False),
+             in_c_key=False)
+
+AddConfigVar('vm.buffer_pool',
+             "Useful only for the vm linkers, with allow_gc. If True, the "
+             "buffers of the garbage collected results are kept in a pool, "
+             "and used for the outputs of the nodes run next (see "
+             "gof.bufferpool). This uses the Python VMs instead of the CVM.",
+             BoolParam(False),
+             in_c_key=False)
+
+AddConfigVar('vm.buffer_pool_capacity',
+             "Maximum size (in MB) of the buffers kept in the pool of each "
+             "function, when vm.buffer_pool is True.",
+             IntParam(256, lambda i: i >= 0),
+             in_c_key=False)
+
+AddConfigVar('vm.buffer_pool_eviction',
+             "The buffers removed from the pool when a new one does not fit "
+             "in vm.buffer_pool_capacity: the ones returned the longest time "
+             "ago (lru), or the largest ones.",
+             EnumStr('lru', 'largest'),
+             in_c_key=False)
+
 raise_with_op = link.raise_with_op
 
 
+def _symbolic_shape(fgraph, var):
+    # The variables with the same symbolic shape have the same shape. The
+    # shapes given by the ShapeFeature are tuples of scalar variables, and
+    # the same variable gives the same value. None if it is not known.
+    shape = None
+    shape_feature = getattr(fgraph, 'shape_feature', None)
+    if shape_feature is not None and var in shape_feature.shape_of:
+        shape = []
+        for s in shape_feature.shape_of[var]:
+            if isinstance(s, graph.Constant):
+                shape.append(int(s.data))
+            else:
+                shape.append(s)
+        shape = tuple(shape)
+    return shape
+
+
+def memory_plan(fgraph, order):
+    """
+    Return the groups of intermediate results of `fgraph` that can share
+    their storage.
+
+    Each group is a list of variables `[v_1, v_2, ...]`: the node that
+    computes v_{i+1} runs after all the nodes that compute or use v_i (or a
+    view of it), in any order of execution that respects the dependencies
+    of the graph and `fgraph.orderings()`. So when v_{i+1} is computed, v_i
+    is not needed anymore, and the op can write v_{i+1} into the buffer of
+    v_i if it has the right shape. This is not true if some nodes can be
+    skipped (lazy evaluation).
+
+    The variables are put in groups of the same dtype and ndim, with a
+    greedy first-fit on the nodes in `order`: a variable goes in the first
+    group whose last variable has the same shape (according to the
+    ShapeFeature, if the graph has one), or else in the first group where
+    it fits. The shapes are often not known before the call (e.g. the
+    shape of a shared variable), and the op allocates a new output when
+    the shape does not match. The outputs of the graph, the views and the
+    destroyed results, and the results they alias, are not in any group.
+
+    :param order: the nodes of `fgraph`, in a topological order.
+    """
+    node_idx = dict([(node, i) for i, node in enumerate(order)])
+    ords = fgraph.orderings()
+
+    # The ancestors of each node, as a bit mask of the indices in order.
+    ancestors = []
+    for node in order:
+        prereqs = set([v.owner for v in node.inputs if v.owner])
+        prereqs.update(ords.get(node, []))
+        mask = 0
+        for p in prereqs:
+            j = node_idx[p]
+            mask |= ancestors[j] | (1 << j)
+        ancestors.append(mask)
+
+    # The result whose buffer each variable uses, and the results whose
+    # buffer can not be reused.
+    root, shared = alias_roots(order)
+    keep = set([root.get(v, v) for v in fgraph.outputs]) | shared
+
+    # The nodes that compute or use the buffer of each result.
+    users = {}
+    for i, node in enumerate(order):
+        for v in node.inputs + node.outputs:
+            r = root.get(v, v)
+            users[r] = users.get(r, 0) | (1 << i)
+
+    groups = []
+    # (dtype, ndim) -> list of [group, mask of the users of its last
+    # variable, shape of its last variable]
+    slots = {}
+    for i, node in enumerate(order):
+        for out in node.outputs:
+            if (root[out] is not out or out in keep or
+                    not hasattr(out.type, 'dtype') or
+                    not hasattr(out.type, 'ndim')):
+                continue
+            shape = _symbolic_shape(fgraph, out)
+            candidates = slots.setdefault((out.type.dtype, out.type.ndim),
+                                          [])
+            free = [c for c in candidates if not c[1] & ~ancestors[i]]
+            same = [c for c in free if shape is not None and c[2] == shape]
+            if same or free:
+                slot = (same + free)[0]
+                slot[0].append(out)
+                slot[1] = users[out]
+                slot[2] = shape
+            else:
+                group = [out]
+                groups.append(group)
+                candidates.append([group, users[out], shape])
+    return [g for g in groups if len(g) > 1]
+
+
+def pool_outputs(node, storage_map, outputs):
+    """
+    Return the storage cells of the inputs of `node`, and the list of
+    (variable, storage cell) of its outputs for which a BufferPool can give
+    the buffer: the outputs that are not views nor destroyed inputs, not
+    in `outputs` (the outputs of the graph), and whose type has a dtype and
+    an ndim > 0 (the scalars are not worth it).
+    """
+    aliased = (getattr(node.op, 'view_map', {}).keys() +
+               getattr(node.op, 'destroy_map', {}).keys())
+    return ([storage_map[v] for v in node.inputs],
+            [(var, storage_map[var]) for idx, var in enumerate(node.outputs)
+             if idx not in aliased and var not in outputs and
+             hasattr(var.type, 'dtype') and
+             getattr(var.type, 'ndim', 0) > 0])
+
+
 class VM(object):
     """
     A VM object's __call__ method evaluates a Theano program.
@@ -141,6 +295,29 @@ class VM(object):
             profile.variable_shape = self.variable_shape.copy()
             profile.variable_strides = self.variable_strides.copy()
 
+        pool = getattr(self, 'pool', None)
+        if pool is not None:
+            profile.pool_hits += pool.hits
+            profile.pool_misses += pool.misses
+            profile.pool_unused += pool.unused
+            profile.pool_evictions += pool.evictions
+            profile.pool_max_bytes_held = max(profile.pool_max_bytes_held,
+                                              pool.max_bytes_held)
+            pool.reset_counters()
+
+        if hasattr(self, 'n_allocations'):
+            profile.n_allocations += self.n_allocations
+            profile.allocated_bytes += self.allocated_bytes
+            self.n_allocations = 0
+            self.allocated_bytes = 0
+
+        if self.nodes:
+            profile.node_order[self.nodes[0].fgraph] = list(self.nodes)
+
+        for group in getattr(self, 'memory_groups', []):
+            for var in group:
+                profile.storage_group[var] = group[0]
+
         # clear the timer info out of the buffers
         for i in xrange(len(self.call_times)):
             self.call_times[i] = 0.0
@@ -180,15 +357,24 @@ class LoopGC(VM):
     """
     Unconditional start-to-finish program execution in Python.
     Garbage collection is possible on intermediate results.
+
+    If `pool` is a BufferPool, the results are garbage collected into it,
+    and `pool_outputs` is the list of the outputs of each node that it
+    can fill (see `pool_outputs`).
     """
-    def __init__(self, nodes, thunks, pre_call_clear, post_thunk_clear):
+    def __init__(self, nodes, thunks, pre_call_clear, post_thunk_clear,
+                 pool=None, pool_outputs=None):
         super(LoopGC, self).__init__(nodes, thunks, pre_call_clear)
         self.post_thunk_clear = post_thunk_clear
+        self.pool = pool
+        self.pool_outputs = pool_outputs
         if not (len(nodes) == len(thunks) == len(post_thunk_clear)):
             raise ValueError()
 
     def __call__(self):
-        if self.time_thunks:
+        if self.pool is not None:
+            self.call_with_pool()
+        elif self.time_thunks:
             for cont in self.pre_call_clear:
                 cont[0] = None
             try:
@@ -218,6 +404,220 @@ class LoopGC(VM):
             except:
                 raise_with_op(node, thunk)
 
+    def call_with_pool(self):
+        pool = self.pool
+        for cont in self.pre_call_clear:
+            cont[0] = None
+        try:
+            i = 0
+            for thunk, node, old_storage, (inputs, outputs) in zip(
+                    self.thunks, self.nodes, self.post_thunk_clear,
+                    self.pool_outputs):
+                ticket = pool.fill(inputs, outputs)
+                if self.time_thunks:
+                    t0 = time.time()
+                    thunk()
+                    self.call_times[i] += time.time() - t0
+                    self.call_counts[i] += 1
+                else:
+                    thunk()
+                pool.settle(outputs, ticket)
+                for old_s in old_storage:
+                    pool.clear(old_s)
+                i += 1
+        except:
+            raise_with_op(node, thunk)
+
+
+# The worker threads of the ParallelLoop VMs, stopped at exit (before
+# the interpreter tears down the modules they use).
+_parallel_workers = weakref.WeakKeyDictionary()
+
+
+def _stop_parallel_workers():
+    for tasks, workers in _parallel_workers.items():
+        for worker in workers:
+            tasks.put(None)
+        for worker in workers:
+            worker.join()
+atexit.register(_stop_parallel_workers)
+
+
+def _parallel_worker(tasks):
+    """Run the thunks put in the `tasks` queue by a ParallelLoop, until it
+    receives None."""
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        i, thunk, done = task
+        t0 = time.time()
+        try:
+            thunk()
+        except:
+            done.put((i, t0, time.time(), sys.exc_info()))
+        else:
+            done.put((i, t0, time.time(), None))
+
+
+class ParallelLoop(VM):
+    """
+    Unconditional program execution in Python, running the thunks whose
+    inputs are ready on a pool of threads.
+
+    A node is ready when the nodes that compute its inputs, and the nodes
+    that the fgraph orderings make it wait for (e.g. the other clients of
+    a variable it destroys), have run. Independent branches of the graph
+    then run at the same time, as long as their thunks release the GIL (see
+    `config.cmodule.release_gil`).
+
+    The thread that calls the VM schedules the nodes and runs some of them,
+    the other `n_threads - 1` threads are started at the first call. The
+    thunks must not be lazy. Garbage collection is possible on intermediate
+    results: a variable is cleared once all the nodes that use it have run.
+
+    Attributes:
+
+    call_wait_times - list of floats, one for each thunk. call_wait_times[i]
+        is the time thunks[i] waited between being ready and starting to
+        run, when time_thunks is True.
+    """
+    def __init__(self, nodes, thunks, pre_call_clear, fgraph, storage_map,
+                 allow_gc, n_threads):
+        super(ParallelLoop, self).__init__(nodes, thunks, pre_call_clear)
+        if n_threads < 1:
+            raise ValueError('n_threads must be at least 1', n_threads)
+        self.n_threads = n_threads
+        self.call_wait_times = [0] * len(nodes)
+        self.workers = []
+        self.tasks = None
+
+        node_idx = dict([(node, i) for i, node in enumerate(nodes)])
+        ords = fgraph.orderings()
+        # The number of nodes each node waits for, and the nodes that wait
+        # for each node.
+        self.n_prereqs = [0] * len(nodes)
+        self.successors = [[] for node in nodes]
+        for i, node in enumerate(nodes):
+            prereqs = set([v.owner for v in node.inputs if v.owner])
+            prereqs.update(ords.get(node, []))
+            self.n_prereqs[i] = len(prereqs)
+            for p in prereqs:
+                self.successors[node_idx[p]].append(i)
+        self.initial_ready = [i for i, n in enumerate(self.n_prereqs)
+                              if n == 0]
+
+        # For the gc: the storage of the intermediate results each node
+        # uses, and the number of nodes that use each of them.
+        self.post_thunk_clear = [[] for node in nodes]
+        self.n_users = {}
+        if allow_gc:
+            for i, node in enumerate(nodes):
+                for v in set(node.inputs):
+                    if v.owner and v not in fgraph.outputs:
+                        self.post_thunk_clear[i].append(v)
+                        self.n_users[v] = self.n_users.get(v, 0) + 1
+            self.storage_map = storage_map
+
+    def start_workers(self):
+        import Queue
+        import threading
+        self.tasks = Queue.Queue()
+        for k in range(self.n_threads - 1):
+            worker = threading.Thread(target=_parallel_worker,
+                                      args=(self.tasks,))
+            worker.setDaemon(True)
+            worker.start()
+            self.workers.append(worker)
+        _parallel_workers[self.tasks] = self.workers
+
+    def __del__(self):
+        for worker in self.workers:
+            self.tasks.put(None)
+
+    def __call__(self):
+        import Queue
+        if self.tasks is None:
+            self.start_workers()
+        for cont in self.pre_call_clear:
+            cont[0] = None
+        thunks = self.thunks
+        successors = self.successors
+        post_thunk_clear = self.post_thunk_clear
+        time_thunks = self.time_thunks
+        n_prereqs = list(self.n_prereqs)
+        n_users = self.n_users.copy()
+        ready = list(self.initial_ready)
+        ready_time = {}
+        if time_thunks:
+            t = time.time()
+            for i in ready:
+                ready_time[i] = t
+        done = Queue.Queue()
+        n_left = len(thunks)
+        n_running = 0
+        error = None
+
+        while n_left:
+            if error is None:
+                # Keep one ready node for this thread, and give the other
+                # ones to the workers.
+                while len(ready) > 1 and self.workers:
+                    i = ready.pop()
+                    self.tasks.put((i, thunks[i], done))
+                    n_running += 1
+                if ready:
+                    i = ready.pop()
+                    t0 = time.time()
+                    try:
+                        thunks[i]()
+                    except:
+                        result = (i, t0, time.time(), sys.exc_info())
+                    else:
+                        result = (i, t0, time.time(), None)
+                else:
+                    result = done.get()
+                    n_running -= 1
+            elif n_running:
+                # Let the nodes that are running finish before raising.
+                result = done.get()
+                n_running -= 1
+            else:
+                break
+
+            i, t0, t1, exc_info = result
+            n_left -= 1
+            if exc_info is not None:
+                if error is None:
+                    error = (i, exc_info)
+                continue
+            if time_thunks:
+                self.call_counts[i] += 1
+                self.call_times[i] += t1 - t0
+                self.call_wait_times[i] += t0 - ready_time.pop(i)
+            for v in post_thunk_clear[i]:
+                n_users[v] -= 1
+                if not n_users[v]:
+                    self.storage_map[v][0] = None
+            for j in successors[i]:
+                n_prereqs[j] -= 1
+                if not n_prereqs[j]:
+                    ready.append(j)
+                    if time_thunks:
+                        ready_time[j] = t1
+
+        if error is not None:
+            i, exc_info = error
+            raise_with_op(self.nodes[i], thunks[i], exc_info)
+
+    def update_profile(self, profile):
+        for node, t in zip(self.nodes, self.call_wait_times):
+            profile.apply_wait_time.setdefault(node, 0.0)
+            profile.apply_wait_time[node] += t
+        for i in xrange(len(self.call_wait_times)):
+            self.call_wait_times[i] = 0.0
+        super(ParallelLoop, self).update_profile(profile)
+
 
 class Stack(VM):
     """
@@ -247,7 +647,7 @@ class Stack(VM):
 
     def __init__(self, nodes, thunks, pre_call_clear,
                  storage_map, compute_map, fgraph, allow_gc,
-                 dependencies=None, callback=None):
+                 dependencies=None, callback=None, pool=None):
         super(Stack, self).__init__(nodes, thunks, pre_call_clear)
 
         self.allow_gc = allow_gc
@@ -257,9 +657,17 @@ class Stack(VM):
         self.storage_map = storage_map
         self.variable_shape = {}  # Variable -> shape
         self.variable_strides = {}  # Variable -> strides
+        # Number and size of the outputs the thunks allocated, when profiling
+        self.n_allocations = 0
+        self.allocated_bytes = 0
         self.compute_map = compute_map
         self.node_idx = node_idx = {}
         self.callback = callback
+        # The BufferPool where the results are garbage collected, if any
+        self.pool = pool
+        if pool is not None:
+            self.pool_outputs = [pool_outputs(node, storage_map, self.outputs)
+                                 for node in nodes]
 
         ords = fgraph.orderings()
 
@@ -290,12 +698,22 @@ class Stack(VM):
         if self.allow_gc and self.dependencies is None:
             raise ValueError("Must set dependencies when using GC")
 
+    def gc_storage(self, container):
+        """Free the value in `container`, into the pool if there is one."""
+        if self.pool is None:
+            container[0] = None
+        else:
+            self.pool.clear(container)
+
     def run_thunk_of_node(self, node):
         """Run the thunk corresponding to Apply instance `node`
 
         Calls self.callback if it is defined.
         """
         idx = self.node_idx[node]
+        if self.pool is not None:
+            inputs, outputs = self.pool_outputs[idx]
+            ticket = self.pool.fill(inputs, outputs)
         t0 = time.time()
         rval = self.thunks[idx]()
 
@@ -304,6 +722,8 @@ class Stack(VM):
         # Profile output looks buggy if a node has run but takes 0 time.
         # (and profile code might hide real bugs if it rounds up 0)
         dt = max(time.time() - t0, 1e-10)
+        if self.pool is not None:
+            self.pool.settle(outputs, ticket)
         if self.callback is not None:
             self.callback(
                     node=node,
@@ -375,6 +795,9 @@ class Stack(VM):
                 if computed_ins and not computed_outs:
                     # -- Non-lazy case: have inputs, time to compute outputs
                     try:
+                        if config.profile:
+                            old_outputs = [o[0] for o in thunks[
+                                self.node_idx[current_apply]].outputs]
                         _, dt = self.run_thunk_of_node(current_apply)
                         del _
                         if config.profile:
@@ -384,6 +807,10 @@ class Stack(VM):
                             ## Computing the memory footprint of the the op
                             # ?? What about inplace .. if the op is inplace
                             # you don't actually ask for more memory!
+                            aliased = (getattr(current_apply.op,
+                                               'view_map', {}).keys() +
+                                       getattr(current_apply.op,
+                                               'destroy_map', {}).keys())
                             for (idx, o) in enumerate(
                                     thunks[self.node_idx[
                                         current_apply]].outputs):
@@ -399,6 +826,15 @@ class Stack(VM):
                                     o[0].flags.c_contiguous):
                                     st = 'c'
                                 self.variable_strides[var] = st
+                                # The op allocated a new output if it did
+                                # not reuse the one in its storage.
+                                if (o[0] is not None and
+                                        o[0] is not old_outputs[idx] and
+                                        idx not in aliased):
+                                    self.n_allocations += 1
+                                    if hasattr(var.type, 'get_size'):
+                                        self.allocated_bytes += \
+                                            var.type.get_size(sh)
                     except Exception:
                         raise_with_op(current_apply,
                                       self.thunks[self.node_idx[current_apply]])
@@ -413,7 +849,7 @@ class Stack(VM):
                                     and i not in self.outputs):
                                 if all(compute_map[v][0]
                                         for v in dependencies[i]):
-                                    storage_map[i][0] = None
+                                    self.gc_storage(storage_map[i])
                                     #DO NOT set compute_map to 0
 
                                     #If values become False and the
@@ -498,7 +934,7 @@ class Stack(VM):
                                         empty_storage_map = False
                                         break
                                 if empty_storage_map:
-                                    storage_map[i][0] = None
+                                    self.gc_storage(storage_map[i])
                                     #See the not lazy gc code for explanations
                                     #of compute_map change
                                     compute_map[i][0] = 2
@@ -509,7 +945,7 @@ class Stack(VM):
         if self.allow_gc:
             for v in storage_map:
                 if v.owner and not v in self.outputs:
-                    storage_map[v][0] = None
+                    self.gc_storage(storage_map[v])
 
 
 try:
@@ -537,7 +973,8 @@ class VM_Linker(link.LocalLinker):
     """
 
     def __init__(self, allow_gc=None, use_cloop=False, callback=None,
-                 lazy=None, schedule=None):
+                 lazy=None, schedule=None, parallel=False, memory_plan=None,
+                 buffer_pool=None):
         """
         allow_gc - force the virtual machine to clean up unnecessary
             references, in order to allow garbage collection on
@@ -556,6 +993,23 @@ class VM_Linker(link.LocalLinker):
             version. If lazy is True or False, we force the version used
             between Loop/LoopGC and Stack.
 
+        parallel - run the independent nodes of the graph at the same time
+            on the number of threads given by the Theano flag vm.threads,
+            with the ParallelLoop VM. Lazy graphs and callback still use the
+            Stack VM. use_cloop is ignored.
+
+        memory_plan - share the storage of the intermediate results that are
+            never alive at the same time (see the `memory_plan` function),
+            so that the ops can reuse their buffers. If None, use the Theano
+            flag vm.memory_plan. It is not used with parallel, nor for graphs
+            with lazy nodes.
+
+        buffer_pool - with allow_gc, garbage collect the intermediate
+            results into a BufferPool, whose buffers are used for the next
+            outputs (see theano.gof.bufferpool). If None, use the Theano
+            flag vm.buffer_pool. This uses the Python VMs (LoopGC or Stack)
+            instead of the CVM. It is not used with parallel.
+
         """
         # Note: if more parameters are added to __init__, make sure to forward
         # them in the "type(self)(...)" call in the "accept" method below.
@@ -566,6 +1020,15 @@ class VM_Linker(link.LocalLinker):
         self.use_cloop = use_cloop
         self.callback = callback
         self.lazy = lazy
+        self.parallel = parallel
+        if memory_plan is None:
+            memory_plan = config.vm.memory_plan
+        self.memory_plan = memory_plan
+        if buffer_pool is None:
+            buffer_pool = config.vm.buffer_pool
+        self.buffer_pool = buffer_pool
+        # variable -> the next variable that uses its storage (see make_all)
+        self.next_in_storage = {}
         self.updated_vars = {}
         if schedule:
             self.schedule = schedule
@@ -604,7 +1067,10 @@ class VM_Linker(link.LocalLinker):
                     use_cloop=self.use_cloop,
                     callback=self.callback,
                     lazy=self.lazy,
-                    schedule=self.schedule
+                    schedule=self.schedule,
+                    parallel=self.parallel,
+                    memory_plan=self.memory_plan,
+                    buffer_pool=self.buffer_pool
                     ).accept(fgraph, no_recycling)
         self.fgraph = fgraph
         self.no_recycling = no_recycling
@@ -653,6 +1119,14 @@ class VM_Linker(link.LocalLinker):
                     if cl[0] is not 'output':
                         ls += cl[0].outputs
                 dependencies[k] += ls
+        # When k shares its storage with the variables computed after it
+        # (see memory_plan), clearing it would clear them too, so it must
+        # wait for all of them.
+        for k in variables:
+            v = k
+            while v in self.next_in_storage:
+                v = self.next_in_storage[v]
+                dependencies[k] = dependencies[k] + [v] + dependencies[v]
         return dependencies
 
     def make_vm(self, nodes, thunks,
@@ -665,6 +1139,11 @@ class VM_Linker(link.LocalLinker):
 
         pre_call_clear = [storage_map[v] for v in self.no_recycling]
 
+        pool = None
+        if self.buffer_pool and self.allow_gc and not self.parallel:
+            pool = BufferPool(config.vm.buffer_pool_capacity * 2 ** 20,
+                              config.vm.buffer_pool_eviction)
+
         if (self.callback is not None or
             (config.profile and config.profile_memory)):
 
@@ -681,8 +1160,17 @@ class VM_Linker(link.LocalLinker):
                     storage_map, compute_map,
                     self.fgraph, self.allow_gc,
                     dependencies=deps,
-                    callback=self.callback)
-        elif self.use_cloop:
+                    callback=self.callback,
+                    pool=pool)
+        elif self.parallel and not any([th.lazy for th in thunks]):
+            n_threads = config.vm.threads
+            if n_threads < 0:
+                n_threads = cpuCount()
+            vm = ParallelLoop(
+                    nodes, thunks, pre_call_clear,
+                    self.fgraph, storage_map,
+                    self.allow_gc, n_threads)
+        elif self.use_cloop and not self.parallel and pool is None:
             # create a map from nodes to ints and vars to ints
             nodes_idx = {}
             vars_idx = {}
@@ -807,7 +1295,12 @@ class VM_Linker(link.LocalLinker):
                             nodes,
                             thunks,
                             pre_call_clear,
-                            post_thunk_clear)
+                            post_thunk_clear,
+                            pool=pool,
+                            pool_outputs=[
+                                pool_outputs(node, storage_map,
+                                             self.fgraph.outputs)
+                                for node in nodes])
                 else:
                     vm = Loop(
                             nodes,
@@ -821,10 +1314,33 @@ class VM_Linker(link.LocalLinker):
                         nodes, thunks, pre_call_clear,
                         storage_map, compute_map,
                         self.fgraph, self.allow_gc,
-                        dependencies=deps
+                        dependencies=deps,
+                        pool=pool
                         )
         return vm
 
+    def make_thunks(self, order, storage_map, compute_map):
+        """Return the thunks of the nodes in `order`."""
+        thunks = []
+        precompile = config.cmodule.compile_workers and config.cxx
+        if precompile:
+            theano.gof.op.precompile_c_thunks(order, self.no_recycling)
+        try:
+            for node in order:
+                try:
+                    thunks.append(node.op.make_thunk(node,
+                                                     storage_map,
+                                                     compute_map,
+                                                     self.no_recycling))
+                except Exception, e:
+                    e.args = ("The following error happened while"
+                              " compiling the node", node, "\n") + e.args
+                    raise
+        finally:
+            if precompile:
+                theano.gof.cc.get_module_cache().discard_precompiled()
+        return thunks
+
     def make_all(self, profiler=None, input_storage=None,
                  output_storage=None,
                 ):
@@ -838,17 +1354,26 @@ class VM_Linker(link.LocalLinker):
         for k in storage_map:
             compute_map[k] = [k.owner is None]
 
-        thunks = []
-        for node in order:
-            try:
-                thunks.append(node.op.make_thunk(node,
-                                                 storage_map,
-                                                 compute_map,
-                                                 no_recycling))
-            except Exception, e:
-                e.args = ("The following error happened while"
-                          " compiling the node", node, "\n") + e.args
-                raise
+        # Share the storage of the results that are never alive at the same
+        # time. This is not valid if some nodes can be skipped, so the thunks
+        # are made again without it if one of them is lazy.
+        memory_groups = []
+        if self.memory_plan and not self.parallel:
+            plain_storage_map = storage_map.copy()
+            memory_groups = memory_plan(fgraph, order)
+            for group in memory_groups:
+                for var in group[1:]:
+                    storage_map[var] = storage_map[group[0]]
+        thunks = self.make_thunks(order, storage_map, compute_map)
+        if memory_groups and any([th.lazy for th in thunks]):
+            memory_groups = []
+            storage_map = plain_storage_map
+            thunks = self.make_thunks(order, storage_map, compute_map)
+        self.next_in_storage = {}
+        for group in memory_groups:
+            for var, next_var in zip(group[:-1], group[1:]):
+                self.next_in_storage[var] = next_var
+
         for node, thunk in zip(order, thunks):
             thunk.inputs = [storage_map[v] for v in node.inputs]
             thunk.outputs = [storage_map[v] for v in node.outputs]
@@ -861,6 +1386,7 @@ class VM_Linker(link.LocalLinker):
                 for input in node.inputs:
                     if ((input in computed)
                             and (input not in fgraph.outputs)
+                            and (input not in self.next_in_storage)
                             and (node == last_user[input])):
                         clear_after_this_thunk.append(storage_map[input])
                 post_thunk_clear.append(clear_after_this_thunk)
@@ -874,6 +1400,7 @@ class VM_Linker(link.LocalLinker):
                 compute_map,
                 self.updated_vars
                 )
+        vm.memory_groups = memory_groups
 
         return (vm,
                 [link.Container(input, storage)
@@ -619,6 +619,8 @@ def scan(fn,
     info['n_shared_outs'] = n_shared_outs
     info['n_nit_sot'] = n_nit_sot
     info['truncate_gradient'] = -1
+    info['checkpoint_gradient'] = -1
+    info['associative'] = False
     info['name'] = name
     info['mode'] = mode
     info['destroy_map'] = OrderedDict()
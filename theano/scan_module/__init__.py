@@ -42,3 +42,4 @@ from theano.scan_module import scan_opt
 from theano.scan_module.scan import scan
 from theano.scan_module.scan_views import map, reduce, foldl, foldr
 from theano.scan_module.scan_utils import clone, until
+from theano.scan_module.scan_vectorize import vectorize
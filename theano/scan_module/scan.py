@@ -74,7 +74,9 @@ def scan(fn,
          go_backwards=False,
          mode=None,
          name=None,
-         profile=False):
+         profile=False,
+         checkpoint_gradient=-1,
+         associative=False):
     """
     This function constructs and applies a Scan op to the provided
     arguments.
@@ -273,6 +275,43 @@ def scan(fn,
         different value then -1, you choose to use truncated BPTT instead
         of classical BPTT, where you go for only ``truncate_gradient``
         number of steps back in time.
+        Only the outputs of these last ``truncate_gradient`` steps are
+        kept for the gradient, so the memory it needs does not grow
+        with the number of steps.
+
+
+    :param checkpoint_gradient:
+        ``checkpoint_gradient`` is the number of steps between two
+        states kept for the gradient. By default (-1) the gradient keeps
+        the outputs of every step. With a value k, it keeps the states
+        every k steps only and, going backward, computes again the
+        outputs of each segment of k steps from its first state before
+        computing its gradient. This uses memory proportional to
+        n_steps / k + k instead of n_steps (sqrt(n_steps) is a good
+        choice of k), for two more forward passes over the sequence: one
+        to compute the states kept, one to compute the segments again.
+        It is ignored if ``truncate_gradient`` is given, and for scans
+        with shared variable updates or an ``until`` condition.
+
+
+    :param associative:
+        Tells that ``fn`` is an associative operator: each output is
+        ``op(h_tm1, x_t)`` for its previous value ``h_tm1`` and the
+        sequence at the same position in ``sequences``, ``x_t`` having
+        the same type as ``h_tm1``, and ``op(op(a, b), c) == op(a, op(b,
+        c))``. Examples are cumulative sums, products or maxima, or the
+        linear recurrence ``h_t = A_t h_tm1 + b_t`` written on the pairs
+        ``(A, b)``, whose operator is ``(A_t A, A_t b + b_t)``. The
+        outputs are then computed with a parallel prefix over the steps,
+        in O(log(n_steps)) loops of operations on whole sequences instead
+        of n_steps loops of operations on a single step. Only ``sit_sot``
+        outputs (one per sequence, initialized with ``outputs_info``) and
+        non sequences are allowed, and the ops of ``fn`` must have a
+        batched version (see ``theano.scan_module.vectorize``). A
+        ``ValueError`` is raised otherwise. A step function that only
+        adds or multiplies the output and the sequence is computed with a
+        cumulative sum or product. The outputs of all the steps are
+        computed, even if only the last ones are used.
 
 
     :param go_backwards:
@@ -974,6 +1013,8 @@ def scan(fn,
     info['n_shared_outs'] = n_shared_outs
     info['n_nit_sot'] = n_nit_sot
     info['truncate_gradient'] = truncate_gradient
+    info['checkpoint_gradient'] = checkpoint_gradient
+    info['associative'] = associative
     info['name'] = name
     info['mode'] = mode
     info['destroy_map'] = OrderedDict()
@@ -982,6 +1023,10 @@ def scan(fn,
     info['profile'] = profile
 
     local_op = scan_op.Scan(inner_inputs, new_outs, info)
+    if associative:
+        reason = local_op.no_associative_reason()
+        if reason is not None:
+            raise ValueError('scan: associative=True, but %s' % reason)
 
     ##
     ### Step 8. Compute the outputs using the scan op
@@ -0,0 +1,313 @@
+/*
+ * The loop over the steps of a Scan whose inner function was compiled
+ * into a single C thunk by the CLinker (see Scan.execute_fused).
+ *
+ * Each step puts in the input storage of the thunk views of the current
+ * slices of the sequences and of the taps of the outputs, and in its
+ * output storage views of the slots of the output buffers where the
+ * results of the step go. The C code of the ops writes its outputs in
+ * them when their shape allows it, so most steps do not copy anything.
+ * The C function of the thunk is called directly, without any Python
+ * call.
+ */
+#include <Python.h>
+#include <numpy/arrayobject.h>
+
+#if PY_VERSION_HEX >= 0x03000000
+#include "numpy/npy_3kcompat.h"
+#define PyCObject_AsVoidPtr  NpyCapsule_AsVoidPtr
+#define PyCObject_GetDesc  NpyCapsule_GetDesc
+#define PyCObject_Check NpyCapsule_Check
+#define PyInt_AsLong PyLong_AsLong
+#define PyInt_FromLong PyLong_FromLong
+#endif
+
+/* Return a new reference to the view arr[k]. */
+static PyObject * row(PyObject * obj, npy_intp k)
+{
+    PyArrayObject * arr = (PyArrayObject*)obj;
+    PyArray_Descr * descr = PyArray_DESCR(arr);
+    Py_INCREF(descr);
+    PyObject * view = PyArray_NewFromDescr(
+        &PyArray_Type, descr, PyArray_NDIM(arr) - 1,
+        PyArray_DIMS(arr) + 1, PyArray_STRIDES(arr) + 1,
+        PyArray_BYTES(arr) + k * PyArray_STRIDES(arr)[0],
+        PyArray_FLAGS(arr) & NPY_ARRAY_WRITEABLE, NULL);
+    if (!view)
+        return NULL;
+    Py_INCREF(obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)view, obj) < 0)
+    {
+        Py_DECREF(view);
+        return NULL;
+    }
+    PyArray_UpdateFlags((PyArrayObject*)view, NPY_ARRAY_UPDATE_ALL);
+    return view;
+}
+
+/* Set the content of a storage cell, stealing the reference to value. */
+static void set_cell(PyObject * cells, Py_ssize_t idx, PyObject * value)
+{
+    PyList_SetItem(PyList_GET_ITEM(cells, idx), 0, value);
+}
+
+static PyObject * get_cell(PyObject * cells, Py_ssize_t idx)
+{
+    return PyList_GET_ITEM(PyList_GET_ITEM(cells, idx), 0);
+}
+
+/* Return the buffer of a nit_sot output of `store` slots for the value of
+   its first step, reusing `old` (its buffer of the previous call) if it
+   fits. */
+static PyObject * nit_sot_buffer(PyObject * old, PyObject * value,
+                                 npy_intp store)
+{
+    PyArrayObject * v = (PyArrayObject*)value;
+    int nd = PyArray_NDIM(v);
+    if (PyArray_Check(old) && PyArray_NDIM((PyArrayObject*)old) == nd + 1
+        && PyArray_DIMS((PyArrayObject*)old)[0] >= store
+        && PyArray_EquivTypes(PyArray_DESCR((PyArrayObject*)old),
+                              PyArray_DESCR(v)))
+    {
+        int same = 1;
+        for (int d = 0; d < nd; d++)
+            same = same && (PyArray_DIMS((PyArrayObject*)old)[d + 1]
+                            == PyArray_DIMS(v)[d]);
+        if (same)
+            return PySequence_GetSlice(old, 0, store);
+    }
+    npy_intp * dims = (npy_intp*)malloc((nd + 1) * sizeof(npy_intp));
+    if (!dims)
+        return PyErr_NoMemory();
+    dims[0] = store;
+    for (int d = 0; d < nd; d++)
+        dims[d + 1] = PyArray_DIMS(v)[d];
+    PyObject * rval = PyArray_ZEROS(nd + 1, dims,
+                                    PyArray_DESCR(v)->type_num, 0);
+    free(dims);
+    return rval;
+}
+
+static PyObject * loop(PyObject * self, PyObject * args)
+{
+    PyObject *cthunk, *seqs, *taps, *store_list, *pos_list, *preset_list;
+    PyObject *values, *in_cells, *out_cells;
+    long i, n_steps, n_outs, n_nit_sot, n_shared_outs;
+    int as_while;
+    if (!PyArg_ParseTuple(args, "OllllliOOOOOOOO", &cthunk, &i, &n_steps,
+                          &n_outs, &n_nit_sot, &n_shared_outs, &as_while,
+                          &seqs, &taps, &store_list, &pos_list,
+                          &preset_list, &values, &in_cells, &out_cells))
+        return NULL;
+    if (!PyCObject_Check(cthunk))
+    {
+        PyErr_SetString(PyExc_TypeError, "cthunk must be a CObject");
+        return NULL;
+    }
+    int (*fn)(void*) = (int (*)(void*))PyCObject_AsVoidPtr(cthunk);
+    void * data = PyCObject_GetDesc(cthunk);
+
+    Py_ssize_t n_seqs = PyList_GET_SIZE(seqs);
+    long n_buffers = n_outs + n_nit_sot;
+    long * store = (long*)malloc((n_buffers + 1) * sizeof(long));
+    long * pos = (long*)malloc((n_buffers + 1) * sizeof(long));
+    int * preset = (int*)malloc((n_buffers + 1) * sizeof(int));
+    // The views put in the output storage, to check if the ops used them.
+    PyObject ** slots = (PyObject**)calloc(n_buffers + 1, sizeof(PyObject*));
+    PyObject * rval = NULL;
+    int failure = 0;
+    int stop = 0;
+    if (!store || !pos || !preset || !slots)
+    {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (long j = 0; j < n_buffers; j++)
+    {
+        store[j] = PyInt_AsLong(PyList_GET_ITEM(store_list, j));
+        pos[j] = PyInt_AsLong(PyList_GET_ITEM(pos_list, j));
+        preset[j] = PyObject_IsTrue(PyList_GET_ITEM(preset_list, j));
+    }
+    if (PyErr_Occurred())
+        goto done;
+
+    while (i < n_steps && !stop)
+    {
+        // 1. The inputs of the step
+        Py_ssize_t in_idx = 0;
+        for (Py_ssize_t s = 0; s < n_seqs; s++)
+        {
+            PyObject * view = row(PyList_GET_ITEM(seqs, s), i);
+            if (!view)
+                goto done;
+            set_cell(in_cells, in_idx++, view);
+        }
+        for (long j = 0; j < n_outs; j++)
+        {
+            PyObject * buf = PyList_GET_ITEM(values, j);
+            PyObject * out_taps = PyList_GET_ITEM(taps, j);
+            for (Py_ssize_t t = 0; t < PyTuple_GET_SIZE(out_taps); t++)
+            {
+                long tap = PyInt_AsLong(PyTuple_GET_ITEM(out_taps, t));
+                long idx = ((pos[j] + tap) % store[j] + store[j]) % store[j];
+                PyObject * view = row(buf, idx);
+                if (!view)
+                    goto done;
+                set_cell(in_cells, in_idx++, view);
+            }
+        }
+        for (long j = 0; j < n_shared_outs; j++)
+        {
+            PyObject * value = PyList_GET_ITEM(values, n_buffers + j);
+            Py_INCREF(value);
+            set_cell(in_cells, in_idx++, value);
+        }
+
+        // 2. Where the outputs of the step go
+        for (long j = 0; j < n_buffers; j++)
+        {
+            PyObject * buf = PyList_GET_ITEM(values, j);
+            // The buffer of a nit_sot output is known after its first step
+            if (preset[j] && !(j >= n_outs && i == 0)
+                && PyArray_NDIM((PyArrayObject*)buf) > 1)
+            {
+                slots[j] = row(buf, pos[j]);
+                if (!slots[j])
+                    goto done;
+                Py_INCREF(slots[j]);
+                set_cell(out_cells, j, slots[j]);
+            }
+            else
+            {
+                Py_INCREF(Py_None);
+                set_cell(out_cells, j, Py_None);
+            }
+        }
+        for (long j = n_buffers; j < n_buffers + n_shared_outs + as_while;
+             j++)
+        {
+            Py_INCREF(Py_None);
+            set_cell(out_cells, j, Py_None);
+        }
+
+        // 3. The step
+        failure = fn(data);
+        if (failure)
+            goto done;
+        if (as_while)
+        {
+            stop = PyObject_IsTrue(get_cell(out_cells,
+                                            n_buffers + n_shared_outs));
+            if (stop < 0)
+                goto done;
+        }
+
+        // 4. Copy the outputs the ops did not write in their slot
+        for (long j = 0; j < n_buffers; j++)
+        {
+            PyObject * value = get_cell(out_cells, j);
+            PyObject * buf = PyList_GET_ITEM(values, j);
+            if (!PyArray_Check(value))
+            {
+                PyErr_SetString(PyExc_TypeError,
+                                "Scan: an output of the step is not an "
+                                "ndarray");
+                goto done;
+            }
+            if (j >= n_outs && i == 0)
+            {
+                // The first step of a nit_sot output gives its shape
+                buf = nit_sot_buffer(buf, value, store[j]);
+                if (!buf)
+                    goto done;
+                PyList_SetItem(values, j, buf);
+            }
+            if (value != slots[j])
+            {
+                PyObject * dst = row(buf, pos[j]);
+                if (!dst)
+                    goto done;
+                int err = PyArray_CopyInto((PyArrayObject*)dst,
+                                           (PyArrayObject*)value);
+                Py_DECREF(dst);
+                if (err < 0)
+                    goto done;
+            }
+            Py_CLEAR(slots[j]);
+        }
+        for (long j = 0; j < n_shared_outs; j++)
+        {
+            PyObject * value = get_cell(out_cells, n_buffers + j);
+            // A view could be of an intermediate result, whose memory the
+            // C code reuses at the next step.
+            if (PyArray_Check(value) && PyArray_BASE((PyArrayObject*)value))
+                value = PyArray_NewCopy((PyArrayObject*)value, NPY_ANYORDER);
+            else
+                Py_INCREF(value);
+            if (!value)
+                goto done;
+            PyList_SetItem(values, n_buffers + j, value);
+        }
+        for (long j = 0; j < n_buffers; j++)
+            pos[j] = (pos[j] + 1) % store[j];
+        i++;
+    }
+
+  done:
+    if (!PyErr_Occurred())
+    {
+        for (long j = 0; j < n_buffers; j++)
+            PyList_SetItem(pos_list, j, PyInt_FromLong(pos[j]));
+        rval = Py_BuildValue("(ili)", failure, i, stop);
+    }
+    if (slots)
+        for (long j = 0; j < n_buffers; j++)
+            Py_XDECREF(slots[j]);
+    free(store);
+    free(pos);
+    free(preset);
+    free(slots);
+    return rval;
+}
+
+static PyObject * get_version(PyObject * dummy, PyObject * args)
+{
+    return PyFloat_FromDouble(0.1);
+}
+
+static PyMethodDef scan_fused_methods[] = {
+    {"get_version", get_version, METH_VARARGS, "Get extension version."},
+    {"loop", loop, METH_VARARGS,
+     "loop(cthunk, i, n_steps, n_outs, n_nit_sot, n_shared_outs, as_while, "
+     "seqs, taps, store_steps, pos, preset, values, input_storage, "
+     "output_storage) -> (failure, i, stopped)"},
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "scan_fused",
+    NULL,
+    -1,
+    scan_fused_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit_scan_fused(void)
+{
+    import_array();
+    return PyModule_Create(&moduledef);
+}
+#else
+PyMODINIT_FUNC
+initscan_fused(void)
+{
+    import_array();
+    Py_InitModule("scan_fused", scan_fused_methods);
+}
+#endif
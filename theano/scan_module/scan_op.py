@@ -32,6 +32,7 @@ from theano.tensor.opt import Shape_i
 from theano.gradient import grad_undefined
 from theano.gradient import DisconnectedType
 from theano.compile.profiling import ScanProfileStats
+from theano.configparser import AddConfigVar, BoolParam
 
 from theano.scan_module import scan_utils
 from theano.scan_module.scan_utils import safe_new, forced_replace
@@ -39,6 +40,15 @@ from theano.scan_module.scan_utils import safe_new, forced_replace
 # Logging function for sending warning or info
 _logger = logging.getLogger('theano.scan_module.scan_op')
 
+AddConfigVar('scan.fused',
+             "If True, the inner function of a scan is compiled by the C "
+             "linker into a single C thunk that the loop over the steps "
+             "calls from C, without any Python call per step. Only for the "
+             "scans without mit_mot whose inputs and outputs are tensors and "
+             "whose inner ops all have C code; the others are not changed.",
+             BoolParam(False),
+             in_c_key=False)
+
 
 class Scan(PureOp):
     def __init__(self,
@@ -448,7 +458,8 @@ class Scan(PureOp):
             self.info['destroy_map'] = OrderedDict()
         if not 'destroy_map' in other.info:
             other.info['destroy_map'] = OrderedDict()
-        keys_to_check = ['truncate_gradient', 'profile',
+        keys_to_check = ['truncate_gradient', 'checkpoint_gradient',
+                         'associative', 'profile',
                          'n_seqs', 'tap_array', 'name',
                          'as_while', 'n_mit_sot', 'destroy_map',
                          'n_nit_sot', 'n_shared_outs',
@@ -480,6 +491,22 @@ class Scan(PureOp):
         # like name, mode, etc.
         return True
 
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        # The fused thunk is a C object, make_thunk makes it again
+        d.pop('fused', None)
+        return d
+
+    def __setstate__(self, d):
+        self.__dict__.update(d)
+        # Add the default values of the newer parameters to be able to
+        # reload old pickled objects.
+        for key, default in [('checkpoint_gradient', -1),
+                             ('associative', False)]:
+            if key not in self.info:
+                self.info[key] = default
+                setattr(self, key, default)
+
     def __str__(self):
         if self.gpu:
             gpu_str = 'gpu'
@@ -553,7 +580,13 @@ class Scan(PureOp):
                   self.n_sit_sot +
                   self.n_nit_sot)
         wrapped_inputs = [Param(x, borrow=True) for x in self.inputs]
-        wrapped_outputs = [Out(x, borrow=False) for x in
+        # The outputs of a step are copied in the buffers of scan, or
+        # written directly in them by the ops, through the views of the
+        # buffers put in the output storage before each step. Borrowing
+        # them keeps the function from clearing that storage. The inputs
+        # and constants are not borrowed, so they are copied in their own
+        # storage instead of sharing the one of the input or constant.
+        wrapped_outputs = [Out(x, borrow=x.owner is not None) for x in
                            self.outputs[:slices]]
         wrapped_outputs += self.outputs[slices:]
         profile = None
@@ -575,6 +608,10 @@ class Scan(PureOp):
                                name=self.name,
                                profile=profile,
                                on_unused_input='ignore')
+        if getattr(self, 'fused', None) is None:
+            self.fused = False
+            if theano.config.scan.fused:
+                self.fused = self.make_fused_thunk(node)
 
         try:
             cython_mintaps = numpy.asarray(self.mintaps, dtype='int32')
@@ -650,6 +687,9 @@ class Scan(PureOp):
                         self, node)
         except (ImportError, theano.gof.cmodule.MissingGXX):
             p = self.execute
+        if self.fused:
+            # execute calls the C loop of the fused thunk
+            p = self.execute
         # default arguments are stored in the closure of `rval`
 
         def rval(p=p, i=node_input_storage, o=node_output_storage, n=node):
@@ -663,6 +703,72 @@ class Scan(PureOp):
         rval.lazy = False
         return rval
 
+    def make_fused_thunk(self, node):
+        """
+        Compile the optimized inner graph with the CLinker. Return the
+        thunk and its input and output storage, or False when this scan or
+        its inner graph can not be fused (see config.scan.fused).
+        """
+        fgraph = getattr(self.fn.maker, 'fgraph', None)
+        if (fgraph is None or self.n_mit_mot or
+            not all([isinstance(v.type, TensorType)
+                     for v in (node.inputs[1:] + node.outputs +
+                               fgraph.inputs + fgraph.outputs)]) or
+            # e.g. inner scans and lazy ops
+            not all([isinstance(n.op, gof.Op) for n in fgraph.apply_nodes])):
+            return False
+        input_storage = [[None] for i in fgraph.inputs]
+        output_storage = [[None] for o in fgraph.outputs]
+        try:
+            import scan_fused_ext
+            thunk = gof.CLinker().accept(fgraph).make_thunk(
+                input_storage, output_storage)[0]
+        except (ImportError, NotImplementedError, gof.utils.MethodNotDefined,
+                theano.gof.cmodule.MissingGXX), e:
+            _logger.debug('Scan %s not fused: %s', self.name, e)
+            return False
+        return thunk, input_storage, output_storage
+
+    def execute_fused(self, n_steps, args, outs, seqs, store_steps, pos):
+        """
+        Do all the steps with the C loop of scan_fused_ext, for the fused
+        thunk. The buffers of the outputs are in `outs` and `pos` is
+        updated. Return the number of steps done and if the loop did not
+        stop on the condition of a while.
+        """
+        import scan_fused_ext
+        thunk, input_storage, output_storage = self.fused
+        offset = (self.n_seqs + sum(map(len, self.tap_array[:self.n_outs])) +
+                  self.n_shared_outs)
+        other_args = args[self.nit_sot_arg_offset + self.n_nit_sot:]
+        for idx in xrange(len(other_args)):
+            input_storage[idx + offset][0] = other_args[idx]
+        n_buffers = self.n_outs + self.n_nit_sot
+        values = [outs[j][0] for j in xrange(n_buffers)]
+        values += list(args[self.shared_arg_offset:
+                            self.shared_arg_offset + self.n_shared_outs])
+        # The ops write their outputs directly in the buffers when their
+        # slot is not also read by one of their taps in the same step.
+        preset = [store_steps[j] > 1 and
+                  not [t for t in self.tap_array[j] if t % store_steps[j] == 0]
+                  for j in xrange(self.n_outs)]
+        preset += [store_steps[j] > 1
+                   for j in xrange(self.n_outs, n_buffers)]
+        failure, i, stopped = scan_fused_ext.loop(
+            thunk.cthunk, 0, n_steps, self.n_outs, self.n_nit_sot,
+            self.n_shared_outs, int(self.as_while), list(seqs),
+            [tuple(taps) for taps in self.tap_array[:self.n_outs]],
+            [int(s) for s in store_steps], pos, preset, values,
+            input_storage, output_storage)
+        for j in xrange(n_buffers + self.n_shared_outs):
+            outs[j][0] = values[j]
+        if failure:
+            try:
+                thunk.raise_failure(failure)
+            except Exception:
+                gof.vm.raise_with_op(thunk.nodes[thunk.position_of_error])
+        return i, not stopped
+
     def inner_seqs(self, list_inputs):
         # Given the list of inner inputs this function grabs those
         # corresponding to sequences
@@ -905,8 +1011,23 @@ class Scan(PureOp):
         for idx in xrange(len(other_args)):
             input_storage[idx + offset].storage[0] = other_args[idx]
 
+        # The views of the output buffers put in the output storage. The
+        # states whose slot is also read by one of their taps in the same
+        # step (the ring buffers of ScanSaveMem) are computed outside the
+        # buffer and copied into it.
+        slots = [None] * (self.n_outs + self.n_nit_sot)
+        read_slot = [bool([t for t in self.tap_array[j]
+                           if t % store_steps[j] == 0])
+                     for j in xrange(self.n_outs)]
+        read_slot += [False] * self.n_nit_sot
         i = 0
         cond = True
+        if getattr(self, 'fused', False):
+            # The C loop does all the steps, the loop below does nothing
+            t0_fn = time.time()
+            i, cond = self.execute_fused(n_steps, args, outs, seqs,
+                                         store_steps, pos)
+            t_fn += time.time() - t0_fn
         ############## THE MAIN LOOP #########################
         #for i in xrange(n_steps):
         while (i < n_steps) and cond:
@@ -948,21 +1069,21 @@ class Scan(PureOp):
             for idx in xrange(self.n_mit_mot_outs):
                 output_storage[idx].storage[0] = None
 
+            # The ops write the outputs of the step directly in their slot
+            # of the buffers when they can, so they are not copied. The
+            # buffers of the nit_sot outputs are allocated after the first
+            # step.
             offset = self.n_mit_mot_outs
-            if i != 0 and self.n_nit_sot > 0:
-                for idx in xrange(self.n_outs + self.n_nit_sot -
-                                  self.n_mit_mot):
-                    if (store_steps[idx + self.n_mit_mot] == 1 or
-                        self.vector_outs[idx + self.n_mit_mot]):
-                        output_storage[idx + offset].storage[0] = None
-                    else:
-                        _pos0 = idx + self.n_mit_mot
-                        output_storage[idx + offset].storage[0] =\
-                            outs[_pos0][0][pos[_pos0]]
-            else:
-                for idx in xrange(self.n_outs + self.n_nit_sot -
-                                  self.n_mit_mot):
-                    output_storage[idx + offset].storage[0] = None
+            for idx in xrange(self.n_outs + self.n_nit_sot -
+                              self.n_mit_mot):
+                _pos0 = idx + self.n_mit_mot
+                if (store_steps[_pos0] == 1 or self.vector_outs[_pos0] or
+                    read_slot[_pos0] or
+                    (i == 0 and _pos0 >= self.n_outs)):
+                    slots[_pos0] = None
+                else:
+                    slots[_pos0] = outs[_pos0][0][pos[_pos0]]
+                output_storage[idx + offset].storage[0] = slots[_pos0]
 
             offset += self.n_outs + self.n_nit_sot - self.n_mit_mot
             for idx in xrange(self.n_shared_outs):
@@ -1012,9 +1133,7 @@ class Scan(PureOp):
             offset_out -= self.n_mit_mot
 
             for j in xrange(begin, end):
-                if (store_steps[j] == 1 or self.vector_outs[j] or
-                    outs[j][0][pos[j]] is not
-                      output_storage[offset_out + j].storage[0]):
+                if output_storage[offset_out + j].storage[0] is not slots[j]:
                     outs[j][0][pos[j]] = \
                             output_storage[offset_out + j].storage[0]
 
@@ -1037,9 +1156,7 @@ class Scan(PureOp):
                     elif outs[j][0].shape[0] != store_steps[j]:
                         outs[j][0] = outs[j][0][:store_steps[j]]
                     outs[j][0][pos[j]] = output_storage[jout].storage[0]
-                elif (store_steps[j] == 1 or self.vector_outs[j] or
-                      outs[j][0][pos[j]] is not
-                      output_storage[j + offset_out].storage[0]):
+                elif output_storage[j + offset_out].storage[0] is not slots[j]:
                     outs[j][0][pos[j]] = \
                             output_storage[j + offset_out].storage[0]
 
@@ -1397,6 +1514,12 @@ class Scan(PureOp):
 
     ### GRAD FUNCTION
     def grad(self, inputs, dC_douts):
+        if self.checkpoint_gradient > 0 and self.truncate_gradient == -1:
+            reason = self.no_checkpoint_reason(inputs)
+            if reason is None:
+                return self.checkpointed_grad(inputs, dC_douts)
+            _logger.warning('Scan %s: checkpoint_gradient ignored, %s',
+                            self.name, reason)
         outs = self(*inputs)
         if not isinstance(outs, (list, tuple)):
             outs = [outs]
@@ -1558,6 +1681,15 @@ class Scan(PureOp):
                 dC_dXtm1s.append(safe_new(x))
         for dx, dC_dXtm1 in enumerate(dC_dXtm1s):
             dC_dinps_t[dx + self.n_seqs] += dC_dXtm1
+        def history(x, init_l):
+            # With truncated BPTT the backward scan only reads the last
+            # ``truncate_gradient`` steps of the outputs of the forward
+            # scan. Taking them with a subtensor lets ScanSaveMem shrink
+            # the buffers of the forward scan to that window.
+            if self.truncate_gradient == -1:
+                return x
+            return x[-(self.truncate_gradient + init_l):]
+
         # Construct scan op
         # Seqs
         outer_inp_seqs = [x[::-1] for x in inputs[1:1 + self.n_seqs]]
@@ -1566,9 +1698,10 @@ class Scan(PureOp):
             maxtap = numpy.max(self.tap_array[idx])
             if idx < self.n_mit_mot:
                 outmaxtap = numpy.max(self.mitmot_out_taps()[idx])
+                seq = outs[idx]
             else:
                 outmaxtap = 0
-            seq = outs[idx]
+                seq = history(outs[idx], -mintap)
             for k in self.tap_array[idx]:
                 if outmaxtap -k != 0:
                     nw_seq = seq[k - mintap: -(outmaxtap-k)][::-1]
@@ -1576,7 +1709,7 @@ class Scan(PureOp):
                     nw_seq = seq[k - mintap:][::-1]
                 outer_inp_seqs.append(nw_seq)
         outer_inp_seqs += [
-            x[:-1][::-1] for x in self.outer_sitsot_outs(outs)]
+            history(x, 1)[:-1][::-1] for x in self.outer_sitsot_outs(outs)]
         for x in self.outer_nitsot_outs(dC_douts):
             if not isinstance(x.type, DisconnectedType):
                 outer_inp_seqs.append(x[::-1])
@@ -1601,11 +1734,14 @@ class Scan(PureOp):
                 if hasattr(x[::-1].tag, 'test_value'):
                     assert (x[::-1].tag.test_value.shape[0] ==
                             inputs[0].tag.test_value)
-        outer_inp_seqs += [x[::-1][:numpy.min(taps)]
-                           for taps, x in zip(self.mitsot_taps(),
-                                              self.outer_mitsot_outs(outs))]
-        outer_inp_seqs += [x[::-1][:-1] for x in self.outer_sitsot_outs(outs)]
-        outer_inp_seqs += [x[::-1] for x in self.outer_nitsot_outs(outs)]
+        outer_inp_seqs += [
+            history(x, -numpy.min(taps))[::-1][:numpy.min(taps)]
+            for taps, x in zip(self.mitsot_taps(),
+                               self.outer_mitsot_outs(outs))]
+        outer_inp_seqs += [history(x, 1)[::-1][:-1]
+                           for x in self.outer_sitsot_outs(outs)]
+        outer_inp_seqs += [history(x, 0)[::-1]
+                           for x in self.outer_nitsot_outs(outs)]
 
         inner_inp_seqs = self.inner_seqs(self_inputs)
         inner_inp_seqs += self.inner_mitmot(self_inputs)
@@ -1668,8 +1804,10 @@ class Scan(PureOp):
         for idx in xrange(self.n_mit_sot):
             mitmot_inp_taps.append([])
             mitmot_out_taps.append([])
-            outer_inp_mitmot.append(dC_douts[idx + offset][::-1])
             idx_tap = idx + self.n_mit_mot
+            outer_inp_mitmot.append(history(
+                dC_douts[idx + offset],
+                -numpy.min(self.tap_array[idx_tap]))[::-1])
             inner_inp_mitmot.append(dC_dXts[out_pos])
             out_pos += 1
             n_mitmot_inps += 1
@@ -1704,10 +1842,11 @@ class Scan(PureOp):
             mitmot_out_taps.append([1])
             undefined = False
             if not isinstance(dC_douts[idx + offset].type, DisconnectedType):
-                outer_inp_mitmot.append(dC_douts[idx + offset][::-1])
+                outer_inp_mitmot.append(
+                    history(dC_douts[idx + offset], 1)[::-1])
             else:
                 outer_inp_mitmot.append(
-                    tensor.zeros(outs[idx + offset].shape,
+                    tensor.zeros(history(outs[idx + offset], 1).shape,
                                  dtype=dC_dinps_t[ins_pos].dtype))
             inner_out_mitmot.append(dC_dinps_t[ins_pos])
             for _sh in self.inner_shared(self_inputs):
@@ -1777,6 +1916,8 @@ class Scan(PureOp):
         info['n_mit_mot_outs'] = n_mitmot_outs
         info['mit_mot_out_slices'] = mitmot_out_taps
         info['truncate_gradient'] = self.truncate_gradient
+        info['checkpoint_gradient'] = -1
+        info['associative'] = False
         info['n_sit_sot'] = n_sitsot_outs
         info['n_shared_outs'] = 0
         info['n_nit_sot'] = n_nit_sot
@@ -1841,8 +1982,19 @@ class Scan(PureOp):
                                    p + 1 + self.n_seqs,
                                    inputs[p + 1 + self.n_seqs],
                                    'Depends on a shared variable'))
-            else:
+            elif p < self.n_mit_mot or self.truncate_gradient == -1:
                 gradients.append(x[::-1])
+            else:
+                # The backward scan only went through the truncated window,
+                # the gradients of the older states are the ones of the
+                # cost alone.
+                init_l = -numpy.min(self.tap_array[p])
+                if isinstance(dC_douts[p].type, DisconnectedType):
+                    dC_dout = tensor.zeros_like(outs[p]).astype(x.dtype)
+                else:
+                    dC_dout = dC_douts[p]
+                gradients.append(tensor.set_subtensor(
+                    history(dC_dout, init_l), x[::-1]))
 
         start = len(gradients)
         node = outs[0].owner
@@ -1878,12 +2030,16 @@ class Scan(PureOp):
                                    'Depends on a shared variable'))
             else:
                 gradients.append(x[-1])
+        return self.mask_disconnected(node, dC_douts, gradients)
+
+    def mask_disconnected(self, node, dC_douts, gradients):
         # Mask disconnected gradients
         # Ideally we would want to assert that the gradients we are
         # replacing do indeed evaluate to 0, though that is not practical
         # from a computational point of view
         # The gradients of scan are computed replacing Disconnected with 0,
         # because through the recurrence they can become nonzero
+        connection_pattern = self.connection_pattern(node)
         for idx in xrange(len(gradients)):
             disconnected = True
             for kdx in xrange(len(node.outputs)):
@@ -1894,6 +2050,238 @@ class Scan(PureOp):
                 gradients[idx] = DisconnectedType()()
         return gradients
 
+    def no_associative_reason(self):
+        """
+        Return why the outputs of this scan can not be computed as the
+        prefix of an associative operator (see the ``associative`` argument
+        of scan), or None if they can.
+        """
+        if self.n_mit_mot + self.n_mit_sot + self.n_nit_sot > 0:
+            return 'the scan has outputs that are not sit_sot'
+        if self.n_shared_outs > 0:
+            return 'the scan updates shared variables'
+        if self.as_while:
+            return 'the scan has an until condition'
+        if self.n_sit_sot == 0 or self.n_seqs != self.n_sit_sot:
+            return 'the scan does not have one sequence per output'
+        seqs = self.inputs[:self.n_seqs]
+        states = self.inputs[self.n_seqs:self.n_seqs + self.n_sit_sot]
+        for x, h in izip(seqs, states):
+            if (not isinstance(x.type, TensorType) or
+                    not isinstance(h.type, TensorType) or
+                    x.dtype != h.dtype or x.ndim != h.ndim):
+                return ('the sequence %s and the output %s do not have the '
+                        'same type' % (x, h))
+        # scan_vectorize imports this module
+        from theano.scan_module.scan_vectorize import vectorize
+        replace = OrderedDict()
+        for x in seqs + states:
+            replace[x] = TensorType(dtype=x.dtype,
+                                    broadcastable=(False,) + x.broadcastable)()
+        try:
+            vectorize(self.outputs, replace)
+        except NotImplementedError, e:
+            return 'the step function can not be vectorized (%s)' % e
+        return None
+
+    def no_checkpoint_reason(self, inputs):
+        """
+        Return why the gradient of this scan can not keep only some of its
+        states (see `checkpointed_grad`), or None if it can.
+        """
+        if self.n_mit_mot > 0:
+            return 'the scan has mit_mot outputs'
+        if self.n_shared_outs > 0:
+            return 'the scan updates shared variables'
+        if self.as_while:
+            return 'the scan has an until condition'
+        if self.n_mit_sot + self.n_sit_sot == 0:
+            return 'the scan has no recurrent output'
+        for x in (self.outer_seqs(inputs) +
+                  self.outer_mitsot(inputs) +
+                  self.outer_sitsot(inputs)):
+            if (not isinstance(x.type, TensorType) or
+                    x.dtype not in tensor.float_dtypes):
+                return 'the input %s is not a float tensor' % x
+        for x in self.outer_non_seqs(inputs):
+            if not isinstance(x.type, TensorType):
+                return 'the input %s is not a tensor' % x
+        return None
+
+    def checkpointed_grad(self, inputs, dC_douts):
+        """
+        Gradient that keeps the states of the scan every
+        ``checkpoint_gradient`` steps only.
+
+        A first scan goes over the segments of ``checkpoint_gradient``
+        steps and returns the mit_sot and sit_sot states at their
+        beginning. The backward scan goes over the segments in reverse
+        order. For each one, it runs this scan again on the segment from
+        its first states, and then the usual backward scan of it, which
+        gives the gradients of the segment and of its first states, that
+        the next segment back uses.
+        """
+        k = self.checkpoint_gradient
+        info = OrderedDict(self.info)
+        info['checkpoint_gradient'] = -1
+        segment_op = Scan(self.inputs, self.outputs, info)
+
+        n_steps = inputs[0]
+        seqs = self.outer_seqs(inputs)
+        non_seqs = self.outer_non_seqs(inputs)
+        diff_non_seqs = [x for x in non_seqs
+                         if x.dtype in tensor.float_dtypes]
+        states = self.outer_mitsot(inputs) + self.outer_sitsot(inputs)
+        init_ls = [-numpy.min(taps) for taps in
+                   self.tap_array[self.n_mit_mot:self.n_outs]]
+        firsts = []
+        for x, l in izip(states, init_ls):
+            # scan() puts the initial value of the states at the beginning
+            # of a buffer of n_steps + l rows (see scan_utils.expand), do
+            # not keep that buffer only for its first rows.
+            if (x.owner and isinstance(x.owner.op, tensor.IncSubtensor) and
+                    x.owner.op.set_instead_of_inc and
+                    isinstance(x.owner.op.idx_list[0], slice) and
+                    x.owner.op.idx_list[0].start is None):
+                x = tensor.unbroadcast(x.owner.inputs[1], 0)
+            firsts.append(x[:l])
+        n_states = len(states)
+        outputs = dC_douts[:n_states + self.n_nit_sot]
+        connected = [not isinstance(x.type, DisconnectedType) and
+                     x.dtype in tensor.float_dtypes for x in outputs]
+        # The variables the steps use are given once each to theano.scan,
+        # these are their positions in the arguments of the steps.
+        others = []
+        for x in seqs + non_seqs + [x for x, c in izip(outputs, connected)
+                                    if c]:
+            if x not in others:
+                others.append(x)
+        seqs_pos = [others.index(x) for x in seqs]
+        non_seqs_pos = [others.index(x) for x in non_seqs]
+        outputs_pos = [c and others.index(x) for x, c in
+                       izip(outputs, connected)]
+        if self.name:
+            name = self.name
+        else:
+            name = 'scan_fn'
+
+        def segment(length, seqs, firsts, non_seqs):
+            # This scan on the slices `seqs` of the sequences
+            outs = segment_op(*([length] +
+                                seqs +
+                                firsts +
+                                [length] * self.n_nit_sot +
+                                non_seqs))
+            if type(outs) not in (list, tuple):
+                outs = [outs]
+            return outs
+
+        def checkpoint_step(start, length, *args):
+            firsts = list(args[:n_states])
+            others = args[n_states:]
+            seqs = [others[i][start:start + length] for i in seqs_pos]
+            non_seqs = [others[i] for i in non_seqs_pos]
+            # The buffers of the states have -mintap rows, scan keeps only
+            # the last states in them.
+            return segment(length, seqs, firsts, non_seqs)[:n_states]
+
+        n_segments = (n_steps + k - 1) // k
+        starts = tensor.arange(n_segments) * k
+        lengths = tensor.minimum(k, n_steps - starts)
+        checkpoints, _ = theano.scan(
+            checkpoint_step,
+            sequences=[starts[:-1], lengths[:-1]],
+            outputs_info=firsts,
+            non_sequences=others,
+            name='checkpoints_of_' + name,
+            mode=self.mode)
+        if type(checkpoints) not in (list, tuple):
+            checkpoints = [checkpoints]
+        checkpoints = [tensor.join(0, tensor.shape_padleft(x), c)
+                       for x, c in izip(firsts, checkpoints)]
+
+        def backward_step(start, length, *args):
+            firsts = list(args[:n_states])
+            dC_dlasts = args[n_states:2 * n_states]
+            accs = args[2 * n_states:2 * n_states + len(diff_non_seqs)]
+            others = args[2 * n_states + len(diff_non_seqs):]
+            seqs = [others[i][start:start + length] for i in seqs_pos]
+            non_seqs = [others[i] for i in non_seqs_pos]
+            buffers = [scan_utils.expand(x, length) for x in firsts]
+            outs = segment(length, seqs, buffers, non_seqs)
+            known_grads = OrderedDict()
+            for idx in xrange(n_states):
+                l = init_ls[idx]
+                g = tensor.zeros_like(outs[idx])
+                if connected[idx]:
+                    dC_dout = others[outputs_pos[idx]]
+                    g = tensor.set_subtensor(
+                        g[l:], dC_dout[start + l:start + l + length])
+                # The last states are the first ones of the next segment
+                known_grads[outs[idx]] = tensor.inc_subtensor(
+                    g[-l:], dC_dlasts[idx])
+            for idx in xrange(n_states, len(outputs)):
+                if connected[idx]:
+                    dC_dout = others[outputs_pos[idx]]
+                    known_grads[outs[idx]] = dC_dout[start:start + length]
+            wrt = (firsts +
+                   seqs +
+                   [x for x in non_seqs if x.dtype in tensor.float_dtypes])
+            grads = gradient.grad(cost=None,
+                                  known_grads=known_grads,
+                                  wrt=wrt,
+                                  disconnected_inputs='ignore',
+                                  return_disconnected='zero')
+            dC_dfirsts = grads[:n_states]
+            dC_dseqs = []
+            for x, g in izip(seqs, grads[n_states:n_states + self.n_seqs]):
+                # All the segments give k rows, the last one is shorter
+                padded = tensor.unbroadcast(tensor.zeros(
+                    [k] + [x.shape[i] for i in xrange(1, x.ndim)],
+                    dtype=g.dtype), 0)
+                dC_dseqs.append(tensor.set_subtensor(padded[:length], g))
+            accs = [acc + g for acc, g in
+                    izip(accs, grads[n_states + self.n_seqs:])]
+            return dC_dfirsts + accs + dC_dseqs
+
+        outputs_info = ([tensor.zeros_like(x) for x in firsts] +
+                        [tensor.zeros_like(x) for x in diff_non_seqs] +
+                        [None] * self.n_seqs)
+        grads, _ = theano.scan(
+            backward_step,
+            sequences=([starts[::-1], lengths[::-1]] +
+                       [x[::-1] for x in checkpoints]),
+            outputs_info=outputs_info,
+            non_sequences=others,
+            name='grad_of_' + name,
+            mode=self.mode)
+        if type(grads) not in (list, tuple):
+            grads = [grads]
+
+        gradients = [DisconnectedType()()]
+        for x, g in izip(seqs, grads[n_states + len(diff_non_seqs):]):
+            g = g[::-1]
+            g = g.reshape([g.shape[0] * k] +
+                          [g.shape[i] for i in xrange(2, g.ndim)],
+                          ndim=g.ndim - 1)
+            gradients.append(tensor.set_subtensor(
+                tensor.zeros_like(x)[:n_steps], g[:n_steps]))
+        for idx in xrange(n_states):
+            g = grads[idx][-1]
+            if connected[idx]:
+                g = g + outputs[idx][:init_ls[idx]]
+            gradients.append(tensor.set_subtensor(
+                tensor.zeros_like(states[idx])[:init_ls[idx]], g))
+        gradients += [DisconnectedType()() for x in xrange(self.n_nit_sot)]
+        accs = grads[n_states:n_states + len(diff_non_seqs)]
+        for x in non_seqs:
+            if x.dtype in tensor.float_dtypes:
+                gradients.append(accs.pop(0)[-1])
+            else:
+                gradients.append(gradient._float_zeros_like(x))
+        return self.mask_disconnected(self.make_node(*inputs), dC_douts,
+                                      gradients)
+
     def R_op(self, inputs, eval_points):
         # Step 0. Don't work on the orignal tensor variables
         rval = scan_utils.reconstruct_graph(self.inputs,
@@ -1936,6 +2324,8 @@ class Scan(PureOp):
         info['as_while'] = self.as_while
         info['profile'] = self.profile
         info['truncate_gradient'] = self.truncate_gradient
+        info['checkpoint_gradient'] = self.checkpoint_gradient
+        info['associative'] = False
         if self.name:
             info['name'] = 'rop_of_' + self.name
         else:
@@ -19,6 +19,7 @@ import numpy
 import theano
 from theano import tensor
 from theano.tensor import opt, get_scalar_constant_value
+from theano.tensor import extra_ops
 from theano import gof
 from theano.gof.python25 import maxsize, any, OrderedDict
 from theano.gof.opt import Optimizer
@@ -29,6 +30,7 @@ from theano.compile.function_module import deep_copy_op
 from theano.scan_module import scan_op
 from theano.scan_module import scan_utils
 from theano.scan_module.scan_utils import equal_computations, find_up, scan_args
+from theano.scan_module.scan_vectorize import vectorize
 from theano.gof.opt import pre_constant_merge, pre_greedy_local_optimizer
 
 # Logging function for sending warning or info
@@ -151,6 +153,178 @@ def remove_constants_and_unused_inputs_scan(node):
         return False
 
 
+@gof.local_optimizer([scan_op.Scan])
+def scan_associative(node):
+    """
+    Compute the outputs of a scan whose step function is associative (see
+    the ``associative`` argument of scan) as the prefix of the sequences,
+    preceded by the initial states, for that operator. A scan adding or
+    multiplying its state and its sequence is a cumulative sum or product,
+    the other ones are computed with a parallel prefix (see
+    `parallel_prefix`).
+
+    This is only done for the scans flagged associative: all the outputs
+    are computed, where the loop can keep only the last ones.
+    """
+    if not isinstance(node.op, scan_op.Scan):
+        return False
+    op = node.op
+    if not op.associative or op.no_associative_reason() is not None:
+        return False
+    a = scan_args(node.inputs, node.outputs, op.inputs, op.outputs, op.info)
+    n_steps = a.n_steps
+    elements = [tensor.join(0, init[:1], seq[:n_steps])
+                for init, seq in zip(a.outer_in_sit_sot, a.outer_in_seqs)]
+
+    cumulative = _cumulative_op(op)
+    if cumulative is not None:
+        prefixes = [cumulative(elements[0], axis=0)]
+    else:
+        outs = scan_utils.clone(a.inner_out_sit_sot,
+                                replace=zip(a.inner_in_non_seqs,
+                                            a.outer_in_non_seqs))
+        prefixes = parallel_prefix(outs, a.inner_in_sit_sot,
+                                   a.inner_in_seqs, elements, mode=op.mode)
+
+    rval = []
+    for init, out, prefix in zip(a.outer_in_sit_sot, node.outputs,
+                                 prefixes):
+        out_buffer = tensor.set_subtensor(init[:n_steps + 1], prefix)
+        rval.append(tensor.patternbroadcast(out_buffer, out.broadcastable))
+    return rval
+
+
+def _cumulative_op(op):
+    """
+    Return cumsum or cumprod if the scan op ``op`` only adds or multiplies
+    its state and its sequence, None otherwise.
+    """
+    if len(op.outputs) != 1:
+        return None
+    out = op.outputs[0]
+    x = op.inputs[0]
+    h = op.inputs[1]
+    if (out.owner is None or
+            not isinstance(out.owner.op, tensor.Elemwise) or
+            len(out.owner.inputs) != 2 or
+            set(out.owner.inputs) != set([x, h]) or
+            out.type != h.type):
+        return None
+    scalar_op = out.owner.op.scalar_op
+    if isinstance(scalar_op, theano.scalar.Add):
+        return extra_ops.cumsum
+    if isinstance(scalar_op, theano.scalar.Mul):
+        return extra_ops.cumprod
+    return None
+
+
+def parallel_prefix(outputs, lefts, rights, elements, mode=None):
+    """
+    Return the inclusive prefix of ``elements`` along their first axis for
+    an associative operator, in O(log(n)) steps and O(n) work for n
+    elements:
+
+    - the elements are cut in blocks of k = log2(n) elements, and a scan
+      over the k positions computes the prefixes inside all the blocks at
+      once;
+    - the prefix of the totals of the blocks is computed with the
+      Brent-Kung algorithm (see `_tree_prefix`);
+    - the total of the previous blocks is combined with all the prefixes
+      inside each block at once.
+
+    :param outputs: the results of the operator on the variables ``lefts``
+        and ``rights``. Its inputs and results can be tuples (lists of
+        variables): an element of the prefix is a value for each variable
+        of ``elements``.
+    :param elements: the values to combine, one per variable of ``lefts``.
+
+    The operator is vectorized (see `vectorize`) to combine a batch of
+    pairs.
+    """
+    def combine(olds, news):
+        replace = OrderedDict(zip(lefts, olds) + zip(rights, news))
+        return vectorize(outputs, replace)
+
+    n = elements[0].shape[0]
+    k = tensor.maximum(tensor.cast(
+        tensor.ceil(tensor.log2(tensor.cast(n, 'float64'))), 'int64'), 1)
+    n_blocks = (n + k - 1) // k
+    shapes = []
+    blocks = []
+    for y in elements:
+        shape = [y.shape[i] for i in xrange(1, y.ndim)]
+        # The last block is completed with copies of the last element
+        y = tensor.join(0, y, tensor.alloc(y[-1], n_blocks * k - n, *shape))
+        y = y.reshape([n_blocks, k] + shape, ndim=y.ndim + 1)
+        shapes.append(shape)
+        blocks.append(y.dimshuffle([1, 0] + range(2, y.ndim)))
+
+    def step(*args):
+        return combine(args[len(blocks):], args[:len(blocks)])
+    insides, _ = theano.scan(step, sequences=[b[1:] for b in blocks],
+                             outputs_info=[b[0] for b in blocks],
+                             mode=mode, name='parallel_prefix_blocks')
+    if not isinstance(insides, list):
+        insides = [insides]
+    insides = [tensor.join(0, b[:1], inside)
+               for b, inside in zip(blocks, insides)]
+
+    totals = _tree_prefix(combine, [inside[-1] for inside in insides],
+                          mode)
+    olds = []
+    news = []
+    for total, inside, shape in zip(totals, insides, shapes):
+        old = tensor.alloc(
+            total[:-1].dimshuffle([0, 'x'] + range(1, total.ndim)),
+            n_blocks - 1, k, *shape)
+        new = inside[:, 1:].dimshuffle([1, 0] + range(2, inside.ndim))
+        olds.append(old.reshape([(n_blocks - 1) * k] + shape,
+                                ndim=old.ndim - 1))
+        news.append(new.reshape([(n_blocks - 1) * k] + shape,
+                                ndim=new.ndim - 1))
+    return [tensor.join(0, inside[:, 0], rest)[:n]
+            for inside, rest in zip(insides, combine(olds, news))]
+
+
+def _tree_prefix(combine, elements, mode):
+    """
+    Inclusive prefix of ``elements`` with the Brent-Kung algorithm: an
+    up-sweep combines the elements in a tree of pairs, a down-sweep
+    completes the prefix of the others. Each one is a scan over the
+    O(log(n)) levels of the tree whose steps combine all the pairs of their
+    level at once, with ``combine(olds, news)``.
+    """
+    def up(s, *ys):
+        # The element s * i - 1 gets the elements s * i - s to s * i - 1
+        news = [y[s - 1::s] for y in ys]
+        olds = [y[s // 2 - 1::s][:new.shape[0]]
+                for y, new in zip(ys, news)]
+        return [tensor.set_subtensor(y[s - 1::s], new) for y, new
+                in zip(ys, combine(olds, news))]
+
+    def down(s, *ys):
+        # The element s * i + s / 2 - 1 gets the prefix up to s * i - 1
+        news = [y[s + s // 2 - 1::s] for y in ys]
+        olds = [y[s - 1::s][:new.shape[0]] for y, new in zip(ys, news)]
+        return [tensor.set_subtensor(y[s + s // 2 - 1::s], new) for y, new
+                in zip(ys, combine(olds, news))]
+
+    n = tensor.cast(elements[0].shape[0], 'float64')
+    levels = tensor.maximum(
+        tensor.cast(tensor.ceil(tensor.log2(n)), 'int64'), 1)
+    ys = elements
+    for sweep, steps in ((up, tensor.arange(1, levels + 1)),
+                         (down, tensor.arange(
+                             tensor.maximum(levels - 1, 1), 0, -1))):
+        ys, _ = theano.scan(sweep, sequences=2 ** steps, outputs_info=ys,
+                            mode=mode, name='parallel_prefix_' +
+                            sweep.__name__)
+        if not isinstance(ys, list):
+            ys = [ys]
+        ys = [y[-1] for y in ys]
+    return ys
+
+
 # This is a global opt for historical reason
 # It should be possible to change it to a local opt.
 class PushOutNonSeqScan(gof.Optimizer):
@@ -1094,6 +1268,8 @@ class ScanMerge(gof.Optimizer):
         info['n_shared_outs'] = sum([nd.op.n_shared_outs for nd in nodes])
         info['n_nit_sot'] = sum([nd.op.n_nit_sot for nd in nodes])
         info['truncate_gradient'] = nodes[0].op.truncate_gradient
+        info['checkpoint_gradient'] = nodes[0].op.checkpoint_gradient
+        info['associative'] = False
         info['name'] = '&'.join([nd.op.name for nd in nodes])
         info['mode'] = nodes[0].op.mode
         info['gpu'] = False
@@ -1274,6 +1450,8 @@ class ScanMerge(gof.Optimizer):
 
         can_add = can_add and (node.op.truncate_gradient ==
                                rep.op.truncate_gradient)
+        can_add = can_add and (node.op.checkpoint_gradient ==
+                               rep.op.checkpoint_gradient)
         can_add = can_add and (node.op.mode == rep.op.mode)
         if not node.op.as_while:
             return nsteps == rep_nsteps and can_add
@@ -1701,6 +1879,15 @@ scan_eqopt1.register(
     'all_pushout_opt', scan_seqopt1, 1, 'fast_run', 'scan')
 
 
+# Before the other ones change the inner function
+scan_seqopt1.register('scanOp_associative',
+                      opt.in2out(scan_associative, ignore_newtrees=True),
+                      0.5,
+                      'scan_associative',
+                      'fast_run',
+                      'scan')
+
+
 scan_seqopt1.register('scanOp_remove_constants_and_unused_inputs0',
                       opt.in2out(remove_constants_and_unused_inputs_scan,
                                  ignore_newtrees=True),
@@ -62,7 +62,7 @@ import copy
 
 
 def get_version():
-    return 0.279
+    return 0.282
 
 @cython.boundscheck(False)
 def perform(
@@ -174,6 +174,7 @@ def perform(
     cdef int pos[500] # put a maximum of 500 outputs
     cdef unsigned int len_store_steps = n_mit_mot + n_mit_sot + n_sit_sot + n_nit_sot
     cdef int store_steps[500]
+    cdef int read_slot[500]
     cdef unsigned int l
     cdef unsigned int offset
     cdef int tap
@@ -261,6 +262,17 @@ def perform(
         input_storage[<unsigned int>(idx+offset)].storage[0] = other_args[idx]
 
 
+    # The views of the output buffers put in the output storage. The states
+    # whose slot is also read by one of their taps in the same step (the
+    # ring buffers of ScanSaveMem) are computed outside the buffer and
+    # copied into it.
+    slots = [None] * lenpos
+    for idx in range(lenpos):
+        read_slot[idx] = 0
+        if idx < n_outs:
+            for tdx in range(tap_array_len[idx]):
+                if (tap_array[idx,tdx] % store_steps[idx]) == 0:
+                    read_slot[idx] = 1
     i = 0
     cond = 1
     ############## THE MAIN LOOP #########################
@@ -308,19 +320,18 @@ def perform(
         for idx in range(n_mit_mot_outs):
             output_storage[idx].storage[0] = None
 
+        # The ops write the outputs of the step directly in their slot of
+        # the buffers when they can, so they are not copied. The buffers
+        # of the nit_sot outputs are allocated after the first step.
         offset = n_mit_mot_outs
-        if i !=0 and n_nit_sot >0:
-            for idx in range(n_outs + n_nit_sot - n_mit_mot):
-                if ( store_steps[<unsigned int>(idx+n_mit_mot)] == 1 or
-                    vector_outs[<unsigned int>(idx+n_mit_mot)] == 1):
-                    output_storage[<unsigned int>(idx+offset)].storage[0] = None
-                else:
-                    output_storage[<unsigned int>(idx+offset)].storage[0] =\
-                        outs[<unsigned int>(idx+n_mit_mot)][0][pos[\
-                                            <unsigned int>(idx+n_mit_mot)]]
-        else:
-            for idx in range(n_outs + n_nit_sot - n_mit_mot):
-                output_storage[<unsigned int>(idx+offset)].storage[0] = None
+        for idx in range(n_outs + n_nit_sot - n_mit_mot):
+            jout = idx + n_mit_mot
+            if ( store_steps[jout] == 1 or vector_outs[jout] == 1 or
+                read_slot[jout] == 1 or (i == 0 and jout >= n_outs)):
+                slots[jout] = None
+            else:
+                slots[jout] = outs[jout][0][pos[jout]]
+            output_storage[<unsigned int>(idx+offset)].storage[0] = slots[jout]
 
         offset += n_outs+n_nit_sot - n_mit_mot
         for idx in range(n_shared_outs):
@@ -364,9 +375,8 @@ def perform(
         offset_out -= n_mit_mot
 
         for j in range(begin, end):
-            if ( store_steps[j] == 1 or vector_outs[j] ==1 or
-                outs[j][0][pos[j]] is not output_storage[<unsigned int>(offset_out+j)].storage[0]):
-
+            if (output_storage[<unsigned int>(offset_out+j)].storage[0]
+                    is not slots[j]):
                 outs[j][0][pos[j]] = output_storage[<unsigned int>(offset_out+j)].storage[0]
 
         # 5.3 Copy over the values for nit_sot outputs
@@ -387,8 +397,7 @@ def perform(
                 elif outs[j][0].shape[0] != store_steps[j]:
                     outs[j][0] = outs[j][0][:store_steps[j]]
                 outs[j][0][pos[j]] = output_storage[jout].storage[0]
-            elif (store_steps[j] == 1 or vector_outs[j] == 1 or
-                  outs[j][0][pos[j]] is not output_storage[j+offset_out].storage[0]):
+            elif output_storage[j+offset_out].storage[0] is not slots[j]:
                 outs[j][0][pos[j]] = output_storage[j+offset_out].storage[0]
 
 
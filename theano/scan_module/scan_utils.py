@@ -647,6 +647,8 @@ def compress_outs(op, not_required, inputs):
     info['n_shared_outs'] = 0
     info['n_nit_sot'] = 0
     info['truncate_gradient'] = op.info['truncate_gradient']
+    info['checkpoint_gradient'] = op.info['checkpoint_gradient']
+    info['associative'] = op.info['associative']
     info['name'] = op.info['name']
     info['gpu'] = op.info['gpu']
     info['mode'] = op.info['mode']
@@ -912,8 +914,9 @@ class scan_args(object):
         q += n_shared_outs
 
         self.other_info = OrderedDict()
-        for k in ('truncate_gradient', 'name', 'mode', 'destroy_map',
-                  'gpu', 'as_while', 'profile'):
+        for k in ('truncate_gradient', 'checkpoint_gradient', 'associative',
+                  'name', 'mode', 'destroy_map', 'gpu', 'as_while',
+                  'profile'):
             if k in info:
                 self.other_info[k] = info[k]
 
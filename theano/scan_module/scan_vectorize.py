@@ -0,0 +1,440 @@
+"""
+This module provides a graph transformation that computes a graph, and the
+scans in it, for a whole batch of inputs at once.
+
+A step function is often written for a single sequence and the compiled
+function called once per example. ``vectorize`` rebuilds the graph with an
+extra leading axis over the examples: the scans loop once over the time
+steps for all the examples, and the ops of their inner function work on the
+whole batch (a ``dot`` of a vector by a matrix becomes a ``dot`` of two
+matrices, that the optimizations turn into a Gemm).
+
+See scan.py for details on scan
+"""
+__docformat__ = 'restructedtext en'
+__copyright__ = "(c) 2010, Universite de Montreal"
+
+
+import copy
+import logging
+from itertools import izip
+
+import numpy
+
+from theano import gof
+from theano import tensor
+from theano.compile.ops import Shape, Shape_i
+from theano.gof.python25 import all, any, OrderedDict
+from theano.tensor import elemwise, subtensor
+from theano.scan_module import scan_op
+from theano.scan_module.scan_utils import scan_args
+
+# Logging function for sending warning or info
+_logger = logging.getLogger('theano.scan_module.scan_vectorize')
+
+
+def vectorize(outputs, replace, mask=None):
+    """
+    Return ``outputs`` computed for a batch of values of some of their
+    inputs.
+
+    The graph of ``outputs`` is rebuilt with an extra leading axis, the
+    batch axis, for all the variables that depend on the replaced ones.
+    The scans of the graph become one scan over the batch: the sequences
+    are iterated over their second axis, and the inner function is itself
+    vectorized. The values that do not depend on the batch (the weights of
+    a network for instance) are not copied, unless they are the initial
+    state of a scan whose later states depend on the batch.
+
+    :param outputs: Theano variable or list of Theano variables
+
+    :param replace: dictionary mapping variables of the graph (usually its
+        inputs) to a batch of values for them: variables of the same dtype
+        and one more dimension, the first one being the batch axis. All of
+        them must have the same length on that axis.
+
+    :param mask: optional matrix of shape (batch size, number of steps)
+        used when the sequences of the batch have different lengths. At
+        step ``t`` of the scans, the ``i``-th example is only computed if
+        ``mask[i, t]`` is non zero: otherwise its states keep their
+        previous value and its other outputs (the ones that do not feed a
+        tap) are 0. The last state of a scan is so the state after the last
+        step of each sequence. The mask is indexed by the step of the scans,
+        so for a scan with ``go_backwards=True`` it starts from the end of
+        the sequences. It is applied to all the scans of the graph that
+        depend on the batch, not to the scans nested in them.
+
+    :return: the batched version of ``outputs``, with the batch as first
+        axis (an output that does not depend on the batch is repeated for
+        all the examples).
+
+    The ops of the graph must have a batched version: the elemwise ops,
+    reductions, ``dot``, ``DimShuffle``, subtensors, reshapes,
+    concatenations, shapes and scans (without ``mit_mot`` states and whose
+    updates and stopping condition do not depend on the batch). For other
+    ops a ``NotImplementedError`` is raised.
+
+    Example: the last states of an RNN for 100 sequences of 50 steps
+
+    .. code-block:: python
+
+        x = T.matrix('x')
+        h0 = T.vector('h0')
+        hs, _ = theano.scan(lambda x_t, h_tm1: T.tanh(x_t + T.dot(h_tm1, W)),
+                            sequences=x, outputs_info=h0)
+        X = T.tensor3('X')          # (100, 50, n)
+        H0 = T.matrix('H0')         # (100, n)
+        last = vectorize(hs[-1], {x: X, h0: H0})    # (100, n)
+    """
+    if isinstance(outputs, (list, tuple)):
+        return_list = True
+    else:
+        return_list = False
+        outputs = [outputs]
+
+    memo = OrderedDict()
+    size = None
+    for x, y in replace.items():
+        y = tensor.as_tensor_variable(y)
+        if y.ndim != x.ndim + 1 or y.dtype != x.dtype:
+            raise TypeError(
+                'vectorize: the batch of values of a variable must have the '
+                'same dtype and one more dimension', x, x.type, y.type)
+        memo[x] = (tensor.patternbroadcast(
+            y, y.broadcastable[:1] + x.broadcastable), True)
+        if size is None:
+            size = y.shape[0]
+    if size is None:
+        raise ValueError('vectorize: nothing to replace by a batch')
+    if mask is not None:
+        mask = tensor.as_tensor_variable(mask)
+        if mask.ndim != 2:
+            raise TypeError('vectorize: the mask must be a matrix', mask.type)
+
+    results = _vectorize(outputs, memo, size, mask)
+    rval = [_batched(out, batched, size) for out, batched in results]
+    if return_list:
+        return rval
+    return rval[0]
+
+
+def _vectorize(outputs, memo, size, mask=None):
+    """
+    Vectorize the graph of ``outputs``. ``memo`` maps the variables already
+    known to a pair (new variable, batched), and gets the ones of the graph.
+    Returns the pairs of ``outputs``.
+    """
+    graph_inputs = list(memo.keys()) + gof.graph.inputs(outputs,
+                                                        blockers=memo.keys())
+    for node in gof.graph.io_toposort(graph_inputs, outputs):
+        pairs = [memo.get(x, (x, False)) for x in node.inputs]
+        inputs = [x for x, batched in pairs]
+        batched = [batched for x, batched in pairs]
+        if any(batched):
+            new_outputs = _vectorize_node(node, inputs, batched, size, mask)
+        else:
+            if all(x is y for x, y in izip(inputs, node.inputs)):
+                outs = node.outputs
+            else:
+                outs = node.clone_with_new_inputs(inputs).outputs
+            new_outputs = [(out, False) for out in outs]
+        for out, pair in izip(node.outputs, new_outputs):
+            if out not in memo:
+                memo[out] = pair
+    return [memo.get(out, (out, False)) for out in outputs]
+
+
+def _batched(x, batched, size):
+    """Return ``x`` with a batch axis, repeating it if it has none."""
+    if batched:
+        return x
+    return tensor.alloc(x, size, *[x.shape[i] for i in xrange(x.ndim)])
+
+
+def _broadcastable_batch(x, batched):
+    """Return ``x`` with a batch axis, broadcastable if it has none."""
+    if batched:
+        return x
+    return x.dimshuffle(['x'] + range(x.ndim))
+
+
+def _batched_type(x):
+    """Return a new variable for a batch of values of ``x``."""
+    return tensor.TensorType(dtype=x.dtype,
+                             broadcastable=(False,) + x.broadcastable)(x.name)
+
+
+def _not_batched(node, inputs, batched, what):
+    for x, b in izip(inputs, batched):
+        if b:
+            raise NotImplementedError(
+                'vectorize: the %s of %s depends on the batch' % (
+                    what, node.op))
+
+
+def _vectorize_node(node, inputs, batched, size, mask):
+    """
+    Return the pairs (variable, batched) of the outputs of ``node`` applied
+    to ``inputs``, ``batched`` telling which of them have a batch axis.
+    """
+    op = node.op
+    if isinstance(op, elemwise.Elemwise):
+        outs = op(*[_broadcastable_batch(x, b)
+                    for x, b in izip(inputs, batched)],
+                  **dict(return_list=True))
+        return [(out, True) for out in outs]
+
+    elif isinstance(op, elemwise.DimShuffle):
+        new_order = [0]
+        for i in op.new_order:
+            if i == 'x':
+                new_order.append('x')
+            else:
+                new_order.append(i + 1)
+        return [(inputs[0].dimshuffle(new_order), True)]
+
+    elif isinstance(op, elemwise.CAReduce):
+        new_op = copy.copy(op)
+        if op.axis is None:
+            new_op.axis = tuple(range(1, inputs[0].ndim))
+        else:
+            new_op.axis = tuple(a + 1 for a in op.axis)
+        return [(new_op(inputs[0]), True)]
+
+    elif isinstance(op, tensor.MaxAndArgmax):
+        _not_batched(node, inputs[1:], batched[1:], 'axis')
+        axis = [a + 1 for a in numpy.asarray(inputs[1].data).reshape(-1)]
+        return [(out, True) for out in op(inputs[0], axis)]
+
+    elif isinstance(op, tensor.Dot):
+        return [(_batched_dot(inputs, batched), True)]
+
+    elif isinstance(op, subtensor.Subtensor):
+        _not_batched(node, inputs[1:], batched[1:], 'indices')
+        new_op = subtensor.Subtensor([slice(None)] + list(op.idx_list))
+        return [(new_op(*inputs), True)]
+
+    elif isinstance(op, subtensor.IncSubtensor):
+        _not_batched(node, inputs[2:], batched[2:], 'indices')
+        new_op = subtensor.IncSubtensor(
+            [slice(None)] + list(op.idx_list),
+            set_instead_of_inc=op.set_instead_of_inc)
+        x = _batched(inputs[0], batched[0], size)
+        y = _broadcastable_batch(inputs[1], batched[1])
+        return [(new_op(x, y, *inputs[2:]), True)]
+
+    elif isinstance(op, tensor.Rebroadcast):
+        new_op = tensor.Rebroadcast(*[(axis + 1, broadcastable)
+                                      for axis, broadcastable
+                                      in op.axis.items()])
+        return [(new_op(inputs[0]), True)]
+
+    elif isinstance(op, tensor.Reshape):
+        _not_batched(node, inputs[1:], batched[1:], 'shape')
+        shape = tensor.join(0, tensor.cast(size, 'int64').dimshuffle('x'),
+                            inputs[1])
+        return [(tensor.reshape(inputs[0], shape, ndim=op.ndim + 1), True)]
+
+    elif isinstance(op, tensor.Join):
+        _not_batched(node, inputs[:1], batched[:1], 'axis')
+        axis = tensor.get_scalar_constant_value(inputs[0])
+        if axis < 0:
+            axis += node.outputs[0].ndim
+        return [(tensor.join(axis + 1,
+                             *[_batched(x, b, size)
+                               for x, b in izip(inputs[1:], batched[1:])]),
+                 True)]
+
+    elif isinstance(op, tensor.Alloc):
+        _not_batched(node, inputs[1:], batched[1:], 'shape')
+        value = inputs[0]
+        n_new = len(inputs) - value.ndim
+        value = value.dimshuffle([0] + ['x'] * n_new +
+                                 range(1, value.ndim))
+        return [(tensor.alloc(value, size, *inputs[1:]), True)]
+
+    elif isinstance(op, Shape):
+        # All the examples have the same shape
+        return [(inputs[0].shape[1:], False)]
+
+    elif isinstance(op, Shape_i):
+        return [(Shape_i(op.i + 1)(inputs[0]), False)]
+
+    elif isinstance(op, scan_op.Scan):
+        return _vectorize_scan(node, inputs, batched, size, mask)
+
+    raise NotImplementedError('vectorize: no batched version of %s' % op)
+
+
+def _batched_dot(inputs, batched):
+    """Batched version of the dot of two vectors or matrices."""
+    (x, y), (bx, by) = inputs, batched
+    xdim = x.ndim - bx
+    ydim = y.ndim - by
+    if not by:
+        # (b, [m,] n) . (n, [k]) -> (b, [m,] [k])
+        return tensor.dot(x, y)
+    if not bx:
+        if ydim == 1:
+            # ([m,] n) . (b, n) -> (b, [m])
+            return tensor.dot(y, x.T)
+        # (m, n) . (b, n, k) -> (m, b, k) -> (b, m, k)
+        out = tensor.dot(x, y)
+        if xdim == 2:
+            out = out.dimshuffle(1, 0, 2)
+        return out
+    # Both depend on the batch: sum of the products
+    x = x.dimshuffle(range(x.ndim) + ['x'] * (ydim - 1))
+    y = y.dimshuffle([0] + ['x'] * (xdim - 1) + range(1, y.ndim))
+    return (x * y).sum(axis=xdim)
+
+
+def _vectorize_scan(node, inputs, batched, size, mask):
+    """
+    Batched version of a scan node: the batch becomes the second axis of
+    the sequences and of the states, and the inner function is vectorized.
+    """
+    op = node.op
+    is_batched = dict(izip(inputs, batched))
+    a = scan_args(inputs, node.outputs, op.inputs, op.outputs, op.info)
+    if a.outer_in_mit_mot:
+        raise NotImplementedError('vectorize: scan with mit_mot states')
+    _not_batched(node, [a.n_steps], [is_batched[a.n_steps]],
+                 'number of steps')
+    _not_batched(node, a.outer_in_nit_sot,
+                 [is_batched[x] for x in a.outer_in_nit_sot],
+                 'number of steps')
+    _not_batched(node, a.outer_in_shared,
+                 [is_batched[x] for x in a.outer_in_shared], 'shared state')
+
+    n_mit_sot = len(a.outer_in_mit_sot)
+    n_states = n_mit_sot + len(a.outer_in_sit_sot)
+    n_nit_sot = len(a.outer_in_nit_sot)
+    outer_states = a.outer_in_mit_sot + a.outer_in_sit_sot
+    inner_states = a.inner_in_mit_sot + [[x] for x in a.inner_in_sit_sot]
+    taps = a.mit_sot_in_slices + [[-1]] * len(a.outer_in_sit_sot)
+    inner_outputs = (a.inner_out_mit_sot + a.inner_out_sit_sot +
+                     a.inner_out_nit_sot + a.inner_out_shared)
+    if op.as_while:
+        inner_outputs = inner_outputs + a.cond
+
+    seqs_b = [is_batched[x] for x in a.outer_in_seqs]
+    non_seqs_b = [is_batched[x] for x in a.outer_in_non_seqs]
+    # With a mask, every example has its own states
+    states_b = [mask is not None or is_batched[x] for x in outer_states]
+
+    inner_mask = None
+    if mask is not None:
+        inner_mask = tensor.TensorType(dtype=mask.dtype,
+                                       broadcastable=(False,))('mask_t')
+
+    # A state depends on the batch if its initial value or its update does
+    while True:
+        memo = OrderedDict()
+        for x, b in izip(a.inner_in_seqs + a.inner_in_non_seqs,
+                         seqs_b + non_seqs_b):
+            if b:
+                memo[x] = (_batched_type(x), True)
+        for xs, b in izip(inner_states, states_b):
+            if b:
+                for x in xs:
+                    memo[x] = (_batched_type(x), True)
+        if inner_mask is not None:
+            inner_size = inner_mask.shape[0]
+        else:
+            inner_size = [x for x, b in memo.values() if b][0].shape[0]
+        results = _vectorize(inner_outputs, memo, inner_size)
+        new_states_b = [b or out_b for b, (out, out_b)
+                        in izip(states_b, results[:n_states])]
+        if new_states_b == states_b:
+            break
+        states_b = new_states_b
+
+    # Inner graph
+    new_inner_outputs = []
+    for i, (out, out_b) in enumerate(results[:n_states]):
+        if states_b[i]:
+            out = _batched(out, out_b, inner_size)
+            inner_in = memo[inner_states[i][0]][0]
+            if inner_mask is not None:
+                if -1 not in taps[i]:
+                    raise NotImplementedError(
+                        'vectorize: masked scan state without a -1 tap')
+                prev = memo[inner_states[i][taps[i].index(-1)]][0]
+                out = tensor.switch(_mask_like(inner_mask, out), out, prev)
+            out = tensor.patternbroadcast(out.astype(inner_in.dtype),
+                                          inner_in.broadcastable)
+        new_inner_outputs.append(out)
+    nit_sot_b = []
+    for out, out_b in results[n_states:n_states + n_nit_sot]:
+        if inner_mask is not None:
+            out = _batched(out, out_b, inner_size)
+            out = tensor.switch(_mask_like(inner_mask, out), out,
+                                tensor.zeros_like(out))
+            out_b = True
+        new_inner_outputs.append(out)
+        nit_sot_b.append(out_b)
+    rest = results[n_states + n_nit_sot:]
+    _not_batched(node, [out for out, b in rest], [b for out, b in rest],
+                 'updates or the stopping condition')
+    new_inner_outputs += [out for out, b in rest]
+
+    def new_inner(x):
+        return memo.get(x, (x, False))[0]
+    a.inner_in_seqs = [new_inner(x) for x in a.inner_in_seqs]
+    a.inner_in_mit_sot = [[new_inner(x) for x in xs]
+                          for xs in a.inner_in_mit_sot]
+    a.inner_in_sit_sot = [new_inner(x) for x in a.inner_in_sit_sot]
+    a.inner_in_non_seqs = [new_inner(x) for x in a.inner_in_non_seqs]
+
+    # Outer inputs, with the steps on the first axis
+    new_seqs = []
+    for x, b in izip(a.outer_in_seqs, seqs_b):
+        if b:
+            x = _swap(x)
+        new_seqs.append(x)
+    a.outer_in_seqs = new_seqs
+    new_states = []
+    for x, b in izip(outer_states, states_b):
+        if b and is_batched[x]:
+            x = _swap(x)
+        elif b:
+            x = tensor.alloc(x.dimshuffle([0, 'x'] + range(1, x.ndim)),
+                             x.shape[0], size,
+                             *[x.shape[i] for i in xrange(1, x.ndim)])
+        new_states.append(x)
+    a.outer_in_mit_sot = new_states[:n_mit_sot]
+    a.outer_in_sit_sot = new_states[n_mit_sot:]
+    if inner_mask is not None:
+        a.inner_in_seqs.append(inner_mask)
+        a.outer_in_seqs.append(mask.T[:a.n_steps])
+
+    n_outs = len(new_inner_outputs) - len(rest)
+    a.inner_out_mit_sot = new_inner_outputs[:n_mit_sot]
+    a.inner_out_sit_sot = new_inner_outputs[n_mit_sot:n_states]
+    a.inner_out_nit_sot = new_inner_outputs[n_states:n_outs]
+    info = a.info
+    info['destroy_map'] = OrderedDict()
+    inner_outs = a.inner_outputs
+    if op.as_while:
+        inner_outs = inner_outs + new_inner_outputs[-1:]
+    new_op = scan_op.Scan(a.inner_inputs, inner_outs, info)
+    outs = new_op(*a.outer_inputs, **dict(return_list=True))
+
+    rval = []
+    for out, b in izip(outs, states_b + nit_sot_b):
+        if b:
+            out = _swap(out)
+        rval.append((out, b))
+    rval += [(out, False) for out in outs[len(rval):]]
+    return rval
+
+
+def _swap(x):
+    """Swap the two first axes of ``x``."""
+    return x.dimshuffle([1, 0] + range(2, x.ndim))
+
+
+def _mask_like(mask, x):
+    """Broadcast the mask of the examples over the dimensions of ``x``."""
+    return mask.dimshuffle([0] + ['x'] * (x.ndim - 1))
@@ -261,6 +261,25 @@ class T_Scan(unittest.TestCase):
         theano_values = my_f(state, steps)
         utt.assert_allclose(numpy_values, theano_values)
 
+    def test_unpickle_old_scan(self):
+        # Scan ops pickled before checkpoint_gradient and associative were
+        # added get their default values
+        x = tensor.vector('x')
+        ys, _ = theano.scan(lambda x_t, y_tm1: x_t + y_tm1, sequences=x,
+                            outputs_info=tensor.zeros_like(x[0]))
+        op = ys.owner.inputs[0].owner.op
+        state = op.__getstate__()
+        state['info'] = OrderedDict(state['info'])
+        for key in ('checkpoint_gradient', 'associative'):
+            del state[key]
+            del state['info'][key]
+        old_op = object.__new__(type(op))
+        old_op.__setstate__(state)
+        assert old_op == op
+        assert hash(old_op) == hash(op)
+        assert old_op.checkpoint_gradient == -1
+        assert old_op.associative is False
+
     # generator network, only one output , type scalar ; no sequence or
     # non sequence arguments
     def test_generator_one_output_scalar(self):
@@ -3372,6 +3391,43 @@ class T_Scan(unittest.TestCase):
         f = theano.function([seq], results[1], updates=updates)
         assert numpy.all(exp_out == f(inp))
 
+    def test_outputs_written_in_buffers(self):
+        # The ops write the states directly in the buffer of scan
+        rng = numpy.random.RandomState(utt.fetch_seed())
+        x = tensor.matrix('x')
+        h0 = tensor.vector('h0')
+        hs, _ = theano.scan(lambda x_t, h_tm1: h_tm1 * .5 + x_t,
+                            sequences=x, outputs_info=h0)
+        xv = rng.rand(6, 3).astype(theano.config.floatX)
+        h0v = rng.rand(3).astype(theano.config.floatX)
+        expected = [h0v]
+        for x_t in xv:
+            expected.append(expected[-1] * .5 + x_t)
+        f = theano.function([x, h0], hs)
+        scan_op = [node.op for node in f.maker.fgraph.toposort()
+                   if isinstance(node.op, theano.scan_module.scan_op.Scan)][0]
+        result = f(xv, h0v)
+        assert numpy.allclose(result, expected[1:])
+        # The storage of the inner function still has the view of the slot
+        # of the last state
+        last = scan_op.fn.output_storage[0].storage[0]
+        assert numpy.may_share_memory(last, result)
+
+        # When only the last state is kept, the slot written is the one read
+        # by the oldest tap, so the state is not written in place
+        y0 = tensor.tensor3('y0')
+        ys, _ = theano.scan(lambda a, b: a[::-1] * 2 + b[::-1],
+                            outputs_info=dict(initial=y0, taps=[-3, -1]),
+                            n_steps=7)
+        y0v = rng.rand(3, 2, 2).astype(theano.config.floatX)
+        expected = list(y0v)
+        for t in xrange(7):
+            expected.append(expected[-3][::-1] * 2 + expected[-1][::-1])
+        f = theano.function([y0], ys[-1])
+        assert numpy.allclose(f(y0v), expected[-1])
+        f = theano.function([y0], ys)
+        assert numpy.allclose(f(y0v), expected[3:])
+
     def test_grad_connectivity_matrix(self):
         def inner_fn(x_tm1, y_tm1, z_tm1):
             x_tm1.name = 'x'
@@ -0,0 +1,100 @@
+import numpy
+from nose.tools import assert_raises
+
+import theano
+import theano.tensor as T
+from theano.scan_module.scan_op import Scan
+from theano.tensor.extra_ops import CumsumOp, cumsum
+
+
+def sequential_mode():
+    return theano.compile.get_default_mode().excluding('scan_associative')
+
+
+def scan_steps(f):
+    """Return the number of steps of the scans run by f."""
+    return [node.inputs[0] for node in f.maker.fgraph.toposort()
+            if isinstance(node.op, Scan)]
+
+
+def test_cumsum():
+    rng = numpy.random.RandomState(0)
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+    hs, _ = theano.scan(lambda x_t, h_tm1: h_tm1 + x_t, sequences=x,
+                        outputs_info=h0, associative=True)
+    f = theano.function([x, h0], hs)
+    topo = f.maker.fgraph.toposort()
+    assert not [node for node in topo if isinstance(node.op, Scan)]
+    assert [node for node in topo if isinstance(node.op, CumsumOp)]
+    g = theano.function([x, h0], hs, mode=sequential_mode())
+    for n in (0, 1, 10):
+        xv = rng.rand(n, 3)
+        hv = rng.rand(3)
+        assert numpy.all(f(xv, hv) == g(xv, hv))
+
+
+def test_maximum():
+    rng = numpy.random.RandomState(0)
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+    hs, _ = theano.scan(lambda x_t, h_tm1: T.maximum(h_tm1, x_t),
+                        sequences=x, outputs_info=h0, associative=True)
+    f = theano.function([x, h0], hs)
+    for n in (0, 1, 2, 3, 7, 8, 9, 31, 100):
+        xv = rng.rand(n, 2)
+        hv = rng.rand(2)
+        expected = numpy.maximum.accumulate(numpy.vstack([hv, xv]))[1:]
+        assert numpy.all(f(xv, hv) == expected)
+
+
+def test_linear_recurrence():
+    # h_t = c * dot(A_t, h_tm1) + b_t, on the pairs (A, b)
+    rng = numpy.random.RandomState(0)
+    A = T.tensor3('A')
+    b = T.matrix('b')
+    h0 = T.vector('h0')
+    c = T.scalar('c')
+
+    def step(A_t, b_t, A_tm1, b_tm1, c):
+        return T.dot(A_t * c, A_tm1), T.dot(A_t * c, b_tm1) + b_t
+    k = 3
+    [As, hs], _ = theano.scan(step, sequences=[A, b],
+                              outputs_info=[T.eye(k), h0],
+                              non_sequences=c, associative=True)
+    f = theano.function([A, b, h0, c], hs)
+    n = 20
+    values = [rng.uniform(-.5, .5, (n, k, k)), rng.rand(n, k), rng.rand(k),
+              2.]
+    expected = []
+    h = values[2]
+    for t in range(n):
+        h = 2. * numpy.dot(values[0][t], h) + values[1][t]
+        expected.append(h)
+    assert numpy.allclose(f(*values), expected)
+    # The loops are over the positions in the blocks and the levels of the
+    # tree, not over the steps
+    assert len(scan_steps(f)) == 3
+    g = theano.function([A, b, h0, c], T.grad(hs[-1].sum(), [A, b, h0]))
+    g_sequential = theano.function([A, b, h0, c],
+                                   T.grad(hs[-1].sum(), [A, b, h0]),
+                                   mode=sequential_mode())
+    for x, y in zip(g(*values), g_sequential(*values)):
+        assert numpy.allclose(x, y)
+
+
+def test_not_associative():
+    x = T.vector('x')
+    h0 = T.scalar('h0')
+    # A nit_sot output
+    assert_raises(ValueError, theano.scan,
+                  lambda x_t, h_tm1: [h_tm1 + x_t, x_t * 2], sequences=x,
+                  outputs_info=[h0, None], associative=True)
+    # The sequence and the state do not have the same type
+    assert_raises(ValueError, theano.scan,
+                  lambda x_t, h_tm1: h_tm1 + x_t.sum(),
+                  sequences=T.matrix(), outputs_info=h0, associative=True)
+    # The step function has no batched version
+    assert_raises(ValueError, theano.scan,
+                  lambda x_t, h_tm1: cumsum(h_tm1 + x_t), sequences=T.matrix(),
+                  outputs_info=T.vector(), associative=True)
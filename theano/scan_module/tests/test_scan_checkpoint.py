@@ -0,0 +1,141 @@
+import numpy
+
+import theano
+import theano.tensor as T
+from theano.compile import Mode
+from theano.gof.vm import VM_Linker
+from theano.scan_module.scan_op import Scan
+
+
+def scan_buffers(inputs, outputs, values):
+    """Return the first dimension of the outputs of all the scans."""
+    rows = []
+
+    def callback(node, thunk, storage_map, compute_map):
+        if isinstance(node.op, Scan):
+            rows.extend([storage_map[var][0].shape[0]
+                         for var in node.outputs])
+    f = theano.function(inputs, outputs,
+                        mode=Mode(linker=VM_Linker(callback=callback)))
+    f(*values)
+    return rows
+
+
+def rnn(checkpoint_gradient=-1, truncate_gradient=-1):
+    rng = numpy.random.RandomState(0)
+    W = theano.shared(rng.uniform(-.5, .5, (4, 4)))
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+
+    def step(x_t, h_tm1):
+        h = T.tanh(x_t + T.dot(h_tm1, W))
+        return h, (h_tm1 ** 2).sum()
+    (hs, sums), _ = theano.scan(step, sequences=x, outputs_info=[h0, None],
+                                checkpoint_gradient=checkpoint_gradient,
+                                truncate_gradient=truncate_gradient)
+    return [x, h0], W, hs, sums
+
+
+def test_truncate_gradient_buffers():
+    rng = numpy.random.RandomState(0)
+    values = [rng.rand(20, 4), rng.rand(4)]
+    inputs, W, hs, sums = rnn(truncate_gradient=3)
+    grads = T.grad(hs[-1].sum(), [W, inputs[1]])
+    # Only the states of the 3 last steps are kept
+    assert max(scan_buffers(inputs, grads, values)) == 4
+    no_save_mem = theano.compile.get_default_mode().excluding(
+        'scanOp_save_mem')
+    expected = theano.function(inputs, grads, mode=no_save_mem)(*values)
+    for a, b in zip(theano.function(inputs, grads)(*values), expected):
+        assert numpy.allclose(a, b)
+
+
+def test_truncate_gradient_mit_sot():
+    rng = numpy.random.RandomState(0)
+    x = T.vector('x')
+    y0 = T.matrix('y0')
+    ys, _ = theano.scan(lambda x_t, y_tm3, y_tm1: T.tanh(y_tm3 * x_t + y_tm1),
+                        sequences=x,
+                        outputs_info=dict(initial=y0, taps=[-3, -1]),
+                        truncate_gradient=4)
+    grads = T.grad(ys[-1].sum() + ys[2].sum(), [x, y0])
+    values = [rng.rand(10), rng.rand(3, 2)]
+    no_save_mem = theano.compile.get_default_mode().excluding(
+        'scanOp_save_mem')
+    expected = theano.function([x, y0], grads, mode=no_save_mem)(*values)
+    for a, b in zip(theano.function([x, y0], grads)(*values), expected):
+        assert numpy.allclose(a, b)
+
+
+def test_checkpoint_gradient_rnn():
+    rng = numpy.random.RandomState(0)
+    values = [rng.rand(10, 4), rng.rand(4)]
+    inputs, W, hs, sums = rnn()
+    cost = hs[-1].sum() + (hs ** 2).sum() + sums.sum()
+    expected = theano.function(inputs,
+                               T.grad(cost, inputs + [W]))(*values)
+    # The last segment is shorter, a single segment, one step per segment
+    for k in (3, 5, 20, 1):
+        inputs, W, hs, sums = rnn(checkpoint_gradient=k)
+        cost = hs[-1].sum() + (hs ** 2).sum() + sums.sum()
+        f = theano.function(inputs, T.grad(cost, inputs + [W]))
+        for a, b in zip(f(*values), expected):
+            assert a.shape == b.shape
+            assert numpy.allclose(a, b)
+
+
+def test_checkpoint_gradient_mit_sot():
+    rng = numpy.random.RandomState(0)
+    x = T.vector('x')
+    y0 = T.matrix('y0')
+    W = T.matrix('W')
+    n = T.iscalar('n')
+    values = [rng.rand(9), rng.rand(3, 4), rng.rand(4, 4) * .3, 7]
+
+    def grads(checkpoint_gradient):
+        # An integer non sequence, and fewer steps than the sequence
+        ys, _ = theano.scan(
+            lambda x_t, y_tm3, y_tm1, W, n:
+                T.tanh(T.dot(y_tm3 * x_t + y_tm1, W)) * (n - 6),
+            sequences=x,
+            outputs_info=dict(initial=y0, taps=[-3, -1]),
+            non_sequences=[W, n],
+            n_steps=n,
+            go_backwards=True,
+            checkpoint_gradient=checkpoint_gradient)
+        cost = (ys ** 2).sum() + ys[-1].sum()
+        f = theano.function([x, y0, W, n], T.grad(cost, [x, y0, W]))
+        return f(*values)
+    expected = grads(-1)
+    for k in (2, 4):
+        for a, b in zip(grads(k), expected):
+            assert numpy.allclose(a, b)
+
+
+def test_checkpoint_gradient_buffers():
+    rng = numpy.random.RandomState(0)
+    values = [rng.rand(100, 4), rng.rand(4)]
+    inputs, W, hs, sums = rnn(checkpoint_gradient=10)
+    grads = T.grad(hs[-1].sum(), [W, inputs[1]])
+    # The states are kept every 10 steps, and computed again 10 by 10
+    assert max(scan_buffers(inputs, grads, values)) <= 11
+
+
+def test_checkpoint_gradient_ignored():
+    # The update of `count` is an integer state, the gradient keeps all the
+    # states
+    rng = numpy.random.RandomState(0)
+    count = theano.shared(0)
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+    values = [rng.rand(6, 3), rng.rand(3)]
+    results = []
+    for k in (-1, 2):
+        hs, updates = theano.scan(
+            lambda x_t, h_tm1: (T.tanh(x_t * h_tm1), {count: count + 1}),
+            sequences=x, outputs_info=h0, checkpoint_gradient=k)
+        f = theano.function([x, h0], T.grad(hs[-1].sum(), [x, h0]),
+                            updates=updates)
+        results.append(f(*values))
+    for a, b in zip(*results):
+        assert numpy.allclose(a, b)
@@ -0,0 +1,122 @@
+import numpy
+from nose.plugins.skip import SkipTest
+
+import theano
+import theano.tensor as T
+from theano.scan_module.scan_op import Scan
+
+
+def function(inputs, outputs, fused, updates=None):
+    fused_flag = theano.config.scan.fused
+    theano.config.scan.fused = fused
+    try:
+        return theano.function(inputs, outputs, updates=updates)
+    finally:
+        theano.config.scan.fused = fused_flag
+
+
+def fused_scans(f):
+    return [node for node in f.maker.fgraph.toposort()
+            if isinstance(node.op, Scan) and node.op.fused]
+
+
+def check(inputs, outputs, values, n_fused=1):
+    if not theano.config.cxx:
+        raise SkipTest('The fused scans need a C++ compiler')
+    f = function(inputs, outputs, True)
+    assert len(fused_scans(f)) == n_fused
+    expected = function(inputs, outputs, False)(*values)
+    # Twice, the second call reuses the buffers of the first one
+    for i in range(2):
+        for a, b in zip(f(*values), expected):
+            assert a.shape == b.shape
+            assert numpy.allclose(a, b)
+
+
+def test_rnn():
+    rng = numpy.random.RandomState(0)
+    W = theano.shared(rng.uniform(-.5, .5, (5, 5)))
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+
+    def step(x_t, h_tm1):
+        h = T.tanh(x_t + T.dot(h_tm1, W))
+        return h, h.sum()
+    (hs, sums), _ = theano.scan(step, sequences=x,
+                                outputs_info=[h0, None])
+    check([x, h0], [hs, sums], [rng.rand(7, 5), rng.rand(5)])
+    # Only the last state is kept
+    check([x, h0], [hs[-1]], [rng.rand(7, 5), rng.rand(5)])
+
+
+def test_mit_sot_backwards():
+    rng = numpy.random.RandomState(0)
+    x = T.vector('x')
+    y0 = T.matrix('y0')
+    ys, _ = theano.scan(lambda x_t, y_tm3, y_tm1: y_tm3 * x_t + y_tm1,
+                        sequences=x,
+                        outputs_info=dict(initial=y0, taps=[-3, -1]),
+                        go_backwards=True)
+    check([x, y0], [ys], [rng.rand(6), rng.rand(3, 4)])
+    # With a circular buffer, a tap is read in the slot of the output
+    check([x, y0], [ys[-1]], [rng.rand(6), rng.rand(3, 4)])
+
+
+def test_while():
+    x = T.scalar('x')
+    ys, _ = theano.scan(lambda y: (y * 2, theano.scan_module.until(y > 50)),
+                        outputs_info=x, n_steps=20)
+    check([x], [ys], [numpy.asarray(1.)])
+
+
+def test_shared_updates():
+    rng = numpy.random.RandomState(0)
+    acc = theano.shared(numpy.zeros(3))
+    x = T.matrix('x')
+    ys, updates = theano.scan(
+        lambda x_t: (x_t * 2, {acc: acc + x_t}), sequences=x)
+    f = function([x], ys, True, updates=updates)
+    xv = rng.rand(4, 3)
+    assert numpy.allclose(f(xv), xv * 2)
+    assert numpy.allclose(acc.get_value(), xv.sum(0))
+    if theano.config.cxx:
+        assert fused_scans(f)
+
+
+def test_not_fused():
+    # A scan with an inner scan is not fused
+    rng = numpy.random.RandomState(0)
+    x = T.matrix('x')
+
+    def inner(row):
+        return theano.scan(lambda v, acc: acc + v, sequences=row,
+                           outputs_info=T.zeros_like(row[0]))[0][-1]
+    sums, _ = theano.scan(inner, sequences=x)
+    check([x], [sums], [rng.rand(3, 4)], n_fused=0)
+
+
+def test_error():
+    if not theano.config.cxx:
+        raise SkipTest('The fused scans need a C++ compiler')
+    W = T.matrix('W')
+    h0 = T.vector('h0')
+    hs, _ = theano.scan(lambda h: T.dot(h, W), outputs_info=h0, n_steps=3)
+    f = function([W, h0], hs, True)
+    assert fused_scans(f)
+    try:
+        f(numpy.ones((2, 2)), numpy.ones(3))
+    except ValueError:
+        pass
+    else:
+        assert False
+
+
+def test_pickle():
+    import cPickle
+    x = T.vector('x')
+    ys, _ = theano.scan(lambda x_t, y_tm1: x_t + y_tm1, sequences=x,
+                        outputs_info=T.zeros_like(x[0]))
+    f = function([x], ys, True)
+    g = cPickle.loads(cPickle.dumps(f, -1))
+    xv = numpy.arange(4.)
+    assert numpy.allclose(g(xv), f(xv))
@@ -0,0 +1,139 @@
+import numpy
+from nose.tools import assert_raises
+
+import theano
+import theano.tensor as T
+from theano.scan_module import vectorize
+
+
+def rnn():
+    rng = numpy.random.RandomState(0)
+    W = theano.shared(rng.uniform(-.5, .5, (4, 3)))
+    U = theano.shared(rng.uniform(-.5, .5, (3, 3)))
+    x = T.matrix('x')
+    h0 = T.vector('h0')
+
+    def step(x_t, h_tm1):
+        h = T.tanh(T.dot(x_t, W) + T.dot(h_tm1, U))
+        return h, h.sum()
+    (hs, sums), _ = theano.scan(step, sequences=x, outputs_info=[h0, None])
+    return x, h0, hs, sums
+
+
+def test_rnn():
+    rng = numpy.random.RandomState(0)
+    xv = rng.rand(5, 7, 4)
+    hv = rng.rand(5, 3)
+    x, h0, hs, sums = rnn()
+    f = theano.function([x, h0], [hs, sums])
+    X = T.tensor3('X')
+    H0 = T.matrix('H0')
+    g = theano.function([X, H0], vectorize([hs, sums], {x: X, h0: H0}))
+    batch_hs, batch_sums = g(xv, hv)
+    assert batch_hs.shape == (5, 7, 3)
+    for i in range(5):
+        one_hs, one_sums = f(xv[i], hv[i])
+        assert numpy.allclose(batch_hs[i], one_hs)
+        assert numpy.allclose(batch_sums[i], one_sums)
+
+    # The same initial state for all the sequences
+    g = theano.function([X, h0], vectorize(hs[-1], {x: X}))
+    last = g(xv, hv[0])
+    for i in range(5):
+        assert numpy.allclose(last[i], f(xv[i], hv[0])[0][-1])
+
+
+def test_mask():
+    rng = numpy.random.RandomState(0)
+    xv = rng.rand(4, 6, 4)
+    hv = rng.rand(4, 3)
+    lengths = [6, 2, 4, 1]
+    mv = numpy.asarray([[t < l for t in range(6)] for l in lengths],
+                       dtype=theano.config.floatX)
+    x, h0, hs, sums = rnn()
+    f = theano.function([x, h0], [hs, sums])
+    X = T.tensor3('X')
+    H0 = T.matrix('H0')
+    M = T.matrix('M')
+    g = theano.function([X, H0, M], vectorize([hs[-1], sums],
+                                              {x: X, h0: H0}, mask=M))
+    last, batch_sums = g(xv, hv, mv)
+    for i, l in enumerate(lengths):
+        one_hs, one_sums = f(xv[i, :l], hv[i])
+        assert numpy.allclose(last[i], one_hs[-1])
+        assert numpy.allclose(batch_sums[i, :l], one_sums)
+        assert numpy.all(batch_sums[i, l:] == 0)
+
+
+def test_mit_sot_backwards():
+    rng = numpy.random.RandomState(0)
+    x = T.vector('x')
+    y0 = T.matrix('y0')
+    w = T.vector('w')
+    ys, _ = theano.scan(lambda x_t, y_tm3, y_tm1, w:
+                            T.tanh(y_tm3 * x_t + y_tm1 * w),
+                        sequences=x,
+                        outputs_info=dict(initial=y0, taps=[-3, -1]),
+                        non_sequences=w,
+                        go_backwards=True)
+    cost = (ys ** 2).sum(axis=1)
+    f = theano.function([x, y0, w], cost)
+    X = T.matrix('X')
+    W = T.matrix('W')
+    # A batch of sequences and of weights, the same initial states
+    g = theano.function([X, y0, W], vectorize(cost, {x: X, w: W}))
+    xv = rng.rand(3, 8)
+    yv = rng.rand(3, 2)
+    wv = rng.rand(3, 2)
+    out = g(xv, yv, wv)
+    for i in range(3):
+        assert numpy.allclose(out[i], f(xv[i], yv, wv[i]))
+
+
+def test_batched_weights():
+    # Both arguments of dot depend on the batch, and a nested scan
+    rng = numpy.random.RandomState(0)
+    v = T.vector('v')
+    A = T.matrix('A')
+
+    def power(a_t, v_tm1, A):
+        ws, _ = theano.scan(lambda w_tm1, A: T.dot(A, w_tm1),
+                            outputs_info=v_tm1, non_sequences=A, n_steps=2)
+        return ws[-1] * a_t
+    outs, _ = theano.scan(power, sequences=T.arange(1, 4), outputs_info=v,
+                          non_sequences=A)
+    f = theano.function([v, A], outs)
+    As = T.tensor3('As')
+    Vs = T.matrix('Vs')
+    g = theano.function([Vs, As], vectorize(outs, {v: Vs, A: As}))
+    vv = rng.rand(2, 3)
+    av = rng.rand(2, 3, 3) * .5
+    out = g(vv, av)
+    for i in range(2):
+        assert numpy.allclose(out[i], f(vv[i], av[i]))
+
+
+def test_grad():
+    rng = numpy.random.RandomState(0)
+    x, h0, hs, sums = rnn()
+    X = T.tensor3('X')
+    H0 = T.matrix('H0')
+    cost = vectorize(hs[-1].sum(), {x: X, h0: H0}).sum()
+    g = theano.function([X, H0], T.grad(cost, [X, H0]))
+    f = theano.function([x, h0], T.grad(hs[-1].sum(), [x, h0]))
+    xv = rng.rand(3, 5, 4)
+    hv = rng.rand(3, 3)
+    gx, gh = g(xv, hv)
+    for i in range(3):
+        one_gx, one_gh = f(xv[i], hv[i])
+        assert numpy.allclose(gx[i], one_gx)
+        assert numpy.allclose(gh[i], one_gh)
+
+
+def test_not_implemented():
+    x = T.matrix('x')
+    n = T.iscalar('n')
+    # The number of steps can not depend on the batch
+    ys, _ = theano.scan(lambda x_t: x_t * 2, sequences=x, n_steps=n)
+    assert_raises(NotImplementedError, vectorize, ys, {n: T.ivector()})
+    assert_raises(TypeError, vectorize, ys, {x: T.matrix()})
@@ -60,6 +60,6 @@ from theano.tensor import nnet  # used for softmax, sigmoid, etc.
 from theano.gradient import Rop, Lop, grad, numeric_grad, verify_grad, \
     jacobian, hessian
 
-from theano.tensor.sort import sort, argsort
+from theano.tensor.sort import sort, argsort, topk
 from theano.tensor.extra_ops import (DiffOp, bincount, squeeze,
                        repeat, bartlett, fill_diagonal, cumsum, cumprod)
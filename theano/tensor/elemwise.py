@@ -1163,6 +1163,9 @@ class Elemwise(OpenMPOp):
                 %(loop)s
             }
             """ % locals()
+        if sub['fail'] not in loop:
+            # The loop only reads and writes the data of the arrays.
+            loop = "\n".join([sub['begin_nogil'], loop, sub['end_nogil']])
         return decl, checks, alloc, loop
 
     def c_code(self, node, nodename, inames, onames, sub):
@@ -1181,7 +1184,7 @@ class Elemwise(OpenMPOp):
         return support_code
 
     def c_code_cache_version_apply(self, node):
-        version = [11]  # the version corresponding to the c code in this Op
+        version = [12]  # the version corresponding to the c code in this Op
 
         # now we insert versions for the ops on which we depend...
         scalar_node = Apply(self.scalar_op,
@@ -1585,6 +1588,8 @@ for(int i=0;i<PyArray_NDIM(%(iname)s);i++){
         loop = cgen.make_loop_careduce(
                 [order, range(nnested) + ['x'] * len(axis)],
                 [idtype, adtype], all_code, sub)
+        if sub['fail'] not in loop:
+            loop = "\n".join([sub['begin_nogil'], loop, sub['end_nogil']])
 
         end = ""
         if adtype != odtype:
@@ -1604,7 +1609,7 @@ for(int i=0;i<PyArray_NDIM(%(iname)s);i++){
         return ['<vector>', '<algorithm>']
 
     def c_code_cache_version_apply(self, node):
-        version = [5]  # the version corresponding to the c code in this Op
+        version = [6]  # the version corresponding to the c code in this Op
 
         # now we insert versions for the ops on which we depend...
         scalar_node = Apply(self.scalar_op,
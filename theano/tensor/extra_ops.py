@@ -5,6 +5,7 @@ import theano
 from theano.tensor import basic
 from theano import gof, scalar
 tensor = basic
+from theano.gof.utils import MethodNotDefined
 from theano.gradient import DisconnectedType
 
 
@@ -247,6 +248,119 @@ class DiffOp(theano.Op):
         z = output_storage[0]
         z[0] = np.diff(x, n=self.n, axis=self.axis)
 
+    def c_headers(self):
+        return ['<vector>']
+
+    def c_code(self, node, name, inames, onames, sub):
+        ndim = node.inputs[0].ndim
+        if (self.n == 0 or ndim == 0 or not -ndim <= self.axis < ndim or
+                node.inputs[0].dtype.startswith('complex')):
+            raise MethodNotDefined()
+        x, = inames
+        z, = onames
+        n = self.n
+        axis = self.axis % ndim
+        fail = sub['fail']
+        begin_nogil = sub['begin_nogil']
+        end_nogil = sub['end_nogil']
+        if n == 1:
+            compute = """
+            for (npy_intp o = 0; o < outer; ++o)
+            {
+                const dtype_%(x)s* src = px + o * len * inner;
+                dtype_%(z)s* dst = pz + o * n_out * inner;
+                for (npy_intp i = 0; i < n_out; ++i)
+                    for (npy_intp k = 0; k < inner; ++k)
+                        dst[i * inner + k] = (src[(i + 1) * inner + k] -
+                                              src[i * inner + k]);
+            }
+            """ % locals()
+        else:
+            # Difference blocks of consecutive elements of the inner
+            # dimensions in a buffer that holds the whole axis, so that the
+            # loops run on contiguous memory.
+            compute = """
+            npy_intp block = inner < 256 ? inner : 256;
+            std::vector<dtype_%(x)s> buf(len * block);
+            for (npy_intp o = 0; o < outer && inner == 1; ++o)
+            {
+                const dtype_%(x)s* src = px + o * len;
+                dtype_%(z)s* dst = pz + o * n_out;
+                for (npy_intp i = 0; i < len; ++i)
+                    buf[i] = src[i];
+                for (npy_intp j = 1; j <= %(n)s; ++j)
+                    for (npy_intp i = 0; i < len - j; ++i)
+                        buf[i] = buf[i + 1] - buf[i];
+                for (npy_intp i = 0; i < n_out; ++i)
+                    dst[i] = buf[i];
+            }
+            for (npy_intp o = 0; o < outer && inner > 1; ++o)
+            {
+                for (npy_intp k0 = 0; k0 < inner; k0 += block)
+                {
+                    npy_intp b = inner - k0 < block ? inner - k0 : block;
+                    const dtype_%(x)s* src = px + o * len * inner + k0;
+                    dtype_%(z)s* dst = pz + o * n_out * inner + k0;
+                    for (npy_intp i = 0; i < len; ++i)
+                        for (npy_intp k = 0; k < b; ++k)
+                            buf[i * b + k] = src[i * inner + k];
+                    for (npy_intp j = 1; j <= %(n)s; ++j)
+                        for (npy_intp i = 0; i < len - j; ++i)
+                            for (npy_intp k = 0; k < b; ++k)
+                                buf[i * b + k] = (buf[(i + 1) * b + k] -
+                                                  buf[i * b + k]);
+                    for (npy_intp i = 0; i < n_out; ++i)
+                        for (npy_intp k = 0; k < b; ++k)
+                            dst[i * inner + k] = buf[i * b + k];
+                }
+            }
+            """ % locals()
+        return """
+        {
+        PyArrayObject* xc = (PyArrayObject*) PyArray_GETCONTIGUOUS(%(x)s);
+        if (!xc)
+            %(fail)s;
+        int nd = PyArray_NDIM(xc);
+        npy_intp dims[NPY_MAXDIMS];
+        for (int i = 0; i < nd; ++i)
+            dims[i] = PyArray_DIMS(xc)[i];
+        npy_intp len = dims[%(axis)s];
+        npy_intp n_out = len > %(n)s ? len - %(n)s : 0;
+        dims[%(axis)s] = n_out;
+        if (!(%(z)s && PyArray_IS_C_CONTIGUOUS(%(z)s) &&
+              PyArray_CompareLists(PyArray_DIMS(%(z)s), dims, nd)))
+        {
+            Py_XDECREF(%(z)s);
+            %(z)s = (PyArrayObject*) PyArray_SimpleNew(nd, dims,
+                                                       type_num_%(x)s);
+            if (!%(z)s)
+            {
+                Py_DECREF(xc);
+                %(fail)s;
+            }
+        }
+        // Both arrays are C contiguous: see them as (outer, axis, inner).
+        npy_intp outer = 1;
+        for (int i = 0; i < %(axis)s; ++i)
+            outer *= dims[i];
+        npy_intp inner = 1;
+        for (int i = %(axis)s + 1; i < nd; ++i)
+            inner *= dims[i];
+        const dtype_%(x)s* px = (const dtype_%(x)s*) PyArray_DATA(xc);
+        dtype_%(z)s* pz = (dtype_%(z)s*) PyArray_DATA(%(z)s);
+        if (n_out > 0 && inner > 0)
+        {
+            %(begin_nogil)s
+            %(compute)s
+            %(end_nogil)s
+        }
+        Py_DECREF(xc);
+        }
+        """ % locals()
+
+    def c_code_cache_version(self):
+        return (1,)
+
     def grad(self, inputs, outputs_gradients):
         inputs = inputs[0]
 
@@ -372,6 +486,87 @@ class BinCountOp(theano.Op):
 
         z[0] = theano._asarray(out, dtype=node.outputs[0].dtype)
 
+    def c_code(self, node, name, inames, onames, sub):
+        x, weights = inames
+        z, = onames
+        minlength = self.minlength or 0
+        fail = sub['fail']
+        begin_nogil = sub['begin_nogil']
+        end_nogil = sub['end_nogil']
+        if isinstance(node.inputs[1].type, basic.TensorType):
+            get_weights = """
+            if (PyArray_DIMS(%(weights)s)[0] != n_x)
+            {
+                PyErr_Format(PyExc_ValueError,
+                             "bincount: got %%ld weights for %%ld elements "
+                             "of x", (long)PyArray_DIMS(%(weights)s)[0],
+                             (long)n_x);
+                Py_DECREF(xc);
+                %(fail)s;
+            }
+            PyArrayObject* wc = (PyArrayObject*) PyArray_GETCONTIGUOUS(
+                %(weights)s);
+            if (!wc)
+            {
+                Py_DECREF(xc);
+                %(fail)s;
+            }
+            const dtype_%(weights)s* pw = (const dtype_%(weights)s*)
+                PyArray_DATA(wc);
+            """ % locals()
+            count = "(dtype_%(z)s) pw[i]" % locals()
+            free_weights = "Py_DECREF(wc);"
+        else:
+            get_weights = ""
+            count = "1"
+            free_weights = ""
+        return """
+        {
+        PyArrayObject* xc = (PyArrayObject*) PyArray_GETCONTIGUOUS(%(x)s);
+        if (!xc)
+            %(fail)s;
+        npy_intp n_x = PyArray_DIMS(xc)[0];
+        const dtype_%(x)s* px = (const dtype_%(x)s*) PyArray_DATA(xc);
+        npy_intp n_bins = %(minlength)s;
+        for (npy_intp i = 0; i < n_x; ++i)
+        {
+            if (px[i] < 0)
+            {
+                PyErr_SetString(PyExc_ValueError,
+                    "The first argument of bincount must be non-negative");
+                Py_DECREF(xc);
+                %(fail)s;
+            }
+            if ((npy_intp)px[i] >= n_bins)
+                n_bins = (npy_intp)px[i] + 1;
+        }
+        %(get_weights)s
+        if (!(%(z)s && PyArray_IS_C_CONTIGUOUS(%(z)s) &&
+              PyArray_DIMS(%(z)s)[0] == n_bins))
+        {
+            Py_XDECREF(%(z)s);
+            %(z)s = (PyArrayObject*) PyArray_SimpleNew(1, &n_bins,
+                                                       type_num_%(z)s);
+        }
+        if (%(z)s)
+        {
+            dtype_%(z)s* pz = (dtype_%(z)s*) PyArray_DATA(%(z)s);
+            %(begin_nogil)s
+            memset(pz, 0, n_bins * sizeof(dtype_%(z)s));
+            for (npy_intp i = 0; i < n_x; ++i)
+                pz[(npy_intp)px[i]] += %(count)s;
+            %(end_nogil)s
+        }
+        Py_DECREF(xc);
+        %(free_weights)s
+        if (!%(z)s)
+            %(fail)s;
+        }
+        """ % locals()
+
+    def c_code_cache_version(self):
+        return (2,)
+
     def grad(self, inputs, outputs_gradients):
         output = self(*inputs)
 
@@ -493,6 +688,104 @@ class RepeatOp(theano.Op):
         z = output_storage[0]
         z[0] = np.repeat(x, repeats=repeats, axis=self.axis)
 
+    def c_code(self, node, name, inames, onames, sub):
+        x, repeats = inames
+        z, = onames
+        fail = sub['fail']
+        begin_nogil = sub['begin_nogil']
+        end_nogil = sub['end_nogil']
+        ndim = node.inputs[0].ndim
+        if self.axis is None:
+            # Like numpy, repeat the elements of the flattened input.
+            get_a = ("(PyArrayObject*) PyArray_Ravel(%(x)s, NPY_CORDER)" %
+                     locals())
+            axis = 0
+        else:
+            if not -ndim <= self.axis < ndim:
+                raise MethodNotDefined()
+            get_a = ("(PyArrayObject*) PyArray_GETCONTIGUOUS(%(x)s)" %
+                     locals())
+            axis = self.axis % ndim
+        if node.inputs[1].ndim == 0:
+            n_r = "1"
+        else:
+            n_r = "PyArray_DIMS(%(repeats)s)[0]" % locals()
+        return """
+        {
+        PyArrayObject* a = %(get_a)s;
+        if (!a)
+            %(fail)s;
+        npy_intp len = PyArray_DIMS(a)[%(axis)s];
+        npy_intp n_r = %(n_r)s;
+        if (n_r != 1 && n_r != len)
+        {
+            PyErr_Format(PyExc_ValueError,
+                         "repeat: got %%ld repeats for %%ld elements",
+                         (long)n_r, (long)len);
+            Py_DECREF(a);
+            %(fail)s;
+        }
+        // The repeats of a vector of length 1 are broadcasted.
+        const char* pr = PyArray_BYTES(%(repeats)s);
+        npy_intp sr = n_r == 1 ? 0 : PyArray_STRIDES(%(repeats)s)[0];
+        npy_intp dims[NPY_MAXDIMS];
+        for (int i = 0; i < PyArray_NDIM(a); ++i)
+            dims[i] = PyArray_DIMS(a)[i];
+        dims[%(axis)s] = 0;
+        for (npy_intp i = 0; i < len; ++i)
+        {
+            npy_intp r = (npy_intp)*(dtype_%(repeats)s*)(pr + i * sr);
+            if (r < 0)
+            {
+                PyErr_SetString(PyExc_ValueError,
+                                "negative dimensions are not allowed");
+                Py_DECREF(a);
+                %(fail)s;
+            }
+            dims[%(axis)s] += r;
+        }
+        if (!(%(z)s && PyArray_IS_C_CONTIGUOUS(%(z)s) &&
+              PyArray_NDIM(%(z)s) == PyArray_NDIM(a) &&
+              PyArray_CompareLists(PyArray_DIMS(%(z)s), dims,
+                                   PyArray_NDIM(a))))
+        {
+            Py_XDECREF(%(z)s);
+            %(z)s = (PyArrayObject*) PyArray_SimpleNew(PyArray_NDIM(a), dims,
+                                                       type_num_%(x)s);
+            if (!%(z)s)
+            {
+                Py_DECREF(a);
+                %(fail)s;
+            }
+        }
+        // Both arrays are C contiguous: copy each block of the input
+        // below the axis once per repeat.
+        npy_intp outer = 1;
+        for (int i = 0; i < %(axis)s; ++i)
+            outer *= dims[i];
+        npy_intp chunk = PyArray_ITEMSIZE(a);
+        for (int i = %(axis)s + 1; i < PyArray_NDIM(a); ++i)
+            chunk *= dims[i];
+        const char* src = PyArray_BYTES(a);
+        char* dst = PyArray_BYTES(%(z)s);
+        %(begin_nogil)s
+        for (npy_intp o = 0; o < outer; ++o)
+        {
+            for (npy_intp i = 0; i < len; ++i, src += chunk)
+            {
+                npy_intp r = (npy_intp)*(dtype_%(repeats)s*)(pr + i * sr);
+                for (npy_intp j = 0; j < r; ++j, dst += chunk)
+                    memcpy(dst, src, chunk);
+            }
+        }
+        %(end_nogil)s
+        Py_DECREF(a);
+        }
+        """ % locals()
+
+    def c_code_cache_version(self):
+        return (1,)
+
     def connection_pattern(self, node):
 
         return [[True], [False]]
@@ -600,6 +893,40 @@ class Bartlett(gof.Op):
         out, = out_
         out[0] = numpy.bartlett(M)
 
+    def c_code(self, node, name, inames, onames, sub):
+        M, = inames
+        z, = onames
+        fail = sub['fail']
+        return """
+        {
+        npy_intp M = (npy_intp)((dtype_%(M)s*)PyArray_DATA(%(M)s))[0];
+        npy_intp dims[1] = {M > 0 ? M : 0};
+        if (!(%(z)s && PyArray_DIMS(%(z)s)[0] == dims[0]))
+        {
+            Py_XDECREF(%(z)s);
+            %(z)s = (PyArrayObject*) PyArray_SimpleNew(1, dims, NPY_FLOAT64);
+            if (!%(z)s)
+                %(fail)s;
+        }
+        char* pz = PyArray_BYTES(%(z)s);
+        npy_intp sz = PyArray_STRIDES(%(z)s)[0];
+        if (M == 1)
+            *(npy_float64*)pz = 1.;
+        else
+        {
+            // Computed in the same order as numpy.bartlett.
+            for (npy_intp i = 0; i < M; ++i)
+            {
+                npy_float64 v = 2. * i / (M - 1);
+                *(npy_float64*)(pz + i * sz) = i <= (M - 1) / 2. ? v : 2. - v;
+            }
+        }
+        }
+        """ % locals()
+
+    def c_code_cache_version(self):
+        return (1,)
+
     def infer_shape(self, node, in_shapes):
         temp = node.inputs[0]
         M = tensor.switch(tensor.lt(temp, 0),
@@ -635,13 +962,26 @@ def bartlett(M):
 
 class FillDiagonal(gof.Op):
     # See function fill_diagonal for docstring
+    def __init__(self, inplace=False):
+        self.inplace = inplace
+        if inplace:
+            self.destroy_map = {0: [0]}
+
     def __eq__(self, other):
-        return type(self) == type(other)
+        return type(self) == type(other) and self.inplace == other.inplace
 
     def __hash__(self):
-        return hash(type(self))
+        return hash(type(self)) ^ hash(self.inplace)
+
+    def __setstate__(self, d):
+        self.__dict__.update(d)
+        # Add default value to be able to reload old pickled objects.
+        if not hasattr(self, 'inplace'):
+            self.inplace = False
 
     def __str__(self):
+        if self.inplace:
+            return "%s{inplace}" % self.__class__.__name__
         return self.__class__.__name__
 
     def infer_shape(self, node, in_shapes):
@@ -663,7 +1003,10 @@ class FillDiagonal(gof.Op):
         return gof.Apply(self, [a, val], [a.type()])
 
     def perform(self, node, inputs, output_storage):
-        a = inputs[0].copy()
+        if self.inplace:
+            a = inputs[0]
+        else:
+            a = inputs[0].copy()
         val = inputs[1]
         if a.ndim == 2:
             # numpy.fill_diagonal up to date(including 1.6.2) have a
@@ -678,6 +1021,64 @@ class FillDiagonal(gof.Op):
 
         output_storage[0][0] = a
 
+    def c_code(self, node, name, inames, onames, sub):
+        a, val = inames
+        z, = onames
+        fail = sub['fail']
+        if self.inplace:
+            get_z = """
+            Py_XDECREF(%(z)s);
+            %(z)s = %(a)s;
+            Py_INCREF(%(z)s);
+            """ % locals()
+        else:
+            get_z = """
+            if (!(%(z)s && %(z)s != %(a)s &&
+                  PyArray_CompareLists(PyArray_DIMS(%(z)s),
+                                       PyArray_DIMS(%(a)s),
+                                       PyArray_NDIM(%(a)s))))
+            {
+                Py_XDECREF(%(z)s);
+                %(z)s = (PyArrayObject*) PyArray_SimpleNew(
+                    PyArray_NDIM(%(a)s), PyArray_DIMS(%(a)s),
+                    type_num_%(a)s);
+                if (!%(z)s)
+                    %(fail)s;
+            }
+            if (PyArray_CopyInto(%(z)s, %(a)s))
+                %(fail)s;
+            """ % locals()
+        return """
+        {
+        // Like numpy.fill_diagonal, more than 2 dimensions must be equal,
+        // but a matrix can be rectangular.
+        int nd = PyArray_NDIM(%(a)s);
+        npy_intp n_diag = PyArray_DIMS(%(a)s)[0];
+        for (int i = 1; i < nd; ++i)
+        {
+            if (nd > 2 && PyArray_DIMS(%(a)s)[i] != n_diag)
+            {
+                PyErr_SetString(PyExc_ValueError,
+                    "All dimensions of input must be of equal length");
+                %(fail)s;
+            }
+            if (PyArray_DIMS(%(a)s)[i] < n_diag)
+                n_diag = PyArray_DIMS(%(a)s)[i];
+        }
+        %(get_z)s
+        npy_intp step = 0;
+        for (int i = 0; i < nd; ++i)
+            step += PyArray_STRIDES(%(z)s)[i];
+        dtype_%(z)s v = ((dtype_%(val)s*)PyArray_DATA(%(val)s))[0];
+        char* pz = PyArray_BYTES(%(z)s);
+        for (npy_intp i = 0; i < n_diag; ++i)
+            *(dtype_%(z)s*)(pz + i * step) = v;
+        }
+        """ % locals()
+
+    def c_code_cache_version(self):
+        return (1,)
+
     def grad(self, inp, cost_grad):
         """
         Note: The gradient is currently implemented for matrices
@@ -1,8 +1,15 @@
+import os
+import Queue
+import struct
+import threading
+import zipfile
+
 import numpy
 from theano import gof
 from theano.gof import Constant, Generic, Op
 from theano.gof.sched import key_to_cmp
 from theano.tensor import tensor
+from theano.tensor.basic import as_tensor_variable, discrete_dtypes
 import theano
 ##########################
 # Disk Access
@@ -80,6 +87,307 @@ def load(path, dtype, broadcastable, mmap_mode=None):
 
     return LoadFromDisk(dtype, broadcastable, mmap_mode)(path)
 
+
+# Header of the arrays read by LoadSliceFromDisk, by (path, member):
+# (mtime, size, shape, fortran_order, dtype, data offset in the file), where
+# the offset is None for the compressed members of a .npz file, that can not
+# be read in place.
+_array_headers = {}
+_array_headers_lock = threading.Lock()
+
+
+def _read_array_header(f):
+    version = numpy.lib.format.read_magic(f)
+    if version == (1, 0):
+        return numpy.lib.format.read_array_header_1_0(f)
+    return numpy.lib.format.read_array_header_2_0(f)
+
+
+def _npz_member_name(member):
+    if member.endswith('.npy'):
+        return member
+    return member + '.npy'
+
+
+def _array_header(path, member):
+    st = os.stat(path)
+    key = (path, member)
+    _array_headers_lock.acquire()
+    try:
+        header = _array_headers.get(key)
+    finally:
+        _array_headers_lock.release()
+    if header is not None and header[:2] == (st.st_mtime, st.st_size):
+        return header[2:]
+    if member is None:
+        f = open(path, 'rb')
+        start = 0
+    else:
+        zf = zipfile.ZipFile(path)
+        try:
+            info = zf.getinfo(_npz_member_name(member))
+            if info.compress_type == zipfile.ZIP_STORED:
+                f = open(path, 'rb')
+                # The data of the member follows its local file header,
+                # which has a fixed part of 30 bytes, then the file name
+                # and the extra field.
+                f.seek(info.header_offset)
+                local = f.read(30)
+                if local[:4] != 'PK\x03\x04':
+                    f.close()
+                    raise ValueError("Bad zip local header for %s in %s" %
+                                     (member, path))
+                name_len, extra_len = struct.unpack('<HH', local[26:30])
+                start = info.header_offset + 30 + name_len + extra_len
+            else:
+                f = zf.open(info)
+                start = None
+        finally:
+            zf.close()
+    try:
+        if start is not None:
+            f.seek(start)
+        shape, fortran, dtype = _read_array_header(f)
+        if start is not None:
+            offset = f.tell()
+        else:
+            offset = None
+    finally:
+        f.close()
+    header = (st.st_mtime, st.st_size, shape, fortran, dtype, offset)
+    _array_headers_lock.acquire()
+    try:
+        _array_headers[key] = header
+    finally:
+        _array_headers_lock.release()
+    return header[2:]
+
+
+def _read_compressed_rows(path, member, start, stop):
+    """
+    Return the rows [start:stop] of the compressed member of a .npz file,
+    decompressing it up to the last of them.
+    """
+    zf = zipfile.ZipFile(path)
+    try:
+        f = zf.open(_npz_member_name(member))
+        try:
+            shape, fortran, dtype = _read_array_header(f)
+            if fortran:
+                # The rows are not contiguous in the member.
+                array = numpy.fromstring(f.read(), dtype=dtype)
+                return array.reshape(shape, order='F')[start:stop].copy()
+            row_bytes = dtype.itemsize
+            for d in shape[1:]:
+                row_bytes *= d
+            n_bytes = start * row_bytes
+            while n_bytes > 0:
+                n_bytes -= len(f.read(min(n_bytes, 1 << 20)))
+            data = f.read((stop - start) * row_bytes)
+        finally:
+            f.close()
+    finally:
+        zf.close()
+    return numpy.fromstring(data, dtype=dtype).reshape(
+        (stop - start,) + tuple(shape[1:]))
+
+
+# The read-ahead requests, (path, offset, n_bytes), are served by one daemon
+# thread that reads them from the file, so that they are in the OS cache
+# when a later call maps them.
+_read_ahead_queue = Queue.Queue(maxsize=4)
+_read_ahead_thread = []
+
+
+def _read_ahead_worker():
+    while True:
+        path, offset, n_bytes = _read_ahead_queue.get()
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.lseek(fd, offset, 0)
+                while n_bytes > 0 and os.read(fd, min(n_bytes, 1 << 20)):
+                    n_bytes -= 1 << 20
+            finally:
+                os.close(fd)
+        except (IOError, OSError):
+            pass
+
+
+def _read_ahead(path, offset, n_bytes):
+    if not _read_ahead_thread:
+        _array_headers_lock.acquire()
+        try:
+            if not _read_ahead_thread:
+                thread = threading.Thread(target=_read_ahead_worker)
+                thread.setDaemon(True)
+                thread.start()
+                _read_ahead_thread.append(thread)
+        finally:
+            _array_headers_lock.release()
+    try:
+        _read_ahead_queue.put_nowait((path, offset, n_bytes))
+    except Queue.Full:
+        # The worker is behind: this request is only an optimization.
+        pass
+
+
+class LoadSliceFromDisk(Op):
+    """
+    An operation to load the slice [start:stop] of the first dimension of
+    an array stored in a .npy file, or in a member of a .npz file.
+
+    Only the rows of the slice are read from the file. With mmap_mode 'c',
+    they are mapped in memory copy-on-write, without any copy, unless the
+    data is not aligned for its dtype in the file. With mmap_mode None,
+    they are read into a new array. Members of a .npz file made by
+    numpy.savez_compressed can not be mapped in memory: they need
+    mmap_mode None, and each call decompresses the member up to the last
+    row of its slice.
+
+    With read_ahead, the rows of the next slice of the same length are read
+    from the file in a background thread after each call, so that they
+    are in the OS cache when the next call asks for them.
+
+    See Also
+        load_slice
+
+    @note: Non-differentiable.
+    """
+    def __init__(self, dtype, broadcastable, mmap_mode='c', member=None,
+                 read_ahead=False):
+        self.dtype = numpy.dtype(dtype)
+        self.broadcastable = tuple(broadcastable)
+        if not self.broadcastable:
+            raise ValueError("LoadSliceFromDisk can not slice a scalar")
+        if mmap_mode not in (None, 'c'):
+            raise ValueError("The only supported values for mmap_mode "
+                             "are None and 'c', got %s" % mmap_mode)
+        self.mmap_mode = mmap_mode
+        self.member = member
+        self.read_ahead = read_ahead
+        self._info = (dtype, self.broadcastable, mmap_mode, member,
+                      read_ahead)
+
+    def __eq__(self, other):
+        return (type(self) == type(other) and self._info == other._info)
+
+    def __hash__(self):
+        return hash((type(self),) + self._info)
+
+    def make_node(self, path, start, stop):
+        if isinstance(path, str):
+            path = Constant(Generic(), path)
+        start = as_tensor_variable(start)
+        stop = as_tensor_variable(stop)
+        for i in (start, stop):
+            if i.ndim != 0 or i.dtype not in discrete_dtypes:
+                raise TypeError("start and stop must be integer scalars", i)
+        return gof.Apply(self, [path, start, stop],
+                         [tensor(self.dtype,
+                                 broadcastable=self.broadcastable)])
+
+    def perform(self, node, inp, out):
+        path, start, stop = inp
+        if self.member is None and path.split('.')[-1] == 'npz':
+            raise ValueError("Expected a .npy file, got %s instead" % path)
+        shape, fortran, dtype, offset = _array_header(path, self.member)
+        if dtype != self.dtype:
+            raise TypeError("Expected an array of type %s, got %s instead" %
+                            (self.dtype, dtype))
+        if len(shape) != len(self.broadcastable):
+            raise TypeError("Expected an array of %d dimensions, got %d "
+                            "instead" % (len(self.broadcastable), len(shape)))
+        start, stop, step = slice(int(start), int(stop)).indices(shape[0])
+        stop = max(start, stop)
+        out_shape = (stop - start,) + tuple(shape[1:])
+        if offset is None:
+            if self.mmap_mode is not None:
+                raise ValueError(
+                    "The member %s of %s is compressed, so it can not be "
+                    "mapped in memory. Save the arrays with numpy.savez "
+                    "instead of numpy.savez_compressed, or use "
+                    "mmap_mode=None to decompress the rows of each slice." %
+                    (self.member, path))
+            out[0][0] = _read_compressed_rows(path, self.member, start, stop)
+            return
+        if start == stop:
+            result = numpy.empty(out_shape, dtype=dtype)
+        elif fortran:
+            # The rows are not contiguous in the file.
+            result = numpy.memmap(path, dtype=dtype, mode='c',
+                                  offset=offset, shape=shape,
+                                  order='F')[start:stop]
+            if self.mmap_mode is None:
+                result = numpy.array(result)
+        else:
+            row_bytes = dtype.itemsize
+            for d in shape[1:]:
+                row_bytes *= d
+            if self.mmap_mode is None:
+                f = open(path, 'rb')
+                try:
+                    f.seek(offset + start * row_bytes)
+                    result = numpy.fromfile(
+                        f, dtype=dtype,
+                        count=out_shape[0] * row_bytes // dtype.itemsize
+                    ).reshape(out_shape)
+                finally:
+                    f.close()
+            else:
+                result = numpy.memmap(path, dtype=dtype, mode='c',
+                                      offset=offset + start * row_bytes,
+                                      shape=out_shape)
+                if not result.flags.aligned:
+                    result = numpy.array(result)
+            if self.read_ahead and stop < shape[0]:
+                n_rows = min(stop - start, shape[0] - stop)
+                _read_ahead(path, offset + stop * row_bytes,
+                            n_rows * row_bytes)
+        out[0][0] = result
+
+    def do_constant_folding(self, node):
+        # That would copy the data of the file into the graph.
+        return False
+
+    def __str__(self):
+        return ("LoadSlice{dtype: %s, broadcastable: %s, mmap: %s, "
+                "member: %s, read_ahead: %s}" % self._info)
+
+
+def load_slice(path, start, stop, dtype, broadcastable, mmap_mode='c',
+               member=None, read_ahead=False):
+    """
+    Load the rows [start:stop] of an array from an .npy file, or from a
+    member of an .npz file.
+
+    :param path: A Generic symbolic variable, that will contain a string
+    :param start: integer scalar, the first row to load.
+    :param stop: integer scalar, one past the last row to load. Like for
+      Python slices, negative values count from the end, and the slice is
+      truncated to the rows of the array.
+    :param dtype: The data type of the array to be read.
+    :param broadcastable: The broadcastable pattern of the loaded slice.
+    :param mmap_mode: 'c' (the default) maps the rows of the slice into
+      virtual memory copy-on-write, without copying them. None reads them
+      into a new array. The compressed members of an .npz file (made by
+      numpy.savez_compressed) need None.
+    :param member: The name of the array in the .npz file, None for an
+      .npy file.
+    :param read_ahead: If True, read the next slice of the same length
+      from the file in a background thread after each call.
+
+    >>> from theano import *
+    >>> path = Variable(Generic())
+    >>> i = tensor.lscalar()
+    >>> x = tensor.load_slice(path, i * 100, (i + 1) * 100, 'float32',
+    ...                       (False, False), read_ahead=True)
+    >>> fn = function([path, i], x.mean(axis=0))
+    >>> fn("stored-array.npy", 3)  # rows 300 to 399
+    """
+    return LoadSliceFromDisk(dtype, broadcastable, mmap_mode, member,
+                             read_ahead)(path, start, stop)
+
 ##########################
 # MPI
 ##########################
@@ -958,7 +958,7 @@ class ConvOp(OpenMPOp):
         return ['<numpy/noprefix.h>', '<iostream>', '<sstream>']
 
     def c_code_cache_version(self):
-        return (10, self.openmp, blas.blas_header_version())
+        return (11, self.openmp, blas.blas_header_version())
 
     def c_support_code(self):
         return """
@@ -1380,6 +1380,7 @@ if (!PyArray_ISCONTIGUOUS(%(z)s))
     %(fail)s;
 }
 
+%(begin_nogil)s
 for(int b=0;b< %(self_bsize)s;b++){
   for(int n_kern=0;n_kern<%(self_nkern)s;n_kern++){
 
@@ -1499,6 +1500,7 @@ for(int b=0;b< %(self_bsize)s;b++){
     }
   }//for n_kern
 }//for b
+%(end_nogil)s
 Py_XDECREF(img2d);
 Py_XDECREF(filtersflipped);
 """
@@ -1650,6 +1652,7 @@ for(int i=0;i < kerns_dim[0];++i){
 }
 
 //std::cerr << "-----new loop ----\\n";
+%(begin_nogil)s
 for(int b=0;b< %(self_bsize)s;b++){
     for (int img_col = 0; img_col < Os[1]; ++img_col){
         for (int filter_row = 0; filter_row < kerns_dim[2]; ++filter_row){
@@ -1712,19 +1715,13 @@ for(int b=0;b< %(self_bsize)s;b++){
             for (int img_row = 0; img_row < Os[0]; ++img_row) {
                 for (int kernel_idx = 0; kernel_idx < NKERN; ++kernel_idx) {
                     %(type)s * z_p =  (%(type)s *)PyArray_GETPTR4(%(z)s, b, kernel_idx, img_row, img_col);
-                    if (0)
-                    {
-                        if (b >= PyArray_DIMS(%(z)s)[0]) %(fail)s;
-                        if (kernel_idx >= PyArray_DIMS(%(z)s)[1]) %(fail)s;
-                        if (img_row >= PyArray_DIMS(%(z)s)[2]) %(fail)s;
-                        if (img_col >= PyArray_DIMS(%(z)s)[3]) %(fail)s;
-                    }
                     z_p[0] += kbuf[img_row * kbufstride + kernel_idx];
                 }
             }
         }
     }
 }
+%(end_nogil)s
 free(kbuf);
 }
 Py_XDECREF(img2d);
@@ -1901,6 +1898,7 @@ if (!PyArray_ISCONTIGUOUS(%(z)s))
     %(fail)s;
 }
 
+%(begin_nogil)s
 for(int b=0;b< %(self_bsize)s ;b+=%(unroll_bsize)s){
   for(int n_kern=0;n_kern<%(self_nkern)s;n_kern+=%(unroll_ksize)s){
 
@@ -2000,9 +1998,10 @@ for(int b=0;b< %(self_bsize)s ;b+=%(unroll_bsize)s){
     }//for stack_size
   }//for n_kern
 }//for b
+%(end_nogil)s
 Py_XDECREF(img2d);
 Py_XDECREF(filtersflipped);
-"""
+""" % d
     return ret
 
 _conv_op_code_unroll_patch = """
@@ -2143,6 +2142,7 @@ if (PyArray_STRIDES(%(z)s)[3] != sizeof(%(type)s)) %(fail)s;
 
 //The if on the number of loop make a speed up for small array.
 //with g++ 4.5.1. The compiler should be smart enough to do this himself!
+%(begin_nogil)s
 #pragma omp parallel for schedule(static) if(%(self_bsize)s * %(self_nkern)s > 1)
 // We merge the 2 loop into one to make it easier to parallelize on both
 // This is the equivalent of those 2 lines.
@@ -2278,6 +2278,7 @@ for(int batch_kern_idx=0;
       }//for iter_m
     }//for stack_size
 }//for b and n_kern
+%(end_nogil)s
 
 Py_XDECREF(img2d);
 Py_XDECREF(filtersflipped);
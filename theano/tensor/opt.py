@@ -24,6 +24,7 @@ from theano.gof.python25 import maxsize
 from theano.gof.utils import MethodNotDefined
 from theano.configparser import config
 from theano.tensor.elemwise import Elemwise, DimShuffle
+from theano.tensor.extra_ops import FillDiagonal
 from theano.tensor.subtensor import (get_idx_list, get_canonical_form_slice,
                                      Subtensor, IncSubtensor, AdvancedIncSubtensor1)
 from theano import scalar
@@ -187,24 +188,11 @@ def inplace_elemwise_optimizer_op(OP):
           x + y + z -> x += y += z
           (x + y) * (x * y) -> (x += y) *= (x * y) or (x + y) *= (x *= y)
         """
-        # We should not validate too often as this takes too much time to
-        # execute!
-        # It is the _dfs_toposort() fct in theano/gof/destroyhandler.py
-        # that takes so much time.
-        # Should we try to use another lib that does toposort?
-        #   igraph: http://igraph.sourceforge.net/
-        #   networkx: https://networkx.lanl.gov/
-        # Should we try to use cython?
-        #   Compiling only that fct is not enough, should we try to add the
-        #   deque class too?
-        #   And init the deque and other list to an upper bound number of
-        #   elements?
-        # Maybe Theano should do online toposort as in
-        #   http://code.google.com/p/acyclic
-        #
-        # The next longest optimizer is the canonizer phase.
-        # Then I think it is the [io_?]toposort (need to validate) so check if
-        # the solution is also applicable there.
+        # Validating used to take a time proportional to the size of the
+        # graph, so we did not validate after each change on big graphs.
+        # The DestroyHandler now updates its data structures and the
+        # topological order used to detect cycles incrementally, so that
+        # validating costs about the size of the change.
 
         # We execute `validate` after this number of change.
         check_each_change = config.tensor.insert_inplace_optimizer_validate_nb
@@ -2138,6 +2126,18 @@ compile.optdb.register('local_inplace_incsubtensor1',
                        60, 'fast_run', 'inplace')  # DEBUG
 
 
+@gof.local_optimizer([FillDiagonal])
+def local_inplace_fill_diagonal(node):
+    if isinstance(node.op, FillDiagonal) and not node.op.inplace:
+        return [FillDiagonal(inplace=True)(*node.inputs)]
+    return False
+compile.optdb.register('local_inplace_fill_diagonal',
+                       TopoOptimizer(
+        local_inplace_fill_diagonal,
+        failure_callback=TopoOptimizer.warn_inplace),
+                       60, 'fast_run', 'inplace')
+
+
 @register_canonicalize
 @register_stabilize
 @gof.local_optimizer([IncSubtensor])
@@ -1,11 +1,52 @@
 import numpy as np
 
 import theano
+from theano.gof.utils import MethodNotDefined
+from theano.gradient import DisconnectedType
 from theano.tensor import tensor
-
+from theano.tensor import basic
 from theano.tensor.basic import mul
 
 
+# The NumPy C constants of the sort kinds that have a C implementation.
+_c_sort_kinds = {'quicksort': 'NPY_QUICKSORT',
+                 'mergesort': 'NPY_MERGESORT',
+                 'heapsort': 'NPY_HEAPSORT'}
+
+
+def _c_sort_input(node, name, a, axis, fail):
+    """C code shared by SortOp and ArgSortOp.
+
+    It declares `a_<name>`, a new reference to the array to sort (`a`, or a
+    flattened copy of it when the axis is None), and `axis_<name>`, the
+    axis along which to sort it.
+    """
+    if (isinstance(node.inputs[1], theano.Constant) and
+            node.inputs[1].data is None):
+        return """
+        PyArrayObject* a_%(name)s = (PyArrayObject*) PyArray_Ravel(%(a)s,
+                                                                   NPY_CORDER);
+        if (!a_%(name)s)
+            %(fail)s;
+        int axis_%(name)s = 0;
+        """ % locals()
+    return """
+    int axis_%(name)s = ((dtype_%(axis)s*)PyArray_DATA(%(axis)s))[0];
+    if (axis_%(name)s < 0)
+        axis_%(name)s += PyArray_NDIM(%(a)s);
+    if (axis_%(name)s < 0 || axis_%(name)s >= PyArray_NDIM(%(a)s))
+    {
+        PyErr_Format(PyExc_ValueError,
+                     "axis %%d is out of bounds for an array of %%d dimensions",
+                     (int)((dtype_%(axis)s*)PyArray_DATA(%(axis)s))[0],
+                     PyArray_NDIM(%(a)s));
+        %(fail)s;
+    }
+    PyArrayObject* a_%(name)s = %(a)s;
+    Py_INCREF(a_%(name)s);
+    """ % locals()
+
+
 class SortOp(theano.Op):
     """
     This class is a wrapper for numpy sort function
@@ -42,6 +83,41 @@ class SortOp(theano.Op):
         z = output_storage[0]
         z[0] = np.sort(a, axis, self.kind, self.order)
 
+    def c_code(self, node, name, inp, out, sub):
+        if self.order or self.kind not in _c_sort_kinds:
+            raise MethodNotDefined()
+        a, axis = inp
+        z, = out
+        fail = sub['fail']
+        kind = _c_sort_kinds[self.kind]
+        code = _c_sort_input(node, name, a, axis, fail)
+        code += """
+        if (!(%(z)s && PyArray_NDIM(%(z)s) == PyArray_NDIM(a_%(name)s) &&
+              PyArray_CompareLists(PyArray_DIMS(%(z)s),
+                                   PyArray_DIMS(a_%(name)s),
+                                   PyArray_NDIM(a_%(name)s))))
+        {
+            Py_XDECREF(%(z)s);
+            %(z)s = (PyArrayObject*) PyArray_SimpleNew(
+                PyArray_NDIM(a_%(name)s), PyArray_DIMS(a_%(name)s),
+                type_num_%(a)s);
+        }
+        // Sort a copy of the input in the output storage.
+        if (!%(z)s || PyArray_CopyInto(%(z)s, a_%(name)s) ||
+            PyArray_Sort(%(z)s, axis_%(name)s, %(kind)s))
+        {
+            Py_DECREF(a_%(name)s);
+            %(fail)s;
+        }
+        Py_DECREF(a_%(name)s);
+        """ % locals()
+        # The block keeps the jumps to the failure label from crossing the
+        # declarations.
+        return "{\n%s\n}" % code
+
+    def c_code_cache_version(self):
+        return (1,)
+
     def infer_shape(self, node, inputs_shapes):
         if (isinstance(node.inputs[1], theano.Constant) and
             node.inputs[1].data is None):
@@ -132,6 +208,38 @@ class ArgSortOp(theano.Op):
                 np.argsort(a, axis, self.kind, self.order),
                 dtype=node.outputs[0].dtype)
 
+    def c_code(self, node, name, inp, out, sub):
+        if self.order or self.kind not in _c_sort_kinds:
+            raise MethodNotDefined()
+        a, axis = inp
+        z, = out
+        fail = sub['fail']
+        kind = _c_sort_kinds[self.kind]
+        code = _c_sort_input(node, name, a, axis, fail)
+        code += """
+        PyArrayObject* idx_%(name)s = (PyArrayObject*) PyArray_ArgSort(
+            a_%(name)s, axis_%(name)s, %(kind)s);
+        Py_DECREF(a_%(name)s);
+        if (!idx_%(name)s)
+            %(fail)s;
+        Py_XDECREF(%(z)s);
+        if (PyArray_TYPE(idx_%(name)s) == NPY_INT64)
+        {
+            %(z)s = idx_%(name)s;
+        }
+        else
+        {
+            %(z)s = (PyArrayObject*) PyArray_Cast(idx_%(name)s, NPY_INT64);
+            Py_DECREF(idx_%(name)s);
+            if (!%(z)s)
+                %(fail)s;
+        }
+        """ % locals()
+        return "{\n%s\n}" % code
+
+    def c_code_cache_version(self):
+        return (1,)
+
     def infer_shape(self, node, inputs_shapes):
         if (isinstance(node.inputs[1], theano.Constant) and
                 node.inputs[1].data is None):
@@ -177,3 +285,232 @@ def argsort(a, axis=-1, kind='quicksort', order=None):
     order.
     """
     return ArgSortOp(kind, order)(a, axis)
+
+
+class TopKOp(theano.Op):
+    """
+    Return the `k` largest values of a tensor along an axis, from the
+    largest to the smallest, and their indices along that axis.
+
+    The C implementation uses a partial sort, in O(n log k) for each of the
+    vectors of length n along the axis. NaN values are considered larger
+    than the others. The order of equal values is not specified.
+    """
+    def __init__(self, axis=-1):
+        self.axis = axis
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.axis == other.axis
+
+    def __hash__(self):
+        return hash(type(self)) ^ hash(self.axis)
+
+    def __str__(self):
+        return self.__class__.__name__ + "{%s}" % self.axis
+
+    def make_node(self, x, k):
+        x = basic.as_tensor_variable(x)
+        k = basic.as_tensor_variable(k)
+        if x.ndim == 0:
+            raise ValueError("topk needs a tensor of at least 1 dimension")
+        if not -x.ndim <= self.axis < x.ndim:
+            raise ValueError("axis %s is out of bounds for a tensor of %d "
+                             "dimensions" % (self.axis, x.ndim))
+        if k.ndim != 0 or k.dtype not in basic.discrete_dtypes:
+            raise TypeError("k must be an integer scalar", k)
+        bcast = list(x.broadcastable)
+        bcast[self.axis] = False
+        return theano.Apply(self, [x, k], [
+            basic.TensorType(dtype=x.dtype, broadcastable=bcast)(),
+            basic.TensorType(dtype='int64', broadcastable=bcast)()])
+
+    def perform(self, node, inputs, output_storage):
+        x, k = inputs
+        k = int(k)
+        n = x.shape[self.axis]
+        if not 0 <= k <= n:
+            raise ValueError("topk: k=%d is not in [0, %d]" % (k, n))
+        xs = np.swapaxes(x, self.axis, -1)
+        flat = xs.reshape(int(np.prod(xs.shape[:-1])), n)
+        # A stable sort of the reversed vectors puts the largest values
+        # first once reversed again, with equal values in the same order
+        # as the C implementation.
+        idx = n - 1 - np.argsort(flat[:, ::-1], axis=1,
+                                 kind='mergesort')[:, ::-1][:, :k]
+        rows = np.arange(flat.shape[0]).reshape(-1, 1)
+        shape = xs.shape[:-1] + (k,)
+        values = flat[rows, idx].reshape(shape)
+        output_storage[0][0] = np.swapaxes(values, self.axis, -1).copy()
+        output_storage[1][0] = np.swapaxes(
+            idx.astype('int64').reshape(shape), self.axis, -1).copy()
+
+    def c_support_code(self):
+        return """
+        // Order vector positions from the largest value to the smallest,
+        // NaN being the largest.
+        template <typename T>
+        struct theano_topk_greater
+        {
+            const char* data;
+            npy_intp stride;
+            bool operator()(npy_intp a, npy_intp b) const
+            {
+                T va = *(const T*)(data + a * stride);
+                T vb = *(const T*)(data + b * stride);
+                if (va != va)
+                    return vb == vb;
+                return va > vb;
+            }
+        };
+        """
+
+    def c_headers(self):
+        return ['<algorithm>', '<vector>']
+
+    def c_code(self, node, name, inp, out, sub):
+        x, k = inp
+        values, indices = out
+        fail = sub['fail']
+        begin_nogil = sub['begin_nogil']
+        end_nogil = sub['end_nogil']
+        axis = self.axis % node.inputs[0].ndim
+        return """
+        {
+        npy_intp n_%(name)s = PyArray_DIMS(%(x)s)[%(axis)s];
+        npy_intp k_%(name)s = ((dtype_%(k)s*)PyArray_DATA(%(k)s))[0];
+        if (k_%(name)s < 0 || k_%(name)s > n_%(name)s)
+        {
+            PyErr_Format(PyExc_ValueError, "topk: k=%%ld is not in [0, %%ld]",
+                         (long)k_%(name)s, (long)n_%(name)s);
+            %(fail)s;
+        }
+        npy_intp dims_%(name)s[NPY_MAXDIMS];
+        for (int i = 0; i < PyArray_NDIM(%(x)s); ++i)
+            dims_%(name)s[i] = PyArray_DIMS(%(x)s)[i];
+        dims_%(name)s[%(axis)s] = k_%(name)s;
+        if (!(%(values)s && PyArray_CompareLists(PyArray_DIMS(%(values)s),
+                                                 dims_%(name)s,
+                                                 PyArray_NDIM(%(x)s))))
+        {
+            Py_XDECREF(%(values)s);
+            %(values)s = (PyArrayObject*) PyArray_SimpleNew(
+                PyArray_NDIM(%(x)s), dims_%(name)s, type_num_%(x)s);
+            if (!%(values)s)
+                %(fail)s;
+        }
+        if (!(%(indices)s && PyArray_CompareLists(PyArray_DIMS(%(indices)s),
+                                                  dims_%(name)s,
+                                                  PyArray_NDIM(%(x)s))))
+        {
+            Py_XDECREF(%(indices)s);
+            %(indices)s = (PyArrayObject*) PyArray_SimpleNew(
+                PyArray_NDIM(%(x)s), dims_%(name)s, NPY_INT64);
+            if (!%(indices)s)
+                %(fail)s;
+        }
+        if (PyArray_SIZE(%(values)s) > 0)
+        {
+            // Iterate on the vectors along the axis.
+            int axis_x = %(axis)s, axis_v = %(axis)s, axis_i = %(axis)s;
+            PyArrayIterObject* it_x = (PyArrayIterObject*)
+                PyArray_IterAllButAxis((PyObject*)%(x)s, &axis_x);
+            PyArrayIterObject* it_v = (PyArrayIterObject*)
+                PyArray_IterAllButAxis((PyObject*)%(values)s, &axis_v);
+            PyArrayIterObject* it_i = (PyArrayIterObject*)
+                PyArray_IterAllButAxis((PyObject*)%(indices)s, &axis_i);
+            if (!it_x || !it_v || !it_i)
+            {
+                Py_XDECREF(it_x);
+                Py_XDECREF(it_v);
+                Py_XDECREF(it_i);
+                %(fail)s;
+            }
+            npy_intp sv = PyArray_STRIDES(%(values)s)[%(axis)s];
+            npy_intp si = PyArray_STRIDES(%(indices)s)[%(axis)s];
+            %(begin_nogil)s
+            {
+                std::vector<npy_intp> idx(n_%(name)s);
+                theano_topk_greater<dtype_%(x)s> greater;
+                greater.stride = PyArray_STRIDES(%(x)s)[%(axis)s];
+                while (PyArray_ITER_NOTDONE(it_x))
+                {
+                    greater.data = (const char*)it_x->dataptr;
+                    for (npy_intp j = 0; j < n_%(name)s; ++j)
+                        idx[j] = j;
+                    std::partial_sort(idx.begin(), idx.begin() + k_%(name)s,
+                                      idx.end(), greater);
+                    for (npy_intp j = 0; j < k_%(name)s; ++j)
+                    {
+                        *(dtype_%(x)s*)(it_v->dataptr + j * sv) =
+                            *(const dtype_%(x)s*)(greater.data +
+                                                  idx[j] * greater.stride);
+                        *(npy_int64*)(it_i->dataptr + j * si) = idx[j];
+                    }
+                    PyArray_ITER_NEXT(it_x);
+                    PyArray_ITER_NEXT(it_v);
+                    PyArray_ITER_NEXT(it_i);
+                }
+            }
+            %(end_nogil)s
+            Py_DECREF(it_x);
+            Py_DECREF(it_v);
+            Py_DECREF(it_i);
+        }
+        }
+        """ % locals()
+
+    def c_code_cache_version(self):
+        return (1,)
+
+    def infer_shape(self, node, inputs_shapes):
+        shape = list(inputs_shapes[0])
+        shape[self.axis] = basic.cast(node.inputs[1], 'int64')
+        return [tuple(shape), tuple(shape)]
+
+    def connection_pattern(self, node):
+        # The indices are integers, and k only changes the shape.
+        return [[True, False], [False, False]]
+
+    def grad(self, inputs, output_grads):
+        x, k = inputs
+        gz = output_grads[0]
+        if isinstance(gz.type, DisconnectedType):
+            return [x.zeros_like(), DisconnectedType()()]
+        indices = self(x, k)[1]
+        # Move the axis last, and add the gradient of each value at the
+        # position it came from in the flattened input.
+        axis = self.axis % x.ndim
+        perm = [i for i in range(x.ndim) if i != axis] + [axis]
+        xs = x.dimshuffle(perm)
+        n = xs.shape[-1]
+        n_rows = basic.prod(xs.shape[:-1])
+        idx = indices.dimshuffle(perm).reshape((n_rows, -1), ndim=2)
+        flat_idx = (basic.arange(n_rows).dimshuffle(0, 'x') * n +
+                    idx).flatten()
+        gx = theano.tensor.inc_subtensor(
+            basic.zeros((n_rows * n,), dtype=x.dtype)[flat_idx],
+            gz.dimshuffle(perm).flatten())
+        inv_perm = [perm.index(i) for i in range(x.ndim)]
+        gx = gx.reshape(xs.shape, ndim=x.ndim).dimshuffle(inv_perm)
+        return [gx, DisconnectedType()()]
+
+
+def topk(x, k, axis=-1):
+    """
+    Return the `k` largest values of `x` along `axis`, sorted from the
+    largest to the smallest, and their indices along that axis.
+
+    x : Tensor
+        Tensor of at least 1 dimension.
+
+    k : integer scalar
+        Number of values to return. It must be between 0 and the length of
+        `x` along `axis`.
+
+    axis : int
+        Axis along which to select the values.
+
+    Returns a list [values, indices]. The gradient flows through the
+    values to the positions they were taken from.
+    """
+    return TopKOp(axis)(x, k)
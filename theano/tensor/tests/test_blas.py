@@ -1,4 +1,5 @@
 from copy import copy
+import threading
 from unittest import TestCase
 
 import numpy
@@ -795,6 +796,33 @@ def test_gemm_unrolled():
         unrolled_theano()
 
 
+def test_gemm_threads():
+    """Call a function with Dot22, Elemwise and CAReduce nodes, that release
+    the GIL when config.cmodule.release_gil is True, from several threads."""
+    rng = numpy.random.RandomState(unittest_tools.fetch_seed())
+    x = T.matrix('x')
+    y = T.matrix('y')
+    f = theano.function([x, y], T.tanh(T.dot(x, y) + 1).sum(axis=0),
+                        mode=mode_not_fast_compile)
+    pool = theano.compile.FunctionPool(f)
+    data = [(rng.rand(50, 60).astype(config.floatX),
+             rng.rand(60, 70).astype(config.floatX)) for i in range(4)]
+    results = [None] * len(data)
+
+    def work(i):
+        for j in range(20):
+            results[i] = pool(*data[i])
+    threads = [threading.Thread(target=work, args=(i,))
+               for i in range(len(data))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for (xv, yv), res in zip(data, results):
+        assert numpy.allclose(res, numpy.tanh(numpy.dot(xv, yv) + 1).sum(0),
+                              rtol=1e-4)
+
+
 def test_inplace0():
     #should fail to insert gemm_inplace because gemm_inplace would
     #create cycles
@@ -1,5 +1,6 @@
 import numpy as np
 import numpy
+from nose.plugins.skip import SkipTest
 
 import theano
 from theano.tests import unittest_tools as utt
@@ -142,6 +143,34 @@ class TestBinCountOp(utt.InferShapeTester):
                 assert (np.bincount(a, minlength=23) == f3(a)).all()
                 assert (np.bincount(a, minlength=5) == f4(a)).all()
 
+    def test_reuse_and_errors(self):
+        x = T.lvector('x')
+        w = T.dvector('w')
+        f = theano.function([x, w], [bincount(x), bincount(x, weights=w)])
+        # The number of bins changes between the calls.
+        for high in [10, 3, 3, 20]:
+            a = np.random.random_integers(0, high, size=(30,))
+            weights = np.random.random((30,))
+            out, out_w = f(a, weights)
+            assert (out == np.bincount(a)).all()
+            assert np.allclose(out_w, np.bincount(a, weights=weights))
+        self.assertRaises(ValueError, f, np.array([1, -1, 2]), np.ones(3))
+
+    def test_c_weights_length(self):
+        if not theano.config.cxx:
+            raise SkipTest("G++ not available, so we need to skip this test.")
+        x = T.lvector('x')
+        w = T.dvector('w')
+        f = theano.function([x, w], bincount(x, weights=w),
+                            mode=theano.compile.Mode(linker='c'))
+        assert np.allclose(f([1, 2], [0.5, 2.]), [0., 0.5, 2.])
+        try:
+            f([1, 2], np.ones(3))
+        except ValueError, e:
+            assert '3 weights for 2 elements' in str(e)
+        else:
+            raise AssertionError('bincount should fail')
+
     def test_infer_shape(self):
         for dtype in tensor.discrete_dtypes:
             # uint64 always fails
@@ -210,6 +239,14 @@ class TestDiffOp(utt.InferShapeTester):
                 g = theano.function([x], diff(x, n=k, axis=axis))
                 assert np.allclose(np.diff(a, n=k, axis=axis), g(a))
 
+    def test_short_and_int(self):
+        x = T.ivector('x')
+        a = np.random.random_integers(-50, 50, size=(4,)).astype('int32')
+        for k in range(7):
+            f = theano.function([x], diff(x, n=k))
+            assert np.all(np.diff(a, n=k) == f(a))
+            assert np.all(np.diff(a[:2], n=k) == f(a[:2]))
+
     def test_infer_shape(self):
         x = T.matrix('x')
         a = np.random.random((30, 50)).astype(config.floatX)
@@ -364,6 +401,22 @@ class TestRepeatOp(utt.InferShapeTester):
                                 [a, r],
                                 self.op_class)
 
+    def test_reuse_and_errors(self):
+        x = T.matrix('x')
+        r = T.lvector('r')
+        f = theano.function([x, r], repeat(x, r, axis=1))
+        for shp in [(3, 4), (3, 4), (5, 1), (2, 4)]:
+            a = np.random.random(shp).astype(config.floatX)
+            reps = np.random.random_integers(0, 3, size=(shp[1],))
+            assert np.all(np.repeat(a, reps, axis=1) == f(a, reps))
+        # A vector of 1 repeat is broadcasted.
+        assert np.all(np.repeat(a, [2], axis=1) == f(a, [2]))
+        # Non-contiguous input.
+        a = np.random.random((4, 6)).astype(config.floatX)[:, ::2]
+        assert np.all(np.repeat(a, [1, 0, 2], axis=1) == f(a, [1, 0, 2]))
+        self.assertRaises(ValueError, f, a, [1, -1, 2])
+        self.assertRaises(ValueError, f, a, [1, 2])
+
     def test_grad(self):
         for ndim in range(3):
             a = np.random.random((10, ) * ndim).astype(config.floatX)
@@ -397,6 +450,8 @@ class TestBartlett(utt.InferShapeTester):
         assert numpy.allclose(f(-1), numpy.bartlett(-1))
         b = numpy.array([17], dtype='uint8')
         assert numpy.allclose(f(b[0]), numpy.bartlett(b[0]))
+        for M in [5, 5, 1, 2, 8]:
+            assert numpy.allclose(f(M), numpy.bartlett(M))
 
     def test_infer_shape(self):
         x = tensor.lscalar()
@@ -448,6 +503,41 @@ class TestFillDiagonal(utt.InferShapeTester):
         assert out[2, 2, 2] == val
         assert (out == val).sum() == min(a.shape)
 
+    def test_inplace(self):
+        x = tensor.matrix()
+        y = tensor.scalar()
+        mode = theano.compile.get_default_mode().including('inplace')
+        # fill_diagonal must not work inplace on the input of the function.
+        f = function([x, y], fill_diagonal(x, y), mode=mode)
+        a = numpy.random.rand(5, 8).astype(config.floatX)
+        a_copy = a.copy()
+        out = f(a, 3)
+        assert numpy.all(a == a_copy)
+        assert numpy.all(numpy.diag(out) == 3)
+        # It can work inplace on an intermediate result.
+        f = function([x, y], fill_diagonal(x * 2, y), mode=mode)
+        topo = f.maker.fgraph.toposort()
+        assert [n.op for n in topo if isinstance(n.op, FillDiagonal)] == [
+            FillDiagonal(inplace=True)]
+        for shp in [(5, 8), (8, 5), (8, 5)]:
+            a = numpy.random.rand(*shp).astype(config.floatX)
+            expected = a * 2
+            expected[range(5), range(5)] = 3
+            assert numpy.allclose(f(a, 3), expected)
+        x = tensor.tensor3()
+        f = function([x, y], fill_diagonal(x * 2, y), mode=mode)
+        self.assertRaises(ValueError, f,
+                          numpy.random.rand(3, 3, 4).astype(config.floatX),
+                          3)
+
+    def test_unpickle_old(self):
+        # FillDiagonal ops pickled before inplace was added are not inplace.
+        op = object.__new__(FillDiagonal)
+        op.__setstate__({})
+        assert op == FillDiagonal()
+        assert hash(op) == hash(FillDiagonal())
+        assert str(op) == 'FillDiagonal'
+
     def test_gradient(self):
         utt.verify_grad(fill_diagonal, [numpy.random.rand(5, 8),
                                         numpy.random.rand()],
@@ -54,3 +54,81 @@ class T_load_tensor(unittest.TestCase):
         os.remove(os.path.join(
             theano.config.compiledir,
             "_test.npy"))
+
+
+class T_load_slice(unittest.TestCase):
+    def setUp(self):
+        self.data = numpy.arange(60, dtype='float32').reshape(12, 5)
+        self.filename = os.path.join(theano.config.compiledir,
+                                     "_test_slice.npy")
+        self.npz = os.path.join(theano.config.compiledir,
+                                "_test_slice.npz")
+        self.npz_compressed = os.path.join(theano.config.compiledir,
+                                           "_test_slice_compressed.npz")
+        numpy.save(self.filename, self.data)
+        numpy.savez(self.npz, a=self.data, b=numpy.arange(7))
+        numpy.savez_compressed(self.npz_compressed, a=self.data)
+
+    def check(self, path, **kwargs):
+        p = Variable(Generic())
+        start = tensor.lscalar()
+        stop = tensor.lscalar()
+        x = tensor.load_slice(p, start, stop, 'float32', (False, False),
+                              **kwargs)
+        fn = function([p, start, stop], x)
+        for i, j in [(0, 4), (4, 8), (10, 15), (-3, 12), (5, 5), (7, 3),
+                     (0, 12)]:
+            assert (fn(path, i, j) == self.data[i:j]).all()
+            assert fn(path, i, j).shape == self.data[i:j].shape
+
+    def test_npy(self):
+        self.check(self.filename)
+        self.check(self.filename, mmap_mode=None)
+        self.check(self.filename, read_ahead=True)
+
+    def test_npz(self):
+        self.check(self.npz, member='a')
+        self.check(self.npz, member='a', mmap_mode=None)
+        self.check(self.npz_compressed, member='a', mmap_mode=None,
+                   read_ahead=True)
+
+    def test_zero_copy(self):
+        p = Variable(Generic())
+        x = tensor.load_slice(p, 2, 6, 'float32', (False, False))
+        fn = function([p], x)
+        assert isinstance(fn(self.filename), numpy.memmap)
+
+    def test_inplace(self):
+        # Inplace ops on the slice must not change the file, nor the
+        # next slices.
+        p = Variable(Generic())
+        i = tensor.lscalar()
+        x = tensor.load_slice(p, i, i + 4, 'float32', (False, False))
+        fn = function([p, i], (x ** 2).sum())
+        for k in range(3):
+            assert fn(self.filename, 2) == (self.data[2:6] ** 2).sum()
+        assert (numpy.load(self.filename) == self.data).all()
+
+    def test_errors(self):
+        p = Variable(Generic())
+        x = tensor.load_slice(p, 0, 2, 'int32', (False, False))
+        fn = function([p], x)
+        self.assertRaises(TypeError, fn, self.filename)
+        x = tensor.load_slice(p, 0, 2, 'float32', (False,))
+        fn = function([p], x)
+        self.assertRaises(TypeError, fn, self.filename)
+        self.assertRaises(ValueError, fn, self.npz)
+        # A compressed member can not be mapped in memory.
+        x = tensor.load_slice(p, 0, 2, 'float32', (False, False), member='a')
+        fn = function([p], x)
+        try:
+            fn(self.npz_compressed)
+            assert False
+        except ValueError, e:
+            assert 'numpy.savez' in str(e)
+        self.assertRaises(TypeError, tensor.load_slice, p, 0.5, 2,
+                          'float32', (False,))
+
+    def tearDown(self):
+        for f in (self.filename, self.npz, self.npz_compressed):
+            os.remove(f)
@@ -8,6 +8,7 @@ from theano import tensor
 
 from theano.tensor.sort import sort, SortOp
 from theano.tensor.sort import argsort, ArgSortOp
+from theano.tensor.sort import topk, TopKOp
 
 
 class test_sort(unittest.TestCase):
@@ -83,6 +84,17 @@ class TensorInferShapeTester(utt.InferShapeTester):
                 [np.random.randn(10, 40).astype(theano.config.floatX)],
                 SortOp)
 
+    def test_topk(self):
+        x = tensor.tensor3()
+        k = tensor.iscalar()
+        for axis in (0, 1, -1):
+            self._compile_and_check(
+                    [x, k],
+                    topk(x, k, axis),
+                    [np.random.randn(5, 6, 7).astype(theano.config.floatX),
+                     3],
+                    TopKOp)
+
 
 def test_argsort():
     #Set up
@@ -143,3 +155,111 @@ def test_argsort():
     gv = f(m_val)
     gt = np.argsort(m_val, None)
     assert np.allclose(gv, gt)
+
+
+def test_sort_argsort_c():
+    # Compare the C code with numpy, on inputs that are not contiguous, and
+    # with output storage of a different shape from the previous call.
+    rng = np.random.RandomState(seed=utt.fetch_seed())
+    mode = theano.compile.get_default_mode().excluding('fusion')
+    for dtype in ('float64', 'int32'):
+        a = tensor.matrix(dtype=dtype)
+        axis = tensor.iscalar()
+        for kind in ('quicksort', 'mergesort', 'heapsort'):
+            f = theano.function([a, axis], [sort(a, axis, kind),
+                                            argsort(a, axis, kind)],
+                                mode=mode)
+            f_none = theano.function([a], [sort(a, None, kind),
+                                           argsort(a, None, kind)],
+                                     mode=mode)
+            assert all([node.op.c_code_cache_version()
+                        for node in f.maker.fgraph.toposort()])
+            for shape in ((5, 8), (3, 4)):
+                val = (rng.rand(*shape) * 100).astype(dtype).T
+                for axis_val in (0, 1, -1):
+                    s_val, a_val = f(val, axis_val)
+                    assert np.all(s_val == np.sort(val, axis_val))
+                    assert a_val.dtype == 'int64'
+                    # The values can repeat, so check that the indices
+                    # sort the input.
+                    if axis_val == 0:
+                        by_idx = val[a_val, np.arange(val.shape[1])]
+                    else:
+                        by_idx = val[np.arange(val.shape[0])[:, None], a_val]
+                    assert np.all(by_idx == s_val)
+                s_val, a_val = f_none(val)
+                assert np.all(s_val == np.sort(val, None))
+                assert np.all(val.flatten()[a_val] == s_val)
+            try:
+                f(val, 2)
+            except ValueError:
+                pass
+            else:
+                assert False
+
+
+class test_topk(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.RandomState(seed=utt.fetch_seed())
+
+    def _check(self, f, val, k, axis):
+        values, indices = f(val, k)
+        order = np.argsort(-val, axis=axis, kind='mergesort')
+        expected = np.swapaxes(np.swapaxes(order, axis, -1)[..., :k],
+                               axis, -1)
+        assert indices.dtype == 'int64'
+        assert np.all(indices == expected)
+        assert np.all(values == np.sort(val, axis=axis).take(
+            range(val.shape[axis] - 1, val.shape[axis] - 1 - k, -1),
+            axis=axis))
+
+    def test_values_indices(self):
+        x = tensor.dtensor3()
+        k = tensor.iscalar()
+        for axis in (0, 1, 2, -1):
+            out = topk(x, k, axis)
+            f_c = theano.function([x, k], out)
+            f_py = theano.function([x, k], out,
+                                   mode=theano.Mode(linker='py'))
+            assert isinstance(f_c.maker.fgraph.toposort()[0].op, TopKOp)
+            val = self.rng.rand(4, 5, 6)
+            n = val.shape[axis]
+            for f in (f_c, f_py):
+                for k_val in (0, 1, 3, n):
+                    self._check(f, val, k_val, axis)
+                # Not contiguous input.
+                self._check(f, val.transpose(2, 0, 1), 2, axis)
+                self.assertRaises(ValueError, f, val, n + 1)
+                self.assertRaises(ValueError, f, val, -1)
+
+    def test_nan_int(self):
+        x = tensor.dvector()
+        f = theano.function([x], topk(x, 2))
+        values, indices = f(np.array([1., np.nan, 3., 2.]))
+        assert np.isnan(values[0]) and values[1] == 3
+        assert list(indices) == [1, 2]
+
+        x = tensor.bmatrix()
+        f = theano.function([x], topk(x, 2, axis=0))
+        val = np.array([[1, -5], [3, 7], [-2, 8]], dtype='int8')
+        values, indices = f(val)
+        assert np.all(values == [[3, 8], [1, 7]])
+        assert np.all(indices == [[1, 2], [0, 1]])
+
+    def test_grad(self):
+        # Distinct values, so that the selection is the same in the
+        # finite differences.
+        val = self.rng.permutation(60).reshape(3, 4, 5) / 10.
+        for axis in (0, 1, -1):
+            utt.verify_grad(lambda x: topk(x, 3, axis)[0], [val],
+                            rng=self.rng)
+        # The indices don't have a gradient.
+        x = tensor.dmatrix()
+        values, indices = topk(x, 2)
+        g = theano.grad(values.sum(), x)
+        g_val, i_val = theano.function([x], [g, indices])(val[0])
+        expected = np.zeros_like(val[0])
+        for row, idx in enumerate(i_val):
+            expected[row, idx] = 1
+        assert np.all(g_val == expected)